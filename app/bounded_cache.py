@@ -0,0 +1,135 @@
+# app/bounded_cache.py
+"""
+Bounded Cache - thread-safe LRU map with a per-entry time-to-live.
+
+Shared container behind the evaluation result cache (app/evaluation_cache.py)
+and the delta engine session stores (app/session_store.py).
+
+Design Principles:
+1. Bounded — least recently used entries are evicted beyond max_entries
+2. Expiring — entries older than ttl_seconds are never served; expired
+   entries at the cold end are dropped on every write
+3. Observable — hits, misses, evictions and expirations are counted in
+   memory; no I/O per lookup
+4. max_entries <= 0 disables the cache: get() always misses and put() is a
+   no-op, so callers never need a separate code path
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time cache counters."""
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_entries: int
+    ttl_seconds: float
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to JSON-serializable dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": self.size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class BoundedTTLCache:
+    """Thread-safe LRU map with a per-entry time-to-live."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value stored for `key`, or None if absent or expired."""
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store `value`, dropping expired and then least recently used entries."""
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now + self._ttl, value)
+            self._entries.move_to_end(key)
+            # Expired entries at the cold end go first; they would never be read
+            while self._entries:
+                oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+                if expires_at > now:
+                    break
+                del self._entries[oldest_key]
+                self._expirations += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        """Current counters for monitoring."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_entries=self._max_entries,
+                ttl_seconds=self._ttl,
+            )
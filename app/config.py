@@ -23,6 +23,16 @@ SERVICE_VERSION = "0.1.0"
 # Default values
 DEFAULT_MAX_REQUEST_SIZE_BYTES = 1_048_576  # 1MB
 MIN_REQUEST_SIZE_BYTES = 1024  # 1KB minimum
+DEFAULT_EVAL_CACHE_MAX_ENTRIES = 1024  # 0 disables the evaluation result cache
+DEFAULT_EVAL_CACHE_TTL_SECONDS = 300  # 5 minutes
+DEFAULT_EVAL_EXECUTOR_WORKERS = 4  # Threads for off-loop evaluation work
+EVAL_BACKENDS = ("thread", "process")  # Where /app/evaluate runs the pipeline
+DEFAULT_EVAL_BACKEND = "thread"
+DEFAULT_EVAL_PROCESS_WORKERS = 0  # 0 = one worker process per CPU
+DEFAULT_EVAL_PROCESS_MAX_PENDING = 64  # Queued + running tasks before 503
+DEFAULT_EVAL_TASK_TIMEOUT_SECONDS = 30
+DEFAULT_SESSION_STORE_MAX_ENTRIES = 10_000  # Sessions kept for delta / trend
+DEFAULT_SESSION_STORE_TTL_SECONDS = 1800  # 30 minutes since last evaluation
 
 # Sensitive substrings that should never appear in logs
 SENSITIVE_SUBSTRINGS = ("key", "token", "secret", "password", "credential", "auth")
@@ -60,6 +70,23 @@ class AppConfig:
     # Security settings
     max_request_size_bytes: int = DEFAULT_MAX_REQUEST_SIZE_BYTES
 
+    # Evaluation result cache (OPTIONAL - 0 entries disables it)
+    eval_cache_max_entries: int = DEFAULT_EVAL_CACHE_MAX_ENTRIES
+    eval_cache_ttl_seconds: int = DEFAULT_EVAL_CACHE_TTL_SECONDS
+
+    # Bounded executor for blocking evaluation work (async routes)
+    eval_executor_workers: int = DEFAULT_EVAL_EXECUTOR_WORKERS
+
+    # Evaluation backend (OPTIONAL - "process" runs the pipeline in a process pool)
+    eval_backend: str = DEFAULT_EVAL_BACKEND
+    eval_process_workers: int = DEFAULT_EVAL_PROCESS_WORKERS
+    eval_process_max_pending: int = DEFAULT_EVAL_PROCESS_MAX_PENDING
+    eval_task_timeout_seconds: int = DEFAULT_EVAL_TASK_TIMEOUT_SECONDS
+
+    # Session store for change delta / confidence trend
+    session_store_max_entries: int = DEFAULT_SESSION_STORE_MAX_ENTRIES
+    session_store_ttl_seconds: int = DEFAULT_SESSION_STORE_TTL_SECONDS
+
     # Feature flags (OPTIONAL - default disabled)
     leading_light_enabled: bool = False
     voice_enabled: bool = False
@@ -158,6 +185,61 @@ def load_config(fail_fast: bool = True) -> AppConfig:
     if size_warning:
         warnings.append(size_warning)
 
+    # Evaluation result cache sizing
+    eval_cache_max_entries, cache_warning = _parse_int_env(
+        "EVAL_CACHE_MAX_ENTRIES", DEFAULT_EVAL_CACHE_MAX_ENTRIES, min_value=0
+    )
+    if cache_warning:
+        warnings.append(cache_warning)
+    eval_cache_ttl_seconds, ttl_warning = _parse_int_env(
+        "EVAL_CACHE_TTL_SECONDS", DEFAULT_EVAL_CACHE_TTL_SECONDS, min_value=1
+    )
+    if ttl_warning:
+        warnings.append(ttl_warning)
+
+    # Evaluation executor sizing
+    eval_executor_workers, workers_warning = _parse_int_env(
+        "EVAL_EXECUTOR_WORKERS", DEFAULT_EVAL_EXECUTOR_WORKERS, min_value=1
+    )
+    if workers_warning:
+        warnings.append(workers_warning)
+
+    # Evaluation backend
+    eval_backend = os.environ.get("EVAL_BACKEND", DEFAULT_EVAL_BACKEND).strip().lower()
+    if eval_backend not in EVAL_BACKENDS:
+        warnings.append(
+            f"EVAL_BACKEND='{eval_backend}' is not one of {', '.join(EVAL_BACKENDS)}; "
+            f"using default {DEFAULT_EVAL_BACKEND}"
+        )
+        eval_backend = DEFAULT_EVAL_BACKEND
+    eval_process_workers, process_workers_warning = _parse_int_env(
+        "EVAL_PROCESS_WORKERS", DEFAULT_EVAL_PROCESS_WORKERS, min_value=0
+    )
+    if process_workers_warning:
+        warnings.append(process_workers_warning)
+    eval_process_max_pending, pending_warning = _parse_int_env(
+        "EVAL_PROCESS_MAX_PENDING", DEFAULT_EVAL_PROCESS_MAX_PENDING, min_value=1
+    )
+    if pending_warning:
+        warnings.append(pending_warning)
+    eval_task_timeout_seconds, timeout_warning = _parse_int_env(
+        "EVAL_TASK_TIMEOUT_SECONDS", DEFAULT_EVAL_TASK_TIMEOUT_SECONDS, min_value=1
+    )
+    if timeout_warning:
+        warnings.append(timeout_warning)
+
+    # Session store sizing
+    session_store_max_entries, sessions_warning = _parse_int_env(
+        "SESSION_STORE_MAX_ENTRIES", DEFAULT_SESSION_STORE_MAX_ENTRIES, min_value=1
+    )
+    if sessions_warning:
+        warnings.append(sessions_warning)
+    session_store_ttl_seconds, session_ttl_warning = _parse_int_env(
+        "SESSION_STORE_TTL_SECONDS", DEFAULT_SESSION_STORE_TTL_SECONDS, min_value=1
+    )
+    if session_ttl_warning:
+        warnings.append(session_ttl_warning)
+
     # Feature flags (OPTIONAL - disabled by default)
     leading_light_enabled = _parse_bool_env("LEADING_LIGHT_ENABLED", False)
     voice_enabled = _parse_bool_env("VOICE_ENABLED", False)
@@ -186,6 +268,15 @@ def load_config(fail_fast: bool = True) -> AppConfig:
         git_sha=git_sha,
         build_time_utc=build_time_utc,
         max_request_size_bytes=max_request_size,
+        eval_cache_max_entries=eval_cache_max_entries,
+        eval_cache_ttl_seconds=eval_cache_ttl_seconds,
+        eval_executor_workers=eval_executor_workers,
+        eval_backend=eval_backend,
+        eval_process_workers=eval_process_workers,
+        eval_process_max_pending=eval_process_max_pending,
+        eval_task_timeout_seconds=eval_task_timeout_seconds,
+        session_store_max_entries=session_store_max_entries,
+        session_store_ttl_seconds=session_store_ttl_seconds,
         leading_light_enabled=leading_light_enabled,
         voice_enabled=voice_enabled,
         sherlock_enabled=sherlock_enabled,
@@ -209,6 +300,15 @@ def log_config_snapshot(config: AppConfig) -> str:
         f"git_sha={config.git_sha} "
         f"build_time_utc={config.build_time_utc} "
         f"max_request_size_bytes={config.max_request_size_bytes} "
+        f"eval_cache_max_entries={config.eval_cache_max_entries} "
+        f"eval_cache_ttl_seconds={config.eval_cache_ttl_seconds} "
+        f"eval_executor_workers={config.eval_executor_workers} "
+        f"eval_backend={config.eval_backend} "
+        f"eval_process_workers={config.eval_process_workers} "
+        f"eval_process_max_pending={config.eval_process_max_pending} "
+        f"eval_task_timeout_seconds={config.eval_task_timeout_seconds} "
+        f"session_store_max_entries={config.session_store_max_entries} "
+        f"session_store_ttl_seconds={config.session_store_ttl_seconds} "
         f"leading_light_enabled={config.leading_light_enabled} "
         f"voice_enabled={config.voice_enabled} "
         f"sherlock_enabled={config.sherlock_enabled} "
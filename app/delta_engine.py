@@ -22,6 +22,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
+from app.config import load_config
+from app.session_store import SessionStore
+
+_config = load_config(fail_fast=False)
+
 
 @dataclass(frozen=True)
 class SnapshotDelta:
@@ -235,19 +240,11 @@ def store_snapshot_for_session(
     """
     Store snapshot for later comparison.
 
-    Note: This is a placeholder. Actual storage would use:
-    - Session storage (if available)
-    - In-memory cache with TTL
-    - Redis or similar for production
-
-    For now, we'll use a simple in-memory dict.
+    Sessions expire after SESSION_STORE_TTL_SECONDS without an evaluation;
+    at most SESSION_STORE_MAX_ENTRIES are kept (least recently used first
+    out).
     """
-    # Import here to avoid circular dependency
-    global _snapshot_storage
-    if "_snapshot_storage" not in globals():
-        _snapshot_storage = {}
-    
-    _snapshot_storage[session_id] = snapshot
+    _snapshot_storage.put(session_id, snapshot)
 
 
 def get_previous_snapshot_for_session(
@@ -259,15 +256,26 @@ def get_previous_snapshot_for_session(
     Returns:
         Previous snapshot dict, or None if not found
     """
-    global _snapshot_storage
-    if "_snapshot_storage" not in globals():
-        return None
-    
     return _snapshot_storage.get(session_id)
 
 
-# Module-level storage (temporary, for MVP)
-_snapshot_storage: dict[str, dict] = {}
+# Module-level session stores (see app/session_store.py)
+_snapshot_storage = SessionStore(
+    max_entries=_config.session_store_max_entries,
+    ttl_seconds=_config.session_store_ttl_seconds,
+)
+_signal_storage = SessionStore(
+    max_entries=_config.session_store_max_entries,
+    ttl_seconds=_config.session_store_ttl_seconds,
+)
+
+
+def get_session_store_stats() -> dict:
+    """Size and eviction counters of the snapshot and signal stores."""
+    return {
+        "snapshots": _snapshot_storage.stats().to_dict(),
+        "signals": _signal_storage.stats().to_dict(),
+    }
 
 
 # =============================================================================
@@ -286,17 +294,13 @@ def store_signal_for_session(
     Store signal info for trend comparison.
 
     Args:
-        session_id: Session identifier (parlay_id)
+        session_id: Client session identifier
         signal_info: Current signal info dict with 'signal' and 'fragilityScore'
     """
-    global _signal_storage
-    if "_signal_storage" not in globals():
-        _signal_storage = {}
-    
-    _signal_storage[session_id] = {
+    _signal_storage.put(session_id, {
         "signal": signal_info.get("signal", "yellow"),
         "fragility_score": signal_info.get("fragilityScore", 50),
-    }
+    })
 
 
 def get_previous_signal_for_session(
@@ -308,10 +312,6 @@ def get_previous_signal_for_session(
     Returns:
         Previous signal dict with 'signal' and 'fragility_score', or None
     """
-    global _signal_storage
-    if "_signal_storage" not in globals():
-        return None
-    
     return _signal_storage.get(session_id)
 
 
@@ -376,7 +376,3 @@ def compute_confidence_trend(
         "trend": trend,
         "trend_text": trend_text,
     }
-
-
-# Module-level storage for signal tracking
-_signal_storage: dict[str, dict] = {}
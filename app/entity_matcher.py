@@ -0,0 +1,168 @@
+# app/entity_matcher.py
+"""
+Compiled keyword matcher for entity recognition.
+
+Builds an Aho-Corasick automaton over a fixed keyword set ONCE and then
+finds every keyword occurrence in a single left-to-right pass over the text.
+Cost per call is proportional to the text length (plus the number of hits),
+not to the number of keywords, so full league rosters do not slow parsing.
+
+Matching rules mirror the heuristics the pipeline has always used:
+- any keyword may match as a plain substring ("nets" is found in "hornets")
+- short keywords additionally report whether an occurrence sits on regex
+  word boundaries, i.e. the same result as re.search(r'\\b' + key + r'\\b')
+
+The matcher does not know about teams, players or markets. Callers map the
+returned keys onto their own lookup tables.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as the `re` module's \\w for str."""
+    return ch.isalnum() or ch == "_"
+
+
+def _at_word_boundary(text: str, pos: int) -> bool:
+    """Equivalent of a regex \\b assertion at position `pos` of `text`."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+@dataclass(frozen=True)
+class KeywordHits:
+    """
+    Keywords found in one scan.
+
+    - found: keywords that occur anywhere in the text (substring semantics)
+    - bounded: keywords with at least one occurrence on word boundaries
+    """
+    found: frozenset
+    bounded: frozenset
+
+    def matches(self, key: str, boundary_max_len: int = 3) -> bool:
+        """
+        Apply the pipeline's keyword rule: keys up to `boundary_max_len`
+        characters need a word-boundary match, longer keys a substring match.
+        """
+        if len(key) <= boundary_max_len:
+            return key in self.bounded
+        return key in self.found
+
+    @classmethod
+    def collect(
+        cls,
+        text: str,
+        occurrences: Iterable[tuple[int, int, str]],
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> "KeywordHits":
+        """
+        Build hits from `KeywordMatcher.find_all` output, restricted to the
+        span text[start:end].
+
+        Word boundaries are checked against the full text, so a span that is
+        delimited by whitespace or punctuation behaves exactly as if it had
+        been scanned on its own.
+        """
+        if end is None:
+            end = len(text)
+        found: set[str] = set()
+        bounded: set[str] = set()
+        for occ_start, occ_end, key in occurrences:
+            if occ_start < start or occ_end > end:
+                continue
+            found.add(key)
+            if key not in bounded and _at_word_boundary(text, occ_start) and _at_word_boundary(text, occ_end):
+                bounded.add(key)
+        return cls(found=frozenset(found), bounded=frozenset(bounded))
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of lowercase keywords.
+
+    The goto/failure functions are folded into a complete transition table
+    at build time, so scanning is one dict lookup per character.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._keywords: tuple[str, ...] = tuple(dict.fromkeys(k for k in keywords if k))
+
+        # Trie of all keywords
+        trie: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for key_index, key in enumerate(self._keywords):
+            state = 0
+            for ch in key:
+                nxt = trie[state].get(ch)
+                if nxt is None:
+                    nxt = len(trie)
+                    trie[state][ch] = nxt
+                    trie.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(key_index)
+
+        # Failure links in BFS order (parents before children)
+        fail = [0] * len(trie)
+        order: list[int] = []
+        queue: deque[int] = deque(trie[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, child in trie[state].items():
+                queue.append(child)
+                link = fail[state]
+                while link and ch not in trie[link]:
+                    link = fail[link]
+                fail[child] = trie[link].get(ch, 0)
+                outputs[child].extend(outputs[fail[child]])
+
+        # Fold failure links into a complete transition table
+        transitions: list[dict[str, int]] = [dict(trie[0])] + [{} for _ in trie[1:]]
+        for state in order:
+            table = dict(transitions[fail[state]])
+            table.update(trie[state])
+            transitions[state] = table
+
+        self._transitions = transitions
+        self._outputs: list[tuple[int, ...]] = [tuple(o) for o in outputs]
+        self._lengths: tuple[int, ...] = tuple(len(k) for k in self._keywords)
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        """Keywords compiled into this matcher, in insertion order."""
+        return self._keywords
+
+    def find_all(self, text: str) -> list[tuple[int, int, str]]:
+        """
+        Return every keyword occurrence in `text` as (start, end, key).
+
+        Overlapping occurrences are all reported, so "los angeles lakers"
+        yields both "los angeles lakers" and "lakers". Occurrences are
+        ordered by end position.
+        """
+        transitions = self._transitions
+        outputs = self._outputs
+        keywords = self._keywords
+        lengths = self._lengths
+
+        occurrences: list[tuple[int, int, str]] = []
+        state = 0
+        for end, ch in enumerate(text, 1):
+            state = transitions[state].get(ch, 0)
+            hits = outputs[state]
+            if hits:
+                for key_index in hits:
+                    occurrences.append((end - lengths[key_index], end, keywords[key_index]))
+        return occurrences
+
+    def scan(self, text: str) -> KeywordHits:
+        """Find every keyword occurring in `text` (expected to be lowercased)."""
+        return KeywordHits.collect(text, self.find_all(text))
@@ -0,0 +1,140 @@
+# app/evaluation_cache.py
+"""
+Evaluation Result Cache - content-addressed LRU+TTL cache for run_evaluation.
+
+Popular slips (same-game parlays, copied picks) are evaluated over and over.
+Everything run_evaluation produces is a pure function of:
+- the slip text (legs, markets and entities are parsed from it)
+- the tier
+- the canonical legs (builder mode)
+- the version (sport, source, as_of) of the context snapshot that was applied
+- the Sherlock / DNA feature flags
+
+so a fingerprint over those inputs addresses the full response. A new
+context snapshot changes the fingerprint, which invalidates every entry that
+was built on the old availability data without any explicit purge.
+
+Design Principles:
+1. Bounded and expiring — an LRU+TTL map (app/bounded_cache.py)
+2. Observable — hits and misses are reported through
+   persistence.metrics.record_cache_result (cache="evaluation"), buffered
+   and written off the lookup path in batches; in-memory counters are also
+   served by /metrics/evaluation-cache
+3. Cached values are shared; callers must treat them as read-only
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from threading import Lock, Thread
+from typing import Any, Hashable, Optional
+
+from app.bounded_cache import BoundedTTLCache
+
+_logger = logging.getLogger(__name__)
+
+# Metrics label used for hit/miss counters
+CACHE_NAME = "evaluation"
+
+
+def evaluation_fingerprint(
+    text: str,
+    tier: str,
+    canonical_legs: Optional[tuple] = None,
+    context_version: Optional[tuple] = None,
+    flags: tuple = (),
+) -> str:
+    """
+    Canonical fingerprint of everything an evaluation result depends on.
+
+    Args:
+        text: Normalized slip text the legs were parsed from
+        tier: Tier value ("good", "better", "best")
+        canonical_legs: Builder legs (frozen dataclasses) or None
+        context_version: (sport, source, as_of ISO) per applied snapshot,
+            or None when no context applies to the slip
+        flags: Feature flags that change the response shape
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        [
+            text,
+            tier,
+            [asdict(leg) for leg in canonical_legs] if canonical_legs else None,
+            list(context_version) if context_version else None,
+            list(flags),
+        ],
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EvaluationCache(BoundedTTLCache):
+    """
+    Result cache for run_evaluation, keyed by evaluation_fingerprint.
+
+    max_entries <= 0 disables the cache: get() always misses and put() is a
+    no-op, so callers never need a separate code path.
+
+    Every lookup of an enabled cache is reported as a hit or miss. Results
+    are buffered and, every `report_batch` lookups, written by a background
+    thread, so a lookup never waits on the metrics DB.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300,
+        report_metrics: bool = True,
+        report_batch: int = 32,
+    ):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._report_metrics = report_metrics
+        self._report_batch = max(1, report_batch)
+        self._pending: list[bool] = []
+        self._pending_lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for `key` (None on a miss) and report the lookup."""
+        value = super().get(key)
+        if self.enabled and self._report_metrics:
+            self._report(value is not None)
+        return value
+
+    def flush_metrics(self) -> None:
+        """Write buffered hit/miss reports now (on shutdown, or in tests)."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        _write_cache_results(pending)
+
+    def _report(self, hit: bool) -> None:
+        """Buffer a hit/miss; hand a full batch to a background writer."""
+        with self._pending_lock:
+            self._pending.append(hit)
+            if len(self._pending) < self._report_batch:
+                return
+            pending, self._pending = self._pending, []
+        Thread(
+            target=_write_cache_results,
+            args=(pending,),
+            name="evaluation-cache-metrics",
+            daemon=True,
+        ).start()
+
+
+def _write_cache_results(results: list[bool]) -> None:
+    """Report buffered lookups to persistence metrics (never raises)."""
+    if not results:
+        return
+    try:
+        from persistence.metrics import record_cache_result
+
+        for hit in results:
+            record_cache_result(hit, cache_name=CACHE_NAME)
+    except Exception as e:
+        _logger.debug(f"Failed to record evaluation cache metrics: {e}")
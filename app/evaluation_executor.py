@@ -0,0 +1,56 @@
+# app/evaluation_executor.py
+"""
+Evaluation Executor - bounded worker pool for blocking evaluation work.
+
+The evaluation routes are `async def`, but the pipeline is synchronous: the
+engine is CPU-bound and the context stage persists alerts to SQLite. Running
+that on the event loop stalls every other request on the worker. Routes
+hand that work to this executor instead, so the loop stays free to accept
+and serve requests while up to EVAL_EXECUTOR_WORKERS evaluations run.
+
+The pool is created lazily on first use and sized from AppConfig.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from app.config import load_config
+
+_logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def get_evaluation_executor() -> ThreadPoolExecutor:
+    """Get the process-wide evaluation executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = load_config(fail_fast=False).eval_executor_workers
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evaluation")
+                _logger.info(f"Evaluation executor started with {workers} worker(s)")
+    return _executor
+
+
+async def run_in_evaluation_executor(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking callable on the evaluation executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_evaluation_executor(), functools.partial(fn, *args, **kwargs)
+    )
+
+
+def shutdown_evaluation_executor(wait: bool = True) -> None:
+    """Stop the executor (app shutdown / tests). A later call recreates it."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
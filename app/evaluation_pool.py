@@ -0,0 +1,373 @@
+# app/evaluation_pool.py
+"""
+Evaluation Pool - optional process-pool backend for /app/evaluate.
+
+The thread executor (app/evaluation_executor.py) keeps the event loop free,
+but every evaluation still shares one GIL. With EVAL_BACKEND=process the
+pipeline runs in a pool of worker processes instead, so CPU-bound
+evaluation scales with cores.
+
+- Workers are forked from a forkserver that has already imported
+  app.pipeline (compiled matchers, entity tables); each worker then loads
+  the DNA contract once in its initializer. All workers are started with
+  the pool, not on the first requests.
+- Requests and responses cross the process boundary in a compact form:
+  EvaluationTask carries plain strings and tuples, and the worker returns
+  the plain dict of the PipelineResponse instead of the dataclasses.
+- Workers send their per-stage timings back with each response and the
+  parent records them, so /metrics/stages covers pooled evaluations.
+- Batches resolve context once in the parent and ship the snapshots with
+  each task, so items run concurrently across workers without every
+  worker fetching the same sports.
+- Backpressure: at most EVAL_PROCESS_MAX_PENDING tasks may be queued or
+  running. Beyond that EvaluationPoolBusy is raised (routes answer 503).
+- Each task is bounded by EVAL_TASK_TIMEOUT_SECONDS (EvaluationTimeout).
+- If the pool breaks (a worker died) or is shut down, evaluation falls
+  back to the in-process thread executor and the pool is rebuilt on the
+  next call.
+
+Each worker has its own result cache and context service. Session-bound
+inputs (session_id set) always run in-process: the session stores behind
+the change delta and confidence trend (app/session_store.py) live in the
+parent process, not in whichever worker a request happens to land on.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, astuple, dataclass, replace
+from threading import Lock
+from typing import Optional, Sequence
+
+from app.airlock import CanonicalLegData, NormalizedInput, Tier
+from app.config import load_config
+from app.evaluation_executor import run_in_evaluation_executor
+from app.pipeline import (
+    BatchItemResult,
+    context_snapshots_for_batch,
+    run_evaluation,
+    run_evaluation_async,
+    run_evaluation_batch,
+)
+from app.stage_latency import record_stage_timings
+
+_logger = logging.getLogger(__name__)
+
+
+class EvaluationPoolBusy(Exception):
+    """Raised when the pool already holds its maximum of pending tasks."""
+
+    pass
+
+
+class EvaluationTimeout(Exception):
+    """Raised when a pooled evaluation exceeds its time budget."""
+
+    pass
+
+
+# =============================================================================
+# Wire Format
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class EvaluationTask:
+    """
+    Picklable evaluation request.
+
+    canonical_legs holds CanonicalLegData field tuples; fields holds sorted
+    PIPELINE_FIELDS names, or None for the full response. snapshots holds
+    the ContextSnapshots a batch resolved for this slip, or None to let
+    the worker fetch context itself.
+    """
+    input_text: str
+    tier: str
+    session_id: Optional[str] = None
+    canonical_legs: Optional[tuple] = None
+    fields: Optional[tuple] = None
+    snapshots: Optional[tuple] = None
+
+    @classmethod
+    def from_input(
+        cls,
+        normalized: NormalizedInput,
+        fields: Optional[frozenset] = None,
+        snapshots: Optional[tuple] = None,
+    ) -> EvaluationTask:
+        legs = None
+        if normalized.canonical_legs is not None:
+            legs = tuple(astuple(leg) for leg in normalized.canonical_legs)
+        return cls(
+            input_text=normalized.input_text,
+            tier=normalized.tier.value,
+            session_id=normalized.session_id,
+            canonical_legs=legs,
+            fields=tuple(sorted(fields)) if fields is not None else None,
+            snapshots=snapshots,
+        )
+
+    def to_input(self) -> NormalizedInput:
+        legs = None
+        if self.canonical_legs is not None:
+            legs = tuple(CanonicalLegData(*values) for values in self.canonical_legs)
+        return NormalizedInput(
+            input_text=self.input_text,
+            tier=Tier(self.tier),
+            session_id=self.session_id,
+            canonical_legs=legs,
+        )
+
+    @property
+    def field_set(self) -> Optional[frozenset]:
+        return frozenset(self.fields) if self.fields is not None else None
+
+
+# =============================================================================
+# Worker Side
+# =============================================================================
+
+
+def _init_worker() -> None:
+    """Warm a worker process once, before it takes tasks."""
+    from app.dna.contract_validator import get_contract_version
+    get_contract_version()  # loads and caches the DNA contract
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _evaluate_task(task: EvaluationTask) -> tuple[dict, float]:
+    """
+    Worker entry point: run the pipeline.
+
+    Returns the plain response dict and the call's wall-clock milliseconds,
+    so the parent can record the stage timings (timings_ms) in its own
+    latency histograms.
+    """
+    start = time.perf_counter()
+    response = run_evaluation(task.to_input(), fields=task.field_set, snapshots=task.snapshots)
+    return asdict(response), (time.perf_counter() - start) * 1000
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+
+
+class EvaluationPool:
+    """
+    A warmed ProcessPoolExecutor with backpressure and per-task timeouts.
+
+    Args:
+        workers: Worker processes (0 = one per CPU)
+        max_pending: Queued + running tasks allowed before EvaluationPoolBusy
+        timeout_seconds: Time budget per task
+    """
+
+    def __init__(self, workers: int = 0, max_pending: int = 64, timeout_seconds: float = 30):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.timeout_seconds = timeout_seconds
+        self._pending = 0
+        self._lock = Lock()
+        self._executor = self._start()
+
+    def _start(self) -> ProcessPoolExecutor:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        if context.get_start_method() == "forkserver":
+            context.set_forkserver_preload(["app.pipeline"])
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=context, initializer=_init_worker
+        )
+        # One submit per worker starts them all now rather than on demand
+        for _ in range(self.workers):
+            executor.submit(_ping)
+        _logger.info(f"Evaluation pool started with {self.workers} worker process(es)")
+        return executor
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def evaluate(self, task: EvaluationTask) -> dict:
+        """
+        Run one task in a worker and record its stage timings here.
+
+        Raises:
+            EvaluationPoolBusy: If max_pending tasks are already in flight
+            EvaluationTimeout: If the task exceeds timeout_seconds
+            BrokenProcessPool: If a worker died
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise EvaluationPoolBusy(f"{self._pending} evaluations pending")
+            self._pending += 1
+        try:
+            future = self._executor.submit(_evaluate_task, task)
+        except BaseException as e:
+            self._release(None)
+            if isinstance(e, RuntimeError) and not isinstance(e, BrokenProcessPool):
+                raise BrokenProcessPool(str(e)) from e  # submitted after shutdown
+            raise
+        # A timed-out task keeps its slot until the worker actually finishes it
+        future.add_done_callback(self._release)
+        try:
+            payload, total_ms = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            raise EvaluationTimeout(f"Evaluation exceeded {self.timeout_seconds}s") from None
+        record_stage_timings(payload["timings_ms"], total_ms=total_ms)
+        return payload
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# =============================================================================
+# Process-wide Pool
+# =============================================================================
+
+
+_pool: Optional[EvaluationPool] = None
+_backend: Optional[str] = None
+_pool_lock = Lock()
+
+
+def process_backend_enabled() -> bool:
+    """True when EVAL_BACKEND=process (read once, reset by shutdown)."""
+    global _backend
+    if _backend is None:
+        _backend = load_config(fail_fast=False).eval_backend
+    return _backend == "process"
+
+
+def get_evaluation_pool() -> Optional[EvaluationPool]:
+    """Get the process-wide pool, creating it on first use; None with the thread backend."""
+    global _pool
+    if _pool is None and process_backend_enabled():
+        with _pool_lock:
+            if _pool is None:
+                config = load_config(fail_fast=False)
+                _pool = EvaluationPool(
+                    workers=config.eval_process_workers,
+                    max_pending=config.eval_process_max_pending,
+                    timeout_seconds=config.eval_task_timeout_seconds,
+                )
+    return _pool
+
+
+def _discard_pool(pool: EvaluationPool) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+async def run_evaluation_payload(
+    normalized: NormalizedInput,
+    fields: Optional[frozenset] = None,
+) -> dict:
+    """
+    Evaluate one slip on the configured backend.
+
+    Returns asdict(PipelineResponse). Raises EvaluationPoolBusy /
+    EvaluationTimeout from the process backend; a broken pool falls back
+    to in-process evaluation. Session-bound inputs run in-process.
+    """
+    pool = get_evaluation_pool()
+    if pool is not None and normalized.session_id is None:
+        try:
+            return await pool.evaluate(EvaluationTask.from_input(normalized, fields))
+        except BrokenProcessPool as e:
+            _logger.warning(f"Evaluation pool unavailable ({e}); evaluating in-process")
+            _discard_pool(pool)
+    return asdict(await run_evaluation_async(normalized, fields=fields))
+
+
+def _batch_item(index: int, outcome) -> BatchItemResult:
+    """BatchItemResult for one pooled item (a response dict or the exception)."""
+    if isinstance(outcome, EvaluationPoolBusy):
+        return BatchItemResult(index=index, error=str(outcome), error_code="EVALUATION_BUSY")
+    if isinstance(outcome, EvaluationTimeout):
+        return BatchItemResult(index=index, error=str(outcome), error_code="EVALUATION_TIMEOUT")
+    if isinstance(outcome, BaseException):
+        _logger.warning(f"Batch item {index} failed: {outcome}")
+        return BatchItemResult(index=index, error=str(outcome), error_code="EVALUATION_FAILED")
+    return BatchItemResult(index=index, response=outcome)
+
+
+async def run_evaluation_batch_payload(
+    inputs: Sequence[NormalizedInput],
+    fields: Optional[frozenset] = None,
+) -> list[BatchItemResult]:
+    """
+    Evaluate a batch on the configured backend.
+
+    Returns one BatchItemResult per input, in order, with
+    asdict(PipelineResponse) as the response. With the process backend
+    context is resolved once for the batch and the items run concurrently
+    on the pool; a busy pool or a timeout fails only the affected items.
+    Session-bound items, and every item on the thread backend, run in
+    order through run_evaluation_batch on the executor.
+    """
+    pool = get_evaluation_pool()
+    if pool is not None:
+        pooled = [index for index, normalized in enumerate(inputs) if normalized.session_id is None]
+        local = [index for index, normalized in enumerate(inputs) if normalized.session_id is not None]
+        snapshots = await run_in_evaluation_executor(
+            context_snapshots_for_batch, [inputs[index] for index in pooled]
+        )
+        *outcomes, local_batch = await asyncio.gather(
+            *(
+                pool.evaluate(EvaluationTask.from_input(inputs[index], fields, item_snapshots))
+                for index, item_snapshots in zip(pooled, snapshots, strict=True)
+            ),
+            _run_batch_in_process([inputs[index] for index in local], fields),
+            return_exceptions=True,
+        )
+        if isinstance(local_batch, BaseException):
+            raise local_batch
+        if any(isinstance(outcome, BrokenProcessPool) for outcome in outcomes):
+            _logger.warning("Evaluation pool unavailable; evaluating batch in-process")
+            _discard_pool(pool)
+            fallback = await _run_batch_in_process([inputs[index] for index in pooled], fields)
+            results = [replace(item, index=index) for index, item in zip(pooled, fallback, strict=True)]
+        else:
+            results = [_batch_item(index, outcome) for index, outcome in zip(pooled, outcomes, strict=True)]
+        results.extend(replace(item, index=index) for index, item in zip(local, local_batch, strict=True))
+        return sorted(results, key=lambda item: item.index)
+
+    return await _run_batch_in_process(inputs, fields)
+
+
+async def _run_batch_in_process(
+    inputs: Sequence[NormalizedInput],
+    fields: Optional[frozenset],
+) -> list[BatchItemResult]:
+    if not inputs:
+        return []
+    batch = await run_in_evaluation_executor(run_evaluation_batch, inputs, fields=fields)
+    return [replace(item, response=asdict(item.response)) if item.ok else item for item in batch]
+
+
+def shutdown_evaluation_pool(wait: bool = True) -> None:
+    """Stop the pool (app shutdown / tests). A later call recreates it."""
+    global _pool, _backend
+    with _pool_lock:
+        pool, _pool, _backend = _pool, None, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
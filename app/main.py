@@ -114,10 +114,25 @@ app.include_router(metrics.router)
 # S18: Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables."""
+    """Initialize database tables and, with EVAL_BACKEND=process, the evaluation pool."""
     from app.models import init_db
     init_db()
     print("✅ Database initialized")
+    from app.evaluation_pool import get_evaluation_pool
+    get_evaluation_pool()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop evaluation workers, flush cache metrics and close the context HTTP client."""
+    from app.evaluation_executor import shutdown_evaluation_executor
+    from app.evaluation_pool import shutdown_evaluation_pool
+    from app.pipeline import get_evaluation_cache
+    from context.providers import http
+    shutdown_evaluation_executor(wait=False)
+    shutdown_evaluation_pool(wait=False)
+    get_evaluation_cache().flush_metrics()
+    http.close()
 
 
 @app.get("/health")
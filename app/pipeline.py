@@ -22,8 +22,10 @@ Routes should NOT:
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
-from typing import Optional
+import re
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Sequence
 from uuid import uuid4
 
 from app.airlock import NormalizedInput, Tier
@@ -36,10 +38,20 @@ from core.models.leading_light import (
     ContextModifier,
     ContextModifiers,
 )
+from core.parlay_reducer import build_parlay_state
+from core.risk_inductor import RiskInductor
+from core.sensitivity import LegSensitivity, compute_leave_one_out
 
 # Context ingestion (Sprint 3)
-from context.service import get_context
-from context.apply import apply_context, ContextImpact
+from context.service import (
+    get_context,
+    get_context_async,
+    get_context_many,
+    get_context_many_async,
+    get_context_service,
+)
+from context.snapshot import ContextSnapshot
+from context.apply import apply_context_many, ContextImpact
 
 # Alerts (Sprint 4)
 from alerts.service import check_for_alerts
@@ -80,6 +92,21 @@ from app.delta_engine import (
 # Grounding Score Engine (Ticket 38B-C2)
 from app.grounding_score import compute_grounding_score
 
+# Compiled entity matcher (single-pass keyword scan)
+from app.entity_matcher import KeywordHits, KeywordMatcher
+
+# Stage graph (lazy, dependency-driven run_evaluation)
+from app.stage_graph import Stage, StageGraph
+
+# Evaluation result cache (content-addressed, context-versioned)
+from app.evaluation_cache import EvaluationCache, evaluation_fingerprint
+
+# Per-stage latency histograms
+from app.stage_latency import record_stage_timings
+
+# Bounded executor for off-loop evaluation (async routes)
+from app.evaluation_executor import run_in_evaluation_executor
+
 _logger = logging.getLogger(__name__)
 
 # Load config for feature flags (Ticket 17)
@@ -182,10 +209,16 @@ class PipelineResponse:
     # Ticket 38B-C2: Grounding score (breakdown of output sources)
     grounding_score: Optional[dict] = None
 
+    # Per-leg impact bar (fragility without each leg)
+    leg_impact: Optional[list] = None
+
     # Metadata
     leg_count: int = 0
     tier: str = "good"
 
+    # Per-stage wall-clock milliseconds for this call (not part of the result)
+    timings_ms: Optional[dict] = field(default=None, compare=False)
+
 
 # =============================================================================
 # Evaluation Context (Ticket 28 — Single Source of Truth)
@@ -379,12 +412,138 @@ _SPORT_KEYWORDS = {
 }
 
 
-def _keyword_match(key: str, text: str) -> bool:
-    """Match keyword in text, using word boundary for short keys (<=3 chars)."""
-    import re
-    if len(key) <= 3:
-        return bool(re.search(r'\b' + re.escape(key) + r'\b', text))
-    return key in text
+# Ticket A1: prop abbreviations and full stat words (substring match per leg)
+_PROP_KEYWORDS = (
+    'pts', 'reb', 'ast', 'blk', 'stl', 'to',  # Common abbreviations
+    '3pm', '3pa', 'fgm', 'fga', 'ftm', 'fta',  # Shooting stats
+    'pra', 'pr', 'ra', 'pa',  # Combo props
+    'yards', 'points', 'rebounds', 'assists', 'touchdowns', 'td',  # Full words
+    'tds', 'threes', '3pt', 'steals', 'blocks', 'strikeouts',
+    'home run', 'hr', 'rbi', 'hits', 'receptions', 'rec',
+)
+
+# Over/under keywords that mark a game total (substring match per leg)
+_TOTAL_KEYWORDS = ('over', 'under', 'o/', 'u/')
+
+# Sprint 3: NBA names used for context lookups (substring match, table order)
+_CONTEXT_NBA_TEAMS = {
+    "lakers": "LAL", "lal": "LAL", "los angeles lakers": "LAL",
+    "celtics": "BOS", "bos": "BOS", "boston": "BOS",
+    "nuggets": "DEN", "den": "DEN", "denver": "DEN",
+    "bucks": "MIL", "mil": "MIL", "milwaukee": "MIL",
+    "warriors": "GSW", "gsw": "GSW", "golden state": "GSW",
+    "suns": "PHX", "phx": "PHX", "phoenix": "PHX",
+    "76ers": "PHI", "phi": "PHI", "sixers": "PHI", "philadelphia": "PHI",
+    "mavericks": "DAL", "dal": "DAL", "dallas": "DAL", "mavs": "DAL",
+    "heat": "MIA", "mia": "MIA", "miami": "MIA",
+    "nets": "BKN", "bkn": "BKN", "brooklyn": "BKN",
+    "knicks": "NYK", "nyk": "NYK", "new york": "NYK",
+    "bulls": "CHI", "chi": "CHI", "chicago": "CHI",
+    "clippers": "LAC", "lac": "LAC",
+    "thunder": "OKC", "okc": "OKC", "oklahoma": "OKC",
+    "timberwolves": "MIN", "min": "MIN", "minnesota": "MIN", "wolves": "MIN",
+    "kings": "SAC", "sac": "SAC", "sacramento": "SAC",
+    "pelicans": "NOP", "nop": "NOP", "new orleans": "NOP",
+    "grizzlies": "MEM", "mem": "MEM", "memphis": "MEM",
+    "cavaliers": "CLE", "cle": "CLE", "cleveland": "CLE", "cavs": "CLE",
+    "hawks": "ATL", "atl": "ATL", "atlanta": "ATL",
+    "raptors": "TOR", "tor": "TOR", "toronto": "TOR",
+    "pacers": "IND", "ind": "IND", "indiana": "IND",
+    "hornets": "CHA", "cha": "CHA", "charlotte": "CHA",
+    "wizards": "WAS", "was": "WAS", "washington": "WAS",
+    "magic": "ORL", "orl": "ORL", "orlando": "ORL",
+    "pistons": "DET", "det": "DET", "detroit": "DET",
+    "jazz": "UTA", "uta": "UTA", "utah": "UTA",
+    "rockets": "HOU", "hou": "HOU", "houston": "HOU",
+    "spurs": "SAS", "sas": "SAS", "san antonio": "SAS",
+    "trail blazers": "POR", "por": "POR", "portland": "POR", "blazers": "POR",
+}
+
+# Sprint 3: NBA player keys for context lookups (substring match, list order)
+_CONTEXT_NBA_PLAYERS = (
+    "lebron james", "lebron", "anthony davis", "ad",
+    "jaylen brown", "jayson tatum", "tatum",
+    "nikola jokic", "jokic", "jamal murray",
+    "giannis", "giannis antetokounmpo", "damian lillard", "lillard", "dame",
+    "stephen curry", "curry", "steph", "klay thompson",
+    "kevin durant", "durant", "kd", "devin booker", "booker",
+    "joel embiid", "embiid", "tyrese maxey", "maxey",
+    "luka doncic", "luka", "doncic", "kyrie irving", "kyrie",
+)
+
+# Nickname → full name for context lookup (other keys are title-cased)
+_CONTEXT_PLAYER_NAMES = {
+    "lebron": "LeBron James", "ad": "Anthony Davis",
+    "tatum": "Jayson Tatum", "jokic": "Nikola Jokic",
+    "giannis": "Giannis Antetokounmpo", "lillard": "Damian Lillard",
+    "dame": "Damian Lillard", "curry": "Stephen Curry",
+    "steph": "Stephen Curry", "durant": "Kevin Durant",
+    "kd": "Kevin Durant", "booker": "Devin Booker",
+    "embiid": "Joel Embiid", "maxey": "Tyrese Maxey",
+    "luka": "Luka Doncic", "doncic": "Luka Doncic",
+    "kyrie": "Kyrie Irving",
+}
+
+# Words that mark a slip as NBA for context fetching
+_NBA_CONTEXT_HINTS = ("nba", "basketball", "points", "rebounds", "assists")
+
+
+# -----------------------------------------------------------------------------
+# Compiled matcher — built ONCE at import time
+# -----------------------------------------------------------------------------
+# Every team, player, market and sport keyword goes into a single automaton,
+# so recognize_entities scans the text once regardless of dictionary size.
+# Each table keeps its legacy resolution order (longest key first, then
+# insertion order) via a precomputed rank.
+
+_ENTITY_MATCHER = KeywordMatcher(
+    list(_NBA_TEAMS) + list(_NFL_TEAMS) + list(_NBA_PLAYERS) + list(_NFL_PLAYERS)
+    + list(_MARKET_KEYWORDS) + list(_SPORT_KEYWORDS)
+    + list(_PROP_KEYWORDS) + list(_TOTAL_KEYWORDS)
+    + list(_CONTEXT_NBA_TEAMS) + list(_CONTEXT_NBA_PLAYERS) + list(_NBA_CONTEXT_HINTS)
+)
+
+
+def _rank_by_length(table: dict) -> dict[str, int]:
+    """Rank table keys longest first (stable), matching the legacy scan order."""
+    return {key: rank for rank, key in enumerate(sorted(table, key=len, reverse=True))}
+
+
+_NBA_TEAM_RANK = _rank_by_length(_NBA_TEAMS)
+_NFL_TEAM_RANK = _rank_by_length(_NFL_TEAMS)
+_NBA_PLAYER_RANK = _rank_by_length(_NBA_PLAYERS)
+_NFL_PLAYER_RANK = _rank_by_length(_NFL_PLAYERS)
+_MARKET_RANK = _rank_by_length(_MARKET_KEYWORDS)
+_SPORT_RANK = {key: rank for rank, key in enumerate(_SPORT_KEYWORDS)}
+
+# Table (insertion) order, used where the legacy scan broke on the first hit
+_NBA_TEAM_ORDER = {key: rank for rank, key in enumerate(_NBA_TEAMS)}
+_NFL_TEAM_ORDER = {key: rank for rank, key in enumerate(_NFL_TEAMS)}
+_CONTEXT_TEAM_ORDER = {key: rank for rank, key in enumerate(_CONTEXT_NBA_TEAMS)}
+_CONTEXT_PLAYER_ORDER = {key: rank for rank, key in enumerate(_CONTEXT_NBA_PLAYERS)}
+_PROP_KEYWORD_SET = frozenset(_PROP_KEYWORDS)
+_TOTAL_KEYWORD_SET = frozenset(_TOTAL_KEYWORDS)
+
+# Leg delimiters: " + " (not +3.5), commas, " and "
+_LEG_DELIMITER_PATTERN = re.compile(r'\s+\+\s+|\s*,\s*|\s+and\s+')
+
+# O/U with a number (e.g. "O27.5", "U10")
+_OU_PATTERN = re.compile(r'\b[ou]\d+\.?\d*')
+
+# Pattern-based spread detection: +/-N.N (e.g. -5.5, +3)
+_SPREAD_PATTERN = re.compile(r'[+-]\d+\.?\d*')
+
+
+def _resolve_hits(hits: KeywordHits, table: dict, rank: dict[str, int]) -> list:
+    """
+    Map matched keys onto table values in the table's rank order.
+
+    Short keys (<=3 chars) require a word-boundary match, longer keys a
+    substring match — the same rule the per-key regex scan applied.
+    """
+    keys = [key for key in hits.found if key in rank and hits.matches(key)]
+    keys.sort(key=rank.__getitem__)
+    return [table[key] for key in keys]
 
 
 def recognize_entities(text: str) -> dict:
@@ -395,68 +554,58 @@ def recognize_entities(text: str) -> dict:
         dict with sport_guess, teams_mentioned, players_mentioned, markets_detected
     """
     text_lower = text.lower()
+    return _entities_from_hits(text_lower, _ENTITY_MATCHER.scan(text_lower))
+
 
+def _entities_from_hits(text_lower: str, hits: KeywordHits) -> dict:
+    """Resolve a keyword scan of the full slip into the entities dict."""
     # --- Teams ---
     teams_found: list[str] = []
     nba_team_hits = 0
     nfl_team_hits = 0
 
-    # Check NBA teams (longer keys first to avoid partial matches)
-    for key in sorted(_NBA_TEAMS.keys(), key=len, reverse=True):
-        if _keyword_match(key, text_lower):
-            abbr = _NBA_TEAMS[key]
-            if abbr not in teams_found:
-                teams_found.append(abbr)
-                nba_team_hits += 1
-
-    # Check NFL teams
-    for key in sorted(_NFL_TEAMS.keys(), key=len, reverse=True):
-        if _keyword_match(key, text_lower):
-            abbr = _NFL_TEAMS[key]
-            if abbr not in teams_found:
-                teams_found.append(abbr)
-                nfl_team_hits += 1
+    for abbr in _resolve_hits(hits, _NBA_TEAMS, _NBA_TEAM_RANK):
+        if abbr not in teams_found:
+            teams_found.append(abbr)
+            nba_team_hits += 1
+
+    for abbr in _resolve_hits(hits, _NFL_TEAMS, _NFL_TEAM_RANK):
+        if abbr not in teams_found:
+            teams_found.append(abbr)
+            nfl_team_hits += 1
 
     # --- Players ---
     players_found: list[str] = []
     nba_player_hits = 0
     nfl_player_hits = 0
 
-    for key in sorted(_NBA_PLAYERS.keys(), key=len, reverse=True):
-        if _keyword_match(key, text_lower):
-            name = _NBA_PLAYERS[key]
-            if name not in players_found:
-                players_found.append(name)
-                nba_player_hits += 1
+    for name in _resolve_hits(hits, _NBA_PLAYERS, _NBA_PLAYER_RANK):
+        if name not in players_found:
+            players_found.append(name)
+            nba_player_hits += 1
 
-    for key in sorted(_NFL_PLAYERS.keys(), key=len, reverse=True):
-        if _keyword_match(key, text_lower):
-            name = _NFL_PLAYERS[key]
-            if name not in players_found:
-                players_found.append(name)
-                nfl_player_hits += 1
+    for name in _resolve_hits(hits, _NFL_PLAYERS, _NFL_PLAYER_RANK):
+        if name not in players_found:
+            players_found.append(name)
+            nfl_player_hits += 1
 
     # --- Markets ---
     markets_found: list[str] = []
-    for key in sorted(_MARKET_KEYWORDS.keys(), key=len, reverse=True):
-        if _keyword_match(key, text_lower):
-            market = _MARKET_KEYWORDS[key]
-            if market not in markets_found:
-                markets_found.append(market)
+    for market in _resolve_hits(hits, _MARKET_KEYWORDS, _MARKET_RANK):
+        if market not in markets_found:
+            markets_found.append(market)
 
     # Pattern-based spread detection: +/-N.N (e.g. -5.5, +3)
-    import re
-    if "spread" not in markets_found and re.search(r'[+-]\d+\.?\d*', text_lower):
+    if "spread" not in markets_found and _SPREAD_PATTERN.search(text_lower):
         markets_found.append("spread")
 
     # --- Sport guess ---
     sport_guess = "unknown"
 
-    # Explicit sport keyword takes priority
-    for key, sport in _SPORT_KEYWORDS.items():
-        if key in text_lower:
-            sport_guess = sport
-            break
+    # Explicit sport keyword takes priority (first in table order, substring match)
+    sport_keys = [key for key in hits.found if key in _SPORT_RANK]
+    if sport_keys:
+        sport_guess = _SPORT_KEYWORDS[min(sport_keys, key=_SPORT_RANK.__getitem__)]
 
     # Infer from entity evidence if still unknown
     if sport_guess == "unknown":
@@ -570,72 +719,228 @@ def _detect_same_game_indicator(blocks: list) -> dict:
 
 
 # =============================================================================
-# Per-Leg Market Detection (Ticket 14)
+# Parsed Slip IR — single-pass parse shared by all stages
 # =============================================================================
 
 
-def _detect_leg_markets(bet_text: str) -> list[dict]:
+@dataclass(frozen=True)
+class ParsedLeg:
     """
-    Split input into legs and detect the market type for each leg.
+    One leg of a parsed slip.
 
-    Returns a list of dicts: [{"text": raw_leg, "bet_type": BetType, "base_fragility": float}, ...]
-    
-    Ticket A1: Enhanced to recognize common prop abbreviations (pts, reb, ast, etc.)
+    - text: lowercased leg text (delimiters stripped)
+    - bet_type / base_fragility: per-leg market detection (Ticket 14 / A1)
+    - game_id_hint: "game_<TEAM>" when the leg names a recognized team
+    """
+    text: str
+    bet_type: BetType
+    base_fragility: float
+    game_id_hint: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Legacy leg dict shape returned by _detect_leg_markets."""
+        return {"text": self.text, "bet_type": self.bet_type, "base_fragility": self.base_fragility}
+
+
+@dataclass(frozen=True)
+class ParsedSlip:
+    """
+    Intermediate representation of the raw bet text.
+
+    The text is lowercased and scanned by the compiled entity matcher ONCE;
+    legs, per-leg markets, recognized entities, game-id hints and the context
+    lookup names are all derived from that single scan. Every pipeline stage
+    consumes this object instead of re-parsing input_text.
+
+    Fields:
+    - raw_text: original input text
+    - legs: parsed legs in input order (uncapped)
+    - entities: recognize_entities() output (treat as read-only)
+    - context_players / context_teams: names used for context + alert lookups
+    - is_nba: True if the slip should fetch NBA context
+    - context_sports: sports on the slip to fetch context for (NBA first)
+    """
+    raw_text: str
+    legs: tuple[ParsedLeg, ...]
+    entities: dict
+    context_players: tuple[str, ...] = ()
+    context_teams: tuple[str, ...] = ()
+    is_nba: bool = False
+    context_sports: tuple[str, ...] = ()
+
+    @classmethod
+    def parse(cls, text: str) -> "ParsedSlip":
+        """Tokenize and scan `text` once, producing the full slip IR."""
+        text_lower = text.lower()
+        occurrences = _ENTITY_MATCHER.find_all(text_lower)
+        hits = KeywordHits.collect(text_lower, occurrences)
+
+        entities = _entities_from_hits(text_lower, hits)
+        teams = entities["teams_mentioned"]
+
+        legs = []
+        for start, end in _split_leg_spans(text_lower):
+            leg_text = text_lower[start:end]
+            leg_hits = KeywordHits.collect(text_lower, occurrences, start, end)
+            bet_type, base_fragility = _classify_leg(leg_text, leg_hits)
+            legs.append(ParsedLeg(
+                text=leg_text,
+                bet_type=bet_type,
+                base_fragility=base_fragility,
+                game_id_hint=_leg_game_id_hint(leg_hits, teams),
+            ))
+
+        context_players, context_teams = _context_names_from_hits(hits)
+        is_nba = (
+            "nba" in hits.found
+            or len(context_players) > 0
+            or len(context_teams) > 0
+            or any(word in hits.found for word in _NBA_CONTEXT_HINTS)
+        )
+
+        return cls(
+            raw_text=text,
+            legs=tuple(legs),
+            entities=entities,
+            context_players=context_players,
+            context_teams=context_teams,
+            is_nba=is_nba,
+            context_sports=_context_sports_from_hits(hits, entities, is_nba),
+        )
+
+
+def _split_leg_spans(text_lower: str) -> list[tuple[int, int]]:
+    """
+    Split input into leg spans (start, end) on common leg delimiters.
+
+    Don't split on + when it's part of a number (+3.5): only " + " with
+    surrounding whitespace counts. Spans are whitespace-stripped; if nothing
+    remains the whole text is one leg.
+    """
+    spans = []
+    cursor = 0
+    bounds = [(m.start(), m.end()) for m in _LEG_DELIMITER_PATTERN.finditer(text_lower)]
+    for delim_start, delim_end in bounds + [(len(text_lower), len(text_lower))]:
+        start, end = cursor, delim_start
+        while start < end and text_lower[start].isspace():
+            start += 1
+        while end > start and text_lower[end - 1].isspace():
+            end -= 1
+        if start < end:
+            spans.append((start, end))
+        cursor = delim_end
+
+    if not spans:
+        spans = [(0, len(text_lower))]
+    return spans
+
+
+def _classify_leg(part: str, leg_hits: KeywordHits) -> tuple[BetType, float]:
+    """
+    Detect the market type of one leg.
+
+    Ticket A1: Recognizes common prop abbreviations (pts, reb, ast, etc.)
     and O/U patterns (O27.5, U10.5) for real-world betting slips.
     """
-    text_lower = bet_text.lower()
+    # Check for prop keywords
+    has_prop_keyword = not _PROP_KEYWORD_SET.isdisjoint(leg_hits.found)
 
-    # Split on common leg delimiters
-    # BUT: Don't split on + when it's part of a number (+3.5)
-    # Solution: Split on + with surrounding whitespace
-    import re
-    parts = re.split(r'\s+\+\s+|\s*,\s*|\s+and\s+', text_lower)
-    parts = [p.strip() for p in parts if p.strip()]
+    # Check for O/U patterns with numbers (e.g., "O27.5", "U10")
+    # BUT: Game totals also use O/U patterns (e.g., "O220.5")
+    # Distinction: Props have stat keywords, totals don't
+    has_ou_pattern = bool(_OU_PATTERN.search(part))
 
-    if not parts:
-        parts = [text_lower]
+    # Player props: O/U pattern + prop keyword
+    is_prop = has_prop_keyword or (has_ou_pattern and has_prop_keyword)
 
-    legs = []
-    for part in parts:
-        # Ticket A1: Expanded player prop detection
-        # Check for common prop abbreviations
-        prop_abbreviations = [
-            'pts', 'reb', 'ast', 'blk', 'stl', 'to',  # Common abbreviations
-            '3pm', '3pa', 'fgm', 'fga', 'ftm', 'fta',  # Shooting stats
-            'pra', 'pr', 'ra', 'pa',  # Combo props
-            'yards', 'points', 'rebounds', 'assists', 'touchdowns', 'td',  # Full words
-            'tds', 'threes', '3pt', 'steals', 'blocks', 'strikeouts',
-            'home run', 'hr', 'rbi', 'hits', 'receptions', 'rec',
-        ]
-        
-        # Check for prop keywords
-        has_prop_keyword = any(w in part for w in prop_abbreviations)
-        
-        # Check for O/U patterns with numbers (e.g., "O27.5", "U10")
-        # BUT: Game totals also use O/U patterns (e.g., "O220.5")
-        # Distinction: Props have stat keywords, totals don't
-        has_ou_pattern = bool(re.search(r'\b[ou]\d+\.?\d*', part))
-        
-        # Player props: O/U pattern + prop keyword
-        is_prop = has_prop_keyword or (has_ou_pattern and has_prop_keyword)
-        
-        # Total detection: O/U pattern WITHOUT prop keyword, OR "over"/"under" keywords
-        has_total_keyword = any(w in part for w in ['over', 'under', 'o/', 'u/'])
-        is_total = (has_ou_pattern and not has_prop_keyword) or (has_total_keyword and not has_prop_keyword)
-        
-        # Spread detection: +/- with number, but not if it's a total or prop
-        is_spread = bool(re.search(r'[+-]\d+\.?\d*', part)) and not is_total and not is_prop
-
-        if is_prop:
-            legs.append({"text": part, "bet_type": BetType.PLAYER_PROP, "base_fragility": 0.20})
-        elif is_total:
-            legs.append({"text": part, "bet_type": BetType.TOTAL, "base_fragility": 0.12})
-        elif is_spread:
-            legs.append({"text": part, "bet_type": BetType.SPREAD, "base_fragility": 0.10})
-        else:
-            legs.append({"text": part, "bet_type": BetType.ML, "base_fragility": 0.08})
+    # Total detection: O/U pattern WITHOUT prop keyword, OR "over"/"under" keywords
+    has_total_keyword = not _TOTAL_KEYWORD_SET.isdisjoint(leg_hits.found)
+    is_total = (has_ou_pattern and not has_prop_keyword) or (has_total_keyword and not has_prop_keyword)
 
-    return legs
+    # Spread detection: +/- with number, but not if it's a total or prop
+    is_spread = bool(_SPREAD_PATTERN.search(part)) and not is_total and not is_prop
+
+    if is_prop:
+        return BetType.PLAYER_PROP, 0.20
+    elif is_total:
+        return BetType.TOTAL, 0.12
+    elif is_spread:
+        return BetType.SPREAD, 0.10
+    return BetType.ML, 0.08
+
+
+def _leg_game_id_hint(leg_hits: KeywordHits, teams: list[str]) -> Optional[str]:
+    """
+    Legs mentioning the same team share a game_id.
+
+    First NBA key (table order) whose team was recognized in the slip wins,
+    otherwise the first NFL key found in the leg.
+    """
+    nba_keys = [k for k in leg_hits.found if k in _NBA_TEAM_ORDER and _NBA_TEAMS[k] in teams]
+    if nba_keys:
+        return f"game_{_NBA_TEAMS[min(nba_keys, key=_NBA_TEAM_ORDER.__getitem__)]}"
+    nfl_keys = [k for k in leg_hits.found if k in _NFL_TEAM_ORDER]
+    if nfl_keys:
+        return f"game_{_NFL_TEAMS[min(nfl_keys, key=_NFL_TEAM_ORDER.__getitem__)]}"
+    return None
+
+
+def _context_names_from_hits(hits: KeywordHits) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Resolve context lookup (player_names, team_names) from a slip scan."""
+    found_teams: list[str] = []
+    for key in sorted((k for k in hits.found if k in _CONTEXT_TEAM_ORDER), key=_CONTEXT_TEAM_ORDER.__getitem__):
+        team_abbr = _CONTEXT_NBA_TEAMS[key]
+        if team_abbr not in found_teams:
+            found_teams.append(team_abbr)
+
+    found_players: list[str] = []
+    for key in sorted((k for k in hits.found if k in _CONTEXT_PLAYER_ORDER), key=_CONTEXT_PLAYER_ORDER.__getitem__):
+        full_name = _CONTEXT_PLAYER_NAMES.get(key, key.title())
+        if full_name not in found_players:
+            found_players.append(full_name)
+
+    return tuple(found_players), tuple(found_teams)
+
+
+def _context_sports_from_hits(hits: KeywordHits, entities: dict, is_nba: bool) -> tuple[str, ...]:
+    """
+    Sports a slip's legs belong to, for context fetching.
+
+    NBA keeps its Sprint 3 rule (is_nba), except when the slip resolves only
+    to NFL entities: is_nba also fires on context-name substrings ("chi" in
+    "chiefs"), which must not pull NBA context into an NFL slip. Any other
+    guessed sport is added, and NFL teams or players add NFL even when the
+    guess is NBA, so a mixed slip fetches both.
+    """
+    has_nfl = bool(
+        _resolve_hits(hits, _NFL_TEAMS, _NFL_TEAM_RANK) or _resolve_hits(hits, _NFL_PLAYERS, _NFL_PLAYER_RANK)
+    )
+    has_nba = bool(
+        _resolve_hits(hits, _NBA_TEAMS, _NBA_TEAM_RANK)
+        or _resolve_hits(hits, _NBA_PLAYERS, _NBA_PLAYER_RANK)
+        or any(word in hits.found for word in _NBA_CONTEXT_HINTS)
+    )
+    sports = ["NBA"] if is_nba and (has_nba or not has_nfl) else []
+    sport_guess = entities["sport_guess"]
+    if sport_guess not in ("unknown", "nba"):
+        sports.append(sport_guess.upper())
+    if has_nfl:
+        sports.append("NFL")
+    return tuple(dict.fromkeys(sports))
+
+
+# =============================================================================
+# Per-Leg Market Detection (Ticket 14)
+# =============================================================================
+
+
+def _detect_leg_markets(bet_text: str) -> list[dict]:
+    """
+    Split input into legs and detect the market type for each leg.
+
+    Returns a list of dicts: [{"text": raw_leg, "bet_type": BetType, "base_fragility": float}, ...]
+    """
+    return [leg.to_dict() for leg in ParsedSlip.parse(bet_text).legs]
 
 
 # =============================================================================
@@ -644,22 +949,23 @@ def _detect_leg_markets(bet_text: str) -> list[dict]:
 
 
 def _parse_bet_text(bet_text: str) -> list[BetBlock]:
+    """Parse bet_text into BetBlock objects (see _build_blocks)."""
+    return _build_blocks(ParsedSlip.parse(bet_text))
+
+
+def _build_blocks(slip: ParsedSlip) -> list[BetBlock]:
     """
-    Parse bet_text into BetBlock objects.
+    Build BetBlock objects from a parsed slip.
 
     Uses per-leg market detection so mixed slips (spread + prop + ML)
     produce blocks with distinct bet types and fragility values.
     Does NOT implement scoring logic - just format conversion.
     """
-    import re as _re
-
-    detected_legs = _detect_leg_markets(bet_text)
-    leg_count = min(len(detected_legs), 6)
+    leg_count = min(len(slip.legs), 6)
 
     # Entity recognition for game_id inference
-    entities = recognize_entities(bet_text)
-    sport = entities["sport_guess"] if entities["sport_guess"] != "unknown" else "generic"
-    teams = entities["teams_mentioned"]
+    sport_guess = slip.entities["sport_guess"]
+    sport = sport_guess if sport_guess != "unknown" else "generic"
 
     default_mod = ContextModifier(applied=False, delta=0.0, reason=None)
     modifiers = ContextModifiers(
@@ -671,30 +977,17 @@ def _parse_bet_text(bet_text: str) -> list[BetBlock]:
 
     blocks = []
     for i in range(leg_count):
-        leg = detected_legs[i]
-        # Assign game_id: legs mentioning the same team share a game_id
-        game_id = f"game_{i+1}"
-        leg_text = leg["text"]
-        for t_key, t_abbr in _NBA_TEAMS.items():
-            if t_key in leg_text and t_abbr in teams:
-                game_id = f"game_{t_abbr}"
-                break
-        else:
-            for t_key, t_abbr in _NFL_TEAMS.items():
-                if t_key in leg_text:
-                    game_id = f"game_{t_abbr}"
-                    break
-
+        leg = slip.legs[i]
         block = BetBlock(
             block_id=uuid4(),
             sport=sport,
-            game_id=game_id,
-            bet_type=leg["bet_type"],
-            selection=leg["text"][:80] or f"Leg {i+1}",
-            base_fragility=leg["base_fragility"],
+            game_id=leg.game_id_hint or f"game_{i+1}",
+            bet_type=leg.bet_type,
+            selection=leg.text[:80] or f"Leg {i+1}",
+            base_fragility=leg.base_fragility,
             context_modifiers=modifiers,
             correlation_tags=(),
-            effective_fragility=leg["base_fragility"],
+            effective_fragility=leg.base_fragility,
             player_id=None,
             team_id=None,
         )
@@ -707,7 +1000,7 @@ def _parse_bet_text(bet_text: str) -> list[BetBlock]:
             sport=sport,
             game_id="game_1",
             bet_type=BetType.ML,
-            selection=bet_text[:80],
+            selection=slip.raw_text[:80],
             base_fragility=0.08,
             context_modifiers=modifiers,
             correlation_tags=(),
@@ -957,6 +1250,11 @@ def _fragility_to_signal(fragility: float, evaluation=None) -> str:
     Red rarity enforcement: red ONLY when fragility bucket is critical
     (>60) AND inductor level is critical. Otherwise caps at yellow.
     """
+    return _signal_for(fragility, evaluation.inductor.level if evaluation else None)
+
+
+def _signal_for(fragility: float, inductor: Optional[RiskInductor]) -> str:
+    """Signal color from fragility and inductor level (see _fragility_to_signal)."""
     if fragility <= 15:
         return "blue"
     elif fragility <= 35:
@@ -965,7 +1263,7 @@ def _fragility_to_signal(fragility: float, evaluation=None) -> str:
         return "yellow"
     else:
         # Red rarity: only if inductor is also critical
-        if evaluation and evaluation.inductor.level.value == "critical":
+        if inductor is not None and inductor.value == "critical":
             return "red"
         # Inductor not critical — cap at yellow
         return "yellow"
@@ -1225,12 +1523,12 @@ def _build_primary_failure(evaluation, blocks, entities=None, eval_ctx: Optional
     }
 
 
-def _build_delta_preview(evaluation, blocks, primary_failure) -> dict:
+def _build_delta_preview(evaluation, blocks, primary_failure, leave_one_out=()) -> dict:
     """
     Compute a deterministic 'what if you apply fastestFix' preview.
 
-    Uses existing evaluate_parlay() — no new math.
-    If candidate leg exists and action is remove_leg, re-evaluates without it.
+    Uses the leave-one-out profile (core.sensitivity) — no new math.
+    If candidate leg exists and action is remove_leg, reads its entry.
     Otherwise returns null after/change.
     """
     fastest_fix = primary_failure.get("fastestFix", {})
@@ -1249,18 +1547,11 @@ def _build_delta_preview(evaluation, blocks, primary_failure) -> dict:
     # Can only simulate remove_leg with a known candidate and >1 blocks
     if action == "remove_leg" and candidate_ids and blocks and len(blocks) > 1:
         remove_id = candidate_ids[0]
-        remaining_blocks = [b for b in blocks if str(b.block_id) != remove_id]
-
-        if remaining_blocks:
-            after_eval = evaluate_parlay(
-                blocks=remaining_blocks,
-                dna_profile=None,
-                bankroll=None,
-                candidates=None,
-                max_suggestions=0,
-            )
-            after_fragility = after_eval.metrics.final_fragility
-            after_signal = _fragility_to_signal(after_fragility, after_eval)
+        without = next((e for e in leave_one_out if str(e.block_id) == remove_id), None)
+
+        if without is not None:
+            after_fragility = without.final_fragility
+            after_signal = _signal_for(after_fragility, without.inductor)
             after_state = {
                 "signal": after_signal,
                 "grade": _signal_to_grade(after_signal),
@@ -1299,6 +1590,35 @@ def _build_delta_preview(evaluation, blocks, primary_failure) -> dict:
     }
 
 
+def _build_leg_impact(leave_one_out: tuple[LegSensitivity, ...]) -> list[dict]:
+    """
+    Per-leg impact bar: how much fragility each leg adds to the parlay.
+
+    Reads the leave-one-out profile (core.sensitivity) — no re-evaluation.
+    impact is the fragility drop if the leg were removed (never negative);
+    share scales it against the largest impact for the bar width.
+    """
+    if len(leave_one_out) < 2:
+        return []
+
+    impacts = [max(0.0, -entry.delta_fragility) for entry in leave_one_out]
+    largest = max(impacts)
+    legs = []
+    for entry, impact in zip(leave_one_out, impacts, strict=True):
+        signal = _signal_for(entry.final_fragility, entry.inductor)
+        legs.append({
+            "legId": str(entry.block_id),
+            "impact": round(impact, 2),
+            "share": round(impact / largest, 3) if largest > 0 else 0.0,
+            "without": {
+                "signal": signal,
+                "grade": _signal_to_grade(signal),
+                "fragilityScore": entry.final_fragility,
+            },
+        })
+    return legs
+
+
 def _build_secondary_factors(evaluation, blocks, entities, primary_type: str, eval_ctx: Optional[EvaluationContext] = None) -> list[dict]:
     """
     Build ranked secondary factors (runners-up from the same scoring logic).
@@ -2266,132 +2586,101 @@ def _extract_entities_from_text(text: str) -> tuple[list[str], list[str]]:
     Sprint 3 scope: Simple extraction for NBA.
     Returns (player_names, team_names).
     """
-    text_lower = text.lower()
+    slip = ParsedSlip.parse(text)
+    return list(slip.context_players), list(slip.context_teams)
 
-    # NBA team abbreviations/names to look for
-    nba_teams = {
-        "lakers": "LAL", "lal": "LAL", "los angeles lakers": "LAL",
-        "celtics": "BOS", "bos": "BOS", "boston": "BOS",
-        "nuggets": "DEN", "den": "DEN", "denver": "DEN",
-        "bucks": "MIL", "mil": "MIL", "milwaukee": "MIL",
-        "warriors": "GSW", "gsw": "GSW", "golden state": "GSW",
-        "suns": "PHX", "phx": "PHX", "phoenix": "PHX",
-        "76ers": "PHI", "phi": "PHI", "sixers": "PHI", "philadelphia": "PHI",
-        "mavericks": "DAL", "dal": "DAL", "dallas": "DAL", "mavs": "DAL",
-        "heat": "MIA", "mia": "MIA", "miami": "MIA",
-        "nets": "BKN", "bkn": "BKN", "brooklyn": "BKN",
-        "knicks": "NYK", "nyk": "NYK", "new york": "NYK",
-        "bulls": "CHI", "chi": "CHI", "chicago": "CHI",
-        "clippers": "LAC", "lac": "LAC",
-        "thunder": "OKC", "okc": "OKC", "oklahoma": "OKC",
-        "timberwolves": "MIN", "min": "MIN", "minnesota": "MIN", "wolves": "MIN",
-        "kings": "SAC", "sac": "SAC", "sacramento": "SAC",
-        "pelicans": "NOP", "nop": "NOP", "new orleans": "NOP",
-        "grizzlies": "MEM", "mem": "MEM", "memphis": "MEM",
-        "cavaliers": "CLE", "cle": "CLE", "cleveland": "CLE", "cavs": "CLE",
-        "hawks": "ATL", "atl": "ATL", "atlanta": "ATL",
-        "raptors": "TOR", "tor": "TOR", "toronto": "TOR",
-        "pacers": "IND", "ind": "IND", "indiana": "IND",
-        "hornets": "CHA", "cha": "CHA", "charlotte": "CHA",
-        "wizards": "WAS", "was": "WAS", "washington": "WAS",
-        "magic": "ORL", "orl": "ORL", "orlando": "ORL",
-        "pistons": "DET", "det": "DET", "detroit": "DET",
-        "jazz": "UTA", "uta": "UTA", "utah": "UTA",
-        "rockets": "HOU", "hou": "HOU", "houston": "HOU",
-        "spurs": "SAS", "sas": "SAS", "san antonio": "SAS",
-        "trail blazers": "POR", "por": "POR", "portland": "POR", "blazers": "POR",
-    }
 
-    # Common NBA player names to look for (from sample data)
-    known_players = [
-        "lebron james", "lebron", "anthony davis", "ad",
-        "jaylen brown", "jayson tatum", "tatum",
-        "nikola jokic", "jokic", "jamal murray",
-        "giannis", "giannis antetokounmpo", "damian lillard", "lillard", "dame",
-        "stephen curry", "curry", "steph", "klay thompson",
-        "kevin durant", "durant", "kd", "devin booker", "booker",
-        "joel embiid", "embiid", "tyrese maxey", "maxey",
-        "luka doncic", "luka", "doncic", "kyrie irving", "kyrie",
-    ]
+def _context_sports(slip: ParsedSlip) -> tuple[str, ...]:
+    """Sports on the slip that have a context provider."""
+    service = get_context_service()
+    return tuple(sport for sport in slip.context_sports if service.has_provider(sport))
 
-    found_teams = []
-    for team_key, team_abbr in nba_teams.items():
-        if team_key in text_lower:
-            if team_abbr not in found_teams:
-                found_teams.append(team_abbr)
-
-    found_players = []
-    for player in known_players:
-        if player in text_lower:
-            # Map to full name for context lookup
-            player_map = {
-                "lebron": "LeBron James", "ad": "Anthony Davis",
-                "tatum": "Jayson Tatum", "jokic": "Nikola Jokic",
-                "giannis": "Giannis Antetokounmpo", "lillard": "Damian Lillard",
-                "dame": "Damian Lillard", "curry": "Stephen Curry",
-                "steph": "Stephen Curry", "durant": "Kevin Durant",
-                "kd": "Kevin Durant", "booker": "Devin Booker",
-                "embiid": "Joel Embiid", "maxey": "Tyrese Maxey",
-                "luka": "Luka Doncic", "doncic": "Luka Doncic",
-                "kyrie": "Kyrie Irving",
-            }
-            full_name = player_map.get(player, player.title())
-            if full_name not in found_players:
-                found_players.append(full_name)
 
-    return found_players, found_teams
+def _fetch_context(sports: Sequence[str]) -> dict[str, ContextSnapshot]:
+    """
+    Fetch context snapshots for the given sports, keyed by sport.
+
+    A mixed slip fetches its sports concurrently. Returns {} when the
+    context service fails.
+    """
+    try:
+        if len(sports) == 1:
+            return {sports[0]: get_context(sports[0])}
+        return get_context_many(sports)
+    except Exception as e:
+        _logger.warning(f"Failed to fetch context: {e}")
+        return {}
+
+
+def _fetch_context_snapshots(slip: ParsedSlip) -> tuple[ContextSnapshot, ...]:
+    """
+    Fetch the context snapshots that apply to the bet, one per sport.
+
+    Empty for slips without a sport that has a context provider, or when
+    the context service fails.
+    """
+    return tuple(_fetch_context(_context_sports(slip)).values())
+
+
+async def _fetch_context_snapshots_async(slip: ParsedSlip) -> tuple[ContextSnapshot, ...]:
+    """Non-blocking variant of _fetch_context_snapshots for the event loop."""
+    sports = _context_sports(slip)
+    try:
+        if len(sports) == 1:
+            return (await get_context_async(sports[0]),)
+        return tuple((await get_context_many_async(sports)).values())
+    except Exception as e:
+        _logger.warning(f"Failed to fetch context: {e}")
+        return ()
 
 
-def _fetch_context_for_bet(text: str, correlation_id: Optional[str] = None) -> Optional[dict]:
+def _fetch_context_for_bet(
+    slip: ParsedSlip,
+    snapshots: tuple[ContextSnapshot, ...],
+    correlation_id: Optional[str] = None,
+) -> Optional[dict]:
     """
-    Fetch context data relevant to the bet.
+    Apply context data relevant to the bet.
 
     Sprint 3 scope: NBA availability only.
     Sprint 4: Also triggers alert generation for availability changes.
+    Multi-sport slips apply every sport's snapshot as one impact; alerts
+    are still checked per sport.
 
     Returns context dict or None if not applicable.
     """
     try:
-        # Extract entities from bet text
-        player_names, team_names = _extract_entities_from_text(text)
-
-        # Check if this looks like an NBA bet
-        text_lower = text.lower()
-        is_nba = (
-            "nba" in text_lower
-            or len(player_names) > 0
-            or len(team_names) > 0
-            or any(word in text_lower for word in ["basketball", "points", "rebounds", "assists"])
-        )
+        # Entities come from the already-parsed slip
+        player_names = list(slip.context_players)
+        team_names = list(slip.context_teams)
 
-        if not is_nba:
+        if not snapshots:
             return None
 
-        # Fetch NBA context
-        snapshot = get_context("NBA")
-
         # Sprint 4: Check for alerts (stores any new alerts)
-        new_alerts = check_for_alerts(
-            snapshot=snapshot,
-            player_names=player_names if player_names else None,
-            team_names=team_names if team_names else None,
-            correlation_id=correlation_id,
-        )
+        new_alerts = []
+        for snapshot in snapshots:
+            new_alerts.extend(check_for_alerts(
+                snapshot=snapshot,
+                player_names=player_names if player_names else None,
+                team_names=team_names if team_names else None,
+                correlation_id=correlation_id,
+            ))
         if new_alerts:
             _logger.info(f"Generated {len(new_alerts)} alert(s) for bet evaluation")
 
         # Apply context to get impact
-        impact = apply_context(
-            snapshot=snapshot,
+        impact = apply_context_many(
+            snapshots,
             player_names=player_names if player_names else None,
             team_names=team_names if team_names else None,
         )
 
         # Convert to dict for response
         return {
-            "sport": snapshot.sport,
-            "source": snapshot.source,
-            "as_of": snapshot.as_of.isoformat(),
+            "sport": "+".join(snapshot.sport for snapshot in snapshots),
+            "source": "+".join(snapshot.source for snapshot in snapshots),
+            "as_of": min(snapshot.as_of for snapshot in snapshots).isoformat(),
             "impact": {
                 "adjustment": impact.total_adjustment,
                 "summary": impact.summary,
@@ -2405,7 +2694,7 @@ def _fetch_context_for_bet(text: str, correlation_id: Optional[str] = None) -> O
                 ],
             },
             "missing_data": list(impact.missing_data),
-            "player_count": snapshot.player_count,
+            "player_count": sum(snapshot.player_count for snapshot in snapshots),
             "entities_found": {
                 "players": player_names,
                 "teams": team_names,
@@ -2418,292 +2707,787 @@ def _fetch_context_for_bet(text: str, correlation_id: Optional[str] = None) -> O
         return None
 
 
-def run_evaluation(normalized: NormalizedInput) -> PipelineResponse:
-    """
-    Run the canonical evaluation pipeline.
+# =============================================================================
+# Stage Graph — run_evaluation as declared stages (lazy, dependency-driven)
+# =============================================================================
+# Each stage reads named artifacts and produces one artifact named after it.
+# Stages are declared in the original step order; a request runs only the
+# stages its requested outputs depend on.
 
-    This is the ONLY entry point for evaluation. All routes call this.
 
-    Args:
-        normalized: Validated input from Airlock
+def _canonical_legs_of(normalized: NormalizedInput) -> Optional[tuple]:
+    """Canonical legs (builder mode) if present, else None."""
+    if hasattr(normalized, 'canonical_legs') and normalized.canonical_legs:
+        return normalized.canonical_legs
+    return None
 
-    Returns:
-        PipelineResponse with evaluation, interpretation, context, and explain
 
-    Flow:
-        1. Parse text → BetBlocks
-        2. Call evaluate_parlay() (the canonical core function)
-        3. Fetch external context (Sprint 3)
-        4. Generate plain-English interpretation
-        5. Apply tier filtering to explain
-        6. Return unified response
-    """
-    # Step 1: Entity recognition (Ticket 14 — cheap, deterministic)
-    entities = recognize_entities(normalized.input_text)
-    entities["_raw_text"] = normalized.input_text  # kept for weak_clarity scoring
+def _stage_slip(a: dict) -> ParsedSlip:
+    # Step 1: Parse once into the slip IR (legs, markets, entities, hints)
+    return ParsedSlip.parse(a["normalized"].input_text)
+
+
+def _stage_entities_internal(a: dict) -> dict:
+    entities = dict(a["slip"].entities)
+    entities["_raw_text"] = a["normalized"].input_text  # kept for weak_clarity scoring
+    return entities
 
-    # Step 2: Parse text into BetBlocks (now uses per-leg market detection)
-    blocks = _parse_bet_text(normalized.input_text)
 
+def _stage_blocks(a: dict) -> list:
+    # Step 2: Build BetBlocks from parsed legs (per-leg market detection)
+    return _build_blocks(a["slip"])
+
+
+def _stage_eval_ctx(a: dict) -> EvaluationContext:
     # Ticket 28: Create authoritative EvaluationContext ONCE
     # This is the ONLY place leg_count should be determined
-    canonical_legs = None
-    if hasattr(normalized, 'canonical_legs') and normalized.canonical_legs:
-        canonical_legs = normalized.canonical_legs
-
-    eval_ctx = EvaluationContext.create(blocks=blocks, canonical_legs=canonical_legs)
-    leg_count = eval_ctx.leg_count  # For backwards compatibility with existing code
+    return EvaluationContext.create(
+        blocks=a["blocks"], canonical_legs=_canonical_legs_of(a["normalized"])
+    )
 
-    # Ticket 27B HOTFIX: Use canonical leg count when present (builder mode)
-    # This ensures ALL downstream outputs use the same leg_count
-    canonical_leg_count = None
-    if hasattr(normalized, 'canonical_legs') and normalized.canonical_legs:
-        canonical_leg_count = len(normalized.canonical_legs)
-        leg_count = canonical_leg_count  # Override with canonical count
 
+def _stage_evaluation(a: dict) -> EvaluationResponse:
     # Step 3: Call canonical evaluation engine
-    evaluation = evaluate_parlay(
-        blocks=blocks,
+    return evaluate_parlay(
+        blocks=a["blocks"],
         dna_profile=None,
         bankroll=None,
         candidates=None,
         max_suggestions=0,
     )
 
+
+def _stage_context_snapshots(a: dict) -> tuple[ContextSnapshot, ...]:
+    # Snapshots fetched up front: their versions are part of the result cache key
+    return _fetch_context_snapshots(a["slip"])
+
+
+def _stage_context(a: dict) -> Optional[dict]:
     # Step 4: Fetch external context (Sprint 3 - additive only)
     # Sprint 4: Pass parlay_id as correlation_id for alert tracking
-    context_data = _fetch_context_for_bet(
-        normalized.input_text,
-        correlation_id=str(evaluation.parlay_id),
+    return _fetch_context_for_bet(
+        a["slip"], a["context_snapshots"], correlation_id=str(a["evaluation"].parlay_id)
     )
 
+
+def _stage_interpretation(a: dict) -> dict:
     # Step 5: Generate plain-English interpretation
-    interpretation = {
-        "fragility": _interpret_fragility(evaluation.metrics.final_fragility),
-    }
+    return {"fragility": _interpret_fragility(a["evaluation"].metrics.final_fragility)}
 
+
+def _stage_explain_full(a: dict) -> Optional[dict]:
     # Step 6: Build full explain wrapper
-    # Ticket 28: Pass eval_ctx for authoritative context
-    explain_full = {
-        "summary": _generate_summary(evaluation, eval_ctx=eval_ctx),
+    # GOOD tier derives its structured output from the evaluation instead,
+    # so the summary/alerts wrapper is only built for BETTER/BEST.
+    if a["normalized"].tier == Tier.GOOD:
+        return None
+    evaluation = a["evaluation"]
+    return {
+        "summary": _generate_summary(evaluation, eval_ctx=a["eval_ctx"]),
         "alerts": _generate_alerts(evaluation),
         "recommended_next_step": evaluation.recommendation.reason,
     }
 
-    # Step 7: Build primary failure + delta preview (Ticket 4 + Ticket 14)
-    # Ticket 28: Pass eval_ctx for authoritative leg_count
-    primary_failure = _build_primary_failure(evaluation, blocks, entities, eval_ctx=eval_ctx)
-    delta_preview = _build_delta_preview(evaluation, blocks, primary_failure)
 
+def _stage_primary_failure(a: dict) -> dict:
+    # Step 7: Build primary failure (Ticket 4 + Ticket 14)
+    return _build_primary_failure(a["evaluation"], a["blocks"], a["entities_internal"], eval_ctx=a["eval_ctx"])
+
+
+def _stage_leave_one_out(a: dict) -> tuple:
+    # Fragility/inductor without each leg, from one pairwise penalty table
+    return compute_leave_one_out(build_parlay_state(a["blocks"]))
+
+
+def _stage_delta_preview(a: dict) -> dict:
+    return _build_delta_preview(a["evaluation"], a["blocks"], a["primary_failure"], a["leave_one_out"])
+
+
+def _stage_leg_impact(a: dict) -> list:
+    return _build_leg_impact(a["leave_one_out"])
+
+
+def _stage_signal_info(a: dict) -> dict:
     # Step 8: Build signal info (Ticket 5)
-    signal_info = _build_signal_info(evaluation, primary_failure, delta_preview)
+    return _build_signal_info(a["evaluation"], a["primary_failure"], a["delta_preview"])
+
 
+def _stage_explain(a: dict) -> dict:
     # Step 9: Apply tier filtering (uses primary_failure for specific warnings/tips)
-    explain_filtered = _apply_tier_filtering(normalized.tier, explain_full, evaluation, blocks, primary_failure)
+    return _apply_tier_filtering(
+        a["normalized"].tier, a["explain_full"] or {}, a["evaluation"], a["blocks"], a["primary_failure"]
+    )
+
+
+def _stage_primary_type(a: dict) -> str:
+    primary_failure = a["primary_failure"]
+    return primary_failure.get("type", "unknown") if primary_failure else "unknown"
 
+
+def _stage_entities(a: dict) -> dict:
     # Step 10: Sprint 2 — Compute same-game indicator + volatility flag
-    same_game_info = _detect_same_game_indicator(blocks)
+    # Build public entity output (strip internal _raw_text, add Sprint 2 fields)
+    entities = a["entities_internal"]
+    same_game_info = _detect_same_game_indicator(a["blocks"])
     volatility_flag = _compute_volatility_flag(
         entities.get("markets_detected", []),
-        eval_ctx.leg_count,  # Ticket 28: Use eval_ctx
+        a["eval_ctx"].leg_count,  # Ticket 28: Use eval_ctx
         same_game_info["same_game_count"]
     )
+    entities_public = {k: v for k, v in entities.items() if not k.startswith("_")}
+    entities_public["volatility_flag"] = volatility_flag
+    entities_public["same_game_indicator"] = same_game_info
+    return entities_public
+
 
+def _stage_secondary_factors(a: dict) -> list:
     # Step 11: Sprint 2 — Build secondary factors (runners-up from scoring logic)
-    # Ticket 28: Pass eval_ctx for authoritative leg_count
-    primary_type = primary_failure.get("type", "unknown") if primary_failure else "unknown"
-    secondary_factors = _build_secondary_factors(evaluation, blocks, entities, primary_type, eval_ctx=eval_ctx)
+    return _build_secondary_factors(
+        a["evaluation"], a["blocks"], a["entities_internal"], a["primary_type"], eval_ctx=a["eval_ctx"]
+    )
+
 
+def _stage_human_summary(a: dict) -> str:
     # Step 12: Sprint 2 — Build human summary (always included)
-    # Ticket 28: Pass eval_ctx for authoritative context
-    human_summary = _build_human_summary(evaluation, blocks, entities, primary_failure, eval_ctx=eval_ctx)
+    return _build_human_summary(
+        a["evaluation"], a["blocks"], a["entities_internal"], a["primary_failure"], eval_ctx=a["eval_ctx"]
+    )
 
+
+def _engine_metrics(evaluation: EvaluationResponse) -> dict:
+    return {
+        "final_fragility": evaluation.metrics.final_fragility,
+        "correlation_penalty": evaluation.metrics.correlation_penalty,
+        "leg_penalty": evaluation.metrics.leg_penalty,
+    }
+
+
+def _stage_sherlock_result(a: dict) -> Optional[dict]:
     # Step 13: Ticket 17 — Run Sherlock hook (if enabled)
-    # Ticket 28: Use eval_ctx.leg_count for consistency
-    sherlock_result = None
-    if _config.sherlock_enabled:
-        hook_result = run_sherlock_hook(
-            sherlock_enabled=_config.sherlock_enabled,
-            dna_recording_enabled=_config.dna_recording_enabled,
-            evaluation_metrics={
-                "final_fragility": evaluation.metrics.final_fragility,
-                "correlation_penalty": evaluation.metrics.correlation_penalty,
-                "leg_penalty": evaluation.metrics.leg_penalty,
-            },
-            signal=signal_info.get("signal", "yellow") if signal_info else "yellow",
-            primary_failure_type=primary_type,
-            leg_count=eval_ctx.leg_count,
-        )
-        if hook_result:
-            sherlock_result = hook_result.to_dict()
+    if not _config.sherlock_enabled:
+        return None
+    signal_info = a["signal_info"]
+    hook_result = run_sherlock_hook(
+        sherlock_enabled=_config.sherlock_enabled,
+        dna_recording_enabled=_config.dna_recording_enabled,
+        evaluation_metrics=_engine_metrics(a["evaluation"]),
+        signal=signal_info.get("signal", "yellow") if signal_info else "yellow",
+        primary_failure_type=a["primary_type"],
+        leg_count=a["eval_ctx"].leg_count,
+    )
+    return hook_result.to_dict() if hook_result else None
 
+
+def _stage_debug_explainability(a: dict) -> Optional[dict]:
     # Step 14: Ticket 18 — Transform Sherlock output to explainability blocks
-    debug_explainability = None
-    explainability_output = transform_sherlock_to_explainability(sherlock_result)
-    if explainability_output:
-        debug_explainability = explainability_output.to_dict()
+    explainability_output = transform_sherlock_to_explainability(a["sherlock_result"])
+    return explainability_output.to_dict() if explainability_output else None
+
 
+def _stage_dna_artifacts(a: dict) -> list:
     # Step 15: Ticket 20 — Emit real DNA artifacts from evaluation data
     # Artifacts are deterministic, derived, and never persisted.
-    # Ticket 28: Use eval_ctx.leg_count for consistency
-    dna_artifacts = emit_artifacts_from_evaluation(
-        evaluation_metrics={
-            "final_fragility": evaluation.metrics.final_fragility,
-            "correlation_penalty": evaluation.metrics.correlation_penalty,
-            "leg_penalty": evaluation.metrics.leg_penalty,
-        },
+    signal_info = a["signal_info"]
+    return emit_artifacts_from_evaluation(
+        evaluation_metrics=_engine_metrics(a["evaluation"]),
         signal=signal_info.get("signal", "yellow") if signal_info else "yellow",
-        leg_count=eval_ctx.leg_count,
-        primary_failure_type=primary_type,
-        request_id=str(evaluation.parlay_id),
+        leg_count=a["eval_ctx"].leg_count,
+        primary_failure_type=a["primary_type"],
+        request_id=str(a["evaluation"].parlay_id),
     )
-    dna_artifact_counts = get_artifact_counts(dna_artifacts)
 
+
+def _stage_contract_validation(a: dict) -> dict:
     # Step 16: Ticket 19 — Validate DNA artifacts against contract
-    contract_validation = None
-    if dna_artifacts:
-        validation_result = validate_dna_artifacts(dna_artifacts)
-        contract_validation = validation_result.to_dict()
-        if not validation_result.ok:
-            _logger.warning(
-                f"DNA contract validation FAILED: {len(validation_result.errors)} errors. "
-                f"Artifacts quarantined."
-            )
-    else:
+    dna_artifacts = a["dna_artifacts"]
+    if not dna_artifacts:
         # No artifacts to validate - still get contract version for proof summary
-        contract_validation = {
+        return {
             "ok": True,
             "errors": [],
             "contract_version": get_contract_version(),
             "artifact_count": 0,
             "quarantined": False,
         }
+    validation_result = validate_dna_artifacts(dna_artifacts)
+    if not validation_result.ok:
+        _logger.warning(
+            f"DNA contract validation FAILED: {len(validation_result.errors)} errors. "
+            f"Artifacts quarantined."
+        )
+    return validation_result.to_dict()
+
 
+def _stage_ui_validation(a: dict):
     # Step 17: Ticket 21 — Validate and normalize artifacts for UI via UI contract
     # This is the final safety layer before artifacts reach the proof panel.
-    ui_validation = validate_for_ui(dna_artifacts)
-    ui_artifacts = ui_validation.normalized_artifacts  # Safe for UI
-    ui_contract_status = ui_validation.ui_contract_status
-    ui_contract_version = ui_validation.ui_contract_version
-
+    ui_validation = validate_for_ui(a["dna_artifacts"])
     if not ui_validation.ok:
         _logger.warning(
             f"UI contract validation FAILED: {len(ui_validation.errors)} errors. "
             f"Using fallback artifact for display."
         )
+    return ui_validation
+
 
+def _stage_proof_summary(a: dict) -> dict:
     # Step 18: Ticket 18B — Derive proof summary for UI display (with UI-safe artifacts)
-    proof_summary = derive_proof_summary(
+    ui_validation = a["ui_validation"]
+    return derive_proof_summary(
         sherlock_enabled=_config.sherlock_enabled,
         dna_recording_enabled=_config.dna_recording_enabled,
-        explainability_output=debug_explainability,
-        contract_validation=contract_validation,
-        dna_artifacts=ui_artifacts,  # Use UI-validated artifacts
-        dna_artifact_counts=dna_artifact_counts,
-        ui_contract_status=ui_contract_status,
-        ui_contract_version=ui_contract_version,
+        explainability_output=a["debug_explainability"],
+        contract_validation=a["contract_validation"],
+        dna_artifacts=ui_validation.normalized_artifacts,  # Use UI-validated artifacts
+        dna_artifact_counts=get_artifact_counts(a["dna_artifacts"]),
+        ui_contract_status=ui_validation.ui_contract_status,
+        ui_contract_version=ui_validation.ui_contract_version,
     ).to_dict()
 
-    # Build public entity output (strip internal _raw_text, add Sprint 2 fields)
-    entities_public = {k: v for k, v in entities.items() if not k.startswith("_")}
-    entities_public["volatility_flag"] = volatility_flag
-    entities_public["same_game_indicator"] = same_game_info
 
+def _stage_evaluated_parlay(a: dict) -> dict:
     # Step 19: Ticket 25 — Build evaluated parlay receipt (what was evaluated)
     # Ticket 27: Pass canonical legs if present (builder mode)
-    evaluated_parlay = _build_evaluated_parlay(
-        blocks,
+    normalized = a["normalized"]
+    return _build_evaluated_parlay(
+        a["blocks"],
         normalized.input_text,
         canonical_legs=normalized.canonical_legs if hasattr(normalized, 'canonical_legs') else None
     )
 
+
+def _stage_notable_legs(a: dict) -> list:
     # Step 20: Ticket 25 — Build notable legs (leg-aware context)
-    notable_legs = _build_notable_legs(blocks, evaluation, primary_failure)
+    return _build_notable_legs(a["blocks"], a["evaluation"], a["primary_failure"])
+
 
+def _stage_final_verdict(a: dict) -> dict:
     # Step 21: Ticket 25 — Build final verdict (conclusive summary)
-    # Ticket 28: Pass eval_ctx for authoritative context
-    final_verdict = _build_final_verdict(evaluation, blocks, entities, primary_failure, signal_info, eval_ctx=eval_ctx)
+    return _build_final_verdict(
+        a["evaluation"], a["blocks"], a["entities_internal"], a["primary_failure"], a["signal_info"],
+        eval_ctx=a["eval_ctx"],
+    )
 
+
+def _stage_gentle_guidance(a: dict) -> Optional[dict]:
     # Step 22: Ticket 26 — Build gentle guidance (optional adjustment hints)
-    gentle_guidance = _build_gentle_guidance(primary_failure, signal_info)
+    return _build_gentle_guidance(a["primary_failure"], a["signal_info"])
+
 
+def _stage_grounding_warnings(a: dict) -> Optional[list]:
     # Step 23: Ticket 27 — Build grounding warnings (soft warnings for unrecognized entities)
+    normalized = a["normalized"]
     grounding_warnings = _build_grounding_warnings(
-        evaluated_parlay,
-        entities_public,
+        a["evaluated_parlay"],
+        a["entities"],
         canonical_legs=normalized.canonical_legs if hasattr(normalized, 'canonical_legs') else None
     )
+    return grounding_warnings if grounding_warnings else None
+
 
+def _stage_structure(a: dict) -> dict:
     # Step 24: Ticket 38B-A — Generate structural snapshot
-    structure_snapshot = generate_structure_snapshot(
-        blocks,
+    normalized = a["normalized"]
+    return generate_structure_snapshot(
+        a["blocks"],
         canonical_legs=normalized.canonical_legs if hasattr(normalized, 'canonical_legs') else None
-    )
+    ).to_dict()
+
 
+def _stage_session_id(a: dict) -> Optional[str]:
+    # Client session (refinement flow); None means a standalone evaluation
+    return a["normalized"].session_id
+
+
+def _stage_delta(a: dict) -> Optional[dict]:
     # Step 25: Ticket 38B-B — Compute change delta
-    # Get previous snapshot from session (if any)
-    session_id = str(evaluation.parlay_id)  # Use parlay_id as session identifier
-    previous_snapshot = get_previous_snapshot_for_session(session_id)
-    
-    # Compute delta
-    delta_result = compute_snapshot_delta(
-        previous=previous_snapshot,
-        current=structure_snapshot.to_dict(),
-    )
-    
+    session_id = a["session_id"]
+    previous_snapshot = get_previous_snapshot_for_session(session_id) if session_id else None
+    delta_result = compute_snapshot_delta(previous=previous_snapshot, current=a["structure"])
     # Store current snapshot for next evaluation
-    store_snapshot_for_session(session_id, structure_snapshot.to_dict())
+    if session_id:
+        store_snapshot_for_session(session_id, a["structure"])
+    return delta_result.to_dict() if delta_result else None
+
 
+def _stage_grounding_score(a: dict) -> dict:
     # Step 26: Ticket 38B-C2 — Compute grounding score
-    grounding_score_result = compute_grounding_score(
-        structure=structure_snapshot.to_dict(),
-        evaluation=evaluation,  # Pass object directly, grounding_score handles both dict/object
-        primary_failure=primary_failure,
-        final_verdict=final_verdict,
-    )
+    return compute_grounding_score(
+        structure=a["structure"],
+        evaluation=a["evaluation"],  # Pass object directly, grounding_score handles both dict/object
+        primary_failure=a["primary_failure"],
+        final_verdict=a["final_verdict"],
+    ).to_dict()
 
+
+def _stage_next_action(a: dict) -> Optional[dict]:
     # Step 27: S7-A — Build next action guidance
-    has_fix = bool(primary_failure and primary_failure.get("fastest_fix"))
-    has_warnings = bool(explain_filtered.get("warnings"))
-    has_correlations = bool(evaluation.correlations)
-    next_action = _build_next_action_guidance(
-        signal_info=signal_info,
+    primary_failure = a["primary_failure"]
+    return _build_next_action_guidance(
+        signal_info=a["signal_info"],
         primary_failure=primary_failure,
-        has_fix=has_fix,
-        has_warnings=has_warnings,
-        has_correlations=has_correlations
+        has_fix=bool(primary_failure and primary_failure.get("fastest_fix")),
+        has_warnings=bool(a["explain"].get("warnings")),
+        has_correlations=bool(a["evaluation"].correlations),
     )
 
+
+def _stage_confidence_trend(a: dict) -> Optional[dict]:
     # Step 28: S7-B — Compute confidence trend
-    previous_signal = get_previous_signal_for_session(session_id)
+    session_id = a["session_id"]
+    signal_info = a["signal_info"]
+    previous_signal = get_previous_signal_for_session(session_id) if session_id else None
     confidence_trend = compute_confidence_trend(previous_signal, signal_info)
     # Store current signal for next evaluation
-    store_signal_for_session(session_id, signal_info)
+    if session_id:
+        store_signal_for_session(session_id, signal_info)
+    return confidence_trend
+
+
+_PIPELINE_GRAPH = StageGraph(
+    initial_inputs=("normalized",),
+    stages=[
+        Stage("slip", ("normalized",), _stage_slip),
+        Stage("context_snapshots", ("slip",), _stage_context_snapshots),
+        Stage("entities_internal", ("slip", "normalized"), _stage_entities_internal),
+        Stage("blocks", ("slip",), _stage_blocks),
+        Stage("eval_ctx", ("blocks", "normalized"), _stage_eval_ctx),
+        Stage("evaluation", ("blocks",), _stage_evaluation),
+        Stage("context", ("slip", "context_snapshots", "evaluation"), _stage_context),
+        Stage("interpretation", ("evaluation",), _stage_interpretation),
+        Stage("explain_full", ("normalized", "evaluation", "eval_ctx"), _stage_explain_full),
+        Stage("primary_failure", ("evaluation", "blocks", "entities_internal", "eval_ctx"), _stage_primary_failure),
+        Stage("leave_one_out", ("blocks",), _stage_leave_one_out),
+        Stage("delta_preview", ("evaluation", "blocks", "primary_failure", "leave_one_out"), _stage_delta_preview),
+        Stage("leg_impact", ("leave_one_out",), _stage_leg_impact),
+        Stage("signal_info", ("evaluation", "primary_failure", "delta_preview"), _stage_signal_info),
+        Stage("explain", ("normalized", "explain_full", "evaluation", "blocks", "primary_failure"), _stage_explain),
+        Stage("primary_type", ("primary_failure",), _stage_primary_type),
+        Stage("entities", ("entities_internal", "blocks", "eval_ctx"), _stage_entities),
+        Stage("secondary_factors", ("evaluation", "blocks", "entities_internal", "primary_type", "eval_ctx"), _stage_secondary_factors),
+        Stage("human_summary", ("evaluation", "blocks", "entities_internal", "primary_failure", "eval_ctx"), _stage_human_summary),
+        Stage("sherlock_result", ("evaluation", "signal_info", "primary_type", "eval_ctx"), _stage_sherlock_result),
+        Stage("debug_explainability", ("sherlock_result",), _stage_debug_explainability),
+        Stage("dna_artifacts", ("evaluation", "signal_info", "primary_type", "eval_ctx"), _stage_dna_artifacts),
+        Stage("contract_validation", ("dna_artifacts",), _stage_contract_validation),
+        Stage("ui_validation", ("dna_artifacts",), _stage_ui_validation),
+        Stage("proof_summary", ("debug_explainability", "contract_validation", "ui_validation", "dna_artifacts"), _stage_proof_summary),
+        Stage("evaluated_parlay", ("blocks", "normalized"), _stage_evaluated_parlay),
+        Stage("notable_legs", ("blocks", "evaluation", "primary_failure"), _stage_notable_legs),
+        Stage("final_verdict", ("evaluation", "blocks", "entities_internal", "primary_failure", "signal_info", "eval_ctx"), _stage_final_verdict),
+        Stage("gentle_guidance", ("primary_failure", "signal_info"), _stage_gentle_guidance),
+        Stage("grounding_warnings", ("evaluated_parlay", "entities", "normalized"), _stage_grounding_warnings),
+        Stage("structure", ("blocks", "normalized"), _stage_structure),
+        Stage("session_id", ("normalized",), _stage_session_id),
+        Stage("delta", ("session_id", "structure"), _stage_delta),
+        Stage("grounding_score", ("structure", "evaluation", "primary_failure", "final_verdict"), _stage_grounding_score),
+        Stage("next_action", ("signal_info", "primary_failure", "explain", "evaluation"), _stage_next_action),
+        Stage("confidence_trend", ("session_id", "signal_info"), _stage_confidence_trend),
+    ],
+)
 
-    return PipelineResponse(
-        evaluation=evaluation,
-        interpretation=interpretation,
-        explain=explain_filtered,
-        context=context_data,
-        primary_failure=primary_failure,
-        delta_preview=delta_preview,
-        signal_info=signal_info,
-        entities=entities_public,
-        secondary_factors=secondary_factors,
-        human_summary=human_summary,
-        evaluated_parlay=evaluated_parlay,
-        notable_legs=notable_legs,
-        final_verdict=final_verdict,
-        gentle_guidance=gentle_guidance,
-        next_action=next_action,
-        confidence_trend=confidence_trend,
-        grounding_warnings=grounding_warnings if grounding_warnings else None,
-        sherlock_result=sherlock_result,
-        debug_explainability=debug_explainability,
-        proof_summary=proof_summary,
-        structure=structure_snapshot.to_dict(),  # Ticket 38B-A: Structural snapshot
-        delta=delta_result.to_dict() if delta_result else None,  # Ticket 38B-B: Change delta
-        grounding_score=grounding_score_result.to_dict(),  # Ticket 38B-C2: Grounding score
+# Artifacts every response carries (non-optional PipelineResponse fields)
+_REQUIRED_OUTPUTS = ("evaluation", "interpretation", "explain", "eval_ctx")
+
+# Optional PipelineResponse fields that can be requested via fields=
+PIPELINE_FIELDS = frozenset({
+    "context", "primary_failure", "delta_preview", "signal_info", "entities",
+    "secondary_factors", "human_summary", "evaluated_parlay", "notable_legs",
+    "final_verdict", "gentle_guidance", "next_action", "confidence_trend",
+    "grounding_warnings", "sherlock_result", "debug_explainability",
+    "proof_summary", "structure", "delta", "grounding_score", "leg_impact",
+})
+
+
+# Full responses keyed by evaluation_fingerprint (see app/evaluation_cache.py)
+_RESULT_CACHE = EvaluationCache(
+    max_entries=_config.eval_cache_max_entries,
+    ttl_seconds=_config.eval_cache_ttl_seconds,
+)
+
+
+def get_evaluation_cache() -> EvaluationCache:
+    """Get the process-wide evaluation result cache."""
+    return _RESULT_CACHE
+
+
+def _context_version(snapshots: tuple[ContextSnapshot, ...]) -> Optional[tuple]:
+    """Identity of the context snapshots: changes whenever any is refreshed."""
+    if not snapshots:
+        return None
+    return tuple(
+        (snapshot.sport, snapshot.source, snapshot.as_of.isoformat()) for snapshot in snapshots
+    )
+
+
+def _result_cache_key(
+    normalized: NormalizedInput,
+    slip: ParsedSlip,
+    snapshots: tuple[ContextSnapshot, ...],
+) -> str:
+    return evaluation_fingerprint(
+        text=slip.raw_text,
+        tier=normalized.tier.value,
+        canonical_legs=_canonical_legs_of(normalized),
+        context_version=_context_version(snapshots),
+        flags=(_config.sherlock_enabled, _config.dna_recording_enabled),
+    )
+
+
+def parse_fields(fields: Optional[str]) -> Optional[frozenset]:
+    """
+    Parse a sparse fieldset parameter ("signalInfo,finalVerdict").
+
+    Accepts snake_case or camelCase names. Returns None when no fieldset was
+    given (full response).
+
+    Raises:
+        ValueError: If a name is not a PipelineResponse field
+    """
+    if fields is None or not fields.strip():
+        return None
+    names = set()
+    for raw in fields.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        name = re.sub(r'(?<!^)([A-Z])', r'_\1', raw).lower()
+        if name not in PIPELINE_FIELDS:
+            raise ValueError(f"Unknown field: {raw}")
+        names.add(name)
+    return frozenset(names)
+
+
+def _requested_fields(fields: Optional[frozenset]) -> frozenset:
+    """Validate a sparse fieldset; None means every optional field."""
+    if fields is None:
+        return PIPELINE_FIELDS
+    unknown = set(fields) - PIPELINE_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+    return frozenset(fields)
+
+
+def run_evaluation(
+    normalized: NormalizedInput,
+    fields: Optional[frozenset] = None,
+    snapshots: Optional[tuple[ContextSnapshot, ...]] = None,
+) -> PipelineResponse:
+    """
+    Run the canonical evaluation pipeline.
+
+    This is the ONLY entry point for evaluation. All routes call this.
+
+    Full responses are cached by a fingerprint of the slip, tier, canonical
+    legs and context snapshot versions; a hit skips every stage. Cached
+    responses are shared and must be treated as read-only. Inputs with a
+    session_id bypass the cache: their change delta and confidence trend
+    compare against the session's previous evaluation.
+
+    Every executed stage is timed into the stage latency histograms
+    (app/stage_latency.py); the per-call breakdown is returned in
+    timings_ms.
+
+    Args:
+        normalized: Validated input from Airlock
+        fields: Optional sparse fieldset (PIPELINE_FIELDS names). When given,
+            only the stages those fields depend on run; other optional
+            fields are None. Default runs every stage.
+        snapshots: Context snapshots already resolved for this slip (see
+            context_snapshots_for_batch). Fetched when None.
+
+    Returns:
+        PipelineResponse with evaluation, interpretation, context, and explain
+
+    Flow:
+        1. Parse text → BetBlocks
+        2. Call evaluate_parlay() (the canonical core function)
+        3. Fetch external context (Sprint 3)
+        4. Generate plain-English interpretation
+        5. Apply tier filtering to explain
+        6. Return unified response
+    """
+    snapshots_for = _fetch_context_snapshots if snapshots is None else lambda _slip: snapshots
+    return _evaluate(normalized, _requested_fields(fields), snapshots_for)
+
+
+async def run_evaluation_async(
+    normalized: NormalizedInput,
+    fields: Optional[frozenset] = None,
+) -> PipelineResponse:
+    """
+    Non-blocking run_evaluation for async routes.
+
+    The context snapshots are fetched with the async client on the event
+    loop; the CPU-bound stages and blocking I/O (alert persistence) run on
+    the bounded evaluation executor. Same result and cache as run_evaluation.
+    """
+    requested = _requested_fields(fields)
+    slip = ParsedSlip.parse(normalized.input_text)
+    snapshots = await _fetch_context_snapshots_async(slip)
+    return await run_in_evaluation_executor(
+        _evaluate, normalized, requested, lambda _slip: snapshots, slip=slip
+    )
+
+
+def _evaluate(
+    normalized: NormalizedInput,
+    requested: frozenset,
+    snapshots_for: Callable[[ParsedSlip], tuple[ContextSnapshot, ...]],
+    slip: Optional[ParsedSlip] = None,
+) -> PipelineResponse:
+    """
+    Evaluate one slip.
+
+    `snapshots_for` resolves the context snapshots for a parsed slip, so a
+    batch can fetch each sport once and reuse it for every item. `slip` may be
+    passed when the caller already parsed the input.
+    """
+    for _phase, result in _evaluate_phases(normalized, requested, snapshots_for, slip):
+        response = result
+    return response
+
+
+def _evaluate_phases(
+    normalized: NormalizedInput,
+    requested: frozenset,
+    snapshots_for: Callable[[ParsedSlip], tuple[ContextSnapshot, ...]],
+    slip: Optional[ParsedSlip] = None,
+    phases: Sequence[tuple[str, tuple[str, ...]]] = (),
+) -> Iterator[tuple[str, Any]]:
+    """
+    Evaluate one slip, running the stage graph phase by phase.
+
+    Yields (phase name, {field: value}) once each of `phases` has been
+    computed, then ("complete", PipelineResponse). Phase fields are
+    PipelineResponse field names. A cache hit yields every phase at once
+    from the cached response.
+    """
+    call_start = time.perf_counter()
+    timings: dict[str, float] = {}
+
+    # Parse + context snapshots first: together they address the cached result
+    if slip is None:
+        slip = ParsedSlip.parse(normalized.input_text)
+        timings["slip"] = (time.perf_counter() - call_start) * 1000
+    step_start = time.perf_counter()
+    snapshots = snapshots_for(slip)
+    timings["context_snapshot"] = (time.perf_counter() - step_start) * 1000
+
+    # Session-bound evaluations read and record session history (delta,
+    # confidence trend), so they always run the stages
+    cacheable = normalized.session_id is None
+    cached = None
+    if cacheable:
+        step_start = time.perf_counter()
+        cache_key = _result_cache_key(normalized, slip, snapshots)
+        cached = _RESULT_CACHE.get(cache_key)
+        timings["result_cache"] = (time.perf_counter() - step_start) * 1000
+
+    if cached is not None:
+        record_stage_timings(timings, total_ms=(time.perf_counter() - call_start) * 1000)
+        dropped = {name: None for name in PIPELINE_FIELDS - requested}
+        response = replace(cached, timings_ms=timings, **dropped)
+        for phase, names in phases:
+            yield phase, {name: getattr(response, name) for name in names}
+        yield "complete", response
+        return
+
+    outputs = (*_REQUIRED_OUTPUTS, *requested)
+    values = {"slip": slip, "context_snapshots": snapshots}
+    for phase, names in phases:
+        run = _PIPELINE_GRAPH.run(
+            outputs=[name for name in names if name in outputs],
+            inputs={"normalized": normalized},
+            precomputed=values,
+        )
+        values.update((name, run.values[name]) for name in run.executed)
+        timings.update(run.timings_ms)
+        yield phase, {name: values.get(name) for name in names}
+
+    # Whatever the phases did not cover (everything, without phases)
+    run = _PIPELINE_GRAPH.run(outputs=outputs, inputs={"normalized": normalized}, precomputed=values)
+    timings.update(run.timings_ms)
+    record_stage_timings(timings, total_ms=(time.perf_counter() - call_start) * 1000)
+    _logger.debug(
+        "Pipeline stages: %s",
+        ", ".join(f"{name}={ms:.2f}ms" for name, ms in timings.items()),
+    )
+    out = run.values
+
+    def field_value(name: str):
+        return out.get(name) if name in requested else None
+
+    eval_ctx = out["eval_ctx"]
+    response = PipelineResponse(
+        evaluation=out["evaluation"],
+        interpretation=out["interpretation"],
+        explain=out["explain"],
+        context=field_value("context"),
+        primary_failure=field_value("primary_failure"),
+        delta_preview=field_value("delta_preview"),
+        signal_info=field_value("signal_info"),
+        entities=field_value("entities"),
+        secondary_factors=field_value("secondary_factors"),
+        human_summary=field_value("human_summary"),
+        evaluated_parlay=field_value("evaluated_parlay"),
+        notable_legs=field_value("notable_legs"),
+        final_verdict=field_value("final_verdict"),
+        gentle_guidance=field_value("gentle_guidance"),
+        next_action=field_value("next_action"),
+        confidence_trend=field_value("confidence_trend"),
+        grounding_warnings=field_value("grounding_warnings"),
+        sherlock_result=field_value("sherlock_result"),
+        debug_explainability=field_value("debug_explainability"),
+        proof_summary=field_value("proof_summary"),
+        structure=field_value("structure"),  # Ticket 38B-A: Structural snapshot
+        delta=field_value("delta"),  # Ticket 38B-B: Change delta
+        grounding_score=field_value("grounding_score"),  # Ticket 38B-C2: Grounding score
+        leg_impact=field_value("leg_impact"),
         leg_count=eval_ctx.leg_count,  # Ticket 28: Use authoritative context
         tier=normalized.tier.value,
+        timings_ms=timings,
+    )
+
+    # Only complete responses are cached; sparse ones are cut from them on hit
+    if cacheable and requested == PIPELINE_FIELDS:
+        _RESULT_CACHE.put(cache_key, response)
+    yield "complete", response
+
+
+# =============================================================================
+# Streaming Evaluation
+# =============================================================================
+
+
+# Phases of a streamed evaluation, most decision-relevant first. Together
+# they cover every PipelineResponse field; proof data comes last because
+# Sherlock and artifact validation are the slowest stages.
+STREAM_PHASES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("signal", ("evaluation", "signal_info", "final_verdict")),
+    ("diagnosis", ("primary_failure", "delta_preview", "leg_impact")),
+    ("narrative", (
+        "interpretation", "explain", "human_summary", "secondary_factors",
+        "notable_legs", "evaluated_parlay", "entities", "gentle_guidance",
+        "next_action", "grounding_warnings", "context", "structure", "delta",
+        "confidence_trend", "grounding_score",
+    )),
+    ("proof", ("sherlock_result", "debug_explainability", "proof_summary")),
+)
+
+
+async def run_evaluation_stream(normalized: NormalizedInput) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Streamed full evaluation for progressive (SSE) responses.
+
+    Yields (phase, {field: value}) for each of STREAM_PHASES as soon as its
+    stages have run, then ("complete", PipelineResponse) with the same
+    response run_evaluation returns. Stages run on the evaluation
+    executor, one phase per hop.
+    """
+    slip = ParsedSlip.parse(normalized.input_text)
+    snapshots = await _fetch_context_snapshots_async(slip)
+    phases = _evaluate_phases(
+        normalized, PIPELINE_FIELDS, lambda _slip: snapshots, slip=slip, phases=STREAM_PHASES
     )
+    while True:
+        item = await run_in_evaluation_executor(next, phases, None)
+        if item is None:
+            return
+        yield item
+
+
+# =============================================================================
+# Batch Evaluation
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    """
+    One slot of a batch evaluation.
+
+    Exactly one of `response` / `error` is set. `index` is the position of
+    the input in the batch. `response` is the PipelineResponse, or its
+    asdict() from app.evaluation_pool.run_evaluation_batch_payload.
+    """
+    index: int
+    response: Optional[PipelineResponse | dict] = None
+    error: Optional[str] = None
+    error_code: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _shared_snapshot_resolver() -> Callable[[ParsedSlip], tuple[ContextSnapshot, ...]]:
+    """Snapshot resolver that fetches each sport at most once over its lifetime."""
+    snapshots: dict[str, Optional[ContextSnapshot]] = {}
+
+    def shared_snapshots(slip: ParsedSlip) -> tuple[ContextSnapshot, ...]:
+        sports = _context_sports(slip)
+        missing = [sport for sport in sports if sport not in snapshots]
+        if missing:
+            fetched = _fetch_context(missing)
+            snapshots.update((sport, fetched.get(sport)) for sport in missing)
+        return tuple(snapshots[sport] for sport in sports if snapshots[sport] is not None)
+
+    return shared_snapshots
+
+
+def context_snapshots_for_batch(
+    inputs: Sequence[NormalizedInput],
+) -> list[tuple[ContextSnapshot, ...]]:
+    """
+    Resolve the context snapshots of every input, fetching each sport once.
+
+    Lets a batch dispatched to worker processes share one fetch: each item
+    is evaluated with run_evaluation(..., snapshots=...). An input that
+    fails to parse gets no snapshots; its evaluation reports the error.
+    """
+    resolve = _shared_snapshot_resolver()
+    results = []
+    for normalized in inputs:
+        try:
+            results.append(resolve(ParsedSlip.parse(normalized.input_text)))
+        except Exception:
+            results.append(())
+    return results
+
+
+def run_evaluation_batch(
+    inputs: Sequence[NormalizedInput],
+    fields: Optional[frozenset] = None,
+) -> list[BatchItemResult]:
+    """
+    Evaluate many slips in one call.
+
+    Per-batch work is done once: context is fetched at most once per
+    sport and reused for every item, and repeated slips are served
+    from the result cache after their first evaluation. A failing item does
+    not fail the batch; it yields a BatchItemResult with an error instead.
+
+    Args:
+        inputs: Validated inputs from Airlock
+        fields: Optional sparse fieldset applied to every item
+
+    Returns:
+        One BatchItemResult per input, in input order
+
+    Raises:
+        ValueError: If `fields` names an unknown field (applies to the batch)
+    """
+    requested = _requested_fields(fields)
+    shared_snapshots = _shared_snapshot_resolver()
+
+    results = []
+    for index, normalized in enumerate(inputs):
+        try:
+            response = _evaluate(normalized, requested, shared_snapshots)
+        except Exception as e:
+            _logger.warning(f"Batch item {index} failed: {e}")
+            results.append(BatchItemResult(index=index, error=str(e), error_code="EVALUATION_FAILED"))
+        else:
+            results.append(BatchItemResult(index=index, response=response))
+    return results
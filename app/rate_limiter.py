@@ -120,26 +120,31 @@ class TokenBucket:
     max_tokens: float
     refill_rate: float  # tokens per second
 
-    def consume(self, now: float) -> Tuple[bool, float]:
+    def consume(self, now: float, cost: float = 1.0) -> Tuple[bool, float]:
         """
-        Try to consume a token.
+        Try to consume `cost` tokens.
+
+        A request costing more than the bucket can hold is admitted once the
+        bucket is full and leaves it in debt, so it still pays for every
+        token before the client is allowed again.
 
         Returns:
             (allowed, retry_after_seconds)
             - allowed: True if request is allowed
-            - retry_after_seconds: Seconds until next token available (0 if allowed)
+            - retry_after_seconds: Seconds until enough tokens are available (0 if allowed)
         """
         # Refill tokens based on time elapsed
         elapsed = now - self.last_refill
         self.tokens = min(self.max_tokens, self.tokens + elapsed * self.refill_rate)
         self.last_refill = now
 
-        if self.tokens >= 1.0:
-            self.tokens -= 1.0
+        required = min(cost, self.max_tokens)
+        if self.tokens >= required:
+            self.tokens -= cost
             return True, 0.0
         else:
-            # Calculate time until next token
-            tokens_needed = 1.0 - self.tokens
+            # Calculate time until enough tokens
+            tokens_needed = required - self.tokens
             retry_after = tokens_needed / self.refill_rate
             return False, retry_after
 
@@ -167,10 +172,14 @@ class RateLimiter:
         self._refill_rate = self.requests_per_minute / 60.0
         self._last_cleanup = self.clock()
 
-    def check(self, client_ip: str) -> Tuple[bool, float]:
+    def check(self, client_ip: str, cost: int = 1) -> Tuple[bool, float]:
         """
         Check if request from client_ip is allowed.
 
+        Args:
+            client_ip: Client address (bucket key)
+            cost: Tokens the request consumes (e.g. items in a batch)
+
         Returns:
             (allowed, retry_after_seconds)
         """
@@ -191,7 +200,7 @@ class RateLimiter:
                     refill_rate=self._refill_rate,
                 )
 
-            return self._buckets[client_ip].consume(now)
+            return self._buckets[client_ip].consume(now, cost)
 
     def _cleanup_stale_buckets(self, now: float) -> None:
         """Remove buckets that haven't been used recently."""
@@ -245,7 +254,7 @@ class BypassRateLimiter:
     Used in CI/test mode to prevent flaky tests due to rate limiting.
     """
 
-    def check(self, client_ip: str) -> Tuple[bool, float]:
+    def check(self, client_ip: str, cost: int = 1) -> Tuple[bool, float]:
         """Always allow the request."""
         return True, 0.0
 
@@ -32,9 +32,13 @@ from app.schemas.leading_light import (
     MetricsInfoSchema,
     RecommendationSchema,
     ServiceDisabledResponseSchema,
+    SubParlaySchema,
+    SubParlaySearchRequestSchema,
+    SubParlaySearchResponseSchema,
     SuggestedBlockSchema,
 )
 from app.cost_tracker import record_api_call
+from app.evaluation_executor import run_in_evaluation_executor
 
 # Import core types
 from core.models.leading_light import (
@@ -53,6 +57,7 @@ from core.evaluation import (
     evaluate_parlay,
 )
 from core.context_adapters import adapt_and_apply_signals
+from core.sub_parlay_search import search_sub_parlays
 
 # Import tiering
 from app.tiering import (
@@ -356,8 +361,9 @@ async def evaluate(request: EvaluationRequestSchema) -> EvaluationResponseSchema
             get_max_suggestions_for_plan(plan),
         )
 
-        # Evaluate parlay
-        response = evaluate_parlay(
+        # Evaluate parlay (off the event loop)
+        response = await run_in_evaluation_executor(
+            evaluate_parlay,
             blocks=blocks,
             dna_profile=dna_profile,
             bankroll=request.bankroll,
@@ -400,6 +406,122 @@ async def evaluate(request: EvaluationRequestSchema) -> EvaluationResponseSchema
         )
 
 
+@router.post(
+    "/sub-parlays",
+    response_model=SubParlaySearchResponseSchema,
+    responses={
+        200: {"description": "Successful search"},
+        400: {"description": "Invalid request"},
+        503: {
+            "description": "Service disabled",
+            "model": ServiceDisabledResponseSchema,
+        },
+    },
+    summary="Find sub-parlays under a fragility budget",
+    description=(
+        "Find the leg subsets (of the parlay, plus optional candidates) that keep "
+        "the most legs while final fragility stays within max_fragility and/or "
+        "the DNA fragility tolerance."
+    ),
+)
+async def sub_parlays(request: SubParlaySearchRequestSchema) -> SubParlaySearchResponseSchema:
+    """
+    Search for the largest sub-parlays under a fragility budget.
+
+    Returns the top_k subsets found within time_budget_ms; complete is False
+    when the budget ran out first. Plans without suggestions search the
+    parlay's own legs only, and top_k is capped by the plan's suggestion
+    limit (at least 1). Every search is recorded in the cost tracker.
+    """
+    # Check feature flag
+    if not is_leading_light_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "Leading Light disabled",
+                "detail": "The Leading Light feature is currently disabled. Set LEADING_LIGHT_ENABLED=true to enable.",
+                "code": "SERVICE_DISABLED",
+            },
+        )
+
+    # Parse plan from request
+    plan = parse_plan(request.plan)
+    max_suggestions = get_max_suggestions_for_plan(plan)
+    start_time = time.time()
+    error_code = None
+    result = None
+
+    try:
+        blocks = [_convert_block(b) for b in request.blocks]
+        candidates = []
+        if max_suggestions > 0:
+            candidates = [_convert_block(c) for c in request.candidates or []]
+        dna_profile = _convert_dna_profile(request.dna_profile)
+
+        # Search (off the event loop)
+        result = await run_in_evaluation_executor(
+            search_sub_parlays,
+            blocks=blocks,
+            candidates=candidates,
+            max_fragility=request.max_fragility,
+            dna_profile=dna_profile,
+            top_k=min(request.top_k, max(1, max_suggestions)),
+            time_budget_ms=request.time_budget_ms,
+        )
+
+        return SubParlaySearchResponseSchema(
+            target_fragility=result.target_fragility,
+            complete=result.complete,
+            subsets=[
+                SubParlaySchema(
+                    block_ids=list(subset.block_ids),
+                    legs=subset.legs,
+                    final_fragility=subset.final_fragility,
+                    correlation_penalty=subset.correlation_penalty,
+                    removed_block_ids=list(subset.removed_block_ids),
+                    added_block_ids=list(subset.added_block_ids),
+                )
+                for subset in result.subsets
+            ],
+        )
+
+    except ValueError as e:
+        error_code = "VALIDATION_ERROR"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "Invalid request",
+                "detail": str(e),
+                "code": "VALIDATION_ERROR",
+            },
+        ) from e
+    except Exception as e:
+        error_code = "INTERNAL_ERROR"
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "Internal error",
+                "detail": str(e),
+                "code": "INTERNAL_ERROR",
+            },
+        ) from e
+    finally:
+        record_api_call(
+            endpoint="/leading-light/sub-parlays",
+            latency_ms=(time.time() - start_time) * 1000,
+            success=error_code is None,
+            error_code=error_code,
+            metadata={
+                "operation": "sub_parlay_search",
+                "plan": plan.value,
+                "legs": len(request.blocks),
+                "candidates": len(request.candidates or []),
+                "complete": result.complete if result is not None else None,
+                "nodes_explored": result.nodes_explored if result is not None else None,
+            },
+        )
+
+
 @router.get(
     "/status",
     summary="Check Leading Light status",
@@ -8,6 +8,9 @@ from typing import Optional
 from fastapi import APIRouter, Query
 
 from app.cost_tracker import get_summary, get_recent_calls, get_cache_hit_rate
+from app.delta_engine import get_session_store_stats
+from app.pipeline import get_evaluation_cache
+from app.stage_latency import BUCKET_BOUNDS_MS, get_stage_latency_summary
 
 
 router = APIRouter(
@@ -61,3 +64,45 @@ async def cache_hit_rate(
         "cacheHitRate": get_cache_hit_rate(endpoint),
         "endpoint": endpoint or "all",
     }
+
+
+@router.get("/stages")
+async def stage_latency():
+    """
+    Get evaluation pipeline latency per stage.
+
+    Returns p50/p95/p99 (estimated from fixed in-process buckets) for every
+    stage run_evaluation has executed since startup, slowest p95 first.
+    "total" covers whole run_evaluation calls. With EVAL_BACKEND=process
+    the workers' timings are recorded here as each response comes back.
+    """
+    return {
+        "stages": get_stage_latency_summary(),
+        "bucketBoundsMs": list(BUCKET_BOUNDS_MS),
+    }
+
+
+@router.get("/sessions")
+async def session_stores():
+    """
+    Get size and eviction counters of the delta engine session stores.
+
+    "snapshots" backs the change delta, "signals" the confidence trend.
+    Session-bound evaluations always run in this process, whatever
+    EVAL_BACKEND is, so these are the only session stores.
+    """
+    return get_session_store_stats()
+
+
+@router.get("/evaluation-cache")
+async def evaluation_cache():
+    """
+    Get hit/miss/eviction counters of the evaluation result cache.
+
+    Counted in memory since startup (see app/evaluation_cache.py), in
+    addition to the cache="evaluation" hit/miss rows in persistence
+    metrics. With EVAL_BACKEND=process each worker has its own cache; only
+    evaluations run in this process (thread backend, sessions, fallback)
+    count here, while every worker reports to persistence metrics.
+    """
+    return get_evaluation_cache().stats().to_dict()
@@ -784,7 +784,7 @@ async def v1_evaluate(
     5. Returns full HTML debrief page
     """
     from app.airlock import airlock_ingest, AirlockError
-    from app.pipeline import run_evaluation
+    from app.pipeline import run_evaluation_async
 
     # Parse legs
     try:
@@ -821,8 +821,8 @@ async def v1_evaluate(
             tier=tier,
         )
 
-        # Run evaluation
-        result = run_evaluation(normalized)
+        # Run evaluation (off the event loop)
+        result = await run_evaluation_async(normalized)
 
         # Render debrief
         return _render_debrief_success(
@@ -5,12 +5,16 @@ S6-REFACTOR: Split into template + static files for token efficiency.
 """
 from __future__ import annotations
 
+import json
+import logging
 import time
+from dataclasses import asdict
 from pathlib import Path
 from typing import Optional, List
 
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 
@@ -19,6 +23,8 @@ from app.airlock import airlock_ingest, AirlockError
 from app.rate_limiter import get_client_ip, get_rate_limiter
 from app.correlation import get_request_id
 
+_logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Request Schema
@@ -46,6 +52,23 @@ class WebEvaluateRequest(BaseModel):
         default=None,
         description="Structured leg data from builder. When present, this is source of truth."
     )
+    session_id: Optional[str] = Field(
+        default=None,
+        max_length=128,
+        description="Client session for refinement flows (change delta, confidence trend)",
+    )
+
+
+# Upper bound on slips per batch request
+MAX_BATCH_ITEMS = 50
+
+
+class WebBatchEvaluateRequest(BaseModel):
+    """Request schema for batch evaluation (one WebEvaluateRequest per slip)."""
+    items: List[WebEvaluateRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_ITEMS,
+        description="Slips to evaluate, results are returned in the same order",
+    )
 
 # =============================================================================
 # Router Setup
@@ -127,14 +150,27 @@ async def canonical_app(request: Request, screen: str = "dashboard"):
 
 
 @router.post("/app/evaluate")
-async def evaluate_proxy(request: WebEvaluateRequest, raw_request: Request):
+async def evaluate_proxy(
+    request: WebEvaluateRequest,
+    raw_request: Request,
+    fields: Optional[str] = None,
+    timings: bool = False,
+):
     """
     Server-side proxy for evaluation requests.
 
     Rate limited: 10 requests/minute per IP.
     All input passes through Airlock for validation.
+
+    Optional `fields` query parameter (e.g. ?fields=signalInfo,finalVerdict)
+    requests a sparse response: only the pipeline stages those fields need
+    are run, and only they are returned alongside the core evaluation.
+
+    Optional `timings=true` adds the per-stage millisecond breakdown of this
+    request to `_meta.stages`.
     """
-    from app.pipeline import run_evaluation
+    from app.evaluation_pool import EvaluationPoolBusy, EvaluationTimeout, run_evaluation_payload
+    from app.pipeline import parse_fields
 
     start_time = time.perf_counter()
     request_id = get_request_id(raw_request) or "unknown"
@@ -155,6 +191,7 @@ async def evaluate_proxy(request: WebEvaluateRequest, raw_request: Request):
         normalized = airlock_ingest(
             input_text=request.input,
             tier=request.tier,
+            session_id=request.session_id,
             canonical_legs=canonical_legs,
         )
     except AirlockError as e:
@@ -166,26 +203,202 @@ async def evaluate_proxy(request: WebEvaluateRequest, raw_request: Request):
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Input validation failed: {str(e)}")
 
-    # Run evaluation
-    result = run_evaluation(normalized)
+    # Sparse fieldset (None = full response)
+    try:
+        requested_fields = parse_fields(fields)
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"error": str(e), "code": "INVALID_FIELDS", "detail": str(e)}
+        )
+
+    # Run evaluation (thread or process backend, see app/evaluation_pool.py)
+    try:
+        result_dict = await run_evaluation_payload(normalized, fields=requested_fields)
+    except EvaluationPoolBusy as e:
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": "1"},
+            content={"error": "Evaluation capacity exhausted", "code": "EVALUATION_BUSY", "detail": str(e)}
+        )
+    except EvaluationTimeout as e:
+        return JSONResponse(
+            status_code=504,
+            content={"error": "Evaluation timed out", "code": "EVALUATION_TIMEOUT", "detail": str(e)}
+        )
 
     elapsed = time.perf_counter() - start_time
-    
-    # Convert to dict and add metadata
-    from dataclasses import asdict
-    result_dict = asdict(result)
-    result_dict["_meta"] = {"elapsed_ms": round(elapsed * 1000, 2)}
+    meta = {"elapsed_ms": round(elapsed * 1000, 2)}
+    return _serialize_result(result_dict, normalized, requested_fields, meta, timings)
+
+
+def _serialize_result(result_dict: dict, normalized, requested_fields, meta: dict, timings: bool) -> dict:
+    """Convert an asdict(PipelineResponse) to the camelCase JSON shape of /app/evaluate."""
+    stage_timings = result_dict.pop("timings_ms", None) or {}
+    if requested_fields is not None:
+        result_dict = {
+            k: v for k, v in result_dict.items()
+            if k in requested_fields or k in ("evaluation", "interpretation", "explain", "leg_count", "tier")
+        }
+    if meta or timings:
+        result_dict["_meta"] = dict(meta)
+    if timings:
+        result_dict["_meta"]["stages"] = {
+            name: round(ms, 3) for name, ms in stage_timings.items()
+        }
     
     # Add input object for API compatibility (tests expect this)
     result_dict["input"] = {
         "bet_text": normalized.input_text,
-        "tier": result.tier,
+        "tier": result_dict["tier"],
     }
     
     # Convert snake_case to camelCase for JS frontend compatibility
-    result_dict = convert_keys_to_camel(result_dict)
+    return convert_keys_to_camel(result_dict)
+
+
+@router.post("/app/evaluate/batch")
+async def evaluate_batch(
+    request: WebBatchEvaluateRequest,
+    raw_request: Request,
+    fields: Optional[str] = None,
+    timings: bool = False,
+):
+    """
+    Evaluate up to MAX_BATCH_ITEMS slips in one request.
+
+    Each item has the /app/evaluate request shape and counts as one request
+    for rate limiting. Results come back in input order; an item that fails
+    Airlock validation or evaluation carries an error instead of failing
+    the batch. Items run on the configured backend (app/evaluation_pool.py).
+    """
+    from app.evaluation_pool import run_evaluation_batch_payload
+    from app.pipeline import parse_fields
+
+    start_time = time.perf_counter()
+    client_ip = get_client_ip(raw_request)
+
+    # Rate limiting: one token per item
+    allowed, retry_after = rate_limiter.check(client_ip, cost=len(request.items))
+    if not allowed:
+        raise HTTPException(status_code=429, detail=f"Rate limit exceeded. Retry after {retry_after:.1f} seconds")
 
-    return result_dict
+    try:
+        requested_fields = parse_fields(fields)
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"error": str(e), "code": "INVALID_FIELDS", "detail": str(e)}
+        )
+
+    # Airlock validation per item; invalid items never reach the pipeline
+    items: list = [None] * len(request.items)
+    valid = []
+    for index, item in enumerate(request.items):
+        try:
+            normalized = airlock_ingest(
+                input_text=item.input,
+                tier=item.tier,
+                session_id=item.session_id,
+                canonical_legs=[leg.model_dump() for leg in item.legs] if item.legs else None,
+            )
+        except AirlockError as e:
+            items[index] = {"index": index, "ok": False, "error": {"code": e.code, "message": str(e)}}
+            continue
+        valid.append((index, normalized))
+
+    batch = await run_evaluation_batch_payload(
+        [normalized for _, normalized in valid], fields=requested_fields
+    )
+    for (index, normalized), outcome in zip(valid, batch, strict=True):
+        if outcome.ok:
+            items[index] = {
+                "index": index,
+                "ok": True,
+                "result": _serialize_result(outcome.response, normalized, requested_fields, {}, timings),
+            }
+        else:
+            items[index] = {
+                "index": index,
+                "ok": False,
+                "error": {"code": outcome.error_code, "message": outcome.error},
+            }
+
+    elapsed = time.perf_counter() - start_time
+    return convert_keys_to_camel({
+        "results": items,
+        "_meta": {
+            "elapsed_ms": round(elapsed * 1000, 2),
+            "item_count": len(items),
+            "error_count": sum(1 for item in items if not item["ok"]),
+        },
+    })
+
+
+def _sse_event(event: str, data) -> str:
+    """Format one Server-Sent Event with a camelCase JSON payload."""
+    payload = json.dumps(convert_keys_to_camel(jsonable_encoder(data)), separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@router.post("/app/evaluate/stream")
+async def evaluate_stream(request: WebEvaluateRequest, raw_request: Request):
+    """
+    Streaming variant of /app/evaluate (Server-Sent Events).
+
+    Events arrive as their pipeline stages complete, most decision-relevant
+    first (see STREAM_PHASES in app/pipeline.py):
+
+        signal     evaluation, signalInfo, finalVerdict
+        diagnosis  primaryFailure, deltaPreview, legImpact
+        narrative  summaries, guidance, context, structure, delta, ...
+        proof      sherlockResult, debugExplainability, proofSummary
+        complete   the full /app/evaluate response body
+
+    A failure after streaming has started is sent as an `error` event.
+    Rate limiting and Airlock validation errors are plain JSON responses,
+    as on /app/evaluate.
+    """
+    from app.pipeline import run_evaluation_stream
+
+    start_time = time.perf_counter()
+    client_ip = get_client_ip(raw_request)
+
+    # Rate limiting
+    allowed, retry_after = rate_limiter.check(client_ip)
+    if not allowed:
+        raise HTTPException(status_code=429, detail=f"Rate limit exceeded. Retry after {retry_after:.1f} seconds")
+
+    # Airlock validation
+    try:
+        normalized = airlock_ingest(
+            input_text=request.input,
+            tier=request.tier,
+            session_id=request.session_id,
+            canonical_legs=[leg.model_dump() for leg in request.legs] if request.legs else None,
+        )
+    except AirlockError as e:
+        return JSONResponse(
+            status_code=400,
+            content={"error": str(e), "code": e.code, "detail": str(e)}
+        )
+
+    async def events():
+        try:
+            async for phase, payload in run_evaluation_stream(normalized):
+                if phase == "complete":
+                    meta = {"elapsed_ms": round((time.perf_counter() - start_time) * 1000, 2)}
+                    payload = _serialize_result(asdict(payload), normalized, None, meta, False)
+                yield _sse_event(phase, payload)
+        except Exception as e:
+            _logger.warning(f"Streaming evaluation failed: {e}")
+            yield _sse_event("error", {"code": "EVALUATION_FAILED", "message": str(e)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 # S16: Legacy route redirects
 @router.get("/new")
@@ -133,6 +133,38 @@ class EvaluationRequestSchema(BaseModel):
         return v_lower
 
 
+class SubParlaySearchRequestSchema(BaseModel):
+    """
+    Request schema for sub-parlay search.
+
+    At least one of max_fragility or dna_profile (fragility tolerance)
+    sets the budget; the tighter one applies when both are given.
+    Leg counts are capped: the search builds an O(n^2) pair table.
+    Candidates and top_k are limited by plan, like suggestions.
+    """
+    blocks: List[BetBlockSchema] = Field(max_length=20)
+    candidates: Optional[List[BetBlockSchema]] = Field(default=None, max_length=50)
+    max_fragility: Optional[float] = Field(default=None, ge=0, le=100)
+    dna_profile: Optional[DNAProfileSchema] = None
+    top_k: int = Field(default=5, ge=1, le=20)
+    time_budget_ms: int = Field(default=250, ge=10, le=2000)
+    plan: Optional[str] = Field(
+        default="good",
+        description="Subscription plan tier: good, better, or best"
+    )
+
+    @field_validator("plan")
+    @classmethod
+    def validate_plan(cls, v: Optional[str]) -> str:
+        """Validate plan is one of good, better, best."""
+        if v is None:
+            return "good"
+        v_lower = v.lower()
+        if v_lower not in ("good", "better", "best"):
+            raise ValueError(f"Invalid plan '{v}'. Must be one of: good, better, best")
+        return v_lower
+
+
 # =============================================================================
 # Response Schemas
 # =============================================================================
@@ -201,6 +233,23 @@ class EvaluationResponseSchema(BaseModel):
     suggestions: Optional[List[SuggestedBlockSchema]] = None
 
 
+class SubParlaySchema(BaseModel):
+    """One leg subset under the fragility budget."""
+    block_ids: List[UUID]
+    legs: int
+    final_fragility: float
+    correlation_penalty: float
+    removed_block_ids: List[UUID]
+    added_block_ids: List[UUID]
+
+
+class SubParlaySearchResponseSchema(BaseModel):
+    """Response schema for sub-parlay search."""
+    target_fragility: float
+    complete: bool  # False if the time budget cut the search short
+    subsets: List[SubParlaySchema]
+
+
 # =============================================================================
 # Error Response
 # =============================================================================
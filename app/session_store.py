@@ -0,0 +1,26 @@
+# app/session_store.py
+"""
+Session Store - bounded per-session state for refinement flows.
+
+The delta engine compares each evaluation with the previous one in the same
+session (structural snapshot for the change delta, signal for the
+confidence trend). That state lives here, keyed by the client's session id:
+
+- Every entry expires ttl_seconds after it was last written.
+- At most max_entries sessions are kept; the least recently used session
+  is evicted first, so memory stays bounded however many sessions arrive.
+
+State is per process. With EVAL_BACKEND=process session-bound evaluations
+still run in the parent process (see app/evaluation_pool.py), so every
+session's history lives in one place.
+"""
+from __future__ import annotations
+
+from app.bounded_cache import BoundedTTLCache
+
+
+class SessionStore(BoundedTTLCache):
+    """Session-keyed store with per-entry TTL and an LRU cap (app/bounded_cache.py)."""
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 1800):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
@@ -0,0 +1,148 @@
+# app/stage_graph.py
+"""
+Stage Graph - declarative, dependency-driven execution for the pipeline.
+
+Each stage declares the artifacts it reads (inputs) and produces exactly one
+artifact named after the stage. A request names the artifacts it needs and
+only those stages plus their transitive dependencies run.
+
+Design Principles:
+1. Declaration order is execution order — stages must be declared after the
+   stages they depend on, so side effects keep their original sequence
+2. Unknown inputs fail at build time, not per request
+3. Every executed stage is timed, so stage cost is visible per request
+"""
+from __future__ import annotations
+
+import functools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One pipeline stage.
+
+    Attributes:
+        name: Artifact produced by this stage
+        inputs: Artifacts (stage names or initial inputs) read by this stage
+        run: Callable receiving the artifact dict and returning the artifact
+    """
+    name: str
+    inputs: tuple[str, ...]
+    run: Callable[[Mapping[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class StageRun:
+    """
+    Result of executing a stage graph.
+
+    Attributes:
+        values: All artifacts available after the run (initial inputs included)
+        executed: Stage names in execution order
+        timings_ms: Wall-clock milliseconds spent in each executed stage
+    """
+    values: dict
+    executed: tuple[str, ...]
+    timings_ms: dict = field(default_factory=dict)
+
+
+class StageGraphError(ValueError):
+    """Raised for invalid graph definitions or unknown requested artifacts."""
+
+
+class StageGraph:
+    """
+    Immutable set of stages with dependency resolution.
+
+    Plans are cached per (outputs) set since requests use a handful of
+    distinct field sets. The cache is an LRU bounded by `max_plans`: output
+    sets come from client-supplied fieldsets, so their number is unbounded.
+    """
+
+    def __init__(
+        self,
+        stages: Iterable[Stage],
+        initial_inputs: Iterable[str] = (),
+        max_plans: int = 128,
+    ):
+        self._initial = frozenset(initial_inputs)
+        self._stages: dict[str, Stage] = {}
+        self._order: dict[str, int] = {}
+
+        for stage in stages:
+            if stage.name in self._stages or stage.name in self._initial:
+                raise StageGraphError(f"Duplicate stage: {stage.name}")
+            for name in stage.inputs:
+                if name not in self._stages and name not in self._initial:
+                    raise StageGraphError(
+                        f"Stage '{stage.name}' reads '{name}' before it is produced"
+                    )
+            self._order[stage.name] = len(self._stages)
+            self._stages[stage.name] = stage
+
+        self._cached_plan = functools.lru_cache(maxsize=max_plans)(self._resolve)
+
+    @property
+    def stage_names(self) -> tuple[str, ...]:
+        """All stage names in declaration (execution) order."""
+        return tuple(self._stages)
+
+    def plan(self, outputs: Iterable[str]) -> tuple[str, ...]:
+        """
+        Return the stages needed to produce `outputs`, in execution order.
+
+        Raises:
+            StageGraphError: If an output is neither a stage nor an initial input
+        """
+        return self._cached_plan(frozenset(outputs))
+
+    def _resolve(self, wanted: frozenset) -> tuple[str, ...]:
+        needed: set[str] = set()
+        pending = [name for name in wanted if name not in self._initial]
+        while pending:
+            name = pending.pop()
+            if name in needed:
+                continue
+            stage = self._stages.get(name)
+            if stage is None:
+                raise StageGraphError(f"Unknown pipeline output: {name}")
+            needed.add(name)
+            pending.extend(i for i in stage.inputs if i not in self._initial)
+
+        return tuple(sorted(needed, key=self._order.__getitem__))
+
+    def run(
+        self,
+        outputs: Iterable[str],
+        inputs: Mapping[str, Any],
+        precomputed: Optional[Mapping[str, Any]] = None,
+    ) -> StageRun:
+        """
+        Execute the stages needed for `outputs` against the initial `inputs`.
+
+        `precomputed` supplies artifacts the caller already produced (e.g. the
+        parsed slip used to build a cache key); their stages are not re-run.
+        """
+        missing = self._initial - set(inputs)
+        if missing:
+            raise StageGraphError(f"Missing initial inputs: {sorted(missing)}")
+
+        values = dict(inputs)
+        if precomputed:
+            unknown = set(precomputed) - set(self._stages)
+            if unknown:
+                raise StageGraphError(f"Unknown precomputed artifacts: {sorted(unknown)}")
+            values.update(precomputed)
+
+        timings: dict[str, float] = {}
+        plan = tuple(name for name in self.plan(outputs) if name not in values)
+        for name in plan:
+            start = time.perf_counter()
+            values[name] = self._stages[name].run(values)
+            timings[name] = (time.perf_counter() - start) * 1000
+
+        return StageRun(values=values, executed=plan, timings_ms=timings)
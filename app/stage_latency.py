@@ -0,0 +1,133 @@
+# app/stage_latency.py
+"""
+Stage Latency - in-process, fixed-bucket latency histograms per pipeline stage.
+
+run_evaluation times every stage it executes (see app/stage_graph.py) and
+records the samples here. Histograms use fixed millisecond buckets, so an
+update is one bisect plus a few integer increments under a lock — no
+allocation, no DB write per sample.
+
+Percentiles are estimated by linear interpolation inside the bucket that
+holds the requested rank. Resolution is therefore bounded by bucket width,
+which is fine for finding the dominant stage.
+
+Follows the same module-level store pattern as cost_tracker.py.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, Iterable, Mapping, Optional
+
+# Upper bounds (inclusive, milliseconds) of each bucket; a final overflow
+# bucket catches everything above the last bound.
+BUCKET_BOUNDS_MS: tuple[float, ...] = (
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1, 2.5, 5, 10, 25, 50,
+    100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+# Histogram name for whole run_evaluation calls
+TOTAL_STAGE = "total"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (not thread-safe; guarded by the store)."""
+
+    __slots__ = ("bounds", "counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self, bounds: Iterable[float] = BUCKET_BOUNDS_MS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Add one sample."""
+        self.counts[bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-th percentile (0 < q <= 100) in milliseconds.
+
+        Returns None when no samples were recorded.
+        """
+        if self.count == 0:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max_ms
+                upper = min(upper, self.max_ms)
+                fraction = (rank - seen) / bucket_count
+                return lower + (upper - lower) * max(0.0, min(1.0, fraction))
+            seen += bucket_count
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        """Summary for the metrics API (camelCase, like other metrics payloads)."""
+        def ms(value: Optional[float]) -> Optional[float]:
+            return round(value, 3) if value is not None else None
+
+        return {
+            "count": self.count,
+            "avgMs": ms(self.sum_ms / self.count) if self.count else None,
+            "p50Ms": ms(self.percentile(50)),
+            "p95Ms": ms(self.percentile(95)),
+            "p99Ms": ms(self.percentile(99)),
+            "maxMs": ms(self.max_ms) if self.count else None,
+        }
+
+
+# =============================================================================
+# In-Memory Store
+# =============================================================================
+
+_histograms: Dict[str, LatencyHistogram] = {}
+_lock = Lock()
+
+
+def record_stage_timings(timings_ms: Mapping[str, float], total_ms: Optional[float] = None) -> None:
+    """
+    Record one pipeline run.
+
+    Args:
+        timings_ms: Milliseconds per executed stage
+        total_ms: Wall-clock milliseconds for the whole call (optional)
+    """
+    with _lock:
+        for name, value in timings_ms.items():
+            histogram = _histograms.get(name)
+            if histogram is None:
+                histogram = _histograms[name] = LatencyHistogram()
+            histogram.record(value)
+        if total_ms is not None:
+            histogram = _histograms.get(TOTAL_STAGE)
+            if histogram is None:
+                histogram = _histograms[TOTAL_STAGE] = LatencyHistogram()
+            histogram.record(total_ms)
+
+
+def get_stage_latency_summary() -> Dict[str, dict]:
+    """
+    Get p50/p95/p99 per stage, slowest p95 first.
+
+    Returns:
+        Dict of stage name -> histogram summary
+    """
+    with _lock:
+        summaries = {name: h.to_dict() for name, h in _histograms.items()}
+    return dict(sorted(summaries.items(), key=lambda item: -(item[1]["p95Ms"] or 0.0)))
+
+
+def clear_stage_latency() -> None:
+    """Clear all histograms (for testing)."""
+    with _lock:
+        _histograms.clear()
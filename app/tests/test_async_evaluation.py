@@ -0,0 +1,117 @@
+# app/tests/test_async_evaluation.py
+"""
+Tests for the non-blocking evaluation path.
+
+Verifies:
+1. run_evaluation_async returns the same result as run_evaluation
+2. Engine work runs on the bounded evaluation executor, not the loop thread
+3. The event loop keeps running while an evaluation is in progress
+4. Executor size comes from EVAL_EXECUTOR_WORKERS
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.airlock import NormalizedInput, Tier
+from app.evaluation_executor import get_evaluation_executor, shutdown_evaluation_executor
+from app.pipeline import evaluate_parlay, get_evaluation_cache, run_evaluation, run_evaluation_async
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    get_evaluation_cache().clear()
+    yield
+    get_evaluation_cache().clear()
+
+
+def _input(text="Lakers -5.5 + LeBron over 25.5 points", tier=Tier.BEST):
+    return NormalizedInput(input_text=text, tier=tier)
+
+
+class TestRunEvaluationAsync:
+    """Tests for run_evaluation_async."""
+
+    def test_matches_sync_result(self):
+        normalized = _input()
+        sync_result = run_evaluation(normalized)
+        get_evaluation_cache().clear()
+        async_result = asyncio.run(run_evaluation_async(normalized))
+        assert async_result.signal_info == sync_result.signal_info
+        assert async_result.final_verdict == sync_result.final_verdict
+        assert async_result.context["source"] == sync_result.context["source"]
+
+    def test_sparse_fields(self):
+        result = asyncio.run(run_evaluation_async(_input(), fields=frozenset({"signal_info"})))
+        assert result.signal_info is not None
+        assert result.final_verdict is None
+
+    def test_engine_runs_on_executor_thread(self):
+        threads = []
+
+        def engine(**kwargs):
+            threads.append(threading.current_thread().name)
+            return evaluate_parlay(**kwargs)
+
+        with patch("app.pipeline.evaluate_parlay", side_effect=engine):
+            asyncio.run(run_evaluation_async(_input()))
+        assert threads and threads[0].startswith("evaluation")
+
+    def test_loop_not_blocked_by_slow_evaluation(self):
+        def slow_engine(**kwargs):
+            time.sleep(0.3)
+            return evaluate_parlay(**kwargs)
+
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            await run_evaluation_async(_input())
+            task.cancel()
+            return ticks
+
+        with patch("app.pipeline.evaluate_parlay", side_effect=slow_engine):
+            ticks = asyncio.run(scenario())
+        assert ticks >= 10
+
+    def test_concurrent_evaluations_overlap(self):
+        def slow_engine(**kwargs):
+            time.sleep(0.2)
+            return evaluate_parlay(**kwargs)
+
+        async def scenario():
+            return await asyncio.gather(
+                run_evaluation_async(_input("Lakers ML")),
+                run_evaluation_async(_input("Celtics ML")),
+            )
+
+        start = time.perf_counter()
+        with patch("app.pipeline.evaluate_parlay", side_effect=slow_engine):
+            results = asyncio.run(scenario())
+        assert len(results) == 2
+        assert time.perf_counter() - start < 0.39
+
+
+class TestEvaluationExecutor:
+    """Executor lifecycle."""
+
+    def test_size_from_config(self, monkeypatch):
+        shutdown_evaluation_executor()
+        monkeypatch.setenv("EVAL_EXECUTOR_WORKERS", "2")
+        try:
+            assert get_evaluation_executor()._max_workers == 2
+        finally:
+            shutdown_evaluation_executor()
+
+    def test_recreated_after_shutdown(self):
+        first = get_evaluation_executor()
+        shutdown_evaluation_executor()
+        assert get_evaluation_executor() is not first
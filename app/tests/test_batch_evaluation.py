@@ -0,0 +1,125 @@
+# app/tests/test_batch_evaluation.py
+"""
+Tests for batch evaluation.
+
+Verifies:
+1. run_evaluation_batch returns one result per input, in order
+2. A failing item yields an error without failing the batch
+3. The context snapshot is fetched once per batch
+4. POST /app/evaluate/batch validates items individually and charges
+   one rate-limit token per item
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.airlock import NormalizedInput, Tier
+from app.pipeline import evaluate_parlay, get_evaluation_cache, run_evaluation, run_evaluation_batch
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    get_evaluation_cache().clear()
+    yield
+    get_evaluation_cache().clear()
+
+
+def _inputs(*texts, tier=Tier.GOOD):
+    return [NormalizedInput(input_text=text, tier=tier) for text in texts]
+
+
+class TestRunEvaluationBatch:
+    """Tests for the pipeline entry point."""
+
+    def test_results_in_input_order(self):
+        texts = ("Lakers -5.5 + Celtics ML", "Chiefs -3", "LeBron O27.5 pts + AD O10 reb")
+        results = run_evaluation_batch(_inputs(*texts))
+        assert [r.index for r in results] == [0, 1, 2]
+        assert all(r.ok for r in results)
+        assert [r.response.leg_count for r in results] == [2, 1, 2]
+
+    def test_matches_single_evaluation(self):
+        normalized = _inputs("Lakers -5.5 + Celtics ML", tier=Tier.BEST)[0]
+        single = run_evaluation(normalized)
+        get_evaluation_cache().clear()
+        batch = run_evaluation_batch([normalized])[0].response
+        assert batch.signal_info == single.signal_info
+        assert batch.final_verdict == single.final_verdict
+
+    def test_item_error_does_not_fail_batch(self):
+        def engine(blocks, **kwargs):
+            if any("broken" in b.selection for b in blocks):
+                raise RuntimeError("engine exploded")
+            return evaluate_parlay(blocks=blocks, **kwargs)
+
+        with patch("app.pipeline.evaluate_parlay", side_effect=engine):
+            results = run_evaluation_batch(_inputs("Lakers ML", "Broken ML", "Celtics ML"))
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[1].error == "engine exploded"
+        assert results[1].error_code == "EVALUATION_FAILED"
+        assert results[1].response is None
+
+    def test_context_snapshot_fetched_once_per_sport(self):
+        from app.pipeline import get_context
+        with patch("app.pipeline.get_context", wraps=get_context) as fetch:
+            run_evaluation_batch(_inputs("Lakers ML", "Celtics -3", "Knicks ML + Heat +2", "Chiefs -3"))
+        assert [c.args[0] for c in fetch.call_args_list] == ["NBA", "NFL"]
+
+    def test_unknown_field_rejects_batch(self):
+        with pytest.raises(ValueError):
+            run_evaluation_batch(_inputs("Lakers ML"), fields=frozenset({"nope"}))
+
+    def test_empty_batch(self):
+        assert run_evaluation_batch([]) == []
+
+
+class TestEvaluateBatchEndpoint:
+    """POST /app/evaluate/batch."""
+
+    @pytest.fixture
+    def client(self):
+        from app.rate_limiter import RateLimiter, set_rate_limiter
+        set_rate_limiter(RateLimiter(requests_per_minute=100, burst_size=100))
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        return TestClient(app)
+
+    def test_batch_with_invalid_item(self, client):
+        response = client.post("/app/evaluate/batch", json={"items": [
+            {"input": "Lakers -5.5 + Celtics ML", "tier": "good"},
+            {"input": "   ", "tier": "good"},
+            {"input": "Chiefs -3", "tier": "best"},
+        ]})
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["index"] for r in data["results"]] == [0, 1, 2]
+        assert [r["ok"] for r in data["results"]] == [True, False, True]
+        assert data["results"][1]["error"]["code"]
+        assert data["results"][2]["result"]["tier"] == "best"
+        assert "signalInfo" in data["results"][0]["result"]
+        assert data["Meta"]["errorCount"] == 1
+
+    def test_sparse_fields_apply_to_items(self, client):
+        response = client.post(
+            "/app/evaluate/batch?fields=signalInfo",
+            json={"items": [{"input": "Lakers ML"}]},
+        )
+        result = response.json()["results"][0]["result"]
+        assert "signalInfo" in result
+        assert "finalVerdict" not in result
+
+    def test_each_item_counts_against_rate_limit(self, client):
+        from app.rate_limiter import RateLimiter
+        items = [{"input": "Lakers ML"}] * 4
+        with patch("app.routers.web.rate_limiter", RateLimiter(requests_per_minute=1, burst_size=5)):
+            assert client.post("/app/evaluate/batch", json={"items": items}).status_code == 200
+            assert client.post("/app/evaluate/batch", json={"items": items[:2]}).status_code == 429
+
+    def test_too_many_items_rejected(self, client):
+        from app.routers.web import MAX_BATCH_ITEMS
+        items = [{"input": "Lakers ML"}] * (MAX_BATCH_ITEMS + 1)
+        assert client.post("/app/evaluate/batch", json={"items": items}).status_code == 422
+
+    def test_empty_batch_rejected(self, client):
+        assert client.post("/app/evaluate/batch", json={"items": []}).status_code == 422
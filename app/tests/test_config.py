@@ -264,3 +264,32 @@ class TestFeatureWarnings:
             config = load_config()
 
         assert not any("OPENAI_API_KEY is not set" in w for w in config.warnings)
+
+
+class TestEvaluationBackendConfig:
+    """Tests for the EVAL_BACKEND selection."""
+
+    def test_thread_backend_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            config = load_config()
+
+        assert config.eval_backend == "thread"
+
+    def test_process_backend_selected(self):
+        with patch.dict(
+            os.environ,
+            {"EVAL_BACKEND": "Process", "EVAL_PROCESS_WORKERS": "3", "EVAL_TASK_TIMEOUT_SECONDS": "5"},
+            clear=True,
+        ):
+            config = load_config()
+
+        assert config.eval_backend == "process"
+        assert config.eval_process_workers == 3
+        assert config.eval_task_timeout_seconds == 5
+
+    def test_unknown_backend_uses_default_with_warning(self):
+        with patch.dict(os.environ, {"EVAL_BACKEND": "gpu"}, clear=True):
+            config = load_config()
+
+        assert config.eval_backend == "thread"
+        assert any("EVAL_BACKEND" in w for w in config.warnings)
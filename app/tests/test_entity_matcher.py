@@ -0,0 +1,134 @@
+# app/tests/test_entity_matcher.py
+"""
+Tests for the compiled keyword matcher used by entity recognition.
+
+Verifies:
+1. Aho-Corasick scan finds every (including overlapping) occurrence
+2. Word-boundary reporting matches the re module's \\b semantics
+3. recognize_entities keeps its legacy results and ordering
+"""
+import re
+
+import pytest
+
+from app.entity_matcher import KeywordMatcher
+from app.pipeline import (
+    _MARKET_KEYWORDS,
+    _NBA_PLAYERS,
+    _NBA_TEAMS,
+    _NFL_PLAYERS,
+    _NFL_TEAMS,
+    recognize_entities,
+)
+
+
+class TestKeywordMatcher:
+    """Tests for the automaton itself."""
+
+    def test_finds_overlapping_keywords(self):
+        matcher = KeywordMatcher(["los angeles lakers", "lakers", "angeles"])
+        hits = matcher.scan("los angeles lakers ml")
+        assert hits.found == {"los angeles lakers", "lakers", "angeles"}
+
+    def test_substring_match_inside_word(self):
+        """Long keys keep substring semantics ("nets" inside "hornets")."""
+        matcher = KeywordMatcher(["nets"])
+        hits = matcher.scan("hornets -3")
+        assert "nets" in hits.found
+        assert "nets" not in hits.bounded
+
+    def test_suffix_keyword_via_failure_link(self):
+        matcher = KeywordMatcher(["abcd", "bc"])
+        assert matcher.scan("xabcx").found == {"bc"}
+
+    def test_no_hits(self):
+        hits = KeywordMatcher(["lakers"]).scan("celtics ml")
+        assert hits.found == frozenset()
+        assert hits.bounded == frozenset()
+
+    def test_empty_keywords_ignored(self):
+        matcher = KeywordMatcher(["", "ml", "ml"])
+        assert matcher.keywords == ("ml",)
+
+    @pytest.mark.parametrize("key,text", [
+        ("ad", "ad o10 reb"),
+        ("ad", "bad o10 reb"),
+        ("ad", "ad_o10"),
+        ("o/u", "o/u 220"),
+        ("o/u", "go/up"),
+        ("k's", "cole 8 k's"),
+        ("k's", "8 k'sx"),
+        ("ml", "lakers ml"),
+        ("ml", "html"),
+        ("3pt", "curry 3pt"),
+        ("pts", "27.5pts"),
+        ("ja", "é ja"),
+        ("ja", "éja"),
+    ])
+    def test_boundary_matches_regex(self, key, text):
+        """bounded agrees with re.search(r'\\b' + key + r'\\b')."""
+        hits = KeywordMatcher([key]).scan(text)
+        expected = bool(re.search(r"\b" + re.escape(key) + r"\b", text))
+        assert (key in hits.bounded) == expected
+
+    def test_matches_applies_length_rule(self):
+        hits = KeywordMatcher(["ad", "lakers"]).scan("bad lakerstown")
+        assert not hits.matches("ad")
+        assert hits.matches("lakers")
+
+
+def _legacy_lookup(table: dict, text_lower: str) -> list:
+    """Reference implementation of the original per-key regex scan."""
+    values = []
+    for key in sorted(table, key=len, reverse=True):
+        if len(key) <= 3:
+            matched = bool(re.search(r"\b" + re.escape(key) + r"\b", text_lower))
+        else:
+            matched = key in text_lower
+        if matched and table[key] not in values:
+            values.append(table[key])
+    return values
+
+
+class TestRecognizeEntitiesCompiled:
+    """recognize_entities results are unchanged by the compiled matcher."""
+
+    SLIPS = [
+        "Lakers -5.5 + Celtics ML",
+        "LeBron James O27.5 pts + AD O10 reb + Lakers ML",
+        "Los Angeles Lakers vs Boston Celtics over 220.5",
+        "Hornets +4 and Nets ML",
+        "Mahomes 2+ TDs, Kelce anytime td, Chiefs -3",
+        "Judge HR + Cole 8 K's",
+        "Steph Curry 5+ threes, Warriors ML",
+        "Jokic triple double",
+        "nothing recognizable here",
+    ]
+
+    @pytest.mark.parametrize("slip", SLIPS)
+    def test_players_and_markets_match_legacy(self, slip):
+        text_lower = slip.lower()
+        result = recognize_entities(slip)
+        players = _legacy_lookup(_NBA_PLAYERS, text_lower)
+        players += [p for p in _legacy_lookup(_NFL_PLAYERS, text_lower) if p not in players]
+        assert result["players_mentioned"] == players
+        markets = _legacy_lookup(_MARKET_KEYWORDS, text_lower)
+        if "spread" not in markets and re.search(r"[+-]\d+\.?\d*", text_lower):
+            markets.append("spread")
+        assert result["markets_detected"] == markets
+
+    @pytest.mark.parametrize("slip", SLIPS)
+    def test_teams_match_legacy(self, slip):
+        text_lower = slip.lower()
+        teams = _legacy_lookup(_NBA_TEAMS, text_lower)
+        teams += [t for t in _legacy_lookup(_NFL_TEAMS, text_lower) if t not in teams]
+        assert recognize_entities(slip)["teams_mentioned"] == teams
+
+    def test_substring_team_match_preserved(self):
+        """'hornets' still also matches the 'nets' key, as before."""
+        teams = recognize_entities("Hornets +4")["teams_mentioned"]
+        assert teams == ["CHA", "BKN"]
+
+    def test_explicit_sport_keyword_priority(self):
+        """First sport keyword in table order wins, not first in text."""
+        assert recognize_entities("football and nba parlay")["sport_guess"] == "nba"
@@ -0,0 +1,193 @@
+# app/tests/test_evaluation_cache.py
+"""
+Tests for the content-addressed evaluation result cache.
+
+Verifies:
+1. LRU eviction, TTL expiry and the disabled (max_entries=0) mode
+2. Fingerprints change with tier, canonical legs and context version
+3. run_evaluation serves repeats from cache without re-running the engine
+4. A new context snapshot invalidates cached results
+5. Hits and misses are reported in batches through persistence metrics
+   and counted in memory for /metrics
+"""
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.airlock import CanonicalLegData, NormalizedInput, Tier
+from app.evaluation_cache import CACHE_NAME, EvaluationCache, evaluation_fingerprint
+from app.pipeline import get_evaluation_cache, run_evaluation
+from context.snapshot import ContextSnapshot
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    get_evaluation_cache().clear()
+    yield
+    get_evaluation_cache().clear()
+
+
+class TestEvaluationCache:
+    """Tests for the LRU+TTL container."""
+
+    def test_get_after_put(self):
+        cache = EvaluationCache(max_entries=4)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = EvaluationCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_expired_entry_is_not_served(self):
+        cache = EvaluationCache(max_entries=4, ttl_seconds=10)
+        with patch("app.bounded_cache.time.monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with patch("app.bounded_cache.time.monotonic", return_value=109.0):
+            assert cache.get("a") == 1
+        with patch("app.bounded_cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") is None
+        assert cache.stats().size == 0
+
+    def test_zero_entries_disables_cache(self):
+        cache = EvaluationCache(max_entries=0)
+        cache.put("a", 1)
+        assert cache.enabled is False
+        assert cache.get("a") is None
+        assert cache.stats().size == 0
+
+    def test_clear_resets_counters(self):
+        cache = EvaluationCache(max_entries=4)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        assert cache.stats().to_dict()["hits"] == 0
+        assert cache.get("a") is None
+
+    def test_reports_hits_and_misses(self):
+        cache = EvaluationCache(max_entries=4, report_batch=8)
+        with patch("persistence.metrics.record_cache_result") as record:
+            cache.get("a")
+            cache.put("a", 1)
+            cache.get("a")
+            record.assert_not_called()  # buffered until the batch fills
+            cache.flush_metrics()
+        assert [c.args[0] for c in record.call_args_list] == [False, True]
+        assert all(c.kwargs["cache_name"] == CACHE_NAME for c in record.call_args_list)
+
+    def test_full_batch_written_in_background(self):
+        cache = EvaluationCache(max_entries=4, report_batch=2)
+        written = threading.Event()
+        with patch("persistence.metrics.record_cache_result", side_effect=lambda *a, **k: written.set()) as record:
+            cache.get("a")
+            cache.get("b")
+            assert written.wait(timeout=5)
+        assert record.call_count >= 1
+
+    def test_metric_failure_does_not_fail_lookup(self):
+        cache = EvaluationCache(max_entries=4, report_batch=1)
+        cache.put("a", 1)
+        with patch("persistence.metrics.record_cache_result", side_effect=RuntimeError("db down")):
+            assert cache.get("a") == 1
+            cache.flush_metrics()
+
+    def test_metrics_endpoint(self):
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+
+        run_evaluation(NormalizedInput(input_text="Lakers -5.5 + Celtics ML", tier=Tier.GOOD))
+        run_evaluation(NormalizedInput(input_text="Lakers -5.5 + Celtics ML", tier=Tier.GOOD))
+
+        data = TestClient(app).get("/metrics/evaluation-cache").json()
+        assert (data["hits"], data["misses"], data["size"]) == (1, 1, 1)
+
+
+class TestEvaluationFingerprint:
+    """Tests for the cache key."""
+
+    BASE = dict(text="Lakers -5.5 + Celtics ML", tier="good")
+
+    def test_deterministic(self):
+        assert evaluation_fingerprint(**self.BASE) == evaluation_fingerprint(**self.BASE)
+
+    def test_tier_changes_key(self):
+        assert evaluation_fingerprint(**self.BASE) != evaluation_fingerprint(
+            text=self.BASE["text"], tier="best"
+        )
+
+    def test_canonical_legs_change_key(self):
+        legs = (CanonicalLegData(entity="Lakers", market="spread", value="-5.5", raw="Lakers -5.5"),)
+        assert evaluation_fingerprint(**self.BASE) != evaluation_fingerprint(
+            **self.BASE, canonical_legs=legs
+        )
+
+    def test_context_version_changes_key(self):
+        v1 = ("NBA", "nba-official", "2026-01-01T10:00:00")
+        v2 = ("NBA", "nba-official", "2026-01-01T10:05:00")
+        assert evaluation_fingerprint(**self.BASE, context_version=v1) != evaluation_fingerprint(
+            **self.BASE, context_version=v2
+        )
+
+
+def _snapshot(as_of: datetime) -> ContextSnapshot:
+    return ContextSnapshot(sport="NBA", as_of=as_of, source="test-source")
+
+
+class TestRunEvaluationCache:
+    """run_evaluation integration."""
+
+    def _input(self, text="Lakers -5.5 + LeBron over 25.5 points", tier=Tier.BEST):
+        return NormalizedInput(input_text=text, tier=tier)
+
+    def test_repeat_skips_engine(self):
+        normalized = self._input()
+        first = run_evaluation(normalized)
+        with patch("app.pipeline.evaluate_parlay") as engine:
+            second = run_evaluation(normalized)
+        engine.assert_not_called()
+        assert second.evaluation is first.evaluation
+        assert second == first
+        assert set(second.timings_ms) == {"slip", "context_snapshot", "result_cache"}
+
+    def test_tier_is_part_of_key(self):
+        good = run_evaluation(self._input(tier=Tier.GOOD))
+        best = run_evaluation(self._input(tier=Tier.BEST))
+        assert good.tier == "good"
+        assert best.tier == "best"
+
+    def test_new_context_snapshot_invalidates(self):
+        normalized = self._input()
+        with patch("app.pipeline.get_context", return_value=_snapshot(datetime(2026, 1, 1, 10, 0))):
+            first = run_evaluation(normalized)
+            assert run_evaluation(normalized).evaluation is first.evaluation
+        with patch("app.pipeline.get_context", return_value=_snapshot(datetime(2026, 1, 1, 10, 5))):
+            refreshed = run_evaluation(normalized)
+        assert refreshed.evaluation is not first.evaluation
+        assert refreshed.context["as_of"] == "2026-01-01T10:05:00"
+
+    def test_sparse_request_served_from_full_entry(self):
+        normalized = self._input()
+        full = run_evaluation(normalized)
+        sparse = run_evaluation(normalized, fields=frozenset({"signal_info"}))
+        assert sparse.signal_info == full.signal_info
+        assert sparse.final_verdict is None
+        assert sparse.evaluation is full.evaluation
+
+    def test_sparse_miss_is_not_cached(self):
+        normalized = self._input()
+        run_evaluation(normalized, fields=frozenset({"signal_info"}))
+        assert get_evaluation_cache().stats().size == 0
+        assert run_evaluation(normalized).final_verdict is not None
@@ -0,0 +1,248 @@
+# app/tests/test_evaluation_pool.py
+"""
+Tests for the process-pool evaluation backend.
+
+Verifies:
+1. EvaluationTask round-trips inputs through pickle
+2. Pooled evaluation matches in-process evaluation
+3. Backpressure and per-task timeouts
+4. A broken pool falls back to in-process evaluation
+5. Batches fetch context once and run on the pool
+6. Session-bound evaluations keep their delta under the process backend
+7. Worker stage timings are recorded in the parent's histograms
+5. /app/evaluate maps a full pool to 503
+"""
+import asyncio
+import pickle
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.airlock import CanonicalLegData, NormalizedInput, Tier, airlock_ingest
+from app.evaluation_pool import (
+    EvaluationPool,
+    EvaluationPoolBusy,
+    EvaluationTask,
+    EvaluationTimeout,
+    get_evaluation_pool,
+    run_evaluation_batch_payload,
+    run_evaluation_payload,
+    shutdown_evaluation_pool,
+)
+from app.pipeline import get_evaluation_cache, run_evaluation
+
+SLIP = "Lakers -5.5 + LeBron over 25.5 points"
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = EvaluationPool(workers=1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    get_evaluation_cache().clear()
+    yield
+    get_evaluation_cache().clear()
+
+
+class TestEvaluationTask:
+    """Tests for the wire format."""
+
+    def test_round_trip(self):
+        legs = (CanonicalLegData(entity="Lakers", market="spread", value="-5.5", raw="Lakers -5.5"),)
+        normalized = NormalizedInput(input_text="Lakers -5.5", tier=Tier.BEST, canonical_legs=legs)
+        task = pickle.loads(pickle.dumps(EvaluationTask.from_input(normalized, frozenset({"signal_info"}))))
+        assert task.to_input() == normalized
+        assert task.field_set == frozenset({"signal_info"})
+
+    def test_session_id_round_trips(self):
+        normalized = airlock_ingest(SLIP, tier="good", session_id="s1")
+        task = pickle.loads(pickle.dumps(EvaluationTask.from_input(normalized)))
+        assert task.to_input() == normalized
+
+    def test_full_response_has_no_fields(self):
+        task = EvaluationTask.from_input(airlock_ingest(SLIP, tier="good"))
+        assert task.fields is None
+        assert task.canonical_legs is None
+
+
+class TestEvaluationPool:
+    """Tests against real worker processes."""
+
+    def test_matches_in_process(self, pool):
+        normalized = airlock_ingest(SLIP, tier="best")
+        pooled = asyncio.run(pool.evaluate(EvaluationTask.from_input(normalized)))
+        local = run_evaluation(normalized)
+        assert pooled["signal_info"] == local.signal_info
+        assert pooled["final_verdict"] == local.final_verdict
+        assert pooled["leg_count"] == local.leg_count
+        assert pool.pending == 0
+
+    def test_sparse_fields(self, pool):
+        task = EvaluationTask.from_input(airlock_ingest(SLIP, tier="good"), frozenset({"signal_info"}))
+        pooled = asyncio.run(pool.evaluate(task))
+        assert pooled["signal_info"] is not None
+        assert pooled["final_verdict"] is None
+
+    def test_stage_timings_recorded_in_parent(self, pool):
+        from app.stage_latency import TOTAL_STAGE, clear_stage_latency, get_stage_latency_summary
+        clear_stage_latency()
+        try:
+            # Slip not used elsewhere, so the worker's result cache misses
+            normalized = airlock_ingest("Knicks +3 + Heat ML", tier="best")
+            pooled = asyncio.run(pool.evaluate(EvaluationTask.from_input(normalized)))
+            summary = get_stage_latency_summary()
+        finally:
+            clear_stage_latency()
+        assert summary["evaluation"]["count"] == 1
+        assert summary[TOTAL_STAGE]["count"] == 1
+        assert set(summary) == set(pooled["timings_ms"]) | {TOTAL_STAGE}
+
+    def test_backpressure(self):
+        busy_pool = EvaluationPool(workers=1, max_pending=1)
+        task = EvaluationTask.from_input(airlock_ingest(SLIP, tier="good"))
+
+        async def scenario():
+            return await asyncio.gather(
+                busy_pool.evaluate(task), busy_pool.evaluate(task), return_exceptions=True
+            )
+
+        try:
+            first, second = asyncio.run(scenario())
+        finally:
+            busy_pool.shutdown()
+        assert isinstance(first, dict)
+        assert isinstance(second, EvaluationPoolBusy)
+
+    def test_timeout(self):
+        slow_pool = EvaluationPool(workers=1, timeout_seconds=0.001)
+        task = EvaluationTask.from_input(airlock_ingest(SLIP, tier="good"))
+        try:
+            with pytest.raises(EvaluationTimeout):
+                asyncio.run(slow_pool.evaluate(task))
+        finally:
+            slow_pool.shutdown()
+
+
+class TestRunEvaluationPayload:
+    """Backend selection and fallback."""
+
+    def test_thread_backend_by_default(self, monkeypatch):
+        monkeypatch.delenv("EVAL_BACKEND", raising=False)
+        shutdown_evaluation_pool()
+        try:
+            assert get_evaluation_pool() is None
+            result = asyncio.run(run_evaluation_payload(airlock_ingest(SLIP, tier="good")))
+        finally:
+            shutdown_evaluation_pool()
+        assert result["tier"] == "good"
+        assert "timings_ms" in result
+
+    def test_broken_pool_falls_back_in_process(self):
+        broken = EvaluationPool(workers=1)
+        broken.shutdown()
+        with patch("app.evaluation_pool.get_evaluation_pool", return_value=broken):
+            result = asyncio.run(run_evaluation_payload(airlock_ingest(SLIP, tier="best")))
+        assert result["tier"] == "best"
+        assert result["final_verdict"] is not None
+
+
+class TestSessionsOnProcessBackend:
+    """Session history stays in the parent process."""
+
+    @pytest.fixture(autouse=True)
+    def clean_sessions(self):
+        from app.delta_engine import _signal_storage, _snapshot_storage
+        _snapshot_storage.clear()
+        _signal_storage.clear()
+        yield
+        _snapshot_storage.clear()
+        _signal_storage.clear()
+
+    def test_session_delta_across_evaluations(self, pool):
+        with patch("app.evaluation_pool.get_evaluation_pool", return_value=pool), \
+             patch.object(pool, "evaluate", wraps=pool.evaluate) as pooled:
+            first = asyncio.run(run_evaluation_payload(
+                airlock_ingest("Lakers -5.5 + Celtics ML", tier="good", session_id="s1")
+            ))
+            second = asyncio.run(run_evaluation_payload(
+                airlock_ingest("Lakers -5.5 + Celtics ML + Heat +3", tier="good", session_id="s1")
+            ))
+        pooled.assert_not_called()
+        assert first["delta"]["has_delta"] is False
+        assert second["delta"]["has_delta"] is True
+        assert second["confidence_trend"]["has_trend"] is True
+
+    def test_batch_session_items_run_in_order_in_process(self, pool):
+        inputs = [
+            airlock_ingest("Lakers -5.5 + Celtics ML", tier="good", session_id="s1"),
+            airlock_ingest("Chiefs -3", tier="good"),
+            airlock_ingest("Lakers -5.5 + Celtics ML + Heat +3", tier="good", session_id="s1"),
+        ]
+        with patch("app.evaluation_pool.get_evaluation_pool", return_value=pool):
+            results = asyncio.run(run_evaluation_batch_payload(inputs))
+        assert [r.index for r in results] == [0, 1, 2]
+        assert results[0].response["delta"]["has_delta"] is False
+        assert results[2].response["delta"]["has_delta"] is True
+
+
+class TestRunEvaluationBatchPayload:
+    """Batches dispatched to the pool."""
+
+    def test_items_run_on_pool_with_shared_context(self, pool):
+        from app.pipeline import get_context
+        inputs = [airlock_ingest(text, tier="best") for text in (SLIP, "Celtics ML", "Chiefs -3")]
+        with patch("app.evaluation_pool.get_evaluation_pool", return_value=pool), \
+             patch("app.pipeline.get_context", wraps=get_context) as fetch:
+            results = asyncio.run(run_evaluation_batch_payload(inputs))
+        assert [c.args[0] for c in fetch.call_args_list] == ["NBA", "NFL"]
+        assert [r.index for r in results] == [0, 1, 2]
+        assert all(r.ok for r in results)
+        assert results[0].response["signal_info"] == run_evaluation(inputs[0]).signal_info
+
+    def test_busy_pool_fails_only_overflow_items(self, pool):
+        inputs = [airlock_ingest(text, tier="good") for text in (SLIP, "Celtics ML")]
+        busy = AsyncMock(side_effect=[{"tier": "good"}, EvaluationPoolBusy("1 evaluations pending")])
+        with patch("app.evaluation_pool.get_evaluation_pool", return_value=pool), \
+             patch.object(pool, "evaluate", busy):
+            results = asyncio.run(run_evaluation_batch_payload(inputs))
+        assert results[0].ok
+        assert results[1].error_code == "EVALUATION_BUSY"
+
+    def test_broken_pool_falls_back_in_process(self):
+        broken = EvaluationPool(workers=1)
+        broken.shutdown()
+        with patch("app.evaluation_pool.get_evaluation_pool", return_value=broken):
+            results = asyncio.run(run_evaluation_batch_payload([airlock_ingest(SLIP, tier="best")]))
+        assert results[0].ok
+        assert results[0].response["final_verdict"] is not None
+
+
+class TestEvaluateEndpointBackpressure:
+    """/app/evaluate surfaces pool limits as HTTP errors."""
+
+    @pytest.fixture
+    def client(self):
+        from app.rate_limiter import RateLimiter, set_rate_limiter
+        set_rate_limiter(RateLimiter(requests_per_minute=100, burst_size=100))
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        return TestClient(app)
+
+    def test_busy_returns_503(self, client):
+        busy = AsyncMock(side_effect=EvaluationPoolBusy("64 evaluations pending"))
+        with patch("app.evaluation_pool.run_evaluation_payload", busy):
+            response = client.post("/app/evaluate", json={"input": SLIP, "tier": "good"})
+        assert response.status_code == 503
+        assert response.json()["code"] == "EVALUATION_BUSY"
+        assert response.headers["retry-after"] == "1"
+
+    def test_timeout_returns_504(self, client):
+        slow = AsyncMock(side_effect=EvaluationTimeout("Evaluation exceeded 30s"))
+        with patch("app.evaluation_pool.run_evaluation_payload", slow):
+            response = client.post("/app/evaluate", json={"input": SLIP, "tier": "good"})
+        assert response.status_code == 504
@@ -765,6 +765,105 @@ class TestContextSignals:
             assert data["detail"]["code"] == "SIGNAL_NOT_ALLOWED"
 
 
+# =============================================================================
+# Sub-Parlay Search Tests
+# =============================================================================
+
+
+class TestSubParlays:
+    """Integration tests for /leading-light/sub-parlays endpoint."""
+
+    def test_flag_disabled_returns_503(self, client, minimal_block):
+        """Disabled flag returns 503."""
+        with patch.dict(os.environ, {"LEADING_LIGHT_ENABLED": "false"}):
+            response = client.post(
+                "/leading-light/sub-parlays",
+                json={"blocks": [minimal_block], "max_fragility": 60},
+            )
+            assert response.status_code == 503
+
+    def test_drops_fragile_leg(self, client, minimal_block):
+        """The most fragile leg is left out to meet the budget."""
+        fragile = {**minimal_block, "game_id": "game-456", "base_fragility": 45.0}
+        steady = {**minimal_block, "game_id": "game-789"}
+        with patch.dict(os.environ, {"LEADING_LIGHT_ENABLED": "true"}):
+            response = client.post(
+                "/leading-light/sub-parlays",
+                json={
+                    "blocks": [minimal_block, fragile, steady],
+                    "max_fragility": 60,
+                    "top_k": 1,
+                },
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["complete"] is True
+            assert data["target_fragility"] == 60
+            best = data["subsets"][0]
+            assert best["legs"] == 2
+            assert len(best["removed_block_ids"]) == 1
+            assert best["final_fragility"] <= 60
+
+    def test_uses_dna_tolerance(self, client, minimal_block, dna_profile):
+        """DNA fragility tolerance sets the budget."""
+        with patch.dict(os.environ, {"LEADING_LIGHT_ENABLED": "true"}):
+            response = client.post(
+                "/leading-light/sub-parlays",
+                json={"blocks": [minimal_block], "dna_profile": dna_profile},
+            )
+            assert response.status_code == 200
+            assert response.json()["target_fragility"] == 50
+
+    def test_budget_required(self, client, minimal_block):
+        """Without max_fragility or DNA profile the request is rejected."""
+        with patch.dict(os.environ, {"LEADING_LIGHT_ENABLED": "true"}):
+            response = client.post(
+                "/leading-light/sub-parlays",
+                json={"blocks": [minimal_block]},
+            )
+            assert response.status_code == 400
+            assert response.json()["detail"]["code"] == "VALIDATION_ERROR"
+
+    def test_candidates_need_a_suggestions_plan(self, client, minimal_block):
+        """GOOD searches the parlay's own legs; BETTER may bring in candidates."""
+        candidate = {**minimal_block, "game_id": "game-999", "base_fragility": 1.0}
+        payload = {"blocks": [minimal_block], "candidates": [candidate], "max_fragility": 60}
+        with patch.dict(os.environ, {"LEADING_LIGHT_ENABLED": "true"}):
+            good = client.post("/leading-light/sub-parlays", json=payload).json()
+            better = client.post("/leading-light/sub-parlays", json={**payload, "plan": "better"}).json()
+
+        assert all(not subset["added_block_ids"] for subset in good["subsets"])
+        assert len(good["subsets"]) == 1  # top_k capped for GOOD
+        assert any(subset["added_block_ids"] for subset in better["subsets"])
+
+    def test_search_is_recorded(self, client, minimal_block):
+        """Each search is recorded in the cost tracker."""
+        from app.cost_tracker import clear_records, get_recent_calls
+
+        clear_records()
+        with patch.dict(os.environ, {"LEADING_LIGHT_ENABLED": "true"}):
+            client.post(
+                "/leading-light/sub-parlays",
+                json={"blocks": [minimal_block], "max_fragility": 60, "plan": "best"},
+            )
+            client.post("/leading-light/sub-parlays", json={"blocks": [minimal_block]})
+
+        calls = get_recent_calls(endpoint_filter="/leading-light/sub-parlays")
+        assert len(calls) == 2
+        assert sorted(call.success for call in calls) == [False, True]
+        assert {call.metadata["plan"] for call in calls} == {"best", "good"}
+
+    def test_oversized_candidate_pool_rejected(self, client, minimal_block):
+        """Candidate lists past the cap are rejected before the search runs."""
+        candidates = [{**minimal_block, "game_id": f"game-{i}"} for i in range(51)]
+        with patch.dict(os.environ, {"LEADING_LIGHT_ENABLED": "true"}):
+            response = client.post(
+                "/leading-light/sub-parlays",
+                json={"blocks": [minimal_block], "candidates": candidates, "max_fragility": 60},
+            )
+            assert response.status_code == 422
+
+
 # =============================================================================
 # OCR Endpoint Tests (Ticket: OCR Verification)
 # =============================================================================
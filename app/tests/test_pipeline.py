@@ -25,6 +25,9 @@ from app.pipeline import (
     _extract_leg_info,
     _build_leg_specific_reason,
     _build_notable_legs,
+    ParsedSlip,
+    _build_blocks,
+    _extract_entities_from_text,
 )
 
 
@@ -63,6 +66,74 @@ class TestParseBetText:
         assert blocks[0].bet_type.value == "total"
 
 
+class TestParsedSlip:
+    """Tests for the single-pass slip IR."""
+
+    def test_legs_and_markets(self):
+        slip = ParsedSlip.parse("LeBron O27.5 pts + Lakers -5.5, Celtics ML")
+        assert [leg.text for leg in slip.legs] == ["lebron o27.5 pts", "lakers -5.5", "celtics ml"]
+        assert [leg.bet_type.value for leg in slip.legs] == ["player_prop", "spread", "ml"]
+
+    def test_legs_not_capped(self):
+        """IR keeps every leg; the block builder applies the 6-leg cap."""
+        slip = ParsedSlip.parse("A + B + C + D + E + F + G + H")
+        assert len(slip.legs) == 8
+        assert len(_build_blocks(slip)) == 6
+
+    def test_game_id_hints_group_same_team(self):
+        slip = ParsedSlip.parse("Lakers -5.5 + Lakers vs Celtics over 220 + Chiefs ML")
+        assert [leg.game_id_hint for leg in slip.legs] == ["game_LAL", "game_LAL", "game_KC"]
+        blocks = _build_blocks(slip)
+        assert blocks[0].game_id == blocks[1].game_id == "game_LAL"
+
+    def test_entities_match_recognize_entities(self):
+        from app.pipeline import recognize_entities
+        text = "Jokic O10.5 reb + Nuggets -3"
+        assert ParsedSlip.parse(text).entities == recognize_entities(text)
+
+    def test_context_names(self):
+        slip = ParsedSlip.parse("Steph 5+ threes + Boston ML")
+        assert slip.context_players == ("Stephen Curry",)
+        assert slip.context_teams == ("BOS",)
+        assert slip.is_nba
+        assert _extract_entities_from_text("Steph 5+ threes + Boston ML") == (["Stephen Curry"], ["BOS"])
+
+    def test_non_nba_slip(self):
+        slip = ParsedSlip.parse("Bills -3 + Mahomes 2+ TDs")
+        assert not slip.is_nba
+        assert slip.context_sports == ("NFL",)
+
+    def test_mixed_slip_context_sports(self):
+        assert ParsedSlip.parse("Lakers ML + Chiefs -3").context_sports == ("NBA", "NFL")
+        assert ParsedSlip.parse("Lakers -5.5 + Celtics ML").context_sports == ("NBA",)
+
+    def test_mixed_slip_gets_context_for_each_sport(self):
+        normalized = airlock_ingest(input_text="Lakers ML + Chiefs -3", tier="good")
+        context = run_evaluation(normalized).context
+        assert context["sport"] == "NBA+NFL"
+        assert context["player_count"] > 0
+
+    def test_nfl_slip_context_matches_single_sport_baseline(self):
+        """"chi" in "chiefs" sets is_nba, but only NFL context is fetched."""
+        slip = ParsedSlip.parse("Chiefs ML + Mahomes over 250 passing yards")
+        assert slip.context_sports == ("NFL",)
+
+        normalized = airlock_ingest(input_text="Chiefs ML + Mahomes over 250 passing yards", tier="good")
+        context = run_evaluation(normalized).context
+        assert context["sport"] == "NFL"
+        assert context["impact"]["adjustment"] == -0.1
+        assert context["impact"]["summary"] == "Context is neutral | 1 concern(s)"
+        assert len(context["impact"]["modifiers"]) == 1
+        assert len(context["missing_data"]) == len(set(context["missing_data"]))
+
+    def test_run_evaluation_parses_once(self):
+        """run_evaluation builds one ParsedSlip per request."""
+        normalized = airlock_ingest(input_text="Lakers -5.5 + Celtics ML", tier="good")
+        with patch("app.pipeline.ParsedSlip.parse", wraps=ParsedSlip.parse) as parse:
+            run_evaluation(normalized)
+        assert parse.call_count == 1
+
+
 class TestGenerateSummary:
     """Tests for summary generation."""
 
@@ -79,6 +79,29 @@ class TestTokenBucket:
         assert bucket.tokens <= 3.0
 
 
+    def test_cost_consumes_that_many_tokens(self):
+        """A request may cost several tokens (batch items)."""
+        bucket = TokenBucket(tokens=3.0, last_refill=0.0, max_tokens=3.0, refill_rate=1.0)
+        allowed, _ = bucket.consume(0.0, cost=2)
+        assert allowed is True
+        assert bucket.tokens == 1.0
+
+        allowed, retry_after = bucket.consume(0.0, cost=2)
+        assert allowed is False
+        assert retry_after == 1.0
+
+    def test_cost_above_capacity_leaves_debt(self):
+        """A request costing more than the bucket holds is paid off afterwards."""
+        bucket = TokenBucket(tokens=3.0, last_refill=0.0, max_tokens=3.0, refill_rate=1.0)
+        allowed, _ = bucket.consume(0.0, cost=10)
+        assert allowed is True
+        assert bucket.tokens == -7.0
+
+        allowed, retry_after = bucket.consume(0.0)
+        assert allowed is False
+        assert retry_after == 8.0
+
+
 class TestRateLimiter:
     """Tests for RateLimiter class."""
 
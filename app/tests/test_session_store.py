@@ -0,0 +1,135 @@
+# app/tests/test_session_store.py
+"""
+Tests for the bounded session store behind the delta engine.
+
+Verifies:
+1. Per-entry TTL and LRU eviction at max_entries
+2. Standalone evaluations no longer add session entries
+3. Evaluations sharing a session_id get a change delta and confidence trend
+4. Session-bound evaluations bypass the result cache
+5. /metrics/sessions reports store sizes
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.airlock import airlock_ingest
+from app.delta_engine import _signal_storage, _snapshot_storage, get_session_store_stats
+from app.pipeline import get_evaluation_cache, run_evaluation
+from app.session_store import SessionStore
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    _snapshot_storage.clear()
+    _signal_storage.clear()
+    get_evaluation_cache().clear()
+    yield
+    _snapshot_storage.clear()
+    _signal_storage.clear()
+    get_evaluation_cache().clear()
+
+
+class TestSessionStore:
+    """Tests for the container."""
+
+    def test_get_after_put(self):
+        store = SessionStore(max_entries=4)
+        store.put("s1", {"leg_count": 2})
+        assert store.get("s1") == {"leg_count": 2}
+        assert store.get("s2") is None
+
+    def test_entry_expires(self):
+        store = SessionStore(max_entries=4, ttl_seconds=10)
+        with patch("app.bounded_cache.time.monotonic", return_value=100.0):
+            store.put("s1", 1)
+        with patch("app.bounded_cache.time.monotonic", return_value=109.0):
+            assert store.get("s1") == 1
+        with patch("app.bounded_cache.time.monotonic", return_value=110.0):
+            assert store.get("s1") is None
+        assert store.stats().expirations == 1
+        assert len(store) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        store = SessionStore(max_entries=2)
+        store.put("s1", 1)
+        store.put("s2", 2)
+        store.get("s1")
+        store.put("s3", 3)
+        assert store.get("s2") is None
+        assert store.get("s1") == 1
+        assert store.stats().evictions == 1
+
+    def test_put_drops_expired_sessions(self):
+        store = SessionStore(max_entries=10, ttl_seconds=10)
+        with patch("app.bounded_cache.time.monotonic", return_value=100.0):
+            store.put("s1", 1)
+            store.put("s2", 2)
+        with patch("app.bounded_cache.time.monotonic", return_value=200.0):
+            store.put("s3", 3)
+        stats = store.stats()
+        assert stats.size == 1
+        assert stats.expirations == 2
+        assert stats.evictions == 0
+
+
+class TestPipelineSessions:
+    """run_evaluation integration."""
+
+    def test_standalone_evaluation_stores_nothing(self):
+        for text in ("Lakers -5.5", "Celtics ML", "Knicks +3"):
+            result = run_evaluation(airlock_ingest(text, tier="good"))
+            assert result.delta["has_delta"] is False
+        assert len(_snapshot_storage) == 0
+        assert len(_signal_storage) == 0
+
+    def test_session_gets_delta_and_trend(self):
+        first = run_evaluation(airlock_ingest("Lakers -5.5 + Celtics ML", tier="good", session_id="s1"))
+        second = run_evaluation(
+            airlock_ingest("Lakers -5.5 + Celtics ML + Heat +3", tier="good", session_id="s1")
+        )
+        assert first.delta["has_delta"] is False
+        assert first.confidence_trend["has_trend"] is False
+        assert second.delta["has_delta"] is True
+        assert second.confidence_trend["has_trend"] is True
+        assert get_session_store_stats()["snapshots"]["size"] == 1
+
+    def test_sessions_are_isolated(self):
+        run_evaluation(airlock_ingest("Lakers -5.5", tier="good", session_id="s1"))
+        other = run_evaluation(airlock_ingest("Lakers -5.5 + Heat +3", tier="good", session_id="s2"))
+        assert other.delta["has_delta"] is False
+
+    def test_session_bypasses_result_cache(self):
+        normalized = airlock_ingest("Lakers -5.5 + Celtics ML", tier="good", session_id="s1")
+        run_evaluation(normalized)
+        repeat = run_evaluation(normalized)
+        assert "result_cache" not in repeat.timings_ms
+        assert repeat.confidence_trend["trend"] == "unchanged"
+        assert get_evaluation_cache().stats().size == 0
+
+
+class TestSessionEndpoints:
+    """HTTP surface."""
+
+    @pytest.fixture
+    def client(self):
+        from app.rate_limiter import RateLimiter, set_rate_limiter
+        set_rate_limiter(RateLimiter(requests_per_minute=100, burst_size=100))
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        return TestClient(app)
+
+    def test_evaluate_with_session_id(self, client):
+        client.post("/app/evaluate", json={"input": "Lakers -5.5", "session_id": "web-1"})
+        data = client.post(
+            "/app/evaluate", json={"input": "Lakers -5.5 + Celtics ML", "session_id": "web-1"}
+        ).json()
+        assert data["delta"]["hasDelta"] is True
+
+    def test_metrics_sessions(self, client):
+        client.post("/app/evaluate", json={"input": "Lakers -5.5", "session_id": "web-2"})
+        data = client.get("/metrics/sessions").json()
+        assert data["snapshots"]["size"] == 1
+        assert data["signals"]["size"] == 1
+        assert data["snapshots"]["max_entries"] > 0
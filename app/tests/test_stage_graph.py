@@ -0,0 +1,205 @@
+# app/tests/test_stage_graph.py
+"""
+Tests for the stage graph and lazy run_evaluation.
+
+Verifies:
+1. Only requested outputs and their dependencies run
+2. Execution follows declaration order
+3. Invalid graphs and unknown outputs are rejected
+4. run_evaluation honours sparse fieldsets without changing full responses
+5. Fieldsets without the proof fields skip the proof stages
+"""
+from dataclasses import asdict
+from unittest.mock import patch
+
+import pytest
+
+from app.airlock import airlock_ingest
+from app.pipeline import _PIPELINE_GRAPH, PIPELINE_FIELDS, parse_fields, run_evaluation
+from app.stage_graph import Stage, StageGraph, StageGraphError
+
+
+def _graph(calls):
+    def track(name, value):
+        def run(a):
+            calls.append(name)
+            return value(a)
+        return run
+
+    return StageGraph(
+        initial_inputs=("x",),
+        stages=[
+            Stage("double", ("x",), track("double", lambda a: a["x"] * 2)),
+            Stage("square", ("x",), track("square", lambda a: a["x"] ** 2)),
+            Stage("total", ("double", "square"), track("total", lambda a: a["double"] + a["square"])),
+            Stage("label", ("double",), track("label", lambda a: f"d={a['double']}")),
+        ],
+    )
+
+
+class TestStageGraph:
+    """Tests for dependency resolution and execution."""
+
+    def test_runs_only_needed_stages(self):
+        calls = []
+        run = _graph(calls).run(["label"], {"x": 3})
+        assert calls == ["double", "label"]
+        assert run.values["label"] == "d=6"
+        assert "square" not in run.values
+
+    def test_declaration_order(self):
+        calls = []
+        _graph(calls).run(["total", "label"], {"x": 2})
+        assert calls == ["double", "square", "total", "label"]
+
+    def test_timings_recorded(self):
+        run = _graph([]).run(["total"], {"x": 1})
+        assert set(run.timings_ms) == {"double", "square", "total"}
+        assert run.executed == ("double", "square", "total")
+
+    def test_plan_is_cached(self):
+        graph = _graph([])
+        assert graph.plan(["total"]) is graph.plan(["total"])
+
+    def test_plan_cache_is_bounded(self):
+        graph = StageGraph(stages=[Stage("a", (), lambda a: 1), Stage("b", (), lambda a: 2)], max_plans=2)
+        for outputs in (["a"], ["b"], ["a", "b"]):
+            graph.plan(outputs)
+        assert graph._cached_plan.cache_info().currsize == 2
+
+    def test_unknown_output(self):
+        with pytest.raises(StageGraphError):
+            _graph([]).plan(["nope"])
+
+    def test_missing_initial_input(self):
+        with pytest.raises(StageGraphError):
+            _graph([]).run(["double"], {})
+
+    def test_input_must_be_declared_first(self):
+        with pytest.raises(StageGraphError):
+            StageGraph(stages=[Stage("b", ("a",), lambda a: 1), Stage("a", (), lambda a: 1)])
+
+    def test_duplicate_stage(self):
+        with pytest.raises(StageGraphError):
+            StageGraph(stages=[Stage("a", (), lambda a: 1), Stage("a", (), lambda a: 2)])
+
+    def test_precomputed_stage_not_rerun(self):
+        calls = []
+        run = _graph(calls).run(["total"], {"x": 3}, precomputed={"double": 100})
+        assert calls == ["square", "total"]
+        assert run.values["total"] == 109
+        assert run.executed == ("square", "total")
+
+    def test_unknown_precomputed_rejected(self):
+        with pytest.raises(StageGraphError):
+            _graph([]).run(["total"], {"x": 1}, precomputed={"nope": 1})
+
+
+class TestLazyRunEvaluation:
+    """Tests for sparse fieldsets through run_evaluation."""
+
+    def test_every_field_has_a_stage(self):
+        assert PIPELINE_FIELDS <= set(_PIPELINE_GRAPH.stage_names)
+
+    def test_sparse_fields_skip_unneeded_stages(self):
+        normalized = airlock_ingest("Lakers -5.5 + Celtics ML", tier="good")
+        with patch("app.pipeline.validate_dna_artifacts") as validate, \
+             patch("app.pipeline.run_sherlock_hook") as sherlock:
+            result = run_evaluation(normalized, fields=frozenset({"signal_info"}))
+        validate.assert_not_called()
+        sherlock.assert_not_called()
+        assert result.signal_info["signal"] in ("blue", "green", "yellow", "red")
+        assert result.proof_summary is None
+        assert result.structure is None
+        assert result.explain["grade"]
+
+    def test_good_tier_plan_excludes_proof_stages(self):
+        plan = _PIPELINE_GRAPH.plan(("evaluation", "interpretation", "explain", "eval_ctx", "final_verdict"))
+        assert "evaluation" in plan
+        for skipped in ("sherlock_result", "dna_artifacts", "contract_validation", "proof_summary", "structure"):
+            assert skipped not in plan
+
+    def test_sparse_values_match_full_run(self):
+        normalized = airlock_ingest("LeBron O27.5 pts + AD O10 reb + Lakers ML", tier="best")
+        full = run_evaluation(normalized)
+        sparse = run_evaluation(normalized, fields=frozenset({"final_verdict", "human_summary"}))
+        assert sparse.final_verdict == full.final_verdict
+        assert sparse.human_summary == full.human_summary
+        assert sparse.explain["summary"] == full.explain["summary"]
+
+    def test_default_returns_all_fields(self):
+        result = asdict(run_evaluation(airlock_ingest("Lakers -5.5", tier="good")))
+        for name in ("signal_info", "final_verdict", "proof_summary", "structure", "grounding_score"):
+            assert result[name] is not None
+
+    def test_narrow_fieldset_skips_proof_stages(self):
+        normalized = airlock_ingest("Lakers -5.5 + Celtics ML", tier="good")
+        with patch("app.pipeline.validate_dna_artifacts") as validate, \
+             patch("app.pipeline.run_sherlock_hook") as sherlock:
+            result = run_evaluation(normalized, fields=frozenset({"final_verdict"}))
+        validate.assert_not_called()
+        sherlock.assert_not_called()
+        assert result.proof_summary is None
+        assert result.sherlock_result is None
+        assert result.final_verdict is not None
+
+    def test_leg_impact_one_entry_per_leg(self):
+        normalized = airlock_ingest("LeBron O27.5 pts + AD O10 reb + Lakers ML", tier="best")
+        result = run_evaluation(normalized, fields=frozenset({"leg_impact"}))
+        assert len(result.leg_impact) == result.leg_count
+        assert max(leg["share"] for leg in result.leg_impact) in (0.0, 1.0)
+        for leg in result.leg_impact:
+            assert leg["impact"] >= 0
+            assert leg["without"]["signal"] in ("blue", "green", "yellow", "red")
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError):
+            run_evaluation(airlock_ingest("Lakers -5.5"), fields=frozenset({"bogus"}))
+
+
+class TestParseFields:
+    """Tests for the fields= query parameter parser."""
+
+    def test_none_means_full_response(self):
+        assert parse_fields(None) is None
+        assert parse_fields("  ") is None
+
+    def test_camel_and_snake_case(self):
+        assert parse_fields("signalInfo, final_verdict") == {"signal_info", "final_verdict"}
+
+    def test_unknown_rejected(self):
+        with pytest.raises(ValueError):
+            parse_fields("signalInfo,madeUp")
+
+
+class TestEvaluateFieldsParam:
+    """/app/evaluate?fields= returns a sparse response."""
+
+    @pytest.fixture
+    def client(self):
+        from app.rate_limiter import RateLimiter, set_rate_limiter
+        set_rate_limiter(RateLimiter(requests_per_minute=100, burst_size=100))
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        return TestClient(app)
+
+    def test_sparse_response(self, client):
+        response = client.post(
+            "/app/evaluate?fields=signalInfo,finalVerdict",
+            json={"input": "Lakers -5.5 + Celtics ML", "tier": "good"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert "signalInfo" in data
+        assert "finalVerdict" in data
+        assert "evaluation" in data
+        assert "proofSummary" not in data
+
+    def test_invalid_field_400(self, client):
+        response = client.post(
+            "/app/evaluate?fields=nope",
+            json={"input": "Lakers -5.5", "tier": "good"},
+        )
+        assert response.status_code == 400
+        assert response.json()["code"] == "INVALID_FIELDS"
@@ -0,0 +1,112 @@
+# app/tests/test_stage_latency.py
+"""
+Tests for per-stage latency histograms.
+
+Verifies:
+1. Fixed-bucket histograms estimate percentiles within bucket resolution
+2. run_evaluation records every executed stage plus the call total
+3. /metrics/stages exposes p50/p95/p99 per stage
+4. /app/evaluate?timings=true adds the per-request breakdown to _meta
+   (serialized as "Meta" by the camelCase conversion)
+"""
+import pytest
+
+from app.airlock import airlock_ingest
+from app.pipeline import get_evaluation_cache, run_evaluation
+from app.stage_latency import (
+    TOTAL_STAGE,
+    LatencyHistogram,
+    clear_stage_latency,
+    get_stage_latency_summary,
+    record_stage_timings,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    clear_stage_latency()
+    get_evaluation_cache().clear()
+    yield
+    clear_stage_latency()
+
+
+class TestLatencyHistogram:
+    """Tests for the histogram itself."""
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) is None
+        assert histogram.to_dict()["count"] == 0
+
+    def test_percentiles_within_bucket(self):
+        histogram = LatencyHistogram(bounds=(1, 10, 100))
+        for _ in range(90):
+            histogram.record(0.5)
+        for _ in range(10):
+            histogram.record(50)
+        assert 0 < histogram.percentile(50) <= 1
+        assert 10 < histogram.percentile(95) <= 50
+        assert histogram.percentile(99) <= histogram.max_ms
+
+    def test_overflow_bucket_capped_at_max(self):
+        histogram = LatencyHistogram(bounds=(1,))
+        histogram.record(250)
+        assert histogram.percentile(99) <= 250
+        assert histogram.to_dict()["maxMs"] == 250
+
+    def test_summary_sorted_by_p95(self):
+        record_stage_timings({"fast": 0.1, "slow": 40.0}, total_ms=41.0)
+        summary = get_stage_latency_summary()
+        assert list(summary)[0] == TOTAL_STAGE
+        assert list(summary)[-1] == "fast"
+        assert summary["slow"]["count"] == 1
+
+
+class TestPipelineInstrumentation:
+    """run_evaluation feeds the histograms."""
+
+    def test_miss_records_each_stage(self):
+        result = run_evaluation(airlock_ingest("Lakers -5.5 + Celtics ML", tier="best"))
+        summary = get_stage_latency_summary()
+        for stage in ("slip", "evaluation", "context", "proof_summary", TOTAL_STAGE):
+            assert summary[stage]["count"] == 1
+        assert "evaluation" in result.timings_ms
+
+    def test_hit_records_lookup_only(self):
+        normalized = airlock_ingest("Lakers -5.5 + Celtics ML", tier="best")
+        run_evaluation(normalized)
+        result = run_evaluation(normalized)
+        summary = get_stage_latency_summary()
+        assert summary["evaluation"]["count"] == 1
+        assert summary["result_cache"]["count"] == 2
+        assert summary[TOTAL_STAGE]["count"] == 2
+        assert "evaluation" not in result.timings_ms
+
+
+class TestStageLatencyEndpoints:
+    """HTTP surface."""
+
+    @pytest.fixture
+    def client(self):
+        from app.rate_limiter import RateLimiter, set_rate_limiter
+        set_rate_limiter(RateLimiter(requests_per_minute=100, burst_size=100))
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        return TestClient(app)
+
+    def test_metrics_stages(self, client):
+        client.post("/app/evaluate", json={"input": "Lakers -5.5 + Celtics ML", "tier": "good"})
+        data = client.get("/metrics/stages").json()
+        assert data["stages"]["evaluation"]["p95Ms"] is not None
+        assert set(data["stages"][TOTAL_STAGE]) >= {"p50Ms", "p95Ms", "p99Ms"}
+        assert data["bucketBoundsMs"]
+
+    def test_meta_breakdown_opt_in(self, client):
+        body = {"input": "Lakers -5.5 + Celtics ML", "tier": "good"}
+        plain = client.post("/app/evaluate", json=body).json()
+        assert "stages" not in plain["Meta"]
+        assert "timingsMs" not in plain
+        get_evaluation_cache().clear()
+        timed = client.post("/app/evaluate?timings=true", json=body).json()
+        assert "evaluation" in timed["Meta"]["stages"]
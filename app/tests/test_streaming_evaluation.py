@@ -0,0 +1,137 @@
+# app/tests/test_streaming_evaluation.py
+"""
+Tests for the streamed (SSE) evaluation.
+
+Verifies:
+1. STREAM_PHASES cover every PipelineResponse field
+2. Phases are yielded in order, before later stages run
+3. The final response equals run_evaluation's
+4. POST /app/evaluate/stream emits one event per phase, then `complete`
+"""
+import asyncio
+import json
+from dataclasses import fields
+from unittest.mock import patch
+
+import pytest
+
+from app.airlock import airlock_ingest
+from app.pipeline import (
+    PIPELINE_FIELDS,
+    STREAM_PHASES,
+    PipelineResponse,
+    _evaluate_phases,
+    _fetch_context_snapshots,
+    derive_proof_summary,
+    get_evaluation_cache,
+    run_evaluation,
+    run_evaluation_stream,
+)
+
+SLIP = "Lakers -5.5 + LeBron over 25.5 points"
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    get_evaluation_cache().clear()
+    yield
+    get_evaluation_cache().clear()
+
+
+def _collect(normalized):
+    async def scenario():
+        return [item async for item in run_evaluation_stream(normalized)]
+    return asyncio.run(scenario())
+
+
+class TestStreamPhases:
+    """Tests for the phased pipeline run."""
+
+    def test_phases_cover_response(self):
+        streamed = [name for _, names in STREAM_PHASES for name in names]
+        expected = {f.name for f in fields(PipelineResponse)} - {"leg_count", "tier", "timings_ms"}
+        assert len(streamed) == len(set(streamed))
+        assert set(streamed) == expected
+
+    def test_signal_before_proof_stages(self):
+        normalized = airlock_ingest(SLIP, tier="best")
+        with patch("app.pipeline.derive_proof_summary", wraps=derive_proof_summary) as proof:
+            phases = _evaluate_phases(
+                normalized, PIPELINE_FIELDS, _fetch_context_snapshots, phases=STREAM_PHASES
+            )
+            phase, payload = next(phases)
+            assert phase == "signal"
+            assert payload["signal_info"]["signal"]
+            assert proof.call_count == 0
+            remaining = [name for name, _ in phases]
+        assert proof.call_count == 1
+        assert remaining == ["diagnosis", "narrative", "proof", "complete"]
+
+    def test_complete_matches_run_evaluation(self):
+        normalized = airlock_ingest(SLIP, tier="best")
+        items = _collect(normalized)
+        streamed = items[-1][1]
+        get_evaluation_cache().clear()
+        direct = run_evaluation(normalized)
+        assert items[-1][0] == "complete"
+        assert streamed.signal_info == direct.signal_info
+        assert streamed.final_verdict == direct.final_verdict
+        assert streamed.proof_summary == direct.proof_summary
+        assert dict(items)["diagnosis"]["primary_failure"] == direct.primary_failure
+
+    def test_stream_fills_and_uses_cache(self):
+        normalized = airlock_ingest(SLIP, tier="best")
+        first = _collect(normalized)
+        with patch("app.pipeline.evaluate_parlay") as engine:
+            second = _collect(normalized)
+        engine.assert_not_called()
+        assert [phase for phase, _ in second] == [phase for phase, _ in first]
+        assert second[-1][1].evaluation is first[-1][1].evaluation
+
+
+def _parse_sse(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestEvaluateStreamEndpoint:
+    """POST /app/evaluate/stream."""
+
+    @pytest.fixture
+    def client(self):
+        from app.rate_limiter import RateLimiter, set_rate_limiter
+        set_rate_limiter(RateLimiter(requests_per_minute=100, burst_size=100))
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        return TestClient(app)
+
+    def test_event_sequence(self, client):
+        response = client.post("/app/evaluate/stream", json={"input": SLIP, "tier": "good"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["signal", "diagnosis", "narrative", "proof", "complete"]
+        assert "signalInfo" in events[0][1]
+        assert "primaryFailure" in events[1][1]
+
+    def test_complete_event_matches_evaluate(self, client):
+        body = {"input": SLIP, "tier": "good"}
+        streamed = _parse_sse(client.post("/app/evaluate/stream", json=body).text)[-1][1]
+        direct = client.post("/app/evaluate", json=body).json()
+        for key in ("signalInfo", "finalVerdict", "proofSummary", "input", "tier"):
+            assert streamed[key] == direct[key]
+
+    def test_invalid_input_is_plain_json(self, client):
+        response = client.post("/app/evaluate/stream", json={"input": "   "})
+        assert response.status_code == 400
+        assert response.json()["code"]
+
+    def test_failure_becomes_error_event(self, client):
+        with patch("app.pipeline.evaluate_parlay", side_effect=RuntimeError("engine exploded")):
+            response = client.post("/app/evaluate/stream", json={"input": "Knicks ML"})
+        events = _parse_sse(response.text)
+        assert events[-1] == ("error", {"code": "EVALUATION_FAILED", "message": "engine exploded"})
@@ -1,6 +1,7 @@
 """Configure pytest for the DNA project."""
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 # =============================================================================
@@ -11,6 +12,9 @@ from pathlib import Path
 os.environ.setdefault("ENV", "test")
 os.environ.setdefault("DNA_RATE_LIMIT_MODE", "ci")
 
+# Keep persisted context snapshots out of the working tree
+os.environ.setdefault("CONTEXT_CACHE_DIR", tempfile.mkdtemp(prefix="context-cache-"))
+
 # Add dna-matrix to path so tests can import core modules
 # This must happen at module level (before test collection)
 dna_matrix_path = Path(__file__).parent / "dna-matrix"
@@ -9,6 +9,7 @@ Module Structure:
 - snapshot.py: ContextSnapshot schema (normalized data model)
 - providers/: Data source implementations
 - service.py: Orchestrates providers and caching
+- store.py: Persists snapshots for warm restarts
 - apply.py: Converts snapshots to confidence modifiers
 """
 
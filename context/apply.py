@@ -14,7 +14,7 @@ Key principle: ADDITIVE ONLY
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
 
 from context.snapshot import ContextSnapshot, PlayerAvailability, PlayerStatus
 
@@ -81,6 +81,55 @@ def apply_context(
     Returns:
         ContextImpact with modifiers and summary
     """
+    return apply_context_many((snapshot,), player_names, team_names)
+
+
+def apply_context_many(
+    snapshots: Sequence[ContextSnapshot],
+    player_names: Optional[list[str]] = None,
+    team_names: Optional[list[str]] = None,
+) -> ContextImpact:
+    """
+    Apply the snapshots of a multi-sport slip as one impact.
+
+    Modifiers from every snapshot are collected, then summed and clamped
+    once, exactly as apply_context() does for a single snapshot. Source-level
+    modifiers (no affected players) and missing-data notes repeated by
+    several snapshots count once.
+    """
+    modifiers: list[ContextModifier] = []
+    seen_source_level: set[tuple[str, str, float]] = set()
+    for snapshot in snapshots:
+        for modifier in _snapshot_modifiers(snapshot, player_names, team_names):
+            if not modifier.affected_players:
+                key = (modifier.reason, modifier.source, modifier.adjustment)
+                if key in seen_source_level:
+                    continue
+                seen_source_level.add(key)
+            modifiers.append(modifier)
+
+    # Calculate total adjustment (clamped to -1.0 to 1.0)
+    total = sum(m.adjustment for m in modifiers)
+    total_clamped = max(-1.0, min(1.0, total))
+
+    # Generate summary
+    summary = _generate_summary(modifiers, total_clamped)
+
+    return ContextImpact(
+        total_adjustment=total_clamped,
+        modifiers=tuple(modifiers),
+        summary=summary,
+        missing_data=tuple(dict.fromkeys(note for snapshot in snapshots for note in snapshot.missing_data)),
+        is_fresh=True,  # Determined by cache in service layer
+    )
+
+
+def _snapshot_modifiers(
+    snapshot: ContextSnapshot,
+    player_names: Optional[list[str]],
+    team_names: Optional[list[str]],
+) -> list[ContextModifier]:
+    """Modifiers one snapshot contributes."""
     modifiers: list[ContextModifier] = []
 
     # Check for missing data impact
@@ -115,20 +164,7 @@ def apply_context(
             )
         )
 
-    # Calculate total adjustment (clamped to -1.0 to 1.0)
-    total = sum(m.adjustment for m in modifiers)
-    total_clamped = max(-1.0, min(1.0, total))
-
-    # Generate summary
-    summary = _generate_summary(modifiers, total_clamped)
-
-    return ContextImpact(
-        total_adjustment=total_clamped,
-        modifiers=tuple(modifiers),
-        summary=summary,
-        missing_data=snapshot.missing_data,
-        is_fresh=True,  # Determined by cache in service layer
-    )
+    return modifiers
 
 
 def _check_players(
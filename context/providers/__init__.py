@@ -5,10 +5,12 @@ Context Data Providers
 Each provider fetches data from a specific source and normalizes it
 into the ContextSnapshot format.
 
-Sprint 3 scope: NBA availability only, one source.
+Providers: NBA availability (NBA official + ESPN), NFL availability (ESPN).
+HTTP goes through the shared pooled client in http.py.
 """
 
 from context.providers.base import ContextProvider
 from context.providers.nba_availability import NBAAvailabilityProvider
+from context.providers.nfl_availability import NFLAvailabilityProvider
 
-__all__ = ["ContextProvider", "NBAAvailabilityProvider"]
+__all__ = ["ContextProvider", "NBAAvailabilityProvider", "NFLAvailabilityProvider"]
@@ -8,6 +8,7 @@ and enable the service layer to orchestrate multiple providers.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -46,6 +47,16 @@ class ContextProvider(ABC):
         """
         ...
 
+    async def fetch_async(self) -> Optional[ContextSnapshot]:
+        """
+        Fetch without blocking the event loop.
+
+        Default implementation runs fetch() in a worker thread. Providers
+        that fetch over HTTP should override this and await the shared
+        pooled client (context.providers.http.run_async / fetch_json).
+        """
+        return await asyncio.to_thread(self.fetch)
+
     def is_available(self) -> bool:
         """
         Check if this provider is currently available.
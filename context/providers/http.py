@@ -0,0 +1,162 @@
+# context/providers/http.py
+"""
+Shared HTTP client for context providers.
+
+Every provider fetches through one pooled httpx.AsyncClient: connections
+are kept alive between fetches, and HTTP/2 is used when the optional h2
+package is installed.
+
+An AsyncClient's connections belong to the event loop that opened them,
+so the client lives on a dedicated loop thread. run() (blocking, for
+fetch() and background refreshes) and run_async() (awaitable from any
+loop, for fetch_async()) both execute on it and share its connections.
+
+Configuration via environment variables:
+- CONTEXT_HTTP_MAX_CONNECTIONS: Connection pool size (default: 20)
+- CONTEXT_HTTP_KEEPALIVE_SECONDS: Idle connection lifetime (default: 60)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+from threading import Lock, Thread
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP/2 needs the h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+REQUEST_HEADERS = {
+    "User-Agent": "DNA-Matrix/1.0",
+    "Accept": "application/json",
+}
+
+_lock = Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _parse_number_env(name: str, default: T, parse: Callable[[str], T], min_value: T) -> T:
+    """
+    Parse a numeric environment variable with validation.
+
+    On a missing, malformed or too-small value, returns default (logging a
+    warning for the latter two) so a bad setting never breaks fetching.
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = parse(raw)
+    except ValueError:
+        _logger.warning(f"{name}='{raw}' is not a valid number; using default {default}")
+        return default
+    if value < min_value:
+        _logger.warning(f"{name}={value} is below minimum {min_value}; using default {default}")
+        return default
+    return value
+
+
+def _get_limits() -> httpx.Limits:
+    """Connection pool limits from environment."""
+    max_connections = _parse_number_env("CONTEXT_HTTP_MAX_CONNECTIONS", 20, int, 1)
+    keepalive = _parse_number_env("CONTEXT_HTTP_KEEPALIVE_SECONDS", 60.0, float, 0.0)
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=keepalive,
+    )
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """The shared HTTP loop, started on first use."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            Thread(target=loop.run_forever, name="context-http", daemon=True).start()
+            _loop = loop
+        return _loop
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    The shared client.
+
+    Only call from coroutines executed through run() or run_async(), so
+    every request uses the shared loop's connections.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=_get_limits(),
+            headers=REQUEST_HEADERS,
+        )
+    return _client
+
+
+def run(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine on the shared HTTP loop and wait for its result.
+
+    Blocks the calling thread; never call it from the shared loop itself.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+async def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the shared HTTP loop without blocking the caller's loop."""
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _get_loop()))
+
+
+async def fetch_json(url: str, timeout: float, label: str) -> Optional[Any]:
+    """
+    GET a JSON document with the shared client.
+
+    Awaitable from any loop (hops to the shared one). Returns None on
+    non-200 responses, timeouts, request errors and unreadable bodies
+    (logged with `label`); never raises.
+    """
+    if asyncio.get_running_loop() is not _loop:
+        return await run_async(fetch_json(url, timeout, label))
+
+    try:
+        response = await get_client().get(url, timeout=timeout)
+
+        if response.status_code != 200:
+            _logger.warning(f"{label} API returned {response.status_code}")
+            return None
+
+        return response.json()
+
+    except httpx.TimeoutException:
+        _logger.warning(f"{label} API request timed out")
+        return None
+    except httpx.RequestError as e:
+        _logger.warning(f"{label} API request failed: {e}")
+        return None
+    except Exception as e:
+        _logger.warning(f"Failed to read {label} API response: {e}")
+        return None
+
+
+def close() -> None:
+    """Close the shared client and stop its loop (on shutdown, or between tests)."""
+    global _loop, _client
+    with _lock:
+        loop, client = _loop, _client
+        _loop = _client = None
+    if loop is None:
+        return
+    if client is not None:
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
@@ -10,23 +10,26 @@ Falls back to sample data if live fetch fails.
 Configuration via environment variables:
 - NBA_AVAILABILITY_LIVE: Set to "true" to enable live data (default: false)
 - NBA_AVAILABILITY_TIMEOUT: HTTP timeout in seconds (default: 10)
+- NBA_AVAILABILITY_HEDGE_DELAY: Seconds before the ESPN backup is requested
+  alongside a slow NBA official request (default: 1.5)
+
+Requests go through the shared pooled client in context.providers.http.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from datetime import datetime
 from typing import Optional
 
-import httpx
-
+from context.providers import http
 from context.providers.base import ContextProvider
 from context.snapshot import (
     ContextSnapshot,
     PlayerAvailability,
     PlayerStatus,
-    empty_snapshot,
 )
 
 
@@ -74,6 +77,11 @@ def _get_config() -> tuple[bool, int]:
     return use_live, timeout
 
 
+def _get_hedge_delay() -> float:
+    """Seconds the NBA official source gets before ESPN is also requested."""
+    return float(os.environ.get("NBA_AVAILABILITY_HEDGE_DELAY", "1.5"))
+
+
 # =============================================================================
 # Sample Data (fallback when live data unavailable)
 # =============================================================================
@@ -137,156 +145,169 @@ def _create_player_id(name: str) -> str:
     return name.lower().replace(" ", "-").replace(".", "").replace("'", "")
 
 
-def _fetch_from_nba_official(timeout: int) -> Optional[list[PlayerAvailability]]:
+def _parse_nba_official(data) -> Optional[list[PlayerAvailability]]:
+    """Parse the NBA official injury report payload."""
+    players = []
+    now = datetime.utcnow()
+
+    # Parse NBA official format
+    # Structure: list of team objects with injury arrays
+    if isinstance(data, list):
+        for team_data in data:
+            team_name = team_data.get("team", "")
+            team_abbr = _parse_team(team_name)
+            injuries = team_data.get("injuries", [])
+
+            for injury in injuries:
+                player_name = injury.get("player", "")
+                if not player_name:
+                    continue
+
+                status_str = injury.get("status", "")
+                reason = injury.get("description", injury.get("injury", ""))
+
+                players.append(PlayerAvailability(
+                    player_id=_create_player_id(player_name),
+                    player_name=player_name,
+                    team=team_abbr,
+                    status=_parse_status(status_str),
+                    reason=reason if reason else None,
+                    updated_at=now,
+                ))
+
+    return players if players else None
+
+
+def _parse_espn(data) -> Optional[list[PlayerAvailability]]:
+    """Parse the ESPN injuries payload."""
+    players = []
+    now = datetime.utcnow()
+
+    # Parse ESPN format
+    # Structure: { "teams": [ { "team": {...}, "injuries": [...] } ] }
+    teams = data.get("teams", [])
+    for team_entry in teams:
+        team_info = team_entry.get("team", {})
+        team_abbr = team_info.get("abbreviation", "UNK")
+        injuries = team_entry.get("injuries", [])
+
+        for injury in injuries:
+            athlete = injury.get("athlete", {})
+            player_name = athlete.get("displayName", "")
+            if not player_name:
+                continue
+
+            status_str = injury.get("status", "")
+            injury_detail = injury.get("type", {})
+            reason = injury_detail.get("description", "")
+
+            players.append(PlayerAvailability(
+                player_id=_create_player_id(player_name),
+                player_name=player_name,
+                team=team_abbr,
+                status=_parse_status(status_str),
+                reason=reason if reason else None,
+                updated_at=now,
+            ))
+
+    return players if players else None
+
+
+# =============================================================================
+# Live Data Fetching (shared HTTP client, see context.providers.http)
+# =============================================================================
+
+
+async def _fetch_from_nba_official_async(timeout: int) -> Optional[list[PlayerAvailability]]:
     """
     Fetch injury data from NBA official endpoint.
 
     Returns list of PlayerAvailability or None on failure.
     """
-    try:
-        with httpx.Client(timeout=timeout) as client:
-            response = client.get(
-                NBA_INJURIES_BASE_URL,
-                headers={
-                    "User-Agent": "DNA-Matrix/1.0",
-                    "Accept": "application/json",
-                },
-            )
-
-            if response.status_code != 200:
-                _logger.warning(f"NBA API returned {response.status_code}")
-                return None
-
-            data = response.json()
-            players = []
-            now = datetime.utcnow()
-
-            # Parse NBA official format
-            # Structure: list of team objects with injury arrays
-            if isinstance(data, list):
-                for team_data in data:
-                    team_name = team_data.get("team", "")
-                    team_abbr = _parse_team(team_name)
-                    injuries = team_data.get("injuries", [])
-
-                    for injury in injuries:
-                        player_name = injury.get("player", "")
-                        if not player_name:
-                            continue
-
-                        status_str = injury.get("status", "")
-                        reason = injury.get("description", injury.get("injury", ""))
-
-                        players.append(PlayerAvailability(
-                            player_id=_create_player_id(player_name),
-                            player_name=player_name,
-                            team=team_abbr,
-                            status=_parse_status(status_str),
-                            reason=reason if reason else None,
-                            updated_at=now,
-                        ))
-
-            return players if players else None
-
-    except httpx.TimeoutException:
-        _logger.warning("NBA API request timed out")
-        return None
-    except httpx.RequestError as e:
-        _logger.warning(f"NBA API request failed: {e}")
+    data = await http.fetch_json(NBA_INJURIES_BASE_URL, timeout, "NBA")
+    if data is None:
         return None
+    try:
+        return _parse_nba_official(data)
     except Exception as e:
         _logger.warning(f"Failed to parse NBA API response: {e}")
         return None
 
 
-def _fetch_from_espn(timeout: int) -> Optional[list[PlayerAvailability]]:
+async def _fetch_from_espn_async(timeout: int) -> Optional[list[PlayerAvailability]]:
     """
     Fetch injury data from ESPN API (backup source).
 
     Returns list of PlayerAvailability or None on failure.
     """
-    try:
-        with httpx.Client(timeout=timeout) as client:
-            response = client.get(
-                ESPN_INJURIES_URL,
-                headers={
-                    "User-Agent": "DNA-Matrix/1.0",
-                    "Accept": "application/json",
-                },
-            )
-
-            if response.status_code != 200:
-                _logger.warning(f"ESPN API returned {response.status_code}")
-                return None
-
-            data = response.json()
-            players = []
-            now = datetime.utcnow()
-
-            # Parse ESPN format
-            # Structure: { "teams": [ { "team": {...}, "injuries": [...] } ] }
-            teams = data.get("teams", [])
-            for team_entry in teams:
-                team_info = team_entry.get("team", {})
-                team_abbr = team_info.get("abbreviation", "UNK")
-                injuries = team_entry.get("injuries", [])
-
-                for injury in injuries:
-                    athlete = injury.get("athlete", {})
-                    player_name = athlete.get("displayName", "")
-                    if not player_name:
-                        continue
-
-                    status_str = injury.get("status", "")
-                    injury_detail = injury.get("type", {})
-                    reason = injury_detail.get("description", "")
-
-                    players.append(PlayerAvailability(
-                        player_id=_create_player_id(player_name),
-                        player_name=player_name,
-                        team=team_abbr,
-                        status=_parse_status(status_str),
-                        reason=reason if reason else None,
-                        updated_at=now,
-                    ))
-
-            return players if players else None
-
-    except httpx.TimeoutException:
-        _logger.warning("ESPN API request timed out")
-        return None
-    except httpx.RequestError as e:
-        _logger.warning(f"ESPN API request failed: {e}")
+    data = await http.fetch_json(ESPN_INJURIES_URL, timeout, "ESPN")
+    if data is None:
         return None
+    try:
+        return _parse_espn(data)
     except Exception as e:
         _logger.warning(f"Failed to parse ESPN API response: {e}")
         return None
 
 
-def _fetch_live_data(timeout: int) -> tuple[Optional[list[PlayerAvailability]], str, list[str]]:
+async def _fetch_live_data_async(
+    timeout: int,
+    hedge_delay: Optional[float] = None,
+) -> tuple[Optional[list[PlayerAvailability]], str, list[str]]:
     """
     Attempt to fetch live data from available sources.
 
+    NBA official is preferred. ESPN is requested as a hedge once the
+    official request has taken hedge_delay seconds (or as soon as it
+    fails), and the first usable answer wins; official wins a tie.
+
     Returns (players, source_name, missing_data_notes).
     """
-    missing = []
+    if hedge_delay is None:
+        hedge_delay = _get_hedge_delay()
 
-    # Try NBA official first
-    players = _fetch_from_nba_official(timeout)
-    if players:
-        return players, "nba-official", []
+    official = asyncio.ensure_future(_fetch_from_nba_official_async(timeout))
+    espn: Optional[asyncio.Future] = None
+    try:
+        # Head start for the preferred source
+        done, _ = await asyncio.wait({official}, timeout=hedge_delay)
+        if official in done and official.result():
+            return official.result(), "nba-official", []
+
+        # Official failed or is slow: race ESPN against it
+        espn = asyncio.ensure_future(_fetch_from_espn_async(timeout))
+        pending = {espn} if official in done else {official, espn}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if official in done and official.result():
+                return official.result(), "nba-official", []
+            if espn in done and espn.result():
+                return espn.result(), "espn-injuries", ["NBA official API unavailable"]
+    finally:
+        for task in (official, espn):
+            if task is not None and not task.done():
+                task.cancel()
 
-    missing.append("NBA official API unavailable")
+    # All sources failed
+    return None, "none", ["NBA official API unavailable", "ESPN API unavailable"]
 
-    # Try ESPN as backup
-    players = _fetch_from_espn(timeout)
-    if players:
-        return players, "espn-injuries", missing
 
-    missing.append("ESPN API unavailable")
+def _fetch_from_nba_official(timeout: int) -> Optional[list[PlayerAvailability]]:
+    """Blocking variant of _fetch_from_nba_official_async."""
+    return http.run(_fetch_from_nba_official_async(timeout))
 
-    # All sources failed
-    return None, "none", missing
+
+def _fetch_from_espn(timeout: int) -> Optional[list[PlayerAvailability]]:
+    """Blocking variant of _fetch_from_espn_async."""
+    return http.run(_fetch_from_espn_async(timeout))
+
+
+def _fetch_live_data(
+    timeout: int,
+    hedge_delay: Optional[float] = None,
+) -> tuple[Optional[list[PlayerAvailability]], str, list[str]]:
+    """Blocking variant of _fetch_live_data_async (same sources, hedging and notes)."""
+    return http.run(_fetch_live_data_async(timeout, hedge_delay))
 
 
 # =============================================================================
@@ -301,6 +322,8 @@ class NBAAvailabilityProvider(ContextProvider):
     Configuration:
     - Set NBA_AVAILABILITY_LIVE=true to enable live fetching
     - Set NBA_AVAILABILITY_TIMEOUT=N for custom timeout (default: 10s)
+    - Set NBA_AVAILABILITY_HEDGE_DELAY=S to request ESPN after S seconds
+      of a slow NBA official request (default: 1.5s)
 
     Graceful degradation:
     - If live fetch fails, returns snapshot with:
@@ -317,6 +340,7 @@ class NBAAvailabilityProvider(ContextProvider):
             use_live_data: Override env var setting. None uses env var.
         """
         env_live, self._timeout = _get_config()
+        self._hedge_delay = _get_hedge_delay()
         self._use_live_data = use_live_data if use_live_data is not None else env_live
         self._source_name = "nba-availability"
         self._last_fetch_source: Optional[str] = None
@@ -348,10 +372,34 @@ class NBAAvailabilityProvider(ContextProvider):
             # Return graceful fallback
             return self._create_fallback_snapshot(str(e))
 
+    async def fetch_async(self) -> Optional[ContextSnapshot]:
+        """
+        Non-blocking variant of fetch() for use on an event loop.
+
+        Live mode awaits the shared HTTP client; sample mode has no I/O.
+        """
+        try:
+            if self._use_live_data:
+                return self._live_snapshot(*await http.run_async(
+                    _fetch_live_data_async(self._timeout, self._hedge_delay)
+                ))
+            else:
+                return self._fetch_sample()
+        except Exception as e:
+            _logger.error(f"Provider fetch failed: {e}")
+            return self._create_fallback_snapshot(str(e))
+
     def _fetch_live(self) -> ContextSnapshot:
         """Fetch from live data sources with fallback."""
-        players, source, missing = _fetch_live_data(self._timeout)
-
+        return self._live_snapshot(*_fetch_live_data(self._timeout, self._hedge_delay))
+
+    def _live_snapshot(
+        self,
+        players: Optional[list[PlayerAvailability]],
+        source: str,
+        missing: list[str],
+    ) -> ContextSnapshot:
+        """Build the snapshot for a live fetch result (sample data if it failed)."""
         if players:
             self._last_fetch_source = source
             return ContextSnapshot(
@@ -0,0 +1,222 @@
+# context/providers/nfl_availability.py
+"""
+NFL Player Availability Provider
+
+Fetches the NFL injury report from ESPN. Falls back to sample data if
+the live fetch fails, like the NBA provider.
+
+Configuration via environment variables:
+- NFL_AVAILABILITY_LIVE: Set to "true" to enable live data (default: false)
+- NFL_AVAILABILITY_TIMEOUT: HTTP timeout in seconds (default: 10)
+
+Requests go through the shared pooled client in context.providers.http.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime
+from typing import Optional
+
+from context.providers import http
+from context.providers.base import ContextProvider
+from context.providers.nba_availability import _parse_espn  # same ESPN shape for every league
+from context.snapshot import (
+    ContextSnapshot,
+    PlayerAvailability,
+    PlayerStatus,
+)
+
+_logger = logging.getLogger(__name__)
+
+ESPN_NFL_INJURIES_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/injuries"
+
+
+def _get_config() -> tuple[bool, int]:
+    """Get provider configuration from environment."""
+    use_live = os.environ.get("NFL_AVAILABILITY_LIVE", "false").lower() == "true"
+    timeout = int(os.environ.get("NFL_AVAILABILITY_TIMEOUT", "10"))
+    return use_live, timeout
+
+
+# =============================================================================
+# Sample Data (fallback when live data unavailable)
+# =============================================================================
+
+_SAMPLE_AVAILABILITY_DATA = [
+    ("patrick-mahomes", "Patrick Mahomes", "KC", PlayerStatus.AVAILABLE, None),
+    ("travis-kelce", "Travis Kelce", "KC", PlayerStatus.QUESTIONABLE, "Knee"),
+    ("josh-allen", "Josh Allen", "BUF", PlayerStatus.AVAILABLE, None),
+    ("jalen-hurts", "Jalen Hurts", "PHI", PlayerStatus.PROBABLE, "Left knee"),
+    ("lamar-jackson", "Lamar Jackson", "BAL", PlayerStatus.AVAILABLE, None),
+    ("christian-mccaffrey", "Christian McCaffrey", "SF", PlayerStatus.OUT, "Achilles"),
+    ("justin-jefferson", "Justin Jefferson", "MIN", PlayerStatus.AVAILABLE, None),
+    ("tyreek-hill", "Tyreek Hill", "MIA", PlayerStatus.DOUBTFUL, "Wrist"),
+]
+
+
+def _get_sample_players() -> list[PlayerAvailability]:
+    """Return sample player data as fallback."""
+    now = datetime.utcnow()
+    return [
+        PlayerAvailability(
+            player_id=pid,
+            player_name=name,
+            team=team,
+            status=status,
+            reason=reason,
+            updated_at=now,
+        )
+        for pid, name, team, status, reason in _SAMPLE_AVAILABILITY_DATA
+    ]
+
+
+# =============================================================================
+# Live Data Fetching (shared HTTP client, see context.providers.http)
+# =============================================================================
+
+
+async def _fetch_from_espn_async(timeout: int) -> Optional[list[PlayerAvailability]]:
+    """
+    Fetch the NFL injury report from ESPN.
+
+    Returns list of PlayerAvailability or None on failure.
+    """
+    data = await http.fetch_json(ESPN_NFL_INJURIES_URL, timeout, "ESPN NFL")
+    if data is None:
+        return None
+    try:
+        return _parse_espn(data)
+    except Exception as e:
+        _logger.warning(f"Failed to parse ESPN NFL API response: {e}")
+        return None
+
+
+def _fetch_from_espn(timeout: int) -> Optional[list[PlayerAvailability]]:
+    """Blocking variant of _fetch_from_espn_async."""
+    return http.run(_fetch_from_espn_async(timeout))
+
+
+# =============================================================================
+# Provider Class
+# =============================================================================
+
+
+class NFLAvailabilityProvider(ContextProvider):
+    """
+    NFL player availability provider with live data support.
+
+    Configuration:
+    - Set NFL_AVAILABILITY_LIVE=true to enable live fetching
+    - Set NFL_AVAILABILITY_TIMEOUT=N for custom timeout (default: 10s)
+
+    Graceful degradation matches NBAAvailabilityProvider: sample data
+    with the failure noted in missing_data and reduced confidence.
+    """
+
+    def __init__(self, use_live_data: Optional[bool] = None):
+        """
+        Initialize provider.
+
+        Args:
+            use_live_data: Override env var setting. None uses env var.
+        """
+        env_live, self._timeout = _get_config()
+        self._use_live_data = use_live_data if use_live_data is not None else env_live
+        self._source_name = "nfl-availability"
+        self._last_fetch_source: Optional[str] = None
+
+    @property
+    def sport(self) -> str:
+        return "NFL"
+
+    @property
+    def source_name(self) -> str:
+        if self._last_fetch_source:
+            return self._last_fetch_source
+        return self._source_name
+
+    def fetch(self) -> Optional[ContextSnapshot]:
+        """
+        Fetch NFL player availability data.
+
+        Falls back to sample data if live fetch fails.
+        """
+        try:
+            if self._use_live_data:
+                return self._live_snapshot(_fetch_from_espn(self._timeout))
+            else:
+                return self._fetch_sample()
+        except Exception as e:
+            _logger.error(f"Provider fetch failed: {e}")
+            return self._create_fallback_snapshot(str(e))
+
+    async def fetch_async(self) -> Optional[ContextSnapshot]:
+        """
+        Non-blocking variant of fetch() for use on an event loop.
+
+        Live mode awaits the shared HTTP client; sample mode has no I/O.
+        """
+        try:
+            if self._use_live_data:
+                return self._live_snapshot(
+                    await http.run_async(_fetch_from_espn_async(self._timeout))
+                )
+            else:
+                return self._fetch_sample()
+        except Exception as e:
+            _logger.error(f"Provider fetch failed: {e}")
+            return self._create_fallback_snapshot(str(e))
+
+    def _live_snapshot(self, players: Optional[list[PlayerAvailability]]) -> ContextSnapshot:
+        """Build the snapshot for a live fetch result (sample data if it failed)."""
+        if players:
+            self._last_fetch_source = "espn-nfl-injuries"
+            return ContextSnapshot(
+                sport=self.sport,
+                as_of=datetime.utcnow(),
+                source="espn-nfl-injuries",
+                players=tuple(players),
+                missing_data=(),
+                confidence_hint=0.3,
+            )
+
+        _logger.warning("NFL live source failed, using sample data fallback")
+        self._last_fetch_source = "sample-fallback"
+        return ContextSnapshot(
+            sport=self.sport,
+            as_of=datetime.utcnow(),
+            source="sample-fallback",
+            players=tuple(_get_sample_players()),
+            missing_data=("ESPN NFL API unavailable", "Using sample data as fallback"),
+            confidence_hint=-0.3,
+        )
+
+    def _fetch_sample(self) -> ContextSnapshot:
+        """Fetch sample data (development mode)."""
+        self._last_fetch_source = "sample-data"
+        return ContextSnapshot(
+            sport=self.sport,
+            as_of=datetime.utcnow(),
+            source="sample-data",
+            players=tuple(_get_sample_players()),
+            missing_data=("Using sample data (live API not enabled)",),
+            confidence_hint=0.0,
+        )
+
+    def _create_fallback_snapshot(self, error: str) -> ContextSnapshot:
+        """Create a fallback snapshot when everything fails."""
+        self._last_fetch_source = "error-fallback"
+        return ContextSnapshot(
+            sport=self.sport,
+            as_of=datetime.utcnow(),
+            source="error-fallback",
+            players=tuple(_get_sample_players()),
+            missing_data=(
+                "availability_source_unreachable",
+                f"Error: {error}",
+                "Using sample data as emergency fallback",
+            ),
+            confidence_hint=-0.5,
+        )
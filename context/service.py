@@ -7,76 +7,174 @@ Routes and other consumers should use this service rather than
 accessing providers directly.
 
 Features:
-- Provider registration and management
+- Sport-keyed provider registry: several providers per sport, ordered by
+  priority, as failovers or merged into one snapshot
+- get_context_many(): the sports of a mixed slip are fetched concurrently
 - In-memory caching with TTL
-- Graceful degradation when providers fail
+- Stale-while-revalidate: an expired snapshot is still served (up to the
+  stale TTL) while one background refresh replaces it
+- Refresh-ahead: a background refresh starts before the entry expires
+- Single-flight: concurrent fetches for a sport share one provider call
+- Warm restarts: fetched snapshots are persisted (context.store) and the
+  last one is served stale on the first request after a restart
+- Graceful degradation when providers fail; a fallback snapshot never
+  replaces usable real data, it only defers the next refresh
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from threading import Lock
-from typing import Optional
+from threading import Lock, Thread
+from typing import Iterable, Optional
 
 from context.providers.base import ContextProvider
 from context.providers.nba_availability import NBAAvailabilityProvider
-from context.snapshot import ContextSnapshot, empty_snapshot
+from context.providers.nfl_availability import NFLAvailabilityProvider
+from context.snapshot import ContextSnapshot, empty_snapshot, merge_snapshots
+from context.store import SnapshotStore, get_snapshot_store, is_fallback_source
+
+_logger = logging.getLogger(__name__)
 
 
 @dataclass
 class CacheEntry:
-    """Cached context snapshot with expiration."""
+    """
+    Cached context snapshot with expiration.
+
+    Fresh until expires_at; refreshed in the background from refresh_at;
+    still served (stale) until stale_until.
+    """
 
     snapshot: ContextSnapshot
     expires_at: datetime
+    refresh_at: Optional[datetime] = None
+    stale_until: Optional[datetime] = None
 
     def is_expired(self) -> bool:
         """Check if cache entry has expired."""
         return datetime.utcnow() > self.expires_at
 
+    def needs_refresh(self) -> bool:
+        """Check if a background refresh should start."""
+        return datetime.utcnow() > (self.refresh_at or self.expires_at)
+
+    def is_usable(self) -> bool:
+        """Check if the snapshot may still be served (fresh or stale)."""
+        return datetime.utcnow() <= (self.stale_until or self.expires_at)
+
+
+@dataclass(frozen=True)
+class ProviderRegistration:
+    """
+    A provider registered for a sport.
+
+    Higher priority is consulted first. Failover providers (merge=False)
+    are tried in turn until one returns a snapshot; merge providers are
+    always fetched and only add players the failover winner lacks.
+    """
+
+    provider: ContextProvider
+    priority: int = 0
+    merge: bool = False
+
 
 class ContextService:
     """
     Central service for context data management.
 
     Handles:
-    - Provider registration
-    - Caching with configurable TTL
+    - Provider registration (sport -> providers in priority order)
+    - Caching with configurable TTL, served stale while refreshing
+    - One in-flight provider fetch per sport
     - Fallback to empty snapshots on failure
     """
 
     # Default cache TTL: 5 minutes
     DEFAULT_TTL_SECONDS = 300
 
-    def __init__(self, cache_ttl_seconds: int = DEFAULT_TTL_SECONDS):
+    # How long past expiry a snapshot is still served while refreshing
+    DEFAULT_STALE_TTL_SECONDS = 3600
+
+    # Start the background refresh once this share of the TTL has passed
+    DEFAULT_REFRESH_AHEAD_RATIO = 0.8
+
+    # How long a real snapshot waits for its next refresh after one fell back
+    DEFAULT_FALLBACK_RETRY_SECONDS = 60
+
+    def __init__(
+        self,
+        cache_ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        stale_ttl_seconds: int = DEFAULT_STALE_TTL_SECONDS,
+        refresh_ahead_ratio: float = DEFAULT_REFRESH_AHEAD_RATIO,
+        snapshot_store: Optional[SnapshotStore] = None,
+        fallback_retry_seconds: int = DEFAULT_FALLBACK_RETRY_SECONDS,
+    ):
         """
         Initialize context service.
 
         Args:
             cache_ttl_seconds: How long to cache snapshots (default 5 min)
+            stale_ttl_seconds: How long past expiry to keep serving a
+                snapshot while it refreshes (default 1 hour)
+            refresh_ahead_ratio: Share of the TTL after which a background
+                refresh starts (default 0.8)
+            snapshot_store: Persists fetched snapshots and restores them
+                after a restart (default: none, memory only)
+            fallback_retry_seconds: When a refresh only yields fallback
+                data, how long the cached real snapshot waits before the
+                next refresh (default 60s)
         """
-        self._providers: dict[str, ContextProvider] = {}
+        self._providers: dict[str, list[ProviderRegistration]] = {}
         self._cache: dict[str, CacheEntry] = {}
         self._cache_ttl = timedelta(seconds=cache_ttl_seconds)
+        self._stale_ttl = timedelta(seconds=stale_ttl_seconds)
+        self._refresh_ahead = self._cache_ttl * refresh_ahead_ratio
+        self._fallback_retry = timedelta(seconds=fallback_retry_seconds)
+        self._inflight: dict[str, Future] = {}
         self._lock = Lock()
+        self._snapshot_store = snapshot_store
+        self._restored: set[str] = set()
 
         # Register default providers
         self._register_defaults()
 
     def _register_defaults(self) -> None:
-        """Register default providers for Sprint 3."""
+        """Register default providers."""
         self.register_provider(NBAAvailabilityProvider())
+        self.register_provider(NFLAvailabilityProvider())
 
-    def register_provider(self, provider: ContextProvider) -> None:
+    def register_provider(
+        self,
+        provider: ContextProvider,
+        priority: int = 0,
+        merge: bool = False,
+    ) -> None:
         """
         Register a context provider.
 
+        Replaces a provider already registered with the same sport and
+        source name.
+
         Args:
             provider: Provider instance to register
+            priority: Higher is consulted first; ties keep registration order
+            merge: Merge this provider's players into the snapshot instead
+                of using it only as a failover
         """
-        key = f"{provider.sport}:{provider.source_name}"
-        self._providers[key] = provider
+        registrations = self._providers.setdefault(provider.sport.upper(), [])
+        registrations[:] = [
+            r for r in registrations if r.provider.source_name != provider.source_name
+        ]
+        registrations.append(ProviderRegistration(provider, priority, merge))
+        registrations.sort(key=lambda r: -r.priority)
+
+    def has_provider(self, sport: str) -> bool:
+        """Check if any provider is registered for a sport."""
+        return bool(self._providers.get(sport.upper()))
 
     def get_context(
         self,
@@ -86,6 +184,11 @@ class ContextService:
         """
         Get context snapshot for a sport.
 
+        A cached snapshot (fresh or stale) is returned without waiting on
+        the provider; a background refresh is started when it is due. Only
+        a miss or force_refresh fetches inline, joining any fetch already
+        in flight for the sport.
+
         Args:
             sport: Sport to get context for (e.g., "NBA")
             force_refresh: If True, bypass cache and fetch fresh
@@ -101,43 +204,262 @@ class ContextService:
             if cached is not None:
                 return cached
 
-        # Find provider for this sport
-        provider = self._find_provider(sport_upper)
-        if provider is None:
-            return empty_snapshot(sport_upper, "no-provider")
+        future, leader = self._join_flight(sport_upper)
+        if not leader:
+            return future.result()
+        return self._fetch(sport_upper, future)
 
-        # Fetch fresh data
-        snapshot = provider.fetch()
-        if snapshot is None:
-            return empty_snapshot(sport_upper, provider.source_name)
+    async def get_context_async(
+        self,
+        sport: str,
+        force_refresh: bool = False,
+    ) -> ContextSnapshot:
+        """
+        Non-blocking variant of get_context() for use on an event loop.
 
-        # Cache the result
-        self._set_cached(sport_upper, snapshot)
+        Cache hits return immediately; misses await the provider's
+        fetch_async() (or the fetch already in flight) instead of
+        blocking the loop on HTTP.
+        """
+        sport_upper = sport.upper()
 
-        return snapshot
+        if not force_refresh:
+            cached = self._get_cached(sport_upper)
+            if cached is not None:
+                return cached
+
+        future, leader = self._join_flight(sport_upper)
+        if not leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            registrations = self._find_providers(sport_upper)
+            snapshot = await self._fetch_from_async(registrations)
+            result = self._store(sport_upper, registrations, snapshot)
+        except BaseException as exc:
+            self._end_flight(sport_upper, future, exception=exc)
+            raise
+        self._end_flight(sport_upper, future, result=result)
+        return result
+
+    def get_context_many(
+        self,
+        sports: Iterable[str],
+        force_refresh: bool = False,
+    ) -> dict[str, ContextSnapshot]:
+        """
+        Get context snapshots for several sports at once.
+
+        Cache hits are returned directly; the remaining sports are fetched
+        concurrently, so a mixed slip waits for its slowest provider rather
+        than the sum of them.
+
+        Args:
+            sports: Sports to get context for (duplicates ignored)
+            force_refresh: If True, bypass cache and fetch fresh
+
+        Returns:
+            {SPORT: ContextSnapshot} in the order sports were given
+        """
+        keys = list(dict.fromkeys(sport.upper() for sport in sports))
+        results: dict[str, ContextSnapshot] = {}
+        misses = []
+        for sport in keys:
+            cached = None if force_refresh else self._get_cached(sport)
+            if cached is not None:
+                results[sport] = cached
+            else:
+                misses.append(sport)
+
+        if len(misses) == 1:
+            results[misses[0]] = self.get_context(misses[0], force_refresh)
+        elif misses:
+            with ThreadPoolExecutor(max_workers=len(misses)) as pool:
+                fetched = pool.map(lambda sport: self.get_context(sport, force_refresh), misses)
+                results.update(zip(misses, fetched, strict=True))
+
+        return {sport: results[sport] for sport in keys}
+
+    async def get_context_many_async(
+        self,
+        sports: Iterable[str],
+        force_refresh: bool = False,
+    ) -> dict[str, ContextSnapshot]:
+        """Non-blocking variant of get_context_many() for use on an event loop."""
+        keys = list(dict.fromkeys(sport.upper() for sport in sports))
+        snapshots = await asyncio.gather(
+            *(self.get_context_async(sport, force_refresh) for sport in keys)
+        )
+        return dict(zip(keys, snapshots, strict=True))
 
     def _get_cached(self, sport: str) -> Optional[ContextSnapshot]:
-        """Get cached snapshot if available and not expired."""
+        """
+        Get cached snapshot if still usable (fresh or stale).
+
+        Starts a background refresh when the entry is due for one.
+        """
         with self._lock:
             entry = self._cache.get(sport)
-            if entry is not None and not entry.is_expired():
-                return entry.snapshot
+            if entry is None and sport not in self._restored:
+                entry = self._restore(sport)
+            if entry is None or not entry.is_usable():
+                return None
+            if entry.needs_refresh() and sport not in self._inflight:
+                future: Future = Future()
+                self._inflight[sport] = future
+                Thread(
+                    target=self._refresh,
+                    args=(sport, future),
+                    name=f"context-refresh-{sport}",
+                    daemon=True,
+                ).start()
+            return entry.snapshot
+
+    def _restore(self, sport: str) -> Optional[CacheEntry]:
+        """
+        Load the persisted snapshot for sport, once per service (lock held).
+
+        It is cached as already due for refresh, and usable until the
+        stale TTL measured from its as_of runs out.
+        """
+        self._restored.add(sport)
+        if self._snapshot_store is None:
             return None
+        snapshot = self._snapshot_store.load(sport)
+        if snapshot is None:
+            return None
+        entry = CacheEntry(
+            snapshot=snapshot,
+            expires_at=snapshot.as_of + self._cache_ttl,
+            refresh_at=snapshot.as_of,
+            stale_until=snapshot.as_of + self._cache_ttl + self._stale_ttl,
+        )
+        if entry.is_usable():
+            self._cache[sport] = entry
+        return entry
+
+    def _refresh(self, sport: str, future: Future) -> None:
+        """Background refresh; the cached entry stays until one succeeds."""
+        try:
+            self._fetch(sport, future)
+        except Exception:
+            _logger.exception(f"Background context refresh failed for {sport}")
+
+    def _fetch(self, sport: str, future: Future) -> ContextSnapshot:
+        """Fetch for the flight `future` leads, cache the result and publish it."""
+        try:
+            registrations = self._find_providers(sport)
+            result = self._store(sport, registrations, self._fetch_from(registrations))
+        except BaseException as exc:
+            self._end_flight(sport, future, exception=exc)
+            raise
+        self._end_flight(sport, future, result=result)
+        return result
+
+    def _join_flight(self, sport: str) -> tuple[Future, bool]:
+        """Return the in-flight fetch for sport, starting one if none: (future, is_leader)."""
+        with self._lock:
+            future = self._inflight.get(sport)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[sport] = future
+            return future, True
+
+    def _end_flight(
+        self,
+        sport: str,
+        future: Future,
+        result: Optional[ContextSnapshot] = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        """Hand the outcome to every caller waiting on the flight, then retire it."""
+        with self._lock:
+            if self._inflight.get(sport) is future:
+                del self._inflight[sport]
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    @staticmethod
+    def _fetch_from(registrations: list[ProviderRegistration]) -> Optional[ContextSnapshot]:
+        """Fetch one sport from its providers (see ProviderRegistration)."""
+        primary = None
+        for registration in registrations:
+            if not registration.merge:
+                primary = registration.provider.fetch()
+                if primary is not None:
+                    break
+        extras = [r.provider.fetch() for r in registrations if r.merge]
+        return _combine(primary, extras)
+
+    @staticmethod
+    async def _fetch_from_async(
+        registrations: list[ProviderRegistration],
+    ) -> Optional[ContextSnapshot]:
+        """Async _fetch_from: merge providers are fetched alongside the failovers."""
+
+        async def failover() -> Optional[ContextSnapshot]:
+            for registration in registrations:
+                if not registration.merge:
+                    snapshot = await registration.provider.fetch_async()
+                    if snapshot is not None:
+                        return snapshot
+            return None
+
+        primary, *extras = await asyncio.gather(
+            failover(), *(r.provider.fetch_async() for r in registrations if r.merge)
+        )
+        return _combine(primary, extras)
+
+    def _store(
+        self,
+        sport: str,
+        registrations: list[ProviderRegistration],
+        snapshot: Optional[ContextSnapshot],
+    ) -> ContextSnapshot:
+        """Cache a fetched snapshot, or build the empty one for a failed fetch."""
+        if not registrations:
+            return empty_snapshot(sport, "no-provider")
+        if snapshot is None:
+            return empty_snapshot(sport, registrations[0].provider.source_name)
+        return self._set_cached(sport, snapshot)
+
+    def _set_cached(self, sport: str, snapshot: ContextSnapshot) -> ContextSnapshot:
+        """
+        Cache a snapshot and persist it for warm restarts.
 
-    def _set_cached(self, sport: str, snapshot: ContextSnapshot) -> None:
-        """Cache a snapshot."""
+        A fallback snapshot does not replace a usable real one: the real
+        entry is kept and its next refresh deferred by the fallback retry.
+        Returns the snapshot now cached.
+        """
+        now = datetime.utcnow()
         with self._lock:
+            current = self._cache.get(sport)
+            if (
+                is_fallback_source(snapshot.source)
+                and current is not None
+                and current.is_usable()
+                and not is_fallback_source(current.snapshot.source)
+            ):
+                current.refresh_at = now + self._fallback_retry
+                return current.snapshot
             self._cache[sport] = CacheEntry(
                 snapshot=snapshot,
-                expires_at=datetime.utcnow() + self._cache_ttl,
+                expires_at=now + self._cache_ttl,
+                refresh_at=now + self._refresh_ahead,
+                stale_until=now + self._cache_ttl + self._stale_ttl,
             )
+            # A live fetch supersedes anything on disk
+            self._restored.add(sport)
+        if self._snapshot_store is not None:
+            self._snapshot_store.save(snapshot)
+        return snapshot
 
-    def _find_provider(self, sport: str) -> Optional[ContextProvider]:
-        """Find a provider for the given sport."""
-        for key, provider in self._providers.items():
-            if provider.sport.upper() == sport and provider.is_available():
-                return provider
-        return None
+    def _find_providers(self, sport: str) -> list[ProviderRegistration]:
+        """Available providers for the given sport, highest priority first."""
+        return [r for r in self._providers.get(sport, ()) if r.provider.is_available()]
 
     def clear_cache(self, sport: Optional[str] = None) -> None:
         """
@@ -159,6 +481,7 @@ class ContextService:
                 sport: {
                     "expires_at": entry.expires_at.isoformat(),
                     "is_expired": entry.is_expired(),
+                    "is_refreshing": sport in self._inflight,
                     "source": entry.snapshot.source,
                     "player_count": entry.snapshot.player_count,
                 }
@@ -166,6 +489,15 @@ class ContextService:
             }
 
 
+def _combine(
+    primary: Optional[ContextSnapshot],
+    extras: list[Optional[ContextSnapshot]],
+) -> Optional[ContextSnapshot]:
+    """Merge the failover winner with the merge providers' snapshots."""
+    snapshots = [s for s in (primary, *extras) if s is not None]
+    return merge_snapshots(snapshots) if snapshots else None
+
+
 # Singleton instance for app-wide use
 _service_instance: Optional[ContextService] = None
 
@@ -174,7 +506,7 @@ def get_context_service() -> ContextService:
     """Get the singleton context service instance."""
     global _service_instance
     if _service_instance is None:
-        _service_instance = ContextService()
+        _service_instance = ContextService(snapshot_store=get_snapshot_store())
     return _service_instance
 
 
@@ -192,3 +524,34 @@ def get_context(sport: str, force_refresh: bool = False) -> ContextSnapshot:
         ContextSnapshot for the sport
     """
     return get_context_service().get_context(sport, force_refresh)
+
+
+async def get_context_async(sport: str, force_refresh: bool = False) -> ContextSnapshot:
+    """
+    Async convenience function to get context for a sport.
+
+    Same contract as get_context(), without blocking the event loop.
+    """
+    return await get_context_service().get_context_async(sport, force_refresh)
+
+
+def get_context_many(sports: Iterable[str], force_refresh: bool = False) -> dict[str, ContextSnapshot]:
+    """
+    Convenience function to get context for several sports concurrently.
+
+    Args:
+        sports: Sports to get context for (e.g., ["NBA", "NFL"])
+        force_refresh: Bypass cache if True
+
+    Returns:
+        {SPORT: ContextSnapshot}
+    """
+    return get_context_service().get_context_many(sports, force_refresh)
+
+
+async def get_context_many_async(
+    sports: Iterable[str],
+    force_refresh: bool = False,
+) -> dict[str, ContextSnapshot]:
+    """Async convenience function to get context for several sports concurrently."""
+    return await get_context_service().get_context_many_async(sports, force_refresh)
@@ -9,6 +9,7 @@ Key design principles:
 - Additive only: context affects confidence, not core scoring
 - Source-agnostic: same schema regardless of data source
 - Cacheable: immutable snapshots with timestamps
+- Indexed: player, team and status lookups are built once per snapshot
 """
 
 from __future__ import annotations
@@ -16,7 +17,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 
 
 class PlayerStatus(Enum):
@@ -75,8 +76,13 @@ class ContextSnapshot:
     # Range: -1.0 to 1.0 (additive modifier)
     confidence_hint: float = 0.0
 
+    # Lookup indexes, built once in __post_init__ (not part of equality)
+    _by_name: dict[str, PlayerAvailability] = field(init=False, repr=False, compare=False)
+    _by_team: dict[str, tuple[PlayerAvailability, ...]] = field(init=False, repr=False, compare=False)
+    _unavailable: tuple[PlayerAvailability, ...] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        """Validate confidence_hint is in valid range."""
+        """Validate confidence_hint is in valid range and index players."""
         if not -1.0 <= self.confidence_hint <= 1.0:
             # Clamp to valid range rather than raise
             object.__setattr__(
@@ -85,25 +91,32 @@ class ContextSnapshot:
                 max(-1.0, min(1.0, self.confidence_hint))
             )
 
+        # First player wins on duplicate names, as a scan would
+        by_name: dict[str, PlayerAvailability] = {}
+        by_team: dict[str, list[PlayerAvailability]] = {}
+        for player in self.players:
+            by_name.setdefault(player.player_name.lower(), player)
+            by_team.setdefault(player.team.upper(), []).append(player)
+        object.__setattr__(self, "_by_name", by_name)
+        object.__setattr__(
+            self, "_by_team", {team: tuple(players) for team, players in by_team.items()}
+        )
+        object.__setattr__(self, "_unavailable", tuple(
+            p for p in self.players
+            if p.status in (PlayerStatus.OUT, PlayerStatus.DOUBTFUL)
+        ))
+
     def get_player(self, player_name: str) -> Optional[PlayerAvailability]:
         """Look up player by name (case-insensitive)."""
-        name_lower = player_name.lower()
-        for player in self.players:
-            if player.player_name.lower() == name_lower:
-                return player
-        return None
+        return self._by_name.get(player_name.lower())
 
     def get_team_players(self, team: str) -> tuple[PlayerAvailability, ...]:
         """Get all players for a team."""
-        team_upper = team.upper()
-        return tuple(p for p in self.players if p.team.upper() == team_upper)
+        return self._by_team.get(team.upper(), ())
 
     def get_unavailable_players(self) -> tuple[PlayerAvailability, ...]:
         """Get all players who are OUT or DOUBTFUL."""
-        return tuple(
-            p for p in self.players
-            if p.status in (PlayerStatus.OUT, PlayerStatus.DOUBTFUL)
-        )
+        return self._unavailable
 
     @property
     def has_missing_data(self) -> bool:
@@ -127,3 +140,33 @@ def empty_snapshot(sport: str = "NBA", source: str = "none") -> ContextSnapshot:
         missing_data=("No data source available",),
         confidence_hint=0.0,
     )
+
+
+def merge_snapshots(snapshots: Sequence[ContextSnapshot]) -> ContextSnapshot:
+    """
+    Combine snapshots of one sport from several providers.
+
+    `snapshots` are in priority order (highest first). A player reported
+    by more than one source keeps the highest-priority record; the others
+    only add players it lacks. The result is as old as its oldest part and
+    takes its confidence hint from the highest-priority snapshot.
+    """
+    if len(snapshots) == 1:
+        return snapshots[0]
+
+    primary = snapshots[0]
+    players: dict[str, PlayerAvailability] = {}
+    for snapshot in snapshots:
+        for player in snapshot.players:
+            players.setdefault(player.player_name.lower(), player)
+
+    return ContextSnapshot(
+        sport=primary.sport,
+        as_of=min(snapshot.as_of for snapshot in snapshots),
+        source="+".join(snapshot.source for snapshot in snapshots),
+        players=tuple(players.values()),
+        missing_data=tuple(dict.fromkeys(
+            note for snapshot in snapshots for note in snapshot.missing_data
+        )),
+        confidence_hint=primary.confidence_hint,
+    )
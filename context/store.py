@@ -0,0 +1,165 @@
+# context/store.py
+"""
+On-disk snapshot store for warm restarts.
+
+The context service keeps the last successfully fetched snapshot per
+sport here, so after a deploy or restart it can serve real context
+immediately (as a stale entry) while a background refresh runs.
+
+Format: one JSON-lines file per sport (<SPORT>.jsonl). The first line
+holds the snapshot header, every following line one player as a compact
+array. Files are written atomically and read line by line on the first
+lookup for a sport, never at import time.
+
+Configuration via environment variables:
+- CONTEXT_CACHE_DIR: Directory for snapshot files (default: .context_cache)
+- DNA_PERSISTENCE: Set to "false" to disable (shared with alerts)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from context.snapshot import ContextSnapshot, PlayerAvailability, PlayerStatus
+
+_logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# Sample data served when live sources fail; never persisted, so a warm
+# restart does not bring back a degraded snapshot
+FALLBACK_SOURCES = frozenset({"sample-fallback", "error-fallback"})
+
+
+def is_fallback_source(source: str) -> bool:
+    """True if any source merged into `source` ("a+b", see merge_snapshots) is a fallback."""
+    return not FALLBACK_SOURCES.isdisjoint(source.split("+"))
+
+
+def _encode_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _decode_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+class SnapshotStore:
+    """
+    Persists the latest snapshot per sport under a directory.
+
+    Thread-safe. I/O failures are logged and never raised: persistence
+    only ever speeds up a cold start.
+    """
+
+    def __init__(self, directory: str | Path):
+        """
+        Initialize snapshot store.
+
+        Args:
+            directory: Where snapshot files live (created on first save)
+        """
+        self._directory = Path(directory)
+        self._lock = Lock()
+
+    def _path(self, sport: str) -> Path:
+        return self._directory / f"{sport.upper()}.jsonl"
+
+    def save(self, snapshot: ContextSnapshot) -> bool:
+        """
+        Persist a snapshot, replacing the previous one for its sport.
+
+        Fallback snapshots are skipped. Returns True if written.
+        """
+        if is_fallback_source(snapshot.source):
+            return False
+
+        header = {
+            "format": FORMAT_VERSION,
+            "sport": snapshot.sport,
+            "as_of": snapshot.as_of.isoformat(),
+            "source": snapshot.source,
+            "missing_data": list(snapshot.missing_data),
+            "confidence_hint": snapshot.confidence_hint,
+        }
+        lines = [json.dumps(header, separators=(",", ":"))]
+        lines.extend(
+            json.dumps([
+                p.player_id,
+                p.player_name,
+                p.team,
+                p.status.value,
+                p.reason,
+                _encode_datetime(p.updated_at),
+            ], separators=(",", ":"))
+            for p in snapshot.players
+        )
+
+        path = self._path(snapshot.sport)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with self._lock:
+                self._directory.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+                os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            _logger.warning(f"Failed to persist {snapshot.sport} context snapshot: {e}")
+            return False
+
+    def load(self, sport: str) -> Optional[ContextSnapshot]:
+        """
+        Load the persisted snapshot for a sport.
+
+        Returns None if there is none or it cannot be read.
+        """
+        path = self._path(sport)
+        try:
+            with self._lock, path.open(encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                if header.get("format") != FORMAT_VERSION:
+                    return None
+                players = []
+                for line in f:
+                    player_id, name, team, status, reason, updated_at = json.loads(line)
+                    players.append(PlayerAvailability(
+                        player_id=player_id,
+                        player_name=name,
+                        team=team,
+                        status=PlayerStatus(status),
+                        reason=reason,
+                        updated_at=_decode_datetime(updated_at),
+                    ))
+                return ContextSnapshot(
+                    sport=header["sport"],
+                    as_of=datetime.fromisoformat(header["as_of"]),
+                    source=header["source"],
+                    players=tuple(players),
+                    missing_data=tuple(header["missing_data"]),
+                    confidence_hint=header["confidence_hint"],
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            _logger.warning(f"Ignoring unreadable {sport} context snapshot: {e}")
+            return None
+
+
+# Singleton instance for app-wide use
+_store_instance: Optional[SnapshotStore] = None
+
+
+def get_snapshot_store() -> Optional[SnapshotStore]:
+    """Get the singleton snapshot store, or None if persistence is disabled."""
+    global _store_instance
+    if os.environ.get("DNA_PERSISTENCE", "true").lower() != "true":
+        return None
+    if _store_instance is None:
+        _store_instance = SnapshotStore(os.environ.get("CONTEXT_CACHE_DIR", ".context_cache"))
+    return _store_instance
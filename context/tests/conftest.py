@@ -0,0 +1,80 @@
+"""Shared fixtures for context tests."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from context.providers import http
+
+
+class StubServer:
+    """
+    Local HTTP server serving canned JSON per path.
+
+    Speaks HTTP/1.1 with keep-alive; `connections` counts the TCP
+    connections accepted, `requests` the requests served.
+    """
+
+    def __init__(self):
+        self.routes: dict[str, tuple[int, object, float]] = {}
+        self.connections = 0
+        self.requests = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                stub.connections += 1
+
+            def do_GET(self):
+                stub.requests += 1
+                status, payload, delay = stub.routes.get(self.path, (404, {}, 0.0))
+                if delay:
+                    time.sleep(delay)
+                body = json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except OSError:
+                    pass  # Client gave up (timeout or cancelled hedge)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def route(self, path: str, payload, status: int = 200, delay: float = 0.0) -> str:
+        """Serve `payload` at `path` after `delay` seconds; returns its URL."""
+        self.routes[path] = (status, payload, delay)
+        return self.url(path)
+
+    def url(self, path: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    """A running StubServer; the shared HTTP client is reset afterwards."""
+    server = StubServer().start()
+    yield server
+    http.close()
+    server.stop()
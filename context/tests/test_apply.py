@@ -4,7 +4,7 @@
 import pytest
 from datetime import datetime
 
-from context.apply import apply_context, ContextModifier, ContextImpact
+from context.apply import apply_context, apply_context_many, ContextModifier, ContextImpact
 from context.snapshot import (
     ContextSnapshot,
     PlayerAvailability,
@@ -200,3 +200,56 @@ class TestContextImpact:
         )
         impact = apply_context(snapshot)
         assert "No live data" in impact.missing_data
+
+
+class TestApplyContextMany:
+    """Test apply_context_many across the sports of a mixed slip."""
+
+    def test_single_snapshot_matches_apply_context(self):
+        snapshot = ContextSnapshot(
+            sport="NBA",
+            as_of=datetime.utcnow(),
+            source="test",
+            players=(PlayerAvailability("p1", "Player One", "LAL", PlayerStatus.OUT),),
+            missing_data=("Some data missing",),
+        )
+        assert apply_context_many((snapshot,), ["Player One"]) == apply_context(snapshot, ["Player One"])
+
+    def test_modifiers_from_every_snapshot(self):
+        nba = ContextSnapshot(
+            sport="NBA",
+            as_of=datetime.utcnow(),
+            source="nba-test",
+            players=(PlayerAvailability("p1", "Player One", "LAL", PlayerStatus.OUT),),
+        )
+        nfl = ContextSnapshot(
+            sport="NFL",
+            as_of=datetime.utcnow(),
+            source="nfl-test",
+            players=(PlayerAvailability("p2", "Player Two", "KC", PlayerStatus.DOUBTFUL),),
+            missing_data=("Partial report",),
+        )
+
+        impact = apply_context_many((nba, nfl), player_names=["Player One", "Player Two"])
+
+        assert {m.source for m in impact.modifiers} == {"nba-test", "nfl-test"}
+        assert impact.missing_data == ("Partial report",)
+        assert impact.total_adjustment == max(-1.0, sum(m.adjustment for m in impact.modifiers))
+
+    def test_shared_source_notes_count_once(self):
+        """Two sample snapshots from one source add one missing-data modifier."""
+        nba, nfl = (
+            ContextSnapshot(
+                sport=sport,
+                as_of=datetime.utcnow(),
+                source="sample-data",
+                missing_data=("Using sample data (live API not enabled)",),
+            )
+            for sport in ("NBA", "NFL")
+        )
+
+        impact = apply_context_many((nba, nfl))
+
+        assert len(impact.modifiers) == 1
+        assert impact.total_adjustment == -0.1
+        assert impact.missing_data == ("Using sample data (live API not enabled)",)
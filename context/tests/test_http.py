@@ -0,0 +1,78 @@
+"""Tests for the shared context HTTP client."""
+
+import asyncio
+
+from context.providers import http
+
+
+class TestFetchJson:
+    """Test fetch_json against a local stub server."""
+
+    def test_returns_parsed_body(self, stub_server):
+        url = stub_server.route("/data", {"ok": True})
+
+        assert http.run(http.fetch_json(url, timeout=5, label="Stub")) == {"ok": True}
+
+    def test_non_200_returns_none(self, stub_server):
+        url = stub_server.route("/data", {}, status=500)
+
+        assert http.run(http.fetch_json(url, timeout=5, label="Stub")) is None
+
+    def test_timeout_returns_none(self, stub_server):
+        url = stub_server.route("/data", {"ok": True}, delay=1.0)
+
+        assert http.run(http.fetch_json(url, timeout=0.1, label="Stub")) is None
+
+    def test_awaitable_from_another_loop(self, stub_server):
+        """Callers on their own event loop hop to the shared one."""
+        url = stub_server.route("/data", [1, 2, 3])
+
+        assert asyncio.run(http.fetch_json(url, timeout=5, label="Stub")) == [1, 2, 3]
+
+
+class TestConnectionReuse:
+    """Sequential fetches share pooled keep-alive connections."""
+
+    def test_sync_and_async_fetches_share_one_connection(self, stub_server):
+        url = stub_server.route("/data", {"ok": True})
+
+        for _ in range(3):
+            http.run(http.fetch_json(url, timeout=5, label="Stub"))
+        for _ in range(3):
+            asyncio.run(http.fetch_json(url, timeout=5, label="Stub"))
+
+        assert stub_server.requests == 6
+        assert stub_server.connections == 1
+
+    def test_close_resets_client(self, stub_server):
+        url = stub_server.route("/data", {"ok": True})
+
+        http.run(http.fetch_json(url, timeout=5, label="Stub"))
+        http.close()
+        http.run(http.fetch_json(url, timeout=5, label="Stub"))
+
+        assert stub_server.connections == 2
+
+
+class TestLimits:
+    """Pool limits from environment."""
+
+    def test_env_overrides(self, monkeypatch):
+        monkeypatch.setenv("CONTEXT_HTTP_MAX_CONNECTIONS", "5")
+        monkeypatch.setenv("CONTEXT_HTTP_KEEPALIVE_SECONDS", "2.5")
+
+        limits = http._get_limits()
+
+        assert limits.max_connections == 5
+        assert limits.keepalive_expiry == 2.5
+
+    def test_malformed_values_fall_back_to_defaults(self, monkeypatch, caplog):
+        monkeypatch.setenv("CONTEXT_HTTP_MAX_CONNECTIONS", "twenty")
+        monkeypatch.setenv("CONTEXT_HTTP_KEEPALIVE_SECONDS", "-1")
+
+        limits = http._get_limits()
+
+        assert limits.max_connections == 20
+        assert limits.keepalive_expiry == 60.0
+        assert "CONTEXT_HTTP_MAX_CONNECTIONS" in caplog.text
+        assert "CONTEXT_HTTP_KEEPALIVE_SECONDS" in caplog.text
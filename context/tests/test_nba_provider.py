@@ -1,12 +1,15 @@
 # context/tests/test_nba_provider.py
-"""Tests for NBA availability provider with mocked HTTP responses."""
+"""Tests for NBA availability provider against mocked and stub-served HTTP responses."""
+
+import asyncio
+import socket
+import time
 
 import pytest
 from datetime import datetime
-from unittest.mock import patch, MagicMock
-
-import httpx
+from unittest.mock import AsyncMock, patch, MagicMock
 
+from context.providers import nba_availability
 from context.providers.nba_availability import (
     NBAAvailabilityProvider,
     get_nba_availability,
@@ -15,6 +18,8 @@ from context.providers.nba_availability import (
     _fetch_from_nba_official,
     _fetch_from_espn,
     _fetch_live_data,
+    _fetch_from_nba_official_async,
+    _fetch_live_data_async,
     _get_sample_players,
 )
 from context.snapshot import PlayerStatus
@@ -128,21 +133,21 @@ class TestParseTeam:
 # =============================================================================
 
 
+def _closed_port_url() -> str:
+    """URL on a local port with nothing listening."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/report"
+
+
 class TestNBAOfficialFetch:
-    """Test _fetch_from_nba_official with mocked responses."""
+    """Test _fetch_from_nba_official against a local stub server."""
 
-    @patch("context.providers.nba_availability.httpx.Client")
-    def test_successful_fetch(self, mock_client_class):
+    def test_successful_fetch(self, stub_server, monkeypatch):
         """Successful API response returns player list."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = MOCK_NBA_RESPONSE
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        url = stub_server.route("/nba", MOCK_NBA_RESPONSE)
+        monkeypatch.setattr(nba_availability, "NBA_INJURIES_BASE_URL", url)
 
         players = _fetch_from_nba_official(timeout=10)
 
@@ -152,61 +157,37 @@ class TestNBAOfficialFetch:
         assert players[0].team == "LAL"
         assert players[0].status == PlayerStatus.PROBABLE
 
-    @patch("context.providers.nba_availability.httpx.Client")
-    def test_non_200_response(self, mock_client_class):
+    def test_non_200_response(self, stub_server, monkeypatch):
         """Non-200 response returns None."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        url = stub_server.route("/nba", {}, status=404)
+        monkeypatch.setattr(nba_availability, "NBA_INJURIES_BASE_URL", url)
 
         players = _fetch_from_nba_official(timeout=10)
         assert players is None
 
-    @patch("context.providers.nba_availability.httpx.Client")
-    def test_timeout(self, mock_client_class):
+    def test_timeout(self, stub_server, monkeypatch):
         """Timeout returns None."""
-        mock_client = MagicMock()
-        mock_client.get.side_effect = httpx.TimeoutException("Timeout")
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        url = stub_server.route("/nba", MOCK_NBA_RESPONSE, delay=1.0)
+        monkeypatch.setattr(nba_availability, "NBA_INJURIES_BASE_URL", url)
 
-        players = _fetch_from_nba_official(timeout=10)
+        players = _fetch_from_nba_official(timeout=0.1)
         assert players is None
 
-    @patch("context.providers.nba_availability.httpx.Client")
-    def test_request_error(self, mock_client_class):
+    def test_request_error(self, stub_server, monkeypatch):
         """Request error returns None."""
-        mock_client = MagicMock()
-        mock_client.get.side_effect = httpx.RequestError("Connection failed")
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        monkeypatch.setattr(nba_availability, "NBA_INJURIES_BASE_URL", _closed_port_url())
 
         players = _fetch_from_nba_official(timeout=10)
         assert players is None
 
 
 class TestESPNFetch:
-    """Test _fetch_from_espn with mocked responses."""
+    """Test _fetch_from_espn against a local stub server."""
 
-    @patch("context.providers.nba_availability.httpx.Client")
-    def test_successful_fetch(self, mock_client_class):
+    def test_successful_fetch(self, stub_server, monkeypatch):
         """Successful ESPN response returns player list."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = MOCK_ESPN_RESPONSE
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        url = stub_server.route("/espn", MOCK_ESPN_RESPONSE)
+        monkeypatch.setattr(nba_availability, "ESPN_INJURIES_URL", url)
 
         players = _fetch_from_espn(timeout=10)
 
@@ -219,8 +200,8 @@ class TestESPNFetch:
 class TestLiveDataFetch:
     """Test _fetch_live_data with multiple sources."""
 
-    @patch("context.providers.nba_availability._fetch_from_espn")
-    @patch("context.providers.nba_availability._fetch_from_nba_official")
+    @patch("context.providers.nba_availability._fetch_from_espn_async", new_callable=AsyncMock)
+    @patch("context.providers.nba_availability._fetch_from_nba_official_async", new_callable=AsyncMock)
     def test_nba_official_success(self, mock_nba, mock_espn):
         """When NBA official succeeds, ESPN is not called."""
         mock_nba.return_value = [MagicMock()]  # Non-empty list
@@ -231,8 +212,8 @@ class TestLiveDataFetch:
         assert len(missing) == 0
         mock_espn.assert_not_called()
 
-    @patch("context.providers.nba_availability._fetch_from_espn")
-    @patch("context.providers.nba_availability._fetch_from_nba_official")
+    @patch("context.providers.nba_availability._fetch_from_espn_async", new_callable=AsyncMock)
+    @patch("context.providers.nba_availability._fetch_from_nba_official_async", new_callable=AsyncMock)
     def test_fallback_to_espn(self, mock_nba, mock_espn):
         """When NBA official fails, falls back to ESPN."""
         mock_nba.return_value = None
@@ -243,8 +224,8 @@ class TestLiveDataFetch:
         assert source == "espn-injuries"
         assert "NBA official API unavailable" in missing
 
-    @patch("context.providers.nba_availability._fetch_from_espn")
-    @patch("context.providers.nba_availability._fetch_from_nba_official")
+    @patch("context.providers.nba_availability._fetch_from_espn_async", new_callable=AsyncMock)
+    @patch("context.providers.nba_availability._fetch_from_nba_official_async", new_callable=AsyncMock)
     def test_all_sources_fail(self, mock_nba, mock_espn):
         """When all sources fail, returns None with missing notes."""
         mock_nba.return_value = None
@@ -258,6 +239,59 @@ class TestLiveDataFetch:
         assert "ESPN API unavailable" in missing
 
 
+class TestHedgedFallback:
+    """ESPN is requested alongside a slow NBA official request."""
+
+    def test_slow_official_hedged_by_espn(self, stub_server, monkeypatch):
+        """A hung official endpoint costs the hedge delay, not the timeout."""
+        monkeypatch.setattr(
+            nba_availability, "NBA_INJURIES_BASE_URL",
+            stub_server.route("/nba", MOCK_NBA_RESPONSE, delay=2.0),
+        )
+        monkeypatch.setattr(
+            nba_availability, "ESPN_INJURIES_URL", stub_server.route("/espn", MOCK_ESPN_RESPONSE)
+        )
+
+        start = time.perf_counter()
+        players, source, missing = _fetch_live_data(timeout=5, hedge_delay=0.1)
+        elapsed = time.perf_counter() - start
+
+        assert source == "espn-injuries"
+        assert missing == ["NBA official API unavailable"]
+        assert len(players) == 2
+        assert elapsed < 1.0
+
+    def test_official_preferred_within_hedge_delay(self, stub_server, monkeypatch):
+        """A timely official answer is used and ESPN is never requested."""
+        monkeypatch.setattr(
+            nba_availability, "NBA_INJURIES_BASE_URL", stub_server.route("/nba", MOCK_NBA_RESPONSE)
+        )
+        monkeypatch.setattr(
+            nba_availability, "ESPN_INJURIES_URL", stub_server.route("/espn", MOCK_ESPN_RESPONSE)
+        )
+
+        players, source, missing = _fetch_live_data(timeout=5, hedge_delay=1.0)
+
+        assert source == "nba-official"
+        assert missing == []
+        assert stub_server.requests == 1
+
+    def test_official_still_wins_after_hedge(self, stub_server, monkeypatch):
+        """If ESPN fails, the slow official answer is still used."""
+        monkeypatch.setattr(
+            nba_availability, "NBA_INJURIES_BASE_URL",
+            stub_server.route("/nba", MOCK_NBA_RESPONSE, delay=0.3),
+        )
+        monkeypatch.setattr(
+            nba_availability, "ESPN_INJURIES_URL", stub_server.route("/espn", {}, status=503)
+        )
+
+        players, source, missing = _fetch_live_data(timeout=5, hedge_delay=0.05)
+
+        assert source == "nba-official"
+        assert len(players) == 3
+
+
 # =============================================================================
 # Provider Class Tests
 # =============================================================================
@@ -369,3 +403,54 @@ class TestCacheIntegration:
         assert hasattr(snapshot, "players")
         assert hasattr(snapshot, "missing_data")
         assert hasattr(snapshot, "confidence_hint")
+
+
+# =============================================================================
+# Async Fetch Tests
+# =============================================================================
+
+
+class TestAsyncFetch:
+    """Test the non-blocking fetch path."""
+
+    def test_nba_official_async(self, stub_server, monkeypatch):
+        """Async NBA fetch parses the same payload as the sync path."""
+        url = stub_server.route("/nba", MOCK_NBA_RESPONSE)
+        monkeypatch.setattr(nba_availability, "NBA_INJURIES_BASE_URL", url)
+
+        players = asyncio.run(_fetch_from_nba_official_async(timeout=10))
+
+        assert [p.player_name for p in players] == ["LeBron James", "Anthony Davis", "Jayson Tatum"]
+
+    def test_async_timeout_returns_none(self, stub_server, monkeypatch):
+        """Timeouts degrade to None like the sync path."""
+        url = stub_server.route("/nba", MOCK_NBA_RESPONSE, delay=1.0)
+        monkeypatch.setattr(nba_availability, "NBA_INJURIES_BASE_URL", url)
+
+        assert asyncio.run(_fetch_from_nba_official_async(timeout=0.1)) is None
+
+    @patch("context.providers.nba_availability._fetch_from_espn_async", new_callable=AsyncMock)
+    @patch("context.providers.nba_availability._fetch_from_nba_official_async", new_callable=AsyncMock)
+    def test_async_fallback_to_espn(self, mock_nba, mock_espn):
+        """Async live fetch keeps the NBA -> ESPN fallback order."""
+        mock_nba.return_value = None
+        mock_espn.return_value = _get_sample_players()
+
+        players, source, missing = asyncio.run(_fetch_live_data_async(timeout=10))
+
+        assert source == "espn-injuries"
+        assert missing == ["NBA official API unavailable"]
+
+    def test_provider_fetch_async_sample_mode(self):
+        """Sample mode needs no I/O and matches fetch()."""
+        snapshot = asyncio.run(NBAAvailabilityProvider(use_live_data=False).fetch_async())
+        assert snapshot.source == "sample-data"
+        assert snapshot.player_count > 0
+
+    @patch("context.providers.nba_availability._fetch_live_data_async", new_callable=AsyncMock)
+    def test_provider_fetch_async_live_fallback(self, mock_fetch):
+        """Live async failure falls back to sample data."""
+        mock_fetch.return_value = (None, "none", ["NBA official API unavailable"])
+        snapshot = asyncio.run(NBAAvailabilityProvider(use_live_data=True).fetch_async())
+        assert snapshot.source == "sample-fallback"
+        assert snapshot.confidence_hint == -0.3
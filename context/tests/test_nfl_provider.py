@@ -0,0 +1,95 @@
+# context/tests/test_nfl_provider.py
+"""Tests for NFL availability provider against a local stub server."""
+
+import asyncio
+
+import pytest
+
+from context.providers import nfl_availability
+from context.providers.nfl_availability import NFLAvailabilityProvider
+from context.service import ContextService
+from context.snapshot import PlayerStatus
+
+MOCK_ESPN_NFL_RESPONSE = {
+    "teams": [
+        {
+            "team": {"abbreviation": "KC"},
+            "injuries": [
+                {
+                    "athlete": {"displayName": "Travis Kelce"},
+                    "status": "Questionable",
+                    "type": {"description": "Ankle"},
+                },
+            ],
+        },
+        {
+            "team": {"abbreviation": "SF"},
+            "injuries": [
+                {
+                    "athlete": {"displayName": "Christian McCaffrey"},
+                    "status": "Out",
+                    "type": {"description": "Achilles"},
+                },
+            ],
+        },
+    ]
+}
+
+
+@pytest.fixture
+def nfl_server(stub_server, monkeypatch):
+    """Stub server standing in for the ESPN NFL injuries endpoint."""
+    url = stub_server.route("/nfl/injuries", MOCK_ESPN_NFL_RESPONSE)
+    monkeypatch.setattr(nfl_availability, "ESPN_NFL_INJURIES_URL", url)
+    return stub_server
+
+
+class TestNFLProvider:
+    """Test NFLAvailabilityProvider."""
+
+    def test_sample_mode(self):
+        snapshot = NFLAvailabilityProvider(use_live_data=False).fetch()
+
+        assert snapshot.sport == "NFL"
+        assert snapshot.source == "sample-data"
+        assert snapshot.get_player("Patrick Mahomes") is not None
+
+    def test_live_fetch(self, nfl_server):
+        provider = NFLAvailabilityProvider(use_live_data=True)
+
+        snapshot = provider.fetch()
+
+        assert snapshot.source == "espn-nfl-injuries"
+        assert provider.source_name == "espn-nfl-injuries"
+        assert snapshot.player_count == 2
+        assert snapshot.get_player("travis kelce").status == PlayerStatus.QUESTIONABLE
+        assert snapshot.get_team_players("SF")[0].status == PlayerStatus.OUT
+        assert snapshot.missing_data == ()
+
+    def test_live_fetch_async(self, nfl_server):
+        snapshot = asyncio.run(NFLAvailabilityProvider(use_live_data=True).fetch_async())
+
+        assert snapshot.source == "espn-nfl-injuries"
+        assert snapshot.player_count == 2
+
+    def test_live_failure_falls_back_to_sample(self, nfl_server):
+        nfl_server.route("/nfl/injuries", {}, status=503)
+
+        snapshot = NFLAvailabilityProvider(use_live_data=True).fetch()
+
+        assert snapshot.source == "sample-fallback"
+        assert "ESPN NFL API unavailable" in snapshot.missing_data
+        assert snapshot.confidence_hint < 0
+
+
+class TestMixedSlipContext:
+    """NBA and NFL context fetched together through the service."""
+
+    def test_nfl_served_by_service(self, nfl_server):
+        service = ContextService()
+        service.register_provider(NFLAvailabilityProvider(use_live_data=True))
+
+        snapshots = service.get_context_many(["NBA", "NFL"])
+
+        assert snapshots["NBA"].sport == "NBA"
+        assert snapshots["NFL"].source == "espn-nfl-injuries"
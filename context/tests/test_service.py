@@ -1,11 +1,103 @@
 # context/tests/test_service.py
 """Tests for ContextService."""
 
+import asyncio
+import threading
+import time
+
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from context.providers.base import ContextProvider
+from context.service import ContextService, get_context, get_context_async, get_context_service
+from context.snapshot import ContextSnapshot, PlayerAvailability, PlayerStatus
+from context.store import SnapshotStore
+
+
+class GatedProvider(ContextProvider):
+    """Provider whose fetch blocks until released, counting calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    @property
+    def sport(self) -> str:
+        return "NBA"
+
+    @property
+    def source_name(self) -> str:
+        return "gated"
+
+    def fetch(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        return ContextSnapshot(sport="NBA", as_of=datetime.utcnow(), source="gated")
+
+
+class StaticProvider(ContextProvider):
+    """Provider returning fixed players (or None) after an optional delay."""
+
+    def __init__(self, sport="NBA", source="static", players=(), delay=0.0, fails=False):
+        self._sport = sport
+        self._source = source
+        self._players = tuple(
+            PlayerAvailability(player_id=name, player_name=name, team="TST", status=status)
+            for name, status in players
+        )
+        self._delay = delay
+        self._fails = fails
+        self.calls = 0
+
+    @property
+    def sport(self) -> str:
+        return self._sport
+
+    @property
+    def source_name(self) -> str:
+        return self._source
 
-from context.service import ContextService, get_context, get_context_service
-from context.snapshot import ContextSnapshot
+    def fetch(self):
+        self.calls += 1
+        time.sleep(self._delay)
+        if self._fails:
+            return None
+        return ContextSnapshot(
+            sport=self._sport, as_of=datetime.utcnow(), source=self._source, players=self._players
+        )
+
+    async def fetch_async(self):
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        if self._fails:
+            return None
+        return ContextSnapshot(
+            sport=self._sport, as_of=datetime.utcnow(), source=self._source, players=self._players
+        )
+
+
+def empty_service(*providers: ContextProvider, **kwargs) -> ContextService:
+    service = ContextService(**kwargs)
+    service._providers.clear()
+    for provider in providers:
+        service.register_provider(provider)
+    return service
+
+
+def gated_service(**kwargs) -> tuple[ContextService, GatedProvider]:
+    provider = GatedProvider()
+    return empty_service(provider, **kwargs), provider
+
+
+def age_entry(service: ContextService, sport: str, seconds: int) -> None:
+    """Shift a cache entry's timestamps into the past."""
+    entry = service._cache[sport]
+    shift = timedelta(seconds=seconds)
+    entry.expires_at -= shift
+    entry.refresh_at -= shift
+    entry.stale_until -= shift
 
 
 class TestContextService:
@@ -97,3 +189,301 @@ class TestConvenienceFunctions:
         snapshot = get_context("NBA")
         assert snapshot is not None
         assert snapshot.sport == "NBA"
+
+
+class TestAsyncContext:
+    """Test the non-blocking get_context_async path."""
+
+    def test_get_context_async(self):
+        """Async lookup returns the same kind of snapshot."""
+        service = ContextService()
+        snapshot = asyncio.run(service.get_context_async("nba"))
+        assert snapshot.sport == "NBA"
+        assert snapshot.player_count > 0
+
+    def test_async_shares_cache_with_sync(self):
+        """A snapshot cached by get_context is served to get_context_async."""
+        service = ContextService(cache_ttl_seconds=60)
+        cached = service.get_context("NBA")
+        assert asyncio.run(service.get_context_async("NBA")) is cached
+
+    def test_async_unknown_sport(self):
+        """Unknown sport returns empty snapshot."""
+        snapshot = asyncio.run(ContextService().get_context_async("CRICKET"))
+        assert snapshot.player_count == 0
+
+    def test_get_context_async_function(self):
+        """Module-level convenience function works."""
+        snapshot = asyncio.run(get_context_async("NBA"))
+        assert snapshot.sport == "NBA"
+
+
+class TestRevalidation:
+    """Stale-while-revalidate, refresh-ahead and single-flight fetches."""
+
+    def test_concurrent_misses_share_one_fetch(self):
+        """Callers that miss together wait on a single provider fetch."""
+        service, provider = gated_service()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(service.get_context("NBA")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        provider.started.wait(timeout=5)
+        provider.release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert provider.calls == 1
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+
+    def test_expired_entry_served_while_refreshing(self):
+        """An expired snapshot is returned at once; one refresh runs behind it."""
+        service, provider = gated_service(cache_ttl_seconds=60)
+        provider.release.set()
+        stale = service.get_context("NBA")
+        provider.release.clear()
+        provider.started.clear()
+        age_entry(service, "NBA", 61)
+
+        assert service.get_context("NBA") is stale
+        assert service.get_context("NBA") is stale
+        assert provider.started.wait(timeout=5)
+        assert service.get_cache_status()["NBA"]["is_refreshing"]
+
+        provider.release.set()
+        for _ in range(100):
+            if not service.get_cache_status()["NBA"]["is_refreshing"]:
+                break
+            time.sleep(0.01)
+        assert provider.calls == 2
+        assert service.get_context("NBA") is not stale
+
+    def test_refresh_starts_before_expiry(self):
+        """Past the refresh-ahead point a fresh entry triggers a refresh."""
+        service, provider = gated_service(cache_ttl_seconds=100, refresh_ahead_ratio=0.5)
+        provider.release.set()
+        service.get_context("NBA")
+        provider.started.clear()
+        age_entry(service, "NBA", 60)
+
+        service.get_context("NBA")
+        assert provider.started.wait(timeout=5)
+        assert not service._cache["NBA"].is_expired()
+
+    def test_entry_past_stale_ttl_is_a_miss(self):
+        """Beyond the stale window the caller fetches inline."""
+        service, provider = gated_service(cache_ttl_seconds=60, stale_ttl_seconds=60)
+        provider.release.set()
+        first = service.get_context("NBA")
+        age_entry(service, "NBA", 121)
+
+        assert service.get_context("NBA") is not first
+        assert provider.calls == 2
+
+    def test_fallback_refresh_keeps_real_snapshot(self):
+        """An outage during revalidation keeps serving the real stale data."""
+        provider = StaticProvider(source="espn-injuries", players=[("Player One", PlayerStatus.OUT)])
+        service = empty_service(provider, cache_ttl_seconds=60, fallback_retry_seconds=30)
+        real = service.get_context("NBA")
+        age_entry(service, "NBA", 61)
+        provider._source = "espn+sample-fallback"
+
+        assert service.get_context("NBA") is real
+        for _ in range(100):
+            if not service.get_cache_status()["NBA"]["is_refreshing"]:
+                break
+            time.sleep(0.01)
+
+        assert provider.calls == 2
+        assert service.get_context("NBA") is real
+        entry = service._cache["NBA"]
+        assert not entry.needs_refresh()
+        assert entry.refresh_at > datetime.utcnow() + timedelta(seconds=20)
+
+    def test_async_misses_share_one_fetch(self):
+        """Concurrent async misses share one provider fetch."""
+        service, provider = gated_service()
+        provider.release.set()
+
+        async def fetch_all():
+            return await asyncio.gather(*(service.get_context_async("NBA") for _ in range(5)))
+
+        results = asyncio.run(fetch_all())
+        assert provider.calls == 1
+        assert all(result is results[0] for result in results)
+
+
+class TestWarmRestart:
+    """Snapshots persisted by one service are served by the next."""
+
+    def test_fetched_snapshot_is_persisted(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        service, provider = gated_service(snapshot_store=store)
+        provider.release.set()
+
+        snapshot = service.get_context("NBA")
+
+        assert store.load("NBA") == snapshot
+
+    def test_restart_serves_persisted_snapshot_while_refreshing(self, tmp_path):
+        """After a restart the persisted snapshot is served at once, then refreshed."""
+        store = SnapshotStore(tmp_path)
+        persisted = ContextSnapshot(
+            sport="NBA", as_of=datetime.utcnow() - timedelta(minutes=30), source="gated"
+        )
+        store.save(persisted)
+        service, provider = gated_service(snapshot_store=store)
+
+        assert service.get_context("NBA") == persisted
+        assert provider.started.wait(timeout=5)
+        assert service.get_cache_status()["NBA"]["is_expired"]
+
+        provider.release.set()
+        for _ in range(100):
+            if not service.get_cache_status()["NBA"]["is_refreshing"]:
+                break
+            time.sleep(0.01)
+        assert provider.calls == 1
+        assert service.get_context("NBA").as_of > persisted.as_of
+        assert store.load("NBA").as_of > persisted.as_of
+
+    def test_snapshot_past_stale_ttl_is_not_restored(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        store.save(ContextSnapshot(
+            sport="NBA", as_of=datetime.utcnow() - timedelta(hours=2), source="gated"
+        ))
+        service, provider = gated_service(
+            snapshot_store=store, cache_ttl_seconds=60, stale_ttl_seconds=60
+        )
+        provider.release.set()
+
+        snapshot = service.get_context("NBA")
+
+        assert provider.calls == 1
+        assert snapshot.as_of > datetime.utcnow() - timedelta(minutes=1)
+
+    def test_store_read_once_per_sport(self, tmp_path):
+        """After a miss or a live fetch the disk is not consulted again."""
+        store = SnapshotStore(tmp_path)
+        service, provider = gated_service(snapshot_store=store)
+        provider.release.set()
+        service.get_context("NBA")
+        service.clear_cache()
+        store.save(ContextSnapshot(sport="NBA", as_of=datetime(2020, 1, 1), source="gated"))
+
+        assert service.get_context("NBA").as_of.year != 2020
+        assert provider.calls == 2
+
+
+class TestProviderRegistry:
+    """Providers keyed by sport, with priority, failover and merge."""
+
+    def test_default_sports(self):
+        service = ContextService()
+        assert service.has_provider("nba")
+        assert service.has_provider("NFL")
+        assert not service.has_provider("CRICKET")
+
+    def test_highest_priority_wins(self):
+        low = StaticProvider(source="low")
+        high = StaticProvider(source="high")
+        service = empty_service()
+        service.register_provider(low, priority=1)
+        service.register_provider(high, priority=5)
+
+        assert service.get_context("NBA").source == "high"
+        assert low.calls == 0
+
+    def test_failover_to_next_provider(self):
+        broken = StaticProvider(source="broken", fails=True)
+        backup = StaticProvider(source="backup")
+        service = empty_service()
+        service.register_provider(broken, priority=2)
+        service.register_provider(backup, priority=1)
+
+        assert service.get_context("NBA").source == "backup"
+        assert broken.calls == 1
+
+    def test_merge_provider_adds_missing_players(self):
+        primary = StaticProvider(source="primary", players=[("A", PlayerStatus.OUT)])
+        extra = StaticProvider(
+            source="extra", players=[("A", PlayerStatus.AVAILABLE), ("B", PlayerStatus.DOUBTFUL)]
+        )
+        service = empty_service()
+        service.register_provider(primary, priority=1)
+        service.register_provider(extra, merge=True)
+
+        snapshot = service.get_context("NBA")
+        async_snapshot = asyncio.run(service.get_context_async("NBA", force_refresh=True))
+
+        for result in (snapshot, async_snapshot):
+            assert result.source == "primary+extra"
+            assert result.get_player("a").status == PlayerStatus.OUT
+            assert result.get_player("b").status == PlayerStatus.DOUBTFUL
+
+    def test_reregistering_source_replaces_it(self):
+        service = empty_service(StaticProvider(source="same", players=[("A", PlayerStatus.OUT)]))
+        service.register_provider(StaticProvider(source="same"))
+
+        assert len(service._providers["NBA"]) == 1
+        assert service.get_context("NBA").player_count == 0
+
+    def test_all_providers_fail(self):
+        service = empty_service(StaticProvider(source="broken", fails=True))
+
+        snapshot = service.get_context("NBA")
+
+        assert snapshot.source == "broken"
+        assert snapshot.player_count == 0
+        assert "NBA" not in service.get_cache_status()
+
+
+class TestGetContextMany:
+    """Concurrent multi-sport fetches."""
+
+    def test_returns_each_sport(self):
+        service = empty_service(
+            StaticProvider(sport="NBA", source="nba"),
+            StaticProvider(sport="NFL", source="nfl"),
+        )
+
+        snapshots = service.get_context_many(["nfl", "NBA", "NFL", "CRICKET"])
+
+        assert list(snapshots) == ["NFL", "NBA", "CRICKET"]
+        assert snapshots["NBA"].source == "nba"
+        assert snapshots["NFL"].source == "nfl"
+        assert snapshots["CRICKET"].source == "no-provider"
+
+    def test_sports_fetched_concurrently(self):
+        """A mixed slip waits for the slowest provider, not the sum."""
+        service = empty_service(
+            StaticProvider(sport="NBA", delay=0.3),
+            StaticProvider(sport="NFL", delay=0.3),
+            StaticProvider(sport="MLB", delay=0.3),
+        )
+
+        start = time.perf_counter()
+        service.get_context_many(["NBA", "NFL", "MLB"])
+        sync_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        asyncio.run(service.get_context_many_async(["NBA", "NFL", "MLB"], force_refresh=True))
+        async_elapsed = time.perf_counter() - start
+
+        assert sync_elapsed < 0.6
+        assert async_elapsed < 0.6
+
+    def test_cache_hits_not_refetched(self):
+        nba = StaticProvider(sport="NBA")
+        nfl = StaticProvider(sport="NFL")
+        service = empty_service(nba, nfl)
+        first = service.get_context("NBA")
+
+        snapshots = service.get_context_many(["NBA", "NFL"])
+
+        assert snapshots["NBA"] is first
+        assert (nba.calls, nfl.calls) == (1, 1)
@@ -9,6 +9,7 @@ from context.snapshot import (
     PlayerAvailability,
     PlayerStatus,
     empty_snapshot,
+    merge_snapshots,
 )
 
 
@@ -211,6 +212,54 @@ class TestContextSnapshot:
         assert snapshot_missing.has_missing_data
 
 
+
+class TestSnapshotIndexes:
+    """Lookups are served from indexes built with the snapshot."""
+
+    def _snapshot(self, players):
+        return ContextSnapshot(
+            sport="NBA",
+            as_of=datetime(2024, 1, 15, 12, 0),
+            source="test",
+            players=players,
+        )
+
+    def test_duplicate_name_returns_first(self):
+        """First record wins when a name appears twice."""
+        first = PlayerAvailability("p1", "Player 1", "LAL", PlayerStatus.OUT)
+        second = PlayerAvailability("p1b", "PLAYER 1", "BOS", PlayerStatus.AVAILABLE)
+        snapshot = self._snapshot((first, second))
+        assert snapshot.get_player("player 1") is first
+
+    def test_team_lookup_case_insensitive_and_ordered(self):
+        """Team lookup ignores case and keeps snapshot order."""
+        players = (
+            PlayerAvailability("p1", "Player 1", "lal", PlayerStatus.AVAILABLE),
+            PlayerAvailability("p2", "Player 2", "BOS", PlayerStatus.OUT),
+            PlayerAvailability("p3", "Player 3", "LAL", PlayerStatus.OUT),
+        )
+        snapshot = self._snapshot(players)
+        assert snapshot.get_team_players("Lal") == (players[0], players[2])
+        assert snapshot.get_team_players("NYK") == ()
+
+    def test_unavailable_keeps_snapshot_order(self):
+        """OUT and DOUBTFUL players come back in snapshot order."""
+        players = (
+            PlayerAvailability("p1", "Player 1", "LAL", PlayerStatus.DOUBTFUL),
+            PlayerAvailability("p2", "Player 2", "BOS", PlayerStatus.AVAILABLE),
+            PlayerAvailability("p3", "Player 3", "LAL", PlayerStatus.OUT),
+        )
+        snapshot = self._snapshot(players)
+        assert snapshot.get_unavailable_players() == (players[0], players[2])
+
+    def test_indexes_not_part_of_equality_or_repr(self):
+        """Snapshots with the same data are equal; indexes stay out of repr."""
+        players = (PlayerAvailability("p1", "Player 1", "LAL", PlayerStatus.OUT),)
+        snapshot = self._snapshot(players)
+        assert snapshot == self._snapshot(players)
+        assert hash(snapshot) == hash(self._snapshot(players))
+        assert "_by_name" not in repr(snapshot)
+
 class TestEmptySnapshot:
     """Test empty_snapshot factory function."""
 
@@ -226,3 +275,44 @@ class TestEmptySnapshot:
         """Can specify custom sport."""
         snapshot = empty_snapshot(sport="NFL")
         assert snapshot.sport == "NFL"
+
+
+class TestMergeSnapshots:
+    """Test merge_snapshots across providers of one sport."""
+
+    def _snapshot(self, source, as_of, players, missing=(), hint=0.0):
+        return ContextSnapshot(
+            sport="NBA",
+            as_of=as_of,
+            source=source,
+            players=players,
+            missing_data=missing,
+            confidence_hint=hint,
+        )
+
+    def test_single_snapshot_returned_as_is(self):
+        snapshot = self._snapshot("a", datetime(2026, 1, 1), ())
+        assert merge_snapshots([snapshot]) is snapshot
+
+    def test_higher_priority_player_wins(self):
+        primary = self._snapshot(
+            "primary", datetime(2026, 1, 1, 12), (
+                PlayerAvailability("p1", "Player 1", "LAL", PlayerStatus.OUT),
+            ), missing=("ESPN API unavailable",), hint=0.3,
+        )
+        extra = self._snapshot(
+            "extra", datetime(2026, 1, 1, 10), (
+                PlayerAvailability("p1", "player 1", "LAL", PlayerStatus.AVAILABLE),
+                PlayerAvailability("p2", "Player 2", "BOS", PlayerStatus.DOUBTFUL),
+            ), missing=("ESPN API unavailable", "Partial report"),
+        )
+
+        merged = merge_snapshots([primary, extra])
+
+        assert merged.source == "primary+extra"
+        assert merged.as_of == datetime(2026, 1, 1, 10)
+        assert merged.get_player("Player 1").status == PlayerStatus.OUT
+        assert merged.get_player("Player 2").status == PlayerStatus.DOUBTFUL
+        assert merged.player_count == 2
+        assert merged.missing_data == ("ESPN API unavailable", "Partial report")
+        assert merged.confidence_hint == 0.3
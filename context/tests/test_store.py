@@ -0,0 +1,103 @@
+"""Tests for the on-disk context snapshot store."""
+
+from datetime import datetime
+
+import pytest
+
+from context.snapshot import ContextSnapshot, PlayerAvailability, PlayerStatus
+from context.store import SnapshotStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(tmp_path)
+
+
+def make_snapshot(source: str = "nba-official") -> ContextSnapshot:
+    return ContextSnapshot(
+        sport="NBA",
+        as_of=datetime(2026, 1, 15, 18, 30),
+        source=source,
+        players=(
+            PlayerAvailability(
+                player_id="lebron-james",
+                player_name="LeBron James",
+                team="LAL",
+                status=PlayerStatus.QUESTIONABLE,
+                reason="Ankle",
+                updated_at=datetime(2026, 1, 15, 17, 0),
+            ),
+            PlayerAvailability(
+                player_id="jayson-tatum",
+                player_name="Jayson Tatum",
+                team="BOS",
+                status=PlayerStatus.AVAILABLE,
+            ),
+        ),
+        missing_data=("ESPN API unavailable",),
+        confidence_hint=-0.1,
+    )
+
+
+class TestSnapshotStore:
+    """Test SnapshotStore persistence."""
+
+    def test_round_trip(self, store):
+        """A saved snapshot loads back equal, including as_of."""
+        snapshot = make_snapshot()
+        assert store.save(snapshot) is True
+
+        loaded = store.load("nba")
+
+        assert loaded == snapshot
+        assert loaded.as_of == snapshot.as_of
+        assert loaded.get_player("lebron james").status == PlayerStatus.QUESTIONABLE
+
+    def test_one_line_per_player(self, store, tmp_path):
+        """File is a header line followed by one line per player."""
+        store.save(make_snapshot())
+
+        lines = (tmp_path / "NBA.jsonl").read_text().splitlines()
+        assert len(lines) == 3
+
+    def test_save_replaces_previous(self, store):
+        store.save(make_snapshot(source="espn-injuries"))
+        store.save(make_snapshot(source="nba-official"))
+
+        assert store.load("NBA").source == "nba-official"
+
+    def test_fallback_snapshots_not_persisted(self, store):
+        """Degraded fallbacks never replace the last real snapshot."""
+        store.save(make_snapshot())
+
+        assert store.save(make_snapshot(source="sample-fallback")) is False
+        assert store.save(make_snapshot(source="error-fallback")) is False
+        assert store.load("NBA").source == "nba-official"
+
+    def test_merged_fallback_not_persisted(self, store):
+        """A fallback merged with another source is still a fallback."""
+        store.save(make_snapshot())
+
+        assert store.save(make_snapshot(source="espn+sample-fallback")) is False
+        assert store.load("NBA").source == "nba-official"
+
+    def test_missing_file_returns_none(self, store):
+        assert store.load("NFL") is None
+
+    def test_corrupt_file_returns_none(self, store, tmp_path):
+        (tmp_path / "NBA.jsonl").write_text('{"format": 1, "sport": "NBA"}\nnot json\n')
+
+        assert store.load("NBA") is None
+
+    def test_unknown_format_returns_none(self, store, tmp_path):
+        store.save(make_snapshot())
+        path = tmp_path / "NBA.jsonl"
+        path.write_text(path.read_text().replace('"format":1', '"format":99', 1))
+
+        assert store.load("NBA") is None
+
+    def test_unwritable_directory_does_not_raise(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        assert SnapshotStore(blocker / "cache").save(make_snapshot()) is False
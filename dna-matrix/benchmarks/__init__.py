@@ -0,0 +1,12 @@
+# benchmarks/__init__.py
+"""
+Micro-benchmarks for the dna-matrix core engines.
+
+Run from the dna-matrix directory:
+
+    python -m benchmarks.bench_core                 # compare with baseline.json
+    python -m benchmarks.bench_core --update-baseline
+    python -m benchmarks.bench_core --filter compute_suggestions
+
+See bench_core.py for options. Not part of the installed core package.
+"""
@@ -0,0 +1,433 @@
+# benchmarks/bench_core.py
+"""
+Core engine micro-benchmarks with a JSON baseline.
+
+Each case builds its inputs once (untimed), then measures:
+- ops_per_sec: best of `repeats` timed runs, each at least `min_time` long
+- relative_speed: ops_per_sec over the calibration loop's (see below)
+- peak_alloc_bytes: tracemalloc peak above the starting point for one call
+
+Cases are parameterized by leg count (1-20), same-game density, candidate
+pool size (10-10,000) and signal count. Results are compared with
+baseline.json: a case regresses when its ops/sec drops, or its peak
+allocation grows, by more than the tolerance (default 0.25 = 25%, or
+BENCH_TOLERANCE). New cases without a baseline entry are reported, not
+failed.
+
+Speed is judged relative to a fixed pure-Python calibration loop timed
+alongside each case, so a slower or busier machine does not read as a
+regression. Regenerate the baseline with --update-baseline after
+intended changes. A case that looks slower is re-measured up to
+CONFIRM_RUNS times before it is reported.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from core.context_adapters import apply_context_signals
+from core.correlation_engine import compute_correlations
+from core.correlation_matrix import NUMPY_AVAILABLE
+from core.dna_enforcement import apply_dna_enforcement
+from core.evaluation import evaluate_parlay
+from core.models.leading_light import BetBlock, ParlayState
+from core.parlay_batch import ParlayBatch, evaluate_batch
+from core.parlay_reducer import add_block, build_parlay_state, remove_block
+from core.risk_inductor import resolve_inductor
+from core.sensitivity import compute_leave_one_out
+from core.sub_parlay_search import search_sub_parlays
+from core.suggestion_engine import compute_suggestions
+
+from benchmarks.workloads import make_blocks, make_candidates, make_dna_profile, make_signals
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+BASELINE_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_TIME = 0.05  # seconds per timed run
+DEFAULT_REPEATS = 5
+ALLOC_SLACK_BYTES = 1024  # absolute allowance so tiny allocations don't flap
+CONFIRM_RUNS = 2  # re-measurements of a flagged case before it counts
+
+LEG_COUNTS = (1, 5, 10, 20)
+SAME_GAME_DENSITIES = (0.0, 0.5, 1.0)
+CANDIDATE_POOLS = (10, 100, 1_000, 10_000)
+SIGNAL_COUNTS = (1, 10, 50)
+
+
+# =============================================================================
+# Cases
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """
+    One benchmark.
+
+    Attributes:
+        name: Stable identifier, e.g. "compute_correlations[legs=10,same_game=0.5]"
+        setup: Builds the inputs and returns the zero-argument operation to time
+    """
+    name: str
+    setup: Callable[[], Callable[[], object]]
+
+
+def _case(fn_name: str, params: dict, setup: Callable[[], Callable[[], object]]) -> BenchCase:
+    label = ",".join(f"{key}={value}" for key, value in params.items())
+    return BenchCase(name=f"{fn_name}[{label}]", setup=setup)
+
+
+def _state_cases(fn_name: str, op: Callable) -> Iterable[BenchCase]:
+    """Cases that run `op(parlay_state)` over the leg/density grid."""
+    for legs in LEG_COUNTS:
+        for density in SAME_GAME_DENSITIES:
+            def setup(legs=legs, density=density):
+                state = build_parlay_state(make_blocks(legs, density))
+                return lambda: op(state)
+            yield _case(fn_name, {"legs": legs, "same_game": density}, setup)
+
+
+def build_cases() -> list[BenchCase]:
+    """Every benchmark case, in a stable order."""
+    cases: list[BenchCase] = []
+
+    for legs in LEG_COUNTS:
+        for density in SAME_GAME_DENSITIES:
+            def setup(legs=legs, density=density):
+                blocks = make_blocks(legs, density)
+                return lambda: build_parlay_state(blocks)
+            cases.append(_case("build_parlay_state", {"legs": legs, "same_game": density}, setup))
+
+    for legs in LEG_COUNTS:
+        for density in SAME_GAME_DENSITIES:
+            def setup(legs=legs, density=density):
+                blocks = make_blocks(legs + 1, density)
+                state = build_parlay_state(blocks[:-1])
+                return lambda: add_block(state, blocks[-1])
+            cases.append(_case("add_block", {"legs": legs, "same_game": density}, setup))
+
+    for legs in LEG_COUNTS:
+        for density in SAME_GAME_DENSITIES:
+            def setup(legs=legs, density=density):
+                state = build_parlay_state(make_blocks(legs, density))
+                return lambda: remove_block(state, state.blocks[0].block_id)
+            cases.append(_case("remove_block", {"legs": legs, "same_game": density}, setup))
+
+    for legs in LEG_COUNTS:
+        for density in SAME_GAME_DENSITIES:
+            def setup(legs=legs, density=density):
+                blocks = make_blocks(legs, density)
+                return lambda: compute_correlations(blocks)
+            cases.append(_case("compute_correlations", {"legs": legs, "same_game": density}, setup))
+
+    for pool in CANDIDATE_POOLS:
+        def setup(pool=pool):
+            state = build_parlay_state(make_blocks(4, 0.5))
+            candidates = make_candidates(pool)
+            return lambda: compute_suggestions(state, candidates)
+        cases.append(_case("compute_suggestions", {"legs": 4, "candidates": pool}, setup))
+
+    for legs in (5, 20):
+        for count in SIGNAL_COUNTS:
+            def setup(legs=legs, count=count):
+                blocks = make_blocks(legs, 0.5)
+                signals, metadata = make_signals(count)
+                return lambda: apply_context_signals(blocks, signals, metadata)
+            cases.append(_case("apply_context_signals", {"legs": legs, "signals": count}, setup))
+    # Full injury report against a slate of candidate blocks
+    def setup():
+        blocks = make_blocks(1000, 0.5)
+        signals, metadata = make_signals(10_000)
+        return lambda: apply_context_signals(blocks, signals, metadata)
+    cases.append(_case("apply_context_signals", {"legs": 1000, "signals": 10_000}, setup))
+    # Signals without ID metadata match by type and target
+    def setup():
+        blocks = make_blocks(1000, 0.5)
+        signals, _ = make_signals(2_000)
+        return lambda: apply_context_signals(blocks, signals)
+    cases.append(_case("apply_context_signals", {"legs": 1000, "signals": 2_000, "metadata": False}, setup))
+
+    for legs in (10, 20):
+        for density in (0.0, 0.5):
+            def setup(legs=legs, density=density):
+                blocks = make_blocks(legs, density)
+                candidates = make_candidates(10)
+                return lambda: search_sub_parlays(blocks, candidates, max_fragility=80, time_budget_ms=10_000)
+            cases.append(_case("search_sub_parlays", {"legs": legs, "same_game": density, "candidates": 10}, setup))
+
+    profile = make_dna_profile()
+    cases.extend(_state_cases(
+        "apply_dna_enforcement", lambda state: apply_dna_enforcement(state, profile, 1000.0)
+    ))
+    cases.extend(_state_cases("resolve_inductor", resolve_inductor))
+    cases.extend(_state_cases("compute_leave_one_out", compute_leave_one_out))
+
+    for legs in LEG_COUNTS:
+        for density in SAME_GAME_DENSITIES:
+            def setup(legs=legs, density=density):
+                blocks = make_blocks(legs, density)
+                return lambda: evaluate_parlay(blocks)
+            cases.append(_case("evaluate_parlay", {"legs": legs, "same_game": density}, setup))
+    for pool in (10, 100):
+        def setup(pool=pool):
+            blocks = make_blocks(4, 0.5)
+            candidates = make_candidates(pool)
+            return lambda: evaluate_parlay(blocks, dna_profile=profile, bankroll=1000.0, candidates=candidates)
+        cases.append(_case("evaluate_parlay", {"legs": 4, "candidates": pool, "dna": True}, setup))
+
+    # Validated constructor vs the engine-internal trusted path
+    for model, make in (
+        (BetBlock, lambda: make_blocks(1, 0.0)[0]),
+        (ParlayState, lambda: build_parlay_state(make_blocks(10, 0.5))),
+    ):
+        for trusted in (False, True):
+            def setup(model=model, make=make, trusted=trusted):
+                instance = make()
+                kwargs = {f.name: getattr(instance, f.name) for f in fields(instance)}
+                construct = model._trusted if trusted else model
+                return lambda: construct(**kwargs)
+            cases.append(_case("construct", {"model": model.__name__, "trusted": trusted}, setup))
+
+    if NUMPY_AVAILABLE:
+        for count in (100, 10_000):
+            def setup(count=count):
+                batch = ParlayBatch.from_blocks(
+                    make_blocks(5, 0.5, seed=seed, prefix=f"p{seed}") for seed in range(count)
+                )
+                return lambda: evaluate_batch(batch)
+            cases.append(_case("evaluate_batch", {"parlays": count, "legs": 5}, setup))
+
+    return cases
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """
+    Measurement of one case.
+
+    relative_speed is ops_per_sec over the calibration loop's ops/sec timed
+    alongside it; it is what regressions are judged on.
+    """
+    name: str
+    ops_per_sec: float
+    relative_speed: float
+    peak_alloc_bytes: int
+    loops: int
+
+    def to_dict(self) -> dict:
+        """Convert to the baseline JSON entry."""
+        return {
+            "ops_per_sec": round(self.ops_per_sec, 2),
+            "relative_speed": round(self.relative_speed, 6),
+            "peak_alloc_bytes": self.peak_alloc_bytes,
+        }
+
+
+def _calibration_loop() -> int:
+    """Fixed interpreter-bound work used as the machine speed reference."""
+    table: dict[str, int] = {}
+    for i in range(2_000):
+        key = f"k{i % 97}"
+        table[key] = table.get(key, 0) + i
+    return max(table.values())
+
+
+def _timed(op: Callable[[], object], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        op()
+    return time.perf_counter() - start
+
+
+def _calibrate_loops(op: Callable[[], object], min_time: float) -> tuple[int, float]:
+    loops = 1
+    elapsed = _timed(op, loops)
+    while elapsed < min_time:
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9) * 1.1))
+        elapsed = _timed(op, loops)
+    return loops, elapsed
+
+
+def _peak_alloc(op: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        op()
+        return max(0, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+
+
+def measure(
+    case: BenchCase,
+    min_time: float = DEFAULT_MIN_TIME,
+    repeats: int = DEFAULT_REPEATS,
+) -> BenchResult:
+    """
+    Time and allocation-profile one case.
+
+    Each repeat times the case and then the calibration loop back to back,
+    so both see the same machine load; the best of each is kept.
+    """
+    op = case.setup()
+    op()  # warm caches and lazy imports
+
+    loops, best = _calibrate_loops(op, min_time)
+    ref_loops, ref_best = _calibrate_loops(_calibration_loop, min_time)
+    for _ in range(repeats - 1):
+        best = min(best, _timed(op, loops))
+        ref_best = min(ref_best, _timed(_calibration_loop, ref_loops))
+
+    ops_per_sec = loops / best
+    return BenchResult(
+        name=case.name,
+        ops_per_sec=ops_per_sec,
+        relative_speed=ops_per_sec / (ref_loops / ref_best),
+        peak_alloc_bytes=_peak_alloc(op),
+        loops=loops,
+    )
+
+
+# =============================================================================
+# Baseline
+# =============================================================================
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    """Baseline cases by name ({} when there is no baseline yet)."""
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f).get("cases", {})
+
+
+def write_baseline(results: Iterable[BenchResult], path: Path = BASELINE_PATH) -> None:
+    """Merge `results` into the baseline file (other cases are kept)."""
+    cases = load_baseline(path)
+    cases.update({result.name: result.to_dict() for result in results})
+    payload = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": dict(sorted(cases.items())),
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+        f.write("\n")
+
+
+def speed_change(result: BenchResult, expected: dict) -> float:
+    """Fractional change in calibrated speed versus a baseline entry."""
+    return result.relative_speed / expected["relative_speed"] - 1
+
+
+def confirm(
+    case: BenchCase,
+    result: BenchResult,
+    baseline: dict,
+    tolerance: float,
+    min_time: float = DEFAULT_MIN_TIME,
+    repeats: int = DEFAULT_REPEATS,
+) -> BenchResult:
+    """
+    Re-measure a case that looks slower than baseline, keeping its best run.
+
+    A busy neighbour can slow one measurement well past the tolerance; a
+    real regression stays slow on every re-run.
+    """
+    expected = baseline.get(case.name)
+    for _ in range(CONFIRM_RUNS):
+        if expected is None or speed_change(result, expected) >= -tolerance:
+            break
+        rerun = measure(case, min_time, repeats)
+        if rerun.relative_speed > result.relative_speed:
+            result = rerun
+    return result
+
+
+def find_regressions(
+    results: Iterable[BenchResult],
+    baseline: dict,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """Describe every case slower or allocating more than baseline allows."""
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.name)
+        if expected is None:
+            continue
+        change = speed_change(result, expected)
+        if change < -tolerance:
+            regressions.append(
+                f"{result.name}: {change:+.0%} calibrated speed vs baseline "
+                f"({result.ops_per_sec:,.0f} ops/s; -{tolerance:.0%} allowed)"
+            )
+        ceiling = expected["peak_alloc_bytes"] * (1 + tolerance) + ALLOC_SLACK_BYTES
+        if result.peak_alloc_bytes > ceiling:
+            regressions.append(
+                f"{result.name}: peak alloc {result.peak_alloc_bytes:,} B > "
+                f"{expected['peak_alloc_bytes']:,} B baseline (+{tolerance:.0%} allowed)"
+            )
+    return regressions
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this")
+    parser.add_argument(
+        "--tolerance", type=float,
+        default=float(os.environ.get("BENCH_TOLERANCE", DEFAULT_TOLERANCE)),
+        help="Allowed fractional regression (default 0.25 or BENCH_TOLERANCE)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Write results to the baseline")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    results = []
+    for case in build_cases():
+        if args.filter not in case.name:
+            continue
+        result = measure(case, min_time=args.min_time, repeats=args.repeats)
+        if not args.update_baseline:
+            result = confirm(case, result, baseline, args.tolerance, args.min_time, args.repeats)
+        results.append(result)
+        expected = baseline.get(case.name)
+        change = f"{speed_change(result, expected):+7.1%}" if expected else "    new"
+        print(f"{case.name:<60} {result.ops_per_sec:>14,.1f} ops/s {change} "
+              f"{result.peak_alloc_bytes:>12,} B")
+
+    if args.update_baseline:
+        write_baseline(results, args.baseline)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
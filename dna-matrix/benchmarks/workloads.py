@@ -0,0 +1,116 @@
+# benchmarks/workloads.py
+"""
+Deterministic benchmark inputs.
+
+Every generator takes explicit sizes and a seed, so the same case always
+measures the same work.
+"""
+from __future__ import annotations
+
+import random
+from typing import List
+from uuid import UUID
+
+from core.dna_enforcement import BehaviorProfile, DNAProfile, RiskProfile
+from core.models.leading_light import (
+    BetBlock,
+    BetType,
+    ContextImpact,
+    ContextModifier,
+    ContextModifiers,
+    ContextSignal,
+    ContextSignalType,
+    ContextTarget,
+)
+
+# Leg mix cycled through by make_blocks
+_BET_TYPES = (BetType.SPREAD, BetType.PLAYER_PROP, BetType.TOTAL, BetType.ML, BetType.PLAYER_PROP)
+_PROP_TAGS = (["qb_passing"], ["wr_receiving"], ["td_prop"], [])
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def zero_modifiers() -> ContextModifiers:
+    return ContextModifiers(
+        weather=ContextModifier(applied=False, delta=0.0),
+        injury=ContextModifier(applied=False, delta=0.0),
+        trade=ContextModifier(applied=False, delta=0.0),
+        role=ContextModifier(applied=False, delta=0.0),
+    )
+
+
+def make_blocks(legs: int, same_game: float = 0.0, seed: int = 0, prefix: str = "leg") -> List[BetBlock]:
+    """
+    Build `legs` blocks.
+
+    `same_game` is the fraction of legs placed in one shared game (so they
+    can correlate); the rest each get their own game.
+    """
+    rng = random.Random(seed)
+    shared = round(legs * same_game)
+    blocks = []
+    for i in range(legs):
+        bet_type = _BET_TYPES[i % len(_BET_TYPES)]
+        is_prop = bet_type == BetType.PLAYER_PROP
+        blocks.append(BetBlock.create(
+            block_id=_uuid(rng),
+            sport="NFL",
+            game_id="game-shared" if i < shared else f"{prefix}-game-{i}",
+            bet_type=bet_type,
+            selection=f"{prefix} selection {i}",
+            base_fragility=rng.uniform(5.0, 25.0),
+            context_modifiers=zero_modifiers(),
+            correlation_tags=list(_PROP_TAGS[i % len(_PROP_TAGS)]) if is_prop else [],
+            player_id=f"{prefix}-player-{i % 3}" if is_prop else None,
+            team_id=f"{prefix}-team-{i % 4}",
+        ))
+    return blocks
+
+
+def make_candidates(count: int, seed: int = 1) -> List[BetBlock]:
+    """Candidate pool; a quarter share the current parlay's game."""
+    return make_blocks(count, same_game=0.25, seed=seed, prefix="cand")
+
+
+def make_signals(count: int, seed: int = 2) -> tuple[list[ContextSignal], list[dict]]:
+    """Context signals plus ID metadata targeting make_blocks() players, teams and games."""
+    rng = random.Random(seed)
+    kinds = (ContextSignalType.INJURY, ContextSignalType.TRADE, ContextSignalType.WEATHER)
+    signals, metadata = [], []
+    for i in range(count):
+        kind = kinds[i % len(kinds)]
+        target = {
+            ContextSignalType.INJURY: ContextTarget.PLAYER,
+            ContextSignalType.TRADE: ContextTarget.TEAM,
+            ContextSignalType.WEATHER: ContextTarget.GAME,
+        }[kind]
+        signals.append(ContextSignal(
+            context_id=_uuid(rng),
+            type=kind,
+            target=target,
+            status="OUT" if kind == ContextSignalType.INJURY else "active",
+            confidence=0.9,
+            impact=ContextImpact(fragility_delta=rng.uniform(1.0, 8.0), confidence_delta=0.0),
+            explanation=f"signal {i}",
+        ))
+        metadata.append({
+            "player_id": f"leg-player-{i % 3}",
+            "to_team_id": f"leg-team-{i % 4}",
+            "game_id": "game-shared",
+        })
+    return signals, metadata
+
+
+def make_dna_profile() -> DNAProfile:
+    return DNAProfile(
+        risk=RiskProfile(
+            tolerance=50,
+            max_parlay_legs=6,
+            max_stake_pct=0.10,
+            avoid_live_bets=False,
+            avoid_props=False,
+        ),
+        behavior=BehaviorProfile(discipline=0.5),
+    )
@@ -371,6 +371,137 @@ def _signal_matches_block_by_id(
     return False
 
 
+@dataclass(frozen=True, slots=True)
+class _SignalEffect:
+    """
+    Summed impact of the signals matching a block.
+
+    Reasons are the matching explanations "; "-joined, in signal order.
+    """
+    weather_delta: float
+    injury_delta: float
+    trade_delta: float
+    weather_reason: str
+    injury_reason: str
+    trade_reason: str
+    role_delta: float
+
+
+class _SignalIndex:
+    """
+    Signals grouped by the block field they can match, built once per call.
+
+    Each block then looks up only its candidate signals instead of testing
+    every signal; matches are exactly those of _signal_matches_block_by_id,
+    in signal order. Signals without metadata match by (type, target) alone,
+    so they are grouped under that key and each block tests one signal per
+    group. Blocks with the same player, team, weather game and matching
+    groups match the same signals, so their effect is computed once.
+    """
+
+    def __init__(
+        self,
+        signals: Sequence[ContextSignal],
+        signal_metadata: Optional[Sequence[Dict[str, Any]]],
+    ) -> None:
+        self.signals = signals
+        self.weather_by_game: Dict[Any, List[int]] = {}
+        self.by_player: Dict[Any, List[int]] = {}
+        self.by_team: Dict[Any, List[int]] = {}
+        # Signals without metadata match by (type, target), not by ID
+        self.by_type_target: Dict[tuple, List[int]] = {}
+        self._effects: Dict[tuple, Optional[_SignalEffect]] = {}
+
+        for i, signal in enumerate(signals):
+            metadata = signal_metadata[i] if signal_metadata and i < len(signal_metadata) else None
+            if metadata is None:
+                self.by_type_target.setdefault((signal.type, signal.target), []).append(i)
+            elif signal.type == ContextSignalType.WEATHER:
+                game_id = metadata.get("game_id")
+                if game_id:
+                    self.weather_by_game.setdefault(game_id, []).append(i)
+            elif signal.type == ContextSignalType.INJURY:
+                player_id = metadata.get("player_id")
+                if player_id:
+                    self.by_player.setdefault(player_id, []).append(i)
+            elif signal.type == ContextSignalType.TRADE:
+                player_id = metadata.get("player_id")
+                team_id = metadata.get("to_team_id") or metadata.get("from_team_id")
+                if player_id:
+                    self.by_player.setdefault(player_id, []).append(i)
+                if team_id:
+                    self.by_team.setdefault(team_id, []).append(i)
+
+    def _key(self, block: BetBlock) -> tuple:
+        """What determines the signals matching `block` (IDs that hit an index)."""
+        return (
+            block.player_id if block.player_id in self.by_player else None,
+            block.team_id if block.team_id in self.by_team else None,
+            block.game_id
+            if block.game_id in self.weather_by_game and _is_weather_affected_block(block)
+            else None,
+            tuple(
+                type_target
+                for type_target, indices in self.by_type_target.items()
+                if _signal_matches_block(self.signals[indices[0]], block)
+            ),
+        )
+
+    def _matching_key(self, key: tuple) -> List[ContextSignal]:
+        player_id, team_id, game_id, type_targets = key
+        candidates: set = set()
+        for type_target in type_targets:
+            candidates.update(self.by_type_target[type_target])
+        candidates.update(self.by_player.get(player_id, ()))
+        candidates.update(self.by_team.get(team_id, ()))
+        candidates.update(self.weather_by_game.get(game_id, ()))
+        return [self.signals[i] for i in sorted(candidates)]
+
+    def matching(self, block: BetBlock) -> List[ContextSignal]:
+        """Signals that apply to `block`, in signal order."""
+        return self._matching_key(self._key(block))
+
+    def effect(self, block: BetBlock) -> Optional[_SignalEffect]:
+        """Summed impact of the signals matching `block` (None if none match)."""
+        key = self._key(block)
+        if key not in self._effects:
+            matching = self._matching_key(key)
+            self._effects[key] = _signal_effect(matching) if matching else None
+        return self._effects[key]
+
+
+def _signal_effect(signals: Sequence[ContextSignal]) -> _SignalEffect:
+    """Sum the deltas and collect the explanations of matching signals."""
+    weather_delta = 0.0
+    injury_delta = 0.0
+    trade_delta = 0.0
+    weather_reasons: List[str] = []
+    injury_reasons: List[str] = []
+    trade_reasons: List[str] = []
+
+    for signal in signals:
+        if signal.type == ContextSignalType.WEATHER:
+            weather_delta += signal.impact.fragility_delta
+            weather_reasons.append(signal.explanation)
+        elif signal.type == ContextSignalType.INJURY:
+            injury_delta += signal.impact.fragility_delta
+            injury_reasons.append(signal.explanation)
+        elif signal.type == ContextSignalType.TRADE:
+            trade_delta += signal.impact.fragility_delta
+            trade_reasons.append(signal.explanation)
+
+    return _SignalEffect(
+        weather_delta=weather_delta,
+        injury_delta=injury_delta,
+        trade_delta=trade_delta,
+        weather_reason="; ".join(filter(None, weather_reasons)),
+        injury_reason="; ".join(filter(None, injury_reasons)),
+        trade_reason="; ".join(filter(None, trade_reasons)),
+        # Role delta from injury + trade signals
+        role_delta=_compute_role_delta(signals),
+    )
+
+
 # =============================================================================
 # Role Derivation
 # =============================================================================
@@ -404,6 +535,11 @@ def _compute_role_delta(signals: Sequence[ContextSignal]) -> float:
 # =============================================================================
 
 
+def _merge_reasons(reason: Optional[str], added: str) -> Optional[str]:
+    """Existing reason plus new explanations, "; "-joined (None if empty)."""
+    return "; ".join(filter(None, [reason, added])) or None
+
+
 def apply_context_signals(
     blocks: Sequence[BetBlock],
     signals: Sequence[ContextSignal],
@@ -418,6 +554,9 @@ def apply_context_signals(
     - Derives role modifier from injury + trade signals
     - Returns new blocks (immutable)
 
+    Signals are indexed by player, team and game once per call, so each
+    block only checks the signals that can match it.
+
     Args:
         blocks: Sequence of BetBlock objects
         signals: Sequence of ContextSignal objects to apply
@@ -429,71 +568,52 @@ def apply_context_signals(
     if not signals:
         return tuple(blocks)
 
+    index = _SignalIndex(signals, signal_metadata)
     result_blocks: List[BetBlock] = []
 
     for block in blocks:
-        # Find signals that match this block
-        matching_signals: List[ContextSignal] = []
-
-        for i, signal in enumerate(signals):
-            metadata = signal_metadata[i] if signal_metadata and i < len(signal_metadata) else None
-            if _signal_matches_block_by_id(signal, block, metadata):
-                matching_signals.append(signal)
+        # Summed impact of the signals that match this block
+        effect = index.effect(block)
 
-        if not matching_signals:
+        if effect is None:
             result_blocks.append(block)
             continue
 
-        # Compute deltas from matching signals
-        weather_delta = 0.0
-        injury_delta = 0.0
-        trade_delta = 0.0
-        weather_reasons: List[str] = []
-        injury_reasons: List[str] = []
-        trade_reasons: List[str] = []
-
-        for signal in matching_signals:
-            if signal.type == ContextSignalType.WEATHER:
-                weather_delta += signal.impact.fragility_delta
-                weather_reasons.append(signal.explanation)
-            elif signal.type == ContextSignalType.INJURY:
-                injury_delta += signal.impact.fragility_delta
-                injury_reasons.append(signal.explanation)
-            elif signal.type == ContextSignalType.TRADE:
-                trade_delta += signal.impact.fragility_delta
-                trade_reasons.append(signal.explanation)
-
-        # Compute role delta from injury + trade signals
-        role_delta = _compute_role_delta(matching_signals)
+        weather_delta = effect.weather_delta
+        injury_delta = effect.injury_delta
+        trade_delta = effect.trade_delta
+        role_delta = effect.role_delta
 
         # Build new context modifiers (merge with existing)
+        # Trusted construction: every input is a validated core object and
+        # signal deltas are >= 0, so the invariants hold by construction
         old_mods = block.context_modifiers
 
-        new_weather = ContextModifier(
+        new_weather = ContextModifier._trusted(
             applied=old_mods.weather.applied or weather_delta > 0,
             delta=old_mods.weather.delta + weather_delta,
-            reason="; ".join(filter(None, [old_mods.weather.reason] + weather_reasons)) or None,
+            reason=_merge_reasons(old_mods.weather.reason, effect.weather_reason),
         )
 
-        new_injury = ContextModifier(
+        new_injury = ContextModifier._trusted(
             applied=old_mods.injury.applied or injury_delta > 0,
             delta=old_mods.injury.delta + injury_delta,
-            reason="; ".join(filter(None, [old_mods.injury.reason] + injury_reasons)) or None,
+            reason=_merge_reasons(old_mods.injury.reason, effect.injury_reason),
         )
 
-        new_trade = ContextModifier(
+        new_trade = ContextModifier._trusted(
             applied=old_mods.trade.applied or trade_delta > 0,
             delta=old_mods.trade.delta + trade_delta,
-            reason="; ".join(filter(None, [old_mods.trade.reason] + trade_reasons)) or None,
+            reason=_merge_reasons(old_mods.trade.reason, effect.trade_reason),
         )
 
-        new_role = ContextModifier(
+        new_role = ContextModifier._trusted(
             applied=old_mods.role.applied or role_delta > 0,
             delta=min(old_mods.role.delta + role_delta, ROLE_DELTA_CAP),
             reason="Role instability from injury/trade" if role_delta > 0 else old_mods.role.reason,
         )
 
-        new_modifiers = ContextModifiers(
+        new_modifiers = ContextModifiers._trusted(
             weather=new_weather,
             injury=new_injury,
             trade=new_trade,
@@ -504,7 +624,7 @@ def apply_context_signals(
         new_effective = block.base_fragility + new_modifiers.total_delta()
 
         # Create new block with updated modifiers
-        new_block = BetBlock(
+        new_block = BetBlock._trusted(
             block_id=block.block_id,
             sport=block.sport,
             game_id=block.game_id,
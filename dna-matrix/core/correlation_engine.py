@@ -24,11 +24,16 @@ Rules:
 - Penalties apply per pair
 - If multiple types match same pair, apply highest penalty only
 - Deterministic, no randomness
+
+The correlation types are data (CORRELATION_RULES). compile_rules turns the
+table into an index keyed by the pair's bet types, so each pair is only
+tested against the rules that can match it. Add a type (including
+sport-specific ones via CorrelationRule.sports) by adding a table row.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Sequence, Tuple
+from typing import Dict, FrozenSet, List, Sequence, Tuple
 from uuid import UUID
 
 from core.models.leading_light import BetBlock, BetType, Correlation
@@ -53,6 +58,264 @@ TYPE_TD_DEPENDENCY = "td_dependency"
 TYPE_PACE_DEPENDENCY = "pace_dependency"
 
 
+# =============================================================================
+# Rule Table
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class LegPattern:
+    """
+    One side of a correlation rule.
+
+    A leg matches when its bet type is in bet_types (None = any) and it
+    carries at least one of tags (None = no tag needed).
+    """
+    bet_types: FrozenSet[BetType] | None = None
+    tags: FrozenSet[str] | None = None
+
+    def matches(self, block: BetBlock) -> bool:
+        if self.bet_types is not None and block.bet_type not in self.bet_types:
+            return False
+        if self.tags is not None and self.tags.isdisjoint(block.correlation_tags):
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class CorrelationRule:
+    """
+    A correlation type as data.
+
+    A pair matches when every requirement holds:
+    - sports: both legs are one of these sports (None = any sport)
+    - same_game: both legs share a gameId
+    - same_player: both legs share a non-None playerId
+    and then either leg carries override_tag, or one leg matches side_a
+    and the other side_b (in either order).
+    """
+    type: str
+    penalty: int
+    side_a: LegPattern
+    side_b: LegPattern
+    same_game: bool = True
+    same_player: bool = False
+    override_tag: str | None = None
+    sports: FrozenSet[str] | None = None
+
+    def matches(self, block_a: BetBlock, block_b: BetBlock) -> bool:
+        """Reference (uncompiled) evaluation of this rule for one pair."""
+        if self.sports is not None and (
+            block_a.sport not in self.sports or block_b.sport not in self.sports
+        ):
+            return False
+        if self.same_game and block_a.game_id != block_b.game_id:
+            return False
+        if self.same_player and (
+            block_a.player_id is None or block_a.player_id != block_b.player_id
+        ):
+            return False
+        if self.override_tag is not None and (
+            self.override_tag in block_a.correlation_tags
+            or self.override_tag in block_b.correlation_tags
+        ):
+            return True
+        return (
+            (self.side_a.matches(block_a) and self.side_b.matches(block_b))
+            or (self.side_a.matches(block_b) and self.side_b.matches(block_a))
+        )
+
+
+GAME_SCRIPT_TYPES = frozenset({BetType.ML, BetType.SPREAD})
+TOTAL_TYPES = frozenset({BetType.TOTAL, BetType.TEAM_TOTAL})
+RECEIVING_TAGS = frozenset({"wr_receiving", "te_receiving"})
+VOLUME_TAGS = frozenset({
+    "passing_volume", "receiving_volume", "qb_passing", "wr_receiving", "te_receiving",
+})
+
+# Detection order; on equal penalties the earlier rule wins
+CORRELATION_RULES: Tuple[CorrelationRule, ...] = (
+    # Same player, both player props (any game)
+    CorrelationRule(
+        type=TYPE_SAME_PLAYER_MULTI_PROPS,
+        penalty=PENALTY_SAME_PLAYER_MULTI_PROPS,
+        side_a=LegPattern(bet_types=frozenset({BetType.PLAYER_PROP})),
+        side_b=LegPattern(bet_types=frozenset({BetType.PLAYER_PROP})),
+        same_game=False,
+        same_player=True,
+    ),
+    # ml/spread + total/team_total
+    CorrelationRule(
+        type=TYPE_SCRIPT_DEPENDENCY,
+        penalty=PENALTY_SCRIPT_DEPENDENCY,
+        side_a=LegPattern(bet_types=GAME_SCRIPT_TYPES),
+        side_b=LegPattern(bet_types=TOTAL_TYPES),
+        override_tag="script_dependency",
+    ),
+    # QB passing prop + WR/TE receiving prop
+    CorrelationRule(
+        type=TYPE_VOLUME_DEPENDENCY,
+        penalty=PENALTY_VOLUME_DEPENDENCY,
+        side_a=LegPattern(tags=frozenset({"qb_passing"})),
+        side_b=LegPattern(tags=RECEIVING_TAGS),
+        override_tag="volume_dependency",
+    ),
+    # Player TD prop + team spread/ml
+    CorrelationRule(
+        type=TYPE_TD_DEPENDENCY,
+        penalty=PENALTY_TD_DEPENDENCY,
+        side_a=LegPattern(tags=frozenset({"td_prop"})),
+        side_b=LegPattern(bet_types=GAME_SCRIPT_TYPES),
+        override_tag="td_dependency",
+    ),
+    # Game total + passing/receiving volume prop
+    CorrelationRule(
+        type=TYPE_PACE_DEPENDENCY,
+        penalty=PENALTY_PACE_DEPENDENCY,
+        side_a=LegPattern(bet_types=frozenset({BetType.TOTAL})),
+        side_b=LegPattern(tags=VOLUME_TAGS),
+        override_tag="pace_dependency",
+    ),
+)
+
+_RULES_BY_TYPE = {rule.type: rule for rule in CORRELATION_RULES}
+
+
+# =============================================================================
+# Rule Compiler
+# =============================================================================
+
+
+# Tag bitmasks are stored in int64 arrays by the vectorized engine
+MAX_RULE_TAGS = 62
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """
+    A rule specialised to one (bet_type_a, bet_type_b) pair.
+
+    orientations holds the (tag bits for leg a, tag bits for leg b) that
+    remain to be checked for each side assignment the bet types allow;
+    0 means no tag is needed. prefilter is the union of every bit that
+    could make the rule match (0 = none needed).
+    """
+    index: int
+    rule: CorrelationRule
+    override_bit: int
+    orientations: Tuple[Tuple[int, int], ...]
+    prefilter: int
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """
+    Dispatch index built from a rule table.
+
+    by_bet_types maps (bet_type_a, bet_type_b) to the rules that can match
+    such a pair, highest penalty first (table order on ties), so the first
+    rule that matches is the pair's correlation.
+    """
+    rules: Tuple[CorrelationRule, ...]
+    tag_bits: Dict[str, int]
+    by_bet_types: Dict[Tuple[BetType, BetType], Tuple[CompiledRule, ...]]
+
+    def tag_mask(self, tags: Tuple[str, ...]) -> int:
+        mask = 0
+        for tag in tags:
+            mask |= self.tag_bits.get(tag, 0)
+        return mask
+
+
+def compile_rules(rules: Sequence[CorrelationRule]) -> CompiledRules:
+    """
+    Compile a rule table into a dispatch index.
+
+    Raises:
+        ValueError: If the rules reference more than MAX_RULE_TAGS tags
+    """
+    tags = []
+    for rule in rules:
+        for tag in (
+            [rule.override_tag]
+            + sorted(rule.side_a.tags or ())
+            + sorted(rule.side_b.tags or ())
+        ):
+            if tag is not None and tag not in tags:
+                tags.append(tag)
+    if len(tags) > MAX_RULE_TAGS:
+        raise ValueError(f"correlation rules use {len(tags)} tags, max {MAX_RULE_TAGS}")
+    tag_bits = {tag: 1 << i for i, tag in enumerate(tags)}
+
+    def bits(pattern: LegPattern) -> int:
+        return sum(tag_bits[tag] for tag in pattern.tags or ())
+
+    def type_ok(pattern: LegPattern, bet_type: BetType) -> bool:
+        return pattern.bet_types is None or bet_type in pattern.bet_types
+
+    precedence = sorted(range(len(rules)), key=lambda i: -rules[i].penalty)
+    by_bet_types: Dict[Tuple[BetType, BetType], Tuple[CompiledRule, ...]] = {}
+    for type_a in BetType:
+        for type_b in BetType:
+            entries = []
+            for i in precedence:
+                rule = rules[i]
+                orientations = []
+                if type_ok(rule.side_a, type_a) and type_ok(rule.side_b, type_b):
+                    orientations.append((bits(rule.side_a), bits(rule.side_b)))
+                if type_ok(rule.side_b, type_a) and type_ok(rule.side_a, type_b):
+                    orientations.append((bits(rule.side_b), bits(rule.side_a)))
+                override_bit = tag_bits[rule.override_tag] if rule.override_tag else 0
+                if not orientations and not override_bit:
+                    continue
+                if any(a == 0 and b == 0 for a, b in orientations):
+                    prefilter = 0
+                else:
+                    prefilter = override_bit
+                    for a, b in orientations:
+                        prefilter |= a | b
+                entries.append(CompiledRule(
+                    index=i,
+                    rule=rule,
+                    override_bit=override_bit,
+                    orientations=tuple(orientations),
+                    prefilter=prefilter,
+                ))
+            by_bet_types[(type_a, type_b)] = tuple(entries)
+
+    return CompiledRules(rules=tuple(rules), tag_bits=tag_bits, by_bet_types=by_bet_types)
+
+
+COMPILED_RULES = compile_rules(CORRELATION_RULES)
+
+
+def _compiled_matches(
+    compiled: CompiledRule,
+    block_a: BetBlock,
+    mask_a: int,
+    block_b: BetBlock,
+    mask_b: int,
+) -> bool:
+    """CorrelationRule.matches for a pair already dispatched by bet types."""
+    if compiled.prefilter and not compiled.prefilter & (mask_a | mask_b):
+        return False
+    rule = compiled.rule
+    if rule.same_game and block_a.game_id != block_b.game_id:
+        return False
+    if rule.same_player and (block_a.player_id is None or block_a.player_id != block_b.player_id):
+        return False
+    if rule.sports is not None and (
+        block_a.sport not in rule.sports or block_b.sport not in rule.sports
+    ):
+        return False
+    if compiled.override_bit & (mask_a | mask_b):
+        return True
+    for bits_a, bits_b in compiled.orientations:
+        if (not bits_a or mask_a & bits_a) and (not bits_b or mask_b & bits_b):
+            return True
+    return False
+
+
 # =============================================================================
 # Correlation Detection Functions
 # =============================================================================
@@ -66,15 +329,7 @@ def detect_same_player_multi_props(block_a: BetBlock, block_b: BetBlock) -> bool
     - blockA.playerId == blockB.playerId (both non-None)
     - and both blocks are player_prop
     """
-    if block_a.player_id is None or block_b.player_id is None:
-        return False
-    if block_a.player_id != block_b.player_id:
-        return False
-    if block_a.bet_type != BetType.PLAYER_PROP:
-        return False
-    if block_b.bet_type != BetType.PLAYER_PROP:
-        return False
-    return True
+    return _RULES_BY_TYPE[TYPE_SAME_PLAYER_MULTI_PROPS].matches(block_a, block_b)
 
 
 def detect_script_dependency(block_a: BetBlock, block_b: BetBlock) -> bool:
@@ -86,29 +341,7 @@ def detect_script_dependency(block_a: BetBlock, block_b: BetBlock) -> bool:
     - and one is ml/spread AND the other is total/team_total
     - OR correlationTags include "script_dependency"
     """
-    # Check for explicit tag
-    if "script_dependency" in block_a.correlation_tags:
-        if block_a.game_id == block_b.game_id:
-            return True
-    if "script_dependency" in block_b.correlation_tags:
-        if block_a.game_id == block_b.game_id:
-            return True
-
-    # Check game id match
-    if block_a.game_id != block_b.game_id:
-        return False
-
-    # Check bet type combination
-    game_script_types = {BetType.ML, BetType.SPREAD}
-    total_types = {BetType.TOTAL, BetType.TEAM_TOTAL}
-
-    a_is_script = block_a.bet_type in game_script_types
-    b_is_script = block_b.bet_type in game_script_types
-    a_is_total = block_a.bet_type in total_types
-    b_is_total = block_b.bet_type in total_types
-
-    # One must be script type, other must be total type
-    return (a_is_script and b_is_total) or (a_is_total and b_is_script)
+    return _RULES_BY_TYPE[TYPE_SCRIPT_DEPENDENCY].matches(block_a, block_b)
 
 
 def detect_volume_dependency(block_a: BetBlock, block_b: BetBlock) -> bool:
@@ -120,29 +353,7 @@ def detect_volume_dependency(block_a: BetBlock, block_b: BetBlock) -> bool:
     - QB passing prop + WR/TE receiving prop
     - OR correlationTags include "volume_dependency"
     """
-    # Check for explicit tag
-    if "volume_dependency" in block_a.correlation_tags:
-        if block_a.game_id == block_b.game_id:
-            return True
-    if "volume_dependency" in block_b.correlation_tags:
-        if block_a.game_id == block_b.game_id:
-            return True
-
-    # Check game id match
-    if block_a.game_id != block_b.game_id:
-        return False
-
-    # Check for QB/WR correlation via tags
-    # (Selection text matching would require NLP, so we use tags)
-    a_tags = set(block_a.correlation_tags)
-    b_tags = set(block_b.correlation_tags)
-
-    a_is_qb_passing = "qb_passing" in a_tags
-    b_is_qb_passing = "qb_passing" in b_tags
-    a_is_receiving = "wr_receiving" in a_tags or "te_receiving" in a_tags
-    b_is_receiving = "wr_receiving" in b_tags or "te_receiving" in b_tags
-
-    return (a_is_qb_passing and b_is_receiving) or (a_is_receiving and b_is_qb_passing)
+    return _RULES_BY_TYPE[TYPE_VOLUME_DEPENDENCY].matches(block_a, block_b)
 
 
 def detect_td_dependency(block_a: BetBlock, block_b: BetBlock) -> bool:
@@ -153,30 +364,7 @@ def detect_td_dependency(block_a: BetBlock, block_b: BetBlock) -> bool:
     - any player TD prop + team spread/ml in same game
     - OR correlationTags include "td_dependency"
     """
-    # Check for explicit tag
-    if "td_dependency" in block_a.correlation_tags:
-        if block_a.game_id == block_b.game_id:
-            return True
-    if "td_dependency" in block_b.correlation_tags:
-        if block_a.game_id == block_b.game_id:
-            return True
-
-    # Check game id match
-    if block_a.game_id != block_b.game_id:
-        return False
-
-    # Check for TD prop + team spread/ml
-    a_tags = set(block_a.correlation_tags)
-    b_tags = set(block_b.correlation_tags)
-
-    a_is_td_prop = "td_prop" in a_tags
-    b_is_td_prop = "td_prop" in b_tags
-
-    team_types = {BetType.SPREAD, BetType.ML}
-    a_is_team_bet = block_a.bet_type in team_types
-    b_is_team_bet = block_b.bet_type in team_types
-
-    return (a_is_td_prop and b_is_team_bet) or (a_is_team_bet and b_is_td_prop)
+    return _RULES_BY_TYPE[TYPE_TD_DEPENDENCY].matches(block_a, block_b)
 
 
 def detect_pace_dependency(block_a: BetBlock, block_b: BetBlock) -> bool:
@@ -187,30 +375,7 @@ def detect_pace_dependency(block_a: BetBlock, block_b: BetBlock) -> bool:
     - total over/under + passing/receiving volume props in same game
     - OR correlationTags include "pace_dependency"
     """
-    # Check for explicit tag
-    if "pace_dependency" in block_a.correlation_tags:
-        if block_a.game_id == block_b.game_id:
-            return True
-    if "pace_dependency" in block_b.correlation_tags:
-        if block_a.game_id == block_b.game_id:
-            return True
-
-    # Check game id match
-    if block_a.game_id != block_b.game_id:
-        return False
-
-    # Check for total + volume prop
-    a_tags = set(block_a.correlation_tags)
-    b_tags = set(block_b.correlation_tags)
-
-    a_is_total = block_a.bet_type == BetType.TOTAL
-    b_is_total = block_b.bet_type == BetType.TOTAL
-
-    volume_tags = {"passing_volume", "receiving_volume", "qb_passing", "wr_receiving", "te_receiving"}
-    a_is_volume = bool(a_tags & volume_tags)
-    b_is_volume = bool(b_tags & volume_tags)
-
-    return (a_is_total and b_is_volume) or (a_is_volume and b_is_total)
+    return _RULES_BY_TYPE[TYPE_PACE_DEPENDENCY].matches(block_a, block_b)
 
 
 # =============================================================================
@@ -225,26 +390,46 @@ def detect_pair_correlations(
     """
     Detect all correlation types between a pair of blocks.
 
-    Returns list of (type, penalty) tuples for all matching correlations.
+    Returns list of (type, penalty) tuples for all matching correlations,
+    in rule table order.
     """
-    correlations: List[Tuple[str, int]] = []
-
-    if detect_same_player_multi_props(block_a, block_b):
-        correlations.append((TYPE_SAME_PLAYER_MULTI_PROPS, PENALTY_SAME_PLAYER_MULTI_PROPS))
+    return [
+        (rule.type, rule.penalty)
+        for rule in CORRELATION_RULES
+        if rule.matches(block_a, block_b)
+    ]
 
-    if detect_script_dependency(block_a, block_b):
-        correlations.append((TYPE_SCRIPT_DEPENDENCY, PENALTY_SCRIPT_DEPENDENCY))
 
-    if detect_volume_dependency(block_a, block_b):
-        correlations.append((TYPE_VOLUME_DEPENDENCY, PENALTY_VOLUME_DEPENDENCY))
+def highest_pair_correlation(
+    block_a: BetBlock,
+    block_b: BetBlock,
+    compiled: CompiledRules = COMPILED_RULES,
+) -> Tuple[str, int] | None:
+    """
+    The pair's correlation after the highest-penalty rule.
 
-    if detect_td_dependency(block_a, block_b):
-        correlations.append((TYPE_TD_DEPENDENCY, PENALTY_TD_DEPENDENCY))
+    Same as get_highest_penalty_correlation(detect_pair_correlations(a, b)),
+    but only tests the rules the pair's bet types and tags allow, and stops
+    at the first match.
+    """
+    return _highest_compiled(
+        compiled,
+        block_a, compiled.tag_mask(block_a.correlation_tags),
+        block_b, compiled.tag_mask(block_b.correlation_tags),
+    )
 
-    if detect_pace_dependency(block_a, block_b):
-        correlations.append((TYPE_PACE_DEPENDENCY, PENALTY_PACE_DEPENDENCY))
 
-    return correlations
+def _highest_compiled(
+    compiled: CompiledRules,
+    block_a: BetBlock,
+    mask_a: int,
+    block_b: BetBlock,
+    mask_b: int,
+) -> Tuple[str, int] | None:
+    for entry in compiled.by_bet_types[(block_a.bet_type, block_b.bet_type)]:
+        if _compiled_matches(entry, block_a, mask_a, block_b, mask_b):
+            return entry.rule.type, entry.rule.penalty
+    return None
 
 
 def get_highest_penalty_correlation(
@@ -297,6 +482,9 @@ def compute_correlations(blocks: Sequence[BetBlock]) -> CorrelationResult:
     - correlation_penalty: sum of all pair penalties
     - correlation_multiplier: from threshold table
 
+    From VECTORIZE_MIN_BLOCKS blocks up, and when NumPy is installed, the
+    pairs are evaluated as arrays by core.correlation_matrix (same result).
+
     Args:
         blocks: Sequence of BetBlock objects
 
@@ -310,32 +498,36 @@ def compute_correlations(blocks: Sequence[BetBlock]) -> CorrelationResult:
             correlation_multiplier=1.0,
         )
 
+    # Import here to avoid circular dependency
+    from core import correlation_matrix
+    if correlation_matrix.NUMPY_AVAILABLE and len(blocks) >= correlation_matrix.VECTORIZE_MIN_BLOCKS:
+        return correlation_matrix.compute_correlations_matrix(blocks)
+
     correlation_list: List[Correlation] = []
     total_penalty = 0.0
 
+    compiled = COMPILED_RULES
+    masks = [compiled.tag_mask(block.correlation_tags) for block in blocks]
+
     # Check all unique pairs
     for i in range(len(blocks)):
         for j in range(i + 1, len(blocks)):
             block_a = blocks[i]
             block_b = blocks[j]
 
-            # Detect all correlations for this pair
-            pair_correlations = detect_pair_correlations(block_a, block_b)
-
-            if pair_correlations:
-                # Apply highest penalty only (avoid double counting)
-                highest = get_highest_penalty_correlation(pair_correlations)
-                if highest:
-                    corr_type, penalty = highest
-                    correlation_list.append(
-                        Correlation(
-                            block_a=block_a.block_id,
-                            block_b=block_b.block_id,
-                            type=corr_type,
-                            penalty=float(penalty),
-                        )
+            # Highest-penalty matching rule only (avoid double counting)
+            highest = _highest_compiled(compiled, block_a, masks[i], block_b, masks[j])
+            if highest:
+                corr_type, penalty = highest
+                correlation_list.append(
+                    Correlation._trusted(
+                        block_a=block_a.block_id,
+                        block_b=block_b.block_id,
+                        type=corr_type,
+                        penalty=float(penalty),
                     )
-                    total_penalty += penalty
+                )
+                total_penalty += penalty
 
     multiplier = compute_correlation_multiplier(total_penalty)
 
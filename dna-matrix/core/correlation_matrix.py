@@ -0,0 +1,320 @@
+# core/correlation_matrix.py
+"""
+Correlation Matrix - Vectorized pairwise correlation detection.
+
+Same rule table and results as correlation_engine, for many pairs at once:
+- Each block is encoded once into integer arrays (game, player, sport and
+  bet type codes, tag bitmask)
+- Every CORRELATION_RULES row is evaluated for all pairs with NumPy
+  broadcasting
+- "Highest penalty per pair" is applied with the same tie order as
+  get_highest_penalty_correlation
+
+NumPy is optional. Without it NUMPY_AVAILABLE is False and
+correlation_engine keeps using the per-pair detectors.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.correlation_engine import (
+    COMPILED_RULES,
+    CompiledRules,
+    CorrelationResult,
+    LegPattern,
+    compute_correlation_multiplier,
+)
+from core.models.leading_light import BetBlock, BetType, Correlation
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    NUMPY_AVAILABLE = False
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Below this many blocks the per-pair detectors are faster than array setup
+VECTORIZE_MIN_BLOCKS = 20
+
+# Below this many (block, candidate) pairs suggestion sweeps stay per-pair
+VECTORIZE_MIN_PAIRS = 300
+
+_BET_TYPES = tuple(BetType)
+_BET_TYPE_CODES: Dict[BetType, int] = {bet_type: i for i, bet_type in enumerate(_BET_TYPES)}
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+
+@dataclass
+class CodeTables:
+    """String-to-code tables shared by encodings that are compared."""
+    games: Dict[str, int] = field(default_factory=dict)
+    players: Dict[str, int] = field(default_factory=dict)
+    sports: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class EncodedBlocks:
+    """
+    Array encoding of a block sequence.
+
+    Codes are only comparable between encodings built with the same
+    CodeTables.
+    """
+    game: "np.ndarray"
+    player: "np.ndarray"  # -1 when player_id is None
+    sport: "np.ndarray"
+    bet_type: "np.ndarray"
+    tags: "np.ndarray"  # CompiledRules.tag_bits mask
+
+
+def encode_blocks(
+    blocks: Sequence[BetBlock],
+    tables: CodeTables,
+    compiled: CompiledRules = COMPILED_RULES,
+) -> EncodedBlocks:
+    """Encode blocks into arrays, extending `tables` in place."""
+    return encode_legs(
+        ((b.game_id, b.player_id, b.sport, b.bet_type, b.correlation_tags) for b in blocks),
+        tables,
+        compiled,
+    )
+
+
+def encode_legs(
+    legs: Iterable[Tuple[str, Optional[str], str, BetType, Iterable[str]]],
+    tables: CodeTables,
+    compiled: CompiledRules = COMPILED_RULES,
+) -> EncodedBlocks:
+    """
+    Encode (game_id, player_id, sport, bet_type, correlation_tags) rows.
+
+    Same encoding as encode_blocks, for legs that are not BetBlocks (e.g.
+    stored records). Extends `tables` in place.
+    """
+    game: List[int] = []
+    player: List[int] = []
+    sport: List[int] = []
+    bet_type: List[int] = []
+    tags: List[int] = []
+
+    for game_id, player_id, sport_name, leg_bet_type, correlation_tags in legs:
+        game.append(tables.games.setdefault(game_id, len(tables.games)))
+        player.append(
+            -1 if player_id is None
+            else tables.players.setdefault(player_id, len(tables.players))
+        )
+        sport.append(tables.sports.setdefault(sport_name, len(tables.sports)))
+        bet_type.append(_BET_TYPE_CODES[leg_bet_type])
+        tags.append(compiled.tag_mask(correlation_tags))
+
+    return EncodedBlocks(
+        game=np.array(game, dtype=np.int64),
+        player=np.array(player, dtype=np.int64),
+        sport=np.array(sport, dtype=np.int64),
+        bet_type=np.array(bet_type, dtype=np.int64),
+        tags=np.array(tags, dtype=np.int64),
+    )
+
+
+# =============================================================================
+# Pair Matrix
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _RulePlan:
+    """Array form of one rule: bet-type lookup tables and tag bits per side."""
+    types_a: "np.ndarray"
+    tags_a: int
+    types_b: "np.ndarray"
+    tags_b: int
+    override_bit: int
+
+
+_PLANS: Dict[int, Tuple[Tuple[_RulePlan, ...], Tuple[int, ...]]] = {}
+
+
+def _plans(compiled: CompiledRules) -> Tuple[Tuple[_RulePlan, ...], Tuple[int, ...]]:
+    """Rule plans plus the order to apply them in (lowest precedence first)."""
+    cached = _PLANS.get(id(compiled))
+    if cached is None:
+        def types(pattern: LegPattern):
+            return np.array([pattern.bet_types is None or t in pattern.bet_types for t in _BET_TYPES])
+
+        def tags(pattern: LegPattern) -> int:
+            return sum(compiled.tag_bits[tag] for tag in pattern.tags or ())
+
+        plans = tuple(
+            _RulePlan(
+                types_a=types(rule.side_a),
+                tags_a=tags(rule.side_a),
+                types_b=types(rule.side_b),
+                tags_b=tags(rule.side_b),
+                override_bit=compiled.tag_bits[rule.override_tag] if rule.override_tag else 0,
+            )
+            for rule in compiled.rules
+        )
+        # Later assignments win: highest penalty last, table order on ties
+        order = tuple(sorted(
+            range(len(compiled.rules)), key=lambda k: (compiled.rules[k].penalty, -k)
+        ))
+        cached = _PLANS[id(compiled)] = (plans, order)
+    return cached
+
+
+def pair_type_matrix(
+    left: EncodedBlocks,
+    right: EncodedBlocks,
+    tables: CodeTables,
+    compiled: CompiledRules = COMPILED_RULES,
+) -> "np.ndarray":
+    """
+    Winning correlation rule for every (left[i], right[j]) pair.
+
+    Each rule in the table is evaluated for all pairs at once. Returns an
+    int16 matrix of indexes into compiled.rules (-1 = no correlation).
+    """
+    return _winning_rules(left, right, tables, compiled, outer=True)
+
+
+def pair_types(
+    left: EncodedBlocks,
+    right: EncodedBlocks,
+    tables: CodeTables,
+    compiled: CompiledRules = COMPILED_RULES,
+) -> "np.ndarray":
+    """
+    Winning correlation rule for each (left[k], right[k]) pair.
+
+    Element-wise form of pair_type_matrix for encodings of equal length
+    (e.g. the legs of many parlays, gathered pair by pair).
+    """
+    return _winning_rules(left, right, tables, compiled, outer=False)
+
+
+def _winning_rules(
+    left: EncodedBlocks,
+    right: EncodedBlocks,
+    tables: CodeTables,
+    compiled: CompiledRules,
+    outer: bool,
+) -> "np.ndarray":
+    plans, order = _plans(compiled)
+
+    # Outer: left varies along rows, right along columns
+    as_left = (lambda a: a[:, None]) if outer else (lambda a: a)
+    as_right = (lambda a: a[None, :]) if outer else (lambda a: a)
+    shared = outer and right is left
+
+    def side(encoded: EncodedBlocks, types, bits: int):
+        """Legs of `encoded` matching one side of a rule."""
+        matched = types[encoded.bet_type]
+        if bits:
+            matched &= (encoded.tags & bits) != 0
+        return matched
+
+    same_game = None
+    detected = []
+    for rule, plan in zip(compiled.rules, plans, strict=True):
+        left_a = side(left, plan.types_a, plan.tags_a)
+        left_b = side(left, plan.types_b, plan.tags_b)
+        right_a = left_a if shared else side(right, plan.types_a, plan.tags_a)
+        right_b = left_b if shared else side(right, plan.types_b, plan.tags_b)
+        matched = (as_left(left_a) & as_right(right_b)) | (as_left(left_b) & as_right(right_a))
+        if plan.override_bit:
+            matched |= (
+                as_left((left.tags & plan.override_bit) != 0)
+                | as_right((right.tags & plan.override_bit) != 0)
+            )
+        if rule.same_game:
+            if same_game is None:
+                same_game = as_left(left.game) == as_right(right.game)
+            matched &= same_game
+        if rule.same_player:
+            matched &= (as_left(left.player) == as_right(right.player)) & as_left(left.player >= 0)
+        if rule.sports is not None:
+            codes = [tables.sports[s] for s in rule.sports if s in tables.sports]
+            matched &= as_left(np.isin(left.sport, codes)) & as_right(np.isin(right.sport, codes))
+        detected.append(matched)
+
+    # Highest penalty wins; equal penalties keep table order
+    shape = (len(left.game), len(right.game)) if outer else len(left.game)
+    winner = np.full(shape, -1, dtype=np.int16)
+    for k in order:
+        winner[detected[k]] = k
+    return winner
+
+
+# =============================================================================
+# Entry Points
+# =============================================================================
+
+
+def compute_correlations_matrix(blocks: Sequence[BetBlock]) -> CorrelationResult:
+    """
+    compute_correlations for all pairs at once.
+
+    Pairs come out in the same (i, j) order and the penalty total is the
+    same whole-number sum, so the result equals the per-pair engine's.
+    """
+    tables = CodeTables()
+    encoded = encode_blocks(blocks, tables)
+    rule = pair_type_matrix(encoded, encoded, tables)
+    rule[np.tril_indices(len(blocks))] = -1
+
+    correlation_list: List[Correlation] = []
+    total_penalty = 0.0
+    for i, j in zip(*np.nonzero(rule >= 0), strict=True):
+        matched = COMPILED_RULES.rules[rule[i, j]]
+        corr_type, penalty = matched.type, matched.penalty
+        correlation_list.append(
+            Correlation._trusted(
+                block_a=blocks[i].block_id,
+                block_b=blocks[j].block_id,
+                type=corr_type,
+                penalty=float(penalty),
+            )
+        )
+        total_penalty += penalty
+
+    return CorrelationResult(
+        correlations=tuple(correlation_list),
+        correlation_penalty=total_penalty,
+        correlation_multiplier=compute_correlation_multiplier(total_penalty),
+    )
+
+
+def candidate_penalties(
+    blocks: Sequence[BetBlock],
+    candidates: Sequence[BetBlock],
+) -> List[int]:
+    """
+    Summed pair penalty each candidate would add against `blocks`.
+
+    Equivalent to summing the highest pair penalty of (block, candidate)
+    over all blocks, for every candidate.
+    """
+    if not blocks:
+        return [0] * len(candidates)
+
+    tables = CodeTables()
+    rule = pair_type_matrix(
+        encode_blocks(blocks, tables),
+        encode_blocks(candidates, tables),
+        tables,
+    )
+    penalty_by_rule = np.array(
+        [matched.penalty for matched in COMPILED_RULES.rules] + [0], dtype=np.int64
+    )
+    # rule == -1 indexes the trailing 0
+    return penalty_by_rule[rule].sum(axis=0).tolist()
@@ -12,15 +12,58 @@ System Invariants (enforced by validation):
 - effectiveFragility >= baseFragility
 - finalFragility clamped [0, 100]
 - correlationMultiplier must be one of [1.0, 1.15, 1.3, 1.5]
+
+Validation runs at construction. Engine code deriving new objects from
+already-validated ones may use Type._trusted(...), the same constructor
+without __post_init__; API boundaries (create/from_dict/__init__) always
+validate.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 
+# =============================================================================
+# Trusted Construction
+# =============================================================================
+
+
+def _trusted_constructor(cls):
+    """
+    Class decorator: add cls._trusted, the dataclass __init__ minus __post_init__.
+
+    Same signature and defaults as the dataclass constructor. Only for
+    engine-internal derivations whose inputs are already-validated core
+    objects; the invariants are the caller's responsibility.
+
+    Generated like dataclasses' own __init__: one direct slot store per
+    field, so it costs a fraction of a validated construction.
+    """
+    names = [f.name for f in fields(cls)]
+    namespace: Dict[str, Any] = {"_new": object.__new__, "_cls": cls}
+    params = []
+    for f in fields(cls):
+        namespace[f"_set_{f.name}"] = getattr(cls, f.name).__set__
+        if f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            params.append(f"{f.name}=_default_{f.name}")
+        else:
+            params.append(f.name)
+    body = "".join(f"    _set_{name}(self, {name})\n" for name in names)
+    exec(
+        f"def _trusted({', '.join(params)}):\n    self = _new(_cls)\n{body}    return self\n",
+        namespace,
+    )
+    trusted = namespace["_trusted"]
+    trusted.__qualname__ = f"{cls.__qualname__}._trusted"
+    trusted.__doc__ = f"Build a {cls.__name__} without validation (engine-internal)."
+    cls._trusted = staticmethod(trusted)
+    return cls
+
+
 # =============================================================================
 # Enums
 # =============================================================================
@@ -61,6 +104,7 @@ class SuggestedBlockLabel(str, Enum):
 # =============================================================================
 
 
+@_trusted_constructor
 @dataclass(frozen=True, slots=True)
 class ContextModifier:
     """
@@ -99,6 +143,7 @@ class ContextModifier:
         return result
 
 
+@_trusted_constructor
 @dataclass(frozen=True, slots=True)
 class ContextModifiers:
     """
@@ -175,6 +220,7 @@ class ContextImpact:
         }
 
 
+@_trusted_constructor
 @dataclass(frozen=True, slots=True)
 class Correlation:
     """Correlation between two bet blocks in a parlay."""
@@ -213,6 +259,7 @@ class Correlation:
         }
 
 
+@_trusted_constructor
 @dataclass(frozen=True, slots=True)
 class ParlayMetrics:
     """Computed metrics for a parlay."""
@@ -261,6 +308,7 @@ class ParlayMetrics:
         }
 
 
+@_trusted_constructor
 @dataclass(frozen=True, slots=True)
 class DNAEnforcement:
     """DNA Matrix enforcement rules for a parlay."""
@@ -312,6 +360,7 @@ class DNAEnforcement:
 # =============================================================================
 
 
+@_trusted_constructor
 @dataclass(frozen=True, slots=True)
 class BetBlock:
     """
@@ -541,6 +590,7 @@ class ContextSignal:
         }
 
 
+@_trusted_constructor
 @dataclass(frozen=True, slots=True)
 class ParlayState:
     """
@@ -0,0 +1,316 @@
+# core/parlay_batch.py
+"""
+Parlay Batch - Columnar evaluation of many parlays at once.
+
+For bulk re-scoring (nightly jobs, analytics) where building a BetBlock
+per leg and a ParlayState per parlay dominates the cost:
+- ParlayBatch holds every leg in flat arrays (effective fragility plus the
+  correlation encoding from correlation_matrix), with offsets per parlay
+- evaluate_batch computes sumBlocks, legPenalty, correlationPenalty,
+  correlationMultiplier, raw/finalFragility and the risk inductor for
+  every parlay with NumPy
+
+Results equal evaluate_parlay (no DNA profile) bit for bit: sums run in
+leg order like compute_sum_blocks, leg penalties and multipliers come
+from the canonical functions, and correlation penalties are whole numbers.
+
+Requires NumPy (the `fast` extra).
+"""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Mapping, Sequence
+
+from core.correlation_engine import (
+    COMPILED_RULES,
+    CompiledRules,
+    compute_correlation_multiplier,
+)
+from core.correlation_matrix import (
+    NUMPY_AVAILABLE,
+    CodeTables,
+    EncodedBlocks,
+    encode_legs,
+    np,
+    pair_types,
+)
+from core.fragility_engine import compute_leg_penalty
+from core.models.leading_light import BetBlock, BetType
+from core.risk_inductor import (
+    CRITICAL_CORRELATION_PENALTY,
+    CRITICAL_MIN_LEGS,
+    THRESHOLD_LOADED,
+    THRESHOLD_STABLE,
+    THRESHOLD_TENSE,
+    RiskInductor,
+)
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Inductor codes used by BatchEvaluation.inductor
+INDUCTORS = (
+    RiskInductor.STABLE,
+    RiskInductor.LOADED,
+    RiskInductor.TENSE,
+    RiskInductor.CRITICAL,
+)
+
+# Pairs scored per pair_types call (bounds temporary memory)
+PAIR_CHUNK = 1 << 20
+
+# sum() compensates float rounding from Python 3.12 on; a plain running
+# sum only matches it before that
+_RUNNING_SUM_MATCHES = sys.version_info < (3, 12)
+
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("ParlayBatch requires NumPy (install the 'fast' extra)")
+
+
+# =============================================================================
+# Batch
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ParlayBatch:
+    """
+    Legs of many parlays in flat arrays.
+
+    Attributes:
+        offsets: Parlay p's legs are [offsets[p], offsets[p + 1])
+        fragility: effectiveFragility of every leg
+        features: Correlation encoding of every leg
+        tables: Code tables the features were encoded with
+    """
+    offsets: "np.ndarray"
+    fragility: "np.ndarray"
+    features: EncodedBlocks
+    tables: CodeTables
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def leg_counts(self) -> "np.ndarray":
+        return np.diff(self.offsets)
+
+    @classmethod
+    def from_blocks(
+        cls,
+        parlays: Iterable[Sequence[BetBlock]],
+        compiled: CompiledRules = COMPILED_RULES,
+    ) -> ParlayBatch:
+        """Build a batch from parlays of BetBlocks."""
+        _require_numpy()
+        offsets = [0]
+        fragility: List[float] = []
+        legs = []
+        for blocks in parlays:
+            for block in blocks:
+                fragility.append(block.effective_fragility)
+                legs.append((
+                    block.game_id, block.player_id, block.sport,
+                    block.bet_type, block.correlation_tags,
+                ))
+            offsets.append(len(fragility))
+        return cls._build(offsets, fragility, legs, compiled)
+
+    @classmethod
+    def from_dicts(
+        cls,
+        parlays: Iterable[Sequence[Mapping[str, Any]]],
+        compiled: CompiledRules = COMPILED_RULES,
+    ) -> ParlayBatch:
+        """
+        Build a batch from stored legs, without creating BetBlocks.
+
+        Legs use the BetBlock.to_dict shape (camelCase or snake_case keys);
+        only sport, gameId, betType, effectiveFragility, correlationTags and
+        playerId are read.
+
+        Raises:
+            ValueError: If a leg has an unknown bet type
+            KeyError: If a required key is missing
+        """
+        _require_numpy()
+        offsets = [0]
+        fragility: List[float] = []
+        legs = []
+        for records in parlays:
+            for data in records:
+                fragility.append(
+                    data["effectiveFragility"] if "effectiveFragility" in data
+                    else data["effective_fragility"]
+                )
+                legs.append((
+                    data["gameId"] if "gameId" in data else data["game_id"],
+                    data.get("playerId", data.get("player_id")),
+                    data["sport"],
+                    BetType(data["betType"] if "betType" in data else data["bet_type"]),
+                    data.get("correlationTags", data.get("correlation_tags", ())),
+                ))
+            offsets.append(len(fragility))
+        return cls._build(offsets, fragility, legs, compiled)
+
+    @classmethod
+    def _build(cls, offsets, fragility, legs, compiled: CompiledRules) -> ParlayBatch:
+        tables = CodeTables()
+        return cls(
+            offsets=np.array(offsets, dtype=np.int64),
+            fragility=np.array(fragility, dtype=np.float64),
+            features=encode_legs(legs, tables, compiled),
+            tables=tables,
+        )
+
+
+# =============================================================================
+# Evaluation
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class BatchEvaluation:
+    """
+    Metrics of every parlay in a batch, one array element per parlay.
+
+    inductor holds codes into INDUCTORS; see inductor_at.
+    """
+    leg_count: "np.ndarray"
+    sum_blocks: "np.ndarray"
+    leg_penalty: "np.ndarray"
+    correlation_penalty: "np.ndarray"
+    correlation_multiplier: "np.ndarray"
+    raw_fragility: "np.ndarray"
+    final_fragility: "np.ndarray"
+    inductor: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.leg_count)
+
+    def inductor_at(self, index: int) -> RiskInductor:
+        return INDUCTORS[self.inductor[index]]
+
+
+def evaluate_batch(
+    batch: ParlayBatch,
+    compiled: CompiledRules = COMPILED_RULES,
+) -> BatchEvaluation:
+    """
+    Evaluate every parlay in the batch.
+
+    Equivalent to evaluate_parlay(blocks) (no DNA profile, so no
+    violations) for each parlay's metrics and inductor level.
+
+    Args:
+        batch: Parlays to evaluate
+        compiled: Correlation rules (must match the batch's encoding)
+
+    Returns:
+        BatchEvaluation with one entry per parlay, in batch order
+    """
+    _require_numpy()
+    leg_count = batch.leg_counts
+    sum_blocks = _segment_sums(batch.fragility, batch.offsets, leg_count)
+    correlation_penalty = _correlation_penalties(batch, leg_count, compiled)
+
+    # Leg counts and penalties take few distinct values: map them through
+    # the canonical functions rather than re-deriving the formulas
+    max_legs = int(leg_count.max()) if len(leg_count) else 0
+    leg_penalty_table = np.array(
+        [0.0] + [compute_leg_penalty(k) for k in range(1, max_legs + 1)], dtype=np.float64
+    )
+    leg_penalty = leg_penalty_table[leg_count]
+
+    penalties, inverse = np.unique(correlation_penalty, return_inverse=True)
+    correlation_multiplier = np.array(
+        [compute_correlation_multiplier(float(p)) for p in penalties], dtype=np.float64
+    )[inverse.reshape(-1)]
+
+    # Same operation order as compute_raw_fragility / compute_final_fragility
+    raw_fragility = sum_blocks + leg_penalty + correlation_penalty
+    final_fragility = np.clip(raw_fragility * correlation_multiplier, 0.0, 100.0)
+
+    # Same thresholds as resolve_inductor
+    critical = (final_fragility > THRESHOLD_TENSE) & (
+        (correlation_penalty >= CRITICAL_CORRELATION_PENALTY) | (leg_count >= CRITICAL_MIN_LEGS)
+    )
+    inductor = np.select(
+        [final_fragility <= THRESHOLD_STABLE, final_fragility <= THRESHOLD_LOADED, critical],
+        [0, 1, 3],
+        default=2,
+    ).astype(np.int8)
+
+    return BatchEvaluation(
+        leg_count=leg_count,
+        sum_blocks=sum_blocks,
+        leg_penalty=leg_penalty,
+        correlation_penalty=correlation_penalty,
+        correlation_multiplier=correlation_multiplier,
+        raw_fragility=raw_fragility,
+        final_fragility=final_fragility,
+        inductor=inductor,
+    )
+
+
+def _segment_sums(values: "np.ndarray", offsets: "np.ndarray", counts: "np.ndarray") -> "np.ndarray":
+    """Per-parlay sum of leg values, rounded exactly like compute_sum_blocks."""
+    if not _RUNNING_SUM_MATCHES:
+        flat = values.tolist()
+        bounds = offsets.tolist()
+        return np.array(
+            [sum(flat[bounds[p]:bounds[p + 1]]) for p in range(len(counts))], dtype=np.float64
+        )
+
+    # Running sum in leg order, one leg position at a time across parlays
+    sums = np.zeros(len(counts), dtype=np.float64)
+    starts = offsets[:-1]
+    for k in range(int(counts.max()) if len(counts) else 0):
+        active = np.nonzero(counts > k)[0]
+        sums[active] += values[starts[active] + k]
+    return sums
+
+
+def _correlation_penalties(
+    batch: ParlayBatch,
+    leg_count: "np.ndarray",
+    compiled: CompiledRules,
+) -> "np.ndarray":
+    """Summed highest pair penalty over every leg pair within each parlay."""
+    parlays = len(batch)
+    total = np.zeros(parlays, dtype=np.float64)
+    if not len(batch.fragility):
+        return total
+
+    # Pairs (i, i + d) of legs in the same parlay
+    leg_parlay = np.repeat(np.arange(parlays), leg_count)
+    position = np.arange(len(leg_parlay)) - batch.offsets[:-1][leg_parlay]
+    remaining = leg_count[leg_parlay] - position - 1
+    lefts = [np.nonzero(remaining >= d)[0] for d in range(1, int(leg_count.max()))]
+    if not lefts:
+        return total
+    left = np.concatenate(lefts)
+    right = left + np.repeat(np.arange(1, len(lefts) + 1), [len(ix) for ix in lefts])
+
+    penalty_by_rule = np.array([rule.penalty for rule in compiled.rules] + [0], dtype=np.float64)
+    features = batch.features
+    for start in range(0, len(left), PAIR_CHUNK):
+        lo, hi = left[start:start + PAIR_CHUNK], right[start:start + PAIR_CHUNK]
+        winner = pair_types(_take(features, lo), _take(features, hi), batch.tables, compiled)
+        # winner == -1 indexes the trailing 0
+        total += np.bincount(leg_parlay[lo], weights=penalty_by_rule[winner], minlength=parlays)
+    return total
+
+
+def _take(features: EncodedBlocks, index: "np.ndarray") -> EncodedBlocks:
+    return EncodedBlocks(
+        game=features.game[index],
+        player=features.player[index],
+        sport=features.sport[index],
+        bet_type=features.bet_type[index],
+        tags=features.tags[index],
+    )
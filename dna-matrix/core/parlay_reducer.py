@@ -12,12 +12,18 @@ Order of Operations (non-negotiable):
 4. Compute rawFragility and finalFragility
 5. Build ParlayState with blocks, metrics, correlations, dnaEnforcement
 
-No step skipping, no caching, no partial updates.
-Every update recomputes derived fields from scratch.
+No step skipping, no caching.
+build_parlay_state recomputes every derived field from scratch.
+add_block/remove_block produce the same ParlayState incrementally: the
+previous state's correlations are its per-pair table and
+metrics.correlationPenalty its running total, so adding a leg only checks
+the n new pairs and removing one only drops its pairs. Set
+VERIFY_INCREMENTAL to check every incremental update against
+build_parlay_state.
 """
 from __future__ import annotations
 
-from typing import List, Sequence
+from typing import Dict, List, Sequence
 from uuid import UUID, uuid4
 
 from core.models.leading_light import (
@@ -27,7 +33,11 @@ from core.models.leading_light import (
     ParlayMetrics,
     ParlayState,
 )
-from core.correlation_engine import compute_correlations
+from core.correlation_engine import (
+    compute_correlation_multiplier,
+    compute_correlations,
+    highest_pair_correlation,
+)
 from core.fragility_engine import (
     compute_leg_penalty,
     compute_sum_blocks,
@@ -36,6 +46,11 @@ from core.fragility_engine import (
 )
 
 
+# Debug mode: re-derive every add_block/remove_block result from scratch and
+# raise AssertionError if the incremental state differs.
+VERIFY_INCREMENTAL = False
+
+
 def build_parlay_state(
     blocks: Sequence[BetBlock],
     parlay_id: UUID | None = None,
@@ -62,6 +77,8 @@ def build_parlay_state(
     """
     if parlay_id is None:
         parlay_id = uuid4()
+    elif not isinstance(parlay_id, UUID):
+        raise TypeError("parlay_id must be a UUID")
 
     # Handle empty parlay
     if not blocks:
@@ -85,47 +102,72 @@ def build_parlay_state(
     # Step 2: Compute correlations
     correlation_result = compute_correlations(blocks)
 
+    # Steps 3-5
+    return _assemble_state(
+        blocks=tuple(blocks),
+        parlay_id=parlay_id,
+        correlations=correlation_result.correlations,
+        correlation_penalty=correlation_result.correlation_penalty,
+    )
+
+
+def _assemble_state(
+    blocks: tuple[BetBlock, ...],
+    parlay_id: UUID,
+    correlations: tuple[Correlation, ...],
+    correlation_penalty: float,
+) -> ParlayState:
+    """
+    Steps 3-5 of the order of operations for a non-empty parlay.
+
+    Shared by the from-scratch and incremental paths so both derive metrics
+    identically from (blocks, correlations, correlationPenalty).
+    """
     # Step 3: Compute legPenalty
-    num_legs = len(blocks)
-    leg_penalty = compute_leg_penalty(num_legs)
+    leg_penalty = compute_leg_penalty(len(blocks))
 
     # Step 4: Compute rawFragility and finalFragility
+    correlation_multiplier = compute_correlation_multiplier(correlation_penalty)
     sum_blocks = compute_sum_blocks(blocks)
     raw_fragility = compute_raw_fragility(
         sum_blocks=sum_blocks,
         leg_penalty=leg_penalty,
-        correlation_penalty=correlation_result.correlation_penalty,
+        correlation_penalty=correlation_penalty,
     )
     final_fragility = compute_final_fragility(
         raw_fragility=raw_fragility,
-        correlation_multiplier=correlation_result.correlation_multiplier,
+        correlation_multiplier=correlation_multiplier,
     )
 
     # Step 5: Build ParlayState
-    metrics = ParlayMetrics(
+    # (trusted: derived from validated blocks by the canonical formulas)
+    metrics = ParlayMetrics._trusted(
         raw_fragility=raw_fragility,
         leg_penalty=leg_penalty,
-        correlation_penalty=correlation_result.correlation_penalty,
-        correlation_multiplier=correlation_result.correlation_multiplier,
+        correlation_penalty=correlation_penalty,
+        correlation_multiplier=correlation_multiplier,
         final_fragility=final_fragility,
     )
 
-    return ParlayState(
+    return ParlayState._trusted(
         parlay_id=parlay_id,
-        blocks=tuple(blocks),
+        blocks=blocks,
         metrics=metrics,
-        correlations=correlation_result.correlations,
+        correlations=correlations,
         dna_enforcement=_empty_dna_enforcement(),
     )
 
 
 def add_block(parlay_state: ParlayState, block: BetBlock) -> ParlayState:
     """
-    Add a block to the parlay and recompute all derived fields.
+    Add a block to the parlay and update all derived fields.
 
     Returns a new ParlayState with the block added.
     The original ParlayState is not modified (immutable update).
 
+    Only the pairs (existing block, new block) are checked for correlations;
+    the result equals build_parlay_state(blocks + [block]).
+
     Args:
         parlay_state: Current parlay state
         block: Block to add
@@ -133,17 +175,58 @@ def add_block(parlay_state: ParlayState, block: BetBlock) -> ParlayState:
     Returns:
         New ParlayState with block added and all fields recomputed
     """
-    new_blocks = list(parlay_state.blocks) + [block]
-    return build_parlay_state(new_blocks, parlay_id=parlay_state.parlay_id)
+    blocks = parlay_state.blocks
+    index = _block_index(blocks)
+    if index is None or block.block_id in index:
+        # Duplicate ids make the pair table ambiguous; rebuild instead
+        return build_parlay_state(blocks + (block,), parlay_id=parlay_state.parlay_id)
+
+    # Existing pairs grouped by their first block, in compute_correlations order
+    rows: List[List[Correlation]] = [[] for _ in blocks]
+    for corr in parlay_state.correlations:
+        row = index.get(corr.block_a)
+        if row is None:
+            return build_parlay_state(blocks + (block,), parlay_id=parlay_state.parlay_id)
+        rows[row].append(corr)
+
+    # New pairs (i, new) sort after every existing (i, j) in row i
+    correlation_penalty = parlay_state.metrics.correlation_penalty
+    for i, existing in enumerate(blocks):
+        highest = highest_pair_correlation(existing, block)
+        if highest:
+            corr_type, penalty = highest
+            rows[i].append(
+                Correlation._trusted(
+                    block_a=existing.block_id,
+                    block_b=block.block_id,
+                    type=corr_type,
+                    penalty=float(penalty),
+                )
+            )
+            correlation_penalty += penalty
+
+    new_state = _assemble_state(
+        blocks=blocks + (block,),
+        parlay_id=parlay_state.parlay_id,
+        correlations=tuple(corr for row in rows for corr in row),
+        correlation_penalty=correlation_penalty,
+    )
+    if VERIFY_INCREMENTAL:
+        _verify(new_state)
+    return new_state
 
 
 def remove_block(parlay_state: ParlayState, block_id: UUID) -> ParlayState:
     """
-    Remove a block from the parlay and recompute all derived fields.
+    Remove a block from the parlay and update all derived fields.
 
     Returns a new ParlayState with the block removed.
     The original ParlayState is not modified (immutable update).
 
+    The removed block's pairs are dropped and their penalties subtracted;
+    no pair is re-checked. The result equals build_parlay_state on the
+    remaining blocks.
+
     Args:
         parlay_state: Current parlay state
         block_id: UUID of block to remove
@@ -154,12 +237,48 @@ def remove_block(parlay_state: ParlayState, block_id: UUID) -> ParlayState:
     Raises:
         ValueError: If block_id not found in parlay
     """
-    new_blocks = [b for b in parlay_state.blocks if b.block_id != block_id]
+    new_blocks = tuple(b for b in parlay_state.blocks if b.block_id != block_id)
 
     if len(new_blocks) == len(parlay_state.blocks):
         raise ValueError(f"Block with id {block_id} not found in parlay")
 
-    return build_parlay_state(new_blocks, parlay_id=parlay_state.parlay_id)
+    if not new_blocks or _block_index(parlay_state.blocks) is None:
+        return build_parlay_state(new_blocks, parlay_id=parlay_state.parlay_id)
+
+    correlations = []
+    correlation_penalty = parlay_state.metrics.correlation_penalty
+    for corr in parlay_state.correlations:
+        if corr.block_a == block_id or corr.block_b == block_id:
+            correlation_penalty -= corr.penalty
+        else:
+            correlations.append(corr)
+
+    new_state = _assemble_state(
+        blocks=new_blocks,
+        parlay_id=parlay_state.parlay_id,
+        correlations=tuple(correlations),
+        correlation_penalty=correlation_penalty,
+    )
+    if VERIFY_INCREMENTAL:
+        _verify(new_state)
+    return new_state
+
+
+def _block_index(blocks: Sequence[BetBlock]) -> Dict[UUID, int] | None:
+    """Map block_id to position, or None if ids are not unique."""
+    index = {block.block_id: i for i, block in enumerate(blocks)}
+    return index if len(index) == len(blocks) else None
+
+
+def _verify(state: ParlayState) -> None:
+    """Raise AssertionError if `state` differs from a from-scratch rebuild."""
+    expected = build_parlay_state(state.blocks, parlay_id=state.parlay_id)
+    if state != expected:
+        raise AssertionError(
+            "Incremental ParlayState diverged from build_parlay_state: "
+            f"{state.metrics} / {len(state.correlations)} correlations vs "
+            f"{expected.metrics} / {len(expected.correlations)} correlations"
+        )
 
 
 def _empty_dna_enforcement() -> DNAEnforcement:
@@ -169,7 +288,7 @@ def _empty_dna_enforcement() -> DNAEnforcement:
     DNA enforcement is computed in TASK 6, but we need a structurally
     valid placeholder here.
     """
-    return DNAEnforcement(
+    return DNAEnforcement._trusted(
         max_legs=10,  # Default max
         fragility_tolerance=100.0,  # Default tolerance
         stake_cap=0.0,  # No stake cap by default
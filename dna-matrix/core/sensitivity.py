@@ -0,0 +1,148 @@
+# core/sensitivity.py
+"""
+Sensitivity Engine - Leave-one-out profile of a parlay.
+
+For every leg, what the parlay would look like without it:
+finalFragility, correlationPenalty and risk inductor.
+
+Computed from the ParlayState already built, in one pass:
+- Each leg's share of correlationPenalty is its row of the pairwise
+  penalty table (the state's correlations); no pair is re-checked
+- sumBlocks without a leg is re-summed over the remaining legs, so every
+  result equals build_parlay_state on them exactly
+
+O(n²) in total, versus n full evaluations.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from core.correlation_engine import compute_correlation_multiplier
+from core.fragility_engine import (
+    compute_final_fragility,
+    compute_leg_penalty,
+    compute_raw_fragility,
+    compute_sum_blocks,
+)
+from core.models.leading_light import ParlayState
+from core.parlay_reducer import build_parlay_state
+from core.risk_inductor import RiskInductor, resolve_inductor_from_metrics
+
+# =============================================================================
+# Result Type
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class LegSensitivity:
+    """
+    The parlay without one leg.
+
+    Attributes:
+        block_id: The leg left out
+        final_fragility: finalFragility of the remaining legs
+        delta_fragility: final_fragility minus the full parlay's
+            (negative = removing the leg lowers fragility)
+        correlation_penalty: correlationPenalty of the remaining legs
+        inductor: Risk inductor of the remaining legs
+    """
+    block_id: UUID
+    final_fragility: float
+    delta_fragility: float
+    correlation_penalty: float
+    inductor: RiskInductor
+
+
+# =============================================================================
+# Main Function
+# =============================================================================
+
+
+def compute_leave_one_out(
+    parlay_state: ParlayState,
+    dna_violations: Optional[tuple[str, ...]] = None,
+) -> Tuple[LegSensitivity, ...]:
+    """
+    Compute the leave-one-out profile of a parlay.
+
+    Args:
+        parlay_state: The parlay state with computed metrics
+        dna_violations: Optional DNA violations (they can escalate the
+            inductor to CRITICAL, as in resolve_inductor)
+
+    Returns:
+        One LegSensitivity per leg, in block order
+    """
+    blocks = parlay_state.blocks
+    current = parlay_state.metrics.final_fragility
+    index = {block.block_id: i for i, block in enumerate(blocks)}
+
+    if len(index) != len(blocks):
+        # Duplicate ids: correlations cannot be attributed to a position
+        return tuple(
+            _from_state(
+                blocks[i].block_id,
+                build_parlay_state(blocks[:i] + blocks[i + 1:]),
+                current,
+                dna_violations,
+            )
+            for i in range(len(blocks))
+        )
+
+    # Row sums of the pairwise penalty table
+    leg_penalty_share = [0.0] * len(blocks)
+    for correlation in parlay_state.correlations:
+        leg_penalty_share[index[correlation.block_a]] += correlation.penalty
+        leg_penalty_share[index[correlation.block_b]] += correlation.penalty
+
+    legs = len(blocks) - 1
+    leg_penalty = compute_leg_penalty(legs) if legs > 0 else 0.0
+
+    profile: List[LegSensitivity] = []
+    for i, block in enumerate(blocks):
+        # Re-summed (O(n)) rather than subtracted, so floats match exactly
+        sum_blocks = compute_sum_blocks(blocks[:i] + blocks[i + 1:])
+        correlation_penalty = parlay_state.metrics.correlation_penalty - leg_penalty_share[i]
+        if legs > 0:
+            final_fragility = compute_final_fragility(
+                raw_fragility=compute_raw_fragility(
+                    sum_blocks=sum_blocks,
+                    leg_penalty=leg_penalty,
+                    correlation_penalty=correlation_penalty,
+                ),
+                correlation_multiplier=compute_correlation_multiplier(correlation_penalty),
+            )
+        else:
+            final_fragility = 0.0
+
+        profile.append(LegSensitivity(
+            block_id=block.block_id,
+            final_fragility=final_fragility,
+            delta_fragility=final_fragility - current,
+            correlation_penalty=correlation_penalty,
+            inductor=resolve_inductor_from_metrics(
+                final_fragility, legs, correlation_penalty, dna_violations
+            ).inductor,
+        ))
+
+    return tuple(profile)
+
+
+def _from_state(
+    block_id: UUID,
+    state: ParlayState,
+    current: float,
+    dna_violations: Optional[tuple[str, ...]],
+) -> LegSensitivity:
+    metrics = state.metrics
+    return LegSensitivity(
+        block_id=block_id,
+        final_fragility=metrics.final_fragility,
+        delta_fragility=metrics.final_fragility - current,
+        correlation_penalty=metrics.correlation_penalty,
+        inductor=resolve_inductor_from_metrics(
+            metrics.final_fragility, len(state.blocks), metrics.correlation_penalty, dna_violations
+        ).inductor,
+    )
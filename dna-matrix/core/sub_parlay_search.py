@@ -0,0 +1,329 @@
+# core/sub_parlay_search.py
+"""
+Sub-Parlay Search - Largest leg subsets under a fragility budget.
+
+Given a parlay's legs (and optional candidate legs), finds the subsets
+that keep the most legs while finalFragility stays at or under a target
+(an explicit maximum and/or the DNA fragility tolerance).
+
+Branch-and-bound over the canonical fragility formulas:
+- Adding a leg never lowers rawFragility: effectiveFragility >= 0, the leg
+  penalty 8 × legs^1.5 grows with legs, and pair penalties are >= 0
+- The correlation multiplier never drops as the penalty grows
+So a subset over budget has no feasible superset, and the cheapest
+remaining legs (with no added correlation) bound how many more legs a
+branch can still take.
+
+Deterministic for the same inputs, unless the time budget cuts the
+search short (complete=False).
+"""
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from core.correlation_engine import compute_correlation_multiplier, highest_pair_correlation
+from core.dna_enforcement import DNAProfile
+from core.fragility_engine import (
+    compute_final_fragility,
+    compute_leg_penalty,
+    compute_raw_fragility,
+)
+from core.models.leading_light import BetBlock, BetType
+from core.parlay_reducer import build_parlay_state
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_TOP_K = 5
+DEFAULT_TIME_BUDGET_MS = 250
+
+# Nodes explored between time-budget checks
+_CLOCK_INTERVAL = 512
+
+
+# =============================================================================
+# Result Types
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class SubParlay:
+    """
+    One feasible subset.
+
+    Attributes:
+        block_ids: Legs of the subset, in input order (blocks, then candidates)
+        legs: Number of legs
+        final_fragility: finalFragility of the subset (via build_parlay_state)
+        correlation_penalty: correlationPenalty of the subset
+        removed_block_ids: Original legs left out
+        added_block_ids: Candidate legs brought in
+    """
+    block_ids: Tuple[UUID, ...]
+    legs: int
+    final_fragility: float
+    correlation_penalty: float
+    removed_block_ids: Tuple[UUID, ...]
+    added_block_ids: Tuple[UUID, ...]
+
+
+@dataclass(frozen=True)
+class SubParlaySearchResult:
+    """
+    Result of a sub-parlay search.
+
+    Attributes:
+        subsets: Best subsets, most legs first, then lowest fragility
+        target_fragility: Budget the subsets were held to
+        complete: False if the time budget ran out before the search did
+        nodes_explored: Search nodes visited
+    """
+    subsets: Tuple[SubParlay, ...]
+    target_fragility: float
+    complete: bool
+    nodes_explored: int
+
+
+class _BudgetExceeded(Exception):
+    """Internal: unwinds the search when the time budget runs out."""
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def resolve_target(
+    max_fragility: Optional[float],
+    dna_profile: Optional[DNAProfile],
+) -> float:
+    """
+    Fragility budget: the tighter of max_fragility and the DNA tolerance.
+
+    Raises:
+        ValueError: If neither is given
+    """
+    targets = []
+    if max_fragility is not None:
+        targets.append(float(max_fragility))
+    if dna_profile is not None:
+        targets.append(float(dna_profile.risk.tolerance))
+    if not targets:
+        raise ValueError("max_fragility or dna_profile is required")
+    return min(targets)
+
+
+def _pair_penalties(items: Sequence[BetBlock], deadline: float) -> List[List[int]]:
+    """
+    Symmetric table of the highest pair penalty between every two items.
+
+    O(n^2) pair checks, so it is charged to the search time budget.
+
+    Raises:
+        _BudgetExceeded: If the deadline passes before the table is built
+    """
+    n = len(items)
+    table = [[0] * n for _ in range(n)]
+    for i in range(n):
+        if time.perf_counter() > deadline:
+            raise _BudgetExceeded
+        for j in range(i + 1, n):
+            highest = highest_pair_correlation(items[i], items[j])
+            if highest:
+                table[i][j] = table[j][i] = highest[1]
+    return table
+
+
+def _final_fragility(sum_blocks: float, legs: int, correlation_penalty: float) -> float:
+    raw_fragility = compute_raw_fragility(
+        sum_blocks=sum_blocks,
+        leg_penalty=compute_leg_penalty(legs),
+        correlation_penalty=correlation_penalty,
+    )
+    return compute_final_fragility(
+        raw_fragility=raw_fragility,
+        correlation_multiplier=compute_correlation_multiplier(correlation_penalty),
+    )
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+
+def search_sub_parlays(
+    blocks: Sequence[BetBlock],
+    candidates: Sequence[BetBlock] = (),
+    max_fragility: Optional[float] = None,
+    dna_profile: Optional[DNAProfile] = None,
+    top_k: int = DEFAULT_TOP_K,
+    time_budget_ms: float = DEFAULT_TIME_BUDGET_MS,
+) -> SubParlaySearchResult:
+    """
+    Find the top_k subsets of blocks + candidates under the fragility budget.
+
+    Subsets are ranked by most legs, then lowest finalFragility, then input
+    order. With a DNA profile the subsets also respect max_parlay_legs, and
+    player props are left out when avoid_props is set.
+
+    Args:
+        blocks: The parlay's legs
+        candidates: Optional extra legs the subsets may include
+        max_fragility: Optional finalFragility budget (0-100)
+        dna_profile: Optional DNA profile (fragility tolerance, max legs)
+        top_k: Number of subsets to return
+        time_budget_ms: Search time limit; the best subsets found so far
+            are returned when it runs out
+
+    Returns:
+        SubParlaySearchResult with the best subsets found
+
+    Raises:
+        ValueError: If no budget is given, top_k < 1, or a leg has negative
+            effective fragility (the bounds need it >= 0)
+    """
+    target = resolve_target(max_fragility, dna_profile)
+    if top_k < 1:
+        raise ValueError(f"top_k must be >= 1, got {top_k}")
+
+    pool = list(blocks) + list(candidates)
+    is_candidate = [False] * len(blocks) + [True] * len(candidates)
+    for block in pool:
+        if block.effective_fragility < 0:
+            raise ValueError(
+                f"Block {block.block_id} has negative effective fragility; "
+                "sub-parlay search requires effective_fragility >= 0"
+            )
+
+    max_legs = len(pool)
+    if dna_profile is not None:
+        max_legs = min(max_legs, dna_profile.risk.max_parlay_legs)
+        if dna_profile.risk.avoid_props:
+            keep = [i for i, block in enumerate(pool) if block.bet_type != BetType.PLAYER_PROP]
+            pool = [pool[i] for i in keep]
+            is_candidate = [is_candidate[i] for i in keep]
+
+    # Search in ascending effective fragility so the cheapest remaining legs
+    # are always a suffix-prefix (for the bound) and good subsets come early
+    order = sorted(range(len(pool)), key=lambda i: pool[i].effective_fragility)
+    items = [pool[i] for i in order]
+    fragility = [block.effective_fragility for block in items]
+    prefix = [0.0]
+    for value in fragility:
+        prefix.append(prefix[-1] + value)
+    n = len(items)
+    deadline = time.perf_counter() + time_budget_ms / 1000.0
+    try:
+        penalties = _pair_penalties(items, deadline)
+    except _BudgetExceeded:
+        return SubParlaySearchResult(
+            subsets=(), target_fragility=target, complete=False, nodes_explored=0
+        )
+
+    # Min-heap of the kept subsets; the root is the worst one
+    # Key: (legs, -final_fragility, reversed input positions)
+    kept: List[Tuple[int, float, Tuple[int, ...], Tuple[int, ...]]] = []
+    nodes = 0
+
+    def offer(chosen: List[int], final_fragility: float) -> None:
+        positions = tuple(sorted(order[c] for c in chosen))
+        entry = (len(chosen), -final_fragility, tuple(-p for p in positions), positions)
+        if len(kept) < top_k:
+            heapq.heappush(kept, entry)
+        elif entry > kept[0]:
+            heapq.heapreplace(kept, entry)
+
+    def can_beat_worst(legs: int, final_fragility: float) -> bool:
+        if len(kept) < top_k:
+            return True
+        worst_legs, worst_negative_fragility = kept[0][0], kept[0][1]
+        if legs != worst_legs:
+            return legs > worst_legs
+        # Equal legs: ties on fragility are decided by input order, so keep them
+        return final_fragility <= -worst_negative_fragility
+
+    def extend(start: int, chosen: List[int], sum_blocks: float, correlation_penalty: float) -> None:
+        nonlocal nodes
+        nodes += 1
+        if nodes % _CLOCK_INTERVAL == 0 and time.perf_counter() > deadline:
+            raise _BudgetExceeded
+
+        legs = len(chosen)
+        multiplier = compute_correlation_multiplier(correlation_penalty)
+
+        # Bound: take the m cheapest remaining legs with no new correlation
+        best_legs, best_fragility = legs, None
+        for m in range(1, min(n - start, max_legs - legs) + 1):
+            lower = compute_final_fragility(
+                raw_fragility=compute_raw_fragility(
+                    sum_blocks=sum_blocks + prefix[start + m] - prefix[start],
+                    leg_penalty=compute_leg_penalty(legs + m),
+                    correlation_penalty=correlation_penalty,
+                ),
+                correlation_multiplier=multiplier,
+            )
+            if lower > target:
+                break
+            best_legs, best_fragility = legs + m, lower
+        if best_fragility is None or not can_beat_worst(best_legs, best_fragility):
+            return
+
+        leg_penalty = compute_leg_penalty(legs + 1)
+        for j in range(start, n):
+            # Every later leg is at least as fragile: nothing further fits
+            floor = (sum_blocks + fragility[j] + leg_penalty + correlation_penalty) * multiplier
+            if min(floor, 100.0) > target:
+                break
+
+            added = 0
+            for c in chosen:
+                added += penalties[c][j]
+            new_penalty = correlation_penalty + added
+            new_sum = sum_blocks + fragility[j]
+            final_fragility = _final_fragility(new_sum, legs + 1, new_penalty)
+            if final_fragility > target:
+                continue
+
+            chosen.append(j)
+            offer(chosen, final_fragility)
+            if legs + 1 < max_legs:
+                extend(j + 1, chosen, new_sum, new_penalty)
+            chosen.pop()
+
+    complete = True
+    try:
+        extend(0, [], 0.0, 0.0)
+    except _BudgetExceeded:
+        complete = False
+
+    # Report exact reducer metrics for the winners, in rank order
+    original_ids = [block.block_id for block in blocks]
+    subsets: List[SubParlay] = []
+    for _, _, _, positions in sorted(kept, reverse=True):
+        chosen_blocks = [pool[p] for p in positions]
+        state = build_parlay_state(chosen_blocks)
+        if state.metrics.final_fragility > target:
+            continue
+        chosen_ids = {block.block_id for block in chosen_blocks}
+        subsets.append(SubParlay(
+            block_ids=tuple(block.block_id for block in chosen_blocks),
+            legs=len(chosen_blocks),
+            final_fragility=state.metrics.final_fragility,
+            correlation_penalty=state.metrics.correlation_penalty,
+            removed_block_ids=tuple(bid for bid in original_ids if bid not in chosen_ids),
+            added_block_ids=tuple(
+                pool[p].block_id for p in positions if is_candidate[p]
+            ),
+        ))
+
+    return SubParlaySearchResult(
+        subsets=tuple(subsets),
+        target_fragility=target,
+        complete=complete,
+        nodes_explored=nodes,
+    )
@@ -6,7 +6,8 @@ Given a current ParlayState and candidate BetBlocks, produces a ranked list
 of SuggestedBlock outputs based on added risk.
 
 This engine:
-- Simulates adding each candidate using build_parlay_state
+- Simulates adding each candidate with the build_parlay_state formulas,
+  checking only the candidate's pairs against the current blocks
 - Computes deltaFragility and addedCorrelation
 - Ranks by lowest added risk
 - Assigns labels based on risk thresholds
@@ -16,16 +17,27 @@ No outcome prediction. No external data. Pure simulation.
 """
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List, Optional, Sequence
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
+from core import correlation_matrix
+from core.correlation_engine import (
+    compute_correlation_multiplier,
+    highest_pair_correlation,
+)
+from core.fragility_engine import (
+    compute_final_fragility,
+    compute_leg_penalty,
+    compute_raw_fragility,
+    compute_sum_blocks,
+)
 from core.models.leading_light import (
     BetBlock,
     ParlayState,
     SuggestedBlock,
     SuggestedBlockLabel,
 )
-from core.parlay_reducer import build_parlay_state
 
 if TYPE_CHECKING:
     from core.dna_enforcement import DNAProfile
@@ -59,6 +71,29 @@ class CandidateEvaluation:
     reason: str
 
 
+@dataclass(frozen=True)
+class ParlayBase:
+    """
+    Per-parlay terms shared by every candidate simulation.
+
+    Taken from the parlay's metrics (computed by build_parlay_state), so a
+    candidate only adds its own pairs and fragility.
+    """
+    blocks: Tuple[BetBlock, ...]
+    sum_blocks: float
+    correlation_penalty: float
+    next_leg_penalty: float
+
+    @classmethod
+    def from_parlay(cls, parlay: ParlayState) -> "ParlayBase":
+        return cls(
+            blocks=parlay.blocks,
+            sum_blocks=compute_sum_blocks(parlay.blocks),
+            correlation_penalty=parlay.metrics.correlation_penalty,
+            next_leg_penalty=compute_leg_penalty(len(parlay.blocks) + 1),
+        )
+
+
 # =============================================================================
 # Label Assignment
 # =============================================================================
@@ -153,30 +188,57 @@ def check_dna_compatible_with_profile(
 # =============================================================================
 
 
-def evaluate_candidate(
-    current_parlay: ParlayState,
+def simulate_add(
+    base: ParlayBase,
     candidate: BetBlock,
-    max_legs: int = DEFAULT_MAX_LEGS,
-    dna_profile: Optional["DNAProfile"] = None,
-) -> CandidateEvaluation | None:
+    pair_penalty: Optional[int] = None,
+) -> Tuple[float, float]:
     """
-    Evaluate a single candidate block.
+    Metrics of the parlay with `candidate` appended, without building it.
 
-    Returns None if deltaFragility <= 0 (should not happen, but enforced).
+    Checks only the n pairs (existing block, candidate), unless their
+    summed penalty is passed in as pair_penalty. Penalties are whole
+    numbers, so adding them to the base total gives the same
+    correlationPenalty as build_parlay_state's pair-order sum.
 
-    Args:
-        current_parlay: Current parlay state
-        candidate: Candidate block to evaluate
-        max_legs: Maximum legs allowed (used if no dna_profile)
-        dna_profile: Optional DNA profile for full compatibility check
+    Returns:
+        (final_fragility, correlation_penalty) of current blocks + candidate
     """
-    # Build new parlay state with candidate added
-    new_blocks = list(current_parlay.blocks) + [candidate]
-    new_parlay = build_parlay_state(new_blocks, parlay_id=current_parlay.parlay_id)
+    correlation_penalty = base.correlation_penalty
+    if pair_penalty is not None:
+        correlation_penalty += pair_penalty
+    else:
+        for block in base.blocks:
+            highest = highest_pair_correlation(block, candidate)
+            if highest:
+                correlation_penalty += highest[1]
+
+    raw_fragility = compute_raw_fragility(
+        sum_blocks=base.sum_blocks + candidate.effective_fragility,
+        leg_penalty=base.next_leg_penalty,
+        correlation_penalty=correlation_penalty,
+    )
+    final_fragility = compute_final_fragility(
+        raw_fragility=raw_fragility,
+        correlation_multiplier=compute_correlation_multiplier(correlation_penalty),
+    )
+    return final_fragility, correlation_penalty
+
+
+def _score_candidate(
+    current_parlay: ParlayState,
+    base: ParlayBase,
+    candidate: BetBlock,
+    max_legs: int,
+    dna_profile: Optional["DNAProfile"],
+    pair_penalty: Optional[int] = None,
+) -> Tuple[float, float, bool] | None:
+    """(deltaFragility, addedCorrelation, dnaCompatible), or None if delta <= 0."""
+    final_fragility, correlation_penalty = simulate_add(base, candidate, pair_penalty)
 
     # Compute deltas
-    delta_fragility = new_parlay.metrics.final_fragility - current_parlay.metrics.final_fragility
-    added_correlation = new_parlay.metrics.correlation_penalty - current_parlay.metrics.correlation_penalty
+    delta_fragility = final_fragility - current_parlay.metrics.final_fragility
+    added_correlation = correlation_penalty - current_parlay.metrics.correlation_penalty
 
     # Enforce deltaFragility > 0 (adding a leg always increases risk)
     if delta_fragility <= 0:
@@ -192,24 +254,56 @@ def evaluate_candidate(
         )
     else:
         # Simple check (max legs only)
-        dna_compatible = check_dna_compatible_simple(new_parlay, max_legs)
+        dna_compatible = len(current_parlay.blocks) + 1 <= max_legs
 
-    # Assign label
-    label = assign_label(delta_fragility)
+    return delta_fragility, added_correlation, dna_compatible
 
-    # Generate reason
-    reason = generate_reason(delta_fragility, added_correlation, dna_compatible, label)
 
+def _build_evaluation(
+    candidate: BetBlock,
+    delta_fragility: float,
+    added_correlation: float,
+    dna_compatible: bool,
+) -> CandidateEvaluation:
+    label = assign_label(delta_fragility)
     return CandidateEvaluation(
         block=candidate,
         delta_fragility=delta_fragility,
         added_correlation=added_correlation,
         dna_compatible=dna_compatible,
         label=label,
-        reason=reason,
+        reason=generate_reason(delta_fragility, added_correlation, dna_compatible, label),
     )
 
 
+def evaluate_candidate(
+    current_parlay: ParlayState,
+    candidate: BetBlock,
+    max_legs: int = DEFAULT_MAX_LEGS,
+    dna_profile: Optional["DNAProfile"] = None,
+    base: Optional[ParlayBase] = None,
+) -> CandidateEvaluation | None:
+    """
+    Evaluate a single candidate block.
+
+    Returns None if deltaFragility <= 0 (should not happen, but enforced).
+
+    Args:
+        current_parlay: Current parlay state
+        candidate: Candidate block to evaluate
+        max_legs: Maximum legs allowed (used if no dna_profile)
+        dna_profile: Optional DNA profile for full compatibility check
+        base: ParlayBase of current_parlay, when evaluating many candidates
+    """
+    if base is None:
+        base = ParlayBase.from_parlay(current_parlay)
+
+    score = _score_candidate(current_parlay, base, candidate, max_legs, dna_profile)
+    if score is None:
+        return None
+    return _build_evaluation(candidate, *score)
+
+
 # =============================================================================
 # Ranking
 # =============================================================================
@@ -226,11 +320,19 @@ def rank_candidates(evaluations: List[CandidateEvaluation]) -> List[CandidateEva
     """
     return sorted(
         evaluations,
-        key=lambda e: (
-            e.delta_fragility,           # Primary: lowest delta
-            e.added_correlation,          # Secondary: lowest correlation
-            not e.dna_compatible,         # Tertiary: True (0) before False (1)
-        )
+        key=lambda e: _rank_key(e.delta_fragility, e.added_correlation, e.dna_compatible),
+    )
+
+
+def _rank_key(
+    delta_fragility: float,
+    added_correlation: float,
+    dna_compatible: bool,
+) -> Tuple[float, float, bool]:
+    return (
+        delta_fragility,           # Primary: lowest delta
+        added_correlation,          # Secondary: lowest correlation
+        not dna_compatible,         # Tertiary: True (0) before False (1)
     )
 
 
@@ -250,7 +352,7 @@ def compute_suggestions(
     Compute ranked suggestions for adding blocks to a parlay.
 
     For each candidate:
-    - Simulates adding it using build_parlay_state
+    - Simulates adding it (only its n new pairs are checked)
     - Computes deltaFragility and addedCorrelation
     - Assigns label and generates reason
     - Ranks by lowest added risk
@@ -266,19 +368,35 @@ def compute_suggestions(
     Returns:
         List of SuggestedBlock objects, ranked by preference
     """
-    # Evaluate all candidates
-    evaluations: List[CandidateEvaluation] = []
-    for candidate in candidates:
-        eval_result = evaluate_candidate(current_parlay, candidate, max_legs, dna_profile)
-        if eval_result is not None:
-            evaluations.append(eval_result)
+    base = ParlayBase.from_parlay(current_parlay)
+
+    # Large sweeps get every candidate's pair penalties from one array pass
+    pair_penalties: List[Optional[int]] = [None] * len(candidates)
+    if (
+        correlation_matrix.NUMPY_AVAILABLE
+        and len(base.blocks) * len(candidates) >= correlation_matrix.VECTORIZE_MIN_PAIRS
+    ):
+        pair_penalties = correlation_matrix.candidate_penalties(base.blocks, candidates)
+
+    # Score all candidates; labels and reasons are only built for the winners
+    scored: List[Tuple[BetBlock, Tuple[float, float, bool]]] = []
+    for candidate, pair_penalty in zip(candidates, pair_penalties, strict=True):
+        score = _score_candidate(
+            current_parlay, base, candidate, max_legs, dna_profile, pair_penalty
+        )
+        if score is not None:
+            scored.append((candidate, score))
 
-    # Rank candidates
-    ranked = rank_candidates(evaluations)
+    # Keep the best max_suggestions (same order and ties as a full stable sort)
+    if max_suggestions >= 0:
+        top = heapq.nsmallest(max_suggestions, scored, key=lambda item: _rank_key(*item[1]))
+    else:
+        top = sorted(scored, key=lambda item: _rank_key(*item[1]))[:max_suggestions]
 
-    # Convert to SuggestedBlock and limit to max_suggestions
+    # Convert to SuggestedBlock
     suggestions: List[SuggestedBlock] = []
-    for eval_result in ranked[:max_suggestions]:
+    for candidate, score in top:
+        eval_result = _build_evaluation(candidate, *score)
         suggestion = SuggestedBlock(
             candidate_block_id=eval_result.block.block_id,
             delta_fragility=eval_result.delta_fragility,
@@ -0,0 +1,146 @@
+# tests/bench/test_bench_core.py
+"""
+Tests for the benchmark harness.
+
+Covers case generation, baseline round-tripping and regression detection;
+the timings themselves are not asserted.
+"""
+import json
+
+import pytest
+from benchmarks.bench_core import (
+    ALLOC_SLACK_BYTES,
+    BASELINE_PATH,
+    BenchCase,
+    BenchResult,
+    build_cases,
+    find_regressions,
+    load_baseline,
+    main,
+    measure,
+    write_baseline,
+)
+from benchmarks.workloads import make_blocks
+from core.correlation_matrix import NUMPY_AVAILABLE
+
+
+def _result(name="case", relative_speed=1.0, peak_alloc_bytes=10_000):
+    return BenchResult(
+        name=name,
+        ops_per_sec=1000.0,
+        relative_speed=relative_speed,
+        peak_alloc_bytes=peak_alloc_bytes,
+        loops=1,
+    )
+
+
+# =============================================================================
+# Cases
+# =============================================================================
+
+
+class TestCases:
+    def test_case_names_unique(self):
+        names = [case.name for case in build_cases()]
+        assert len(names) == len(set(names))
+
+    def test_covers_every_engine(self):
+        names = {case.name.split("[")[0] for case in build_cases()}
+        assert names == {
+            "build_parlay_state",
+            "add_block",
+            "remove_block",
+            "compute_correlations",
+            "compute_suggestions",
+            "apply_context_signals",
+            "apply_dna_enforcement",
+            "resolve_inductor",
+            "evaluate_parlay",
+            "search_sub_parlays",
+            "compute_leave_one_out",
+            "construct",
+        } | ({"evaluate_batch"} if NUMPY_AVAILABLE else set())
+
+    def test_committed_baseline_covers_every_case(self):
+        baseline = load_baseline(BASELINE_PATH)
+        assert {case.name for case in build_cases()} <= set(baseline)
+
+    def test_same_game_density(self):
+        blocks = make_blocks(10, same_game=0.5)
+        assert sum(block.game_id == "game-shared" for block in blocks) == 5
+
+    def test_workloads_deterministic(self):
+        first = make_blocks(5, same_game=0.5, seed=3)
+        second = make_blocks(5, same_game=0.5, seed=3)
+        assert [b.block_id for b in first] == [b.block_id for b in second]
+
+    def test_measure(self):
+        case = BenchCase(name="noop", setup=lambda: (lambda: None))
+        result = measure(case, min_time=0.001, repeats=1)
+        assert result.name == "noop"
+        assert result.ops_per_sec > 0
+        assert result.relative_speed > 0
+
+
+# =============================================================================
+# Baseline
+# =============================================================================
+
+
+class TestBaseline:
+    def test_missing_baseline_is_empty(self, tmp_path):
+        assert load_baseline(tmp_path / "missing.json") == {}
+
+    def test_round_trip_merges(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        write_baseline([_result("a")], path)
+        write_baseline([_result("b", relative_speed=2.0)], path)
+
+        cases = load_baseline(path)
+        assert set(cases) == {"a", "b"}
+        assert cases["b"]["relative_speed"] == 2.0
+        assert json.loads(path.read_text())["version"] == 1
+
+
+# =============================================================================
+# Regressions
+# =============================================================================
+
+
+class TestFindRegressions:
+    @pytest.fixture
+    def baseline(self):
+        return {"case": {"ops_per_sec": 1000.0, "relative_speed": 1.0, "peak_alloc_bytes": 10_000}}
+
+    def test_within_tolerance(self, baseline):
+        assert find_regressions([_result(relative_speed=0.8)], baseline, 0.25) == []
+
+    def test_slower(self, baseline):
+        regressions = find_regressions([_result(relative_speed=0.5)], baseline, 0.25)
+        assert len(regressions) == 1
+        assert "calibrated speed" in regressions[0]
+
+    def test_faster_is_not_regression(self, baseline):
+        assert find_regressions([_result(relative_speed=3.0)], baseline, 0.25) == []
+
+    def test_more_allocation(self, baseline):
+        peak = int(10_000 * 1.25) + ALLOC_SLACK_BYTES + 1
+        regressions = find_regressions([_result(peak_alloc_bytes=peak)], baseline, 0.25)
+        assert len(regressions) == 1
+        assert "peak alloc" in regressions[0]
+
+    def test_tolerance_configurable(self, baseline):
+        assert find_regressions([_result(relative_speed=0.5)], baseline, 0.6) == []
+
+    def test_new_case_ignored(self, baseline):
+        assert find_regressions([_result(name="new", relative_speed=0.01)], baseline) == []
+
+
+class TestMain:
+    def test_update_then_compare(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        args = ["--filter", "resolve_inductor[legs=1,", "--baseline", str(path),
+                "--min-time", "0.001", "--repeats", "1"]
+        assert main(args + ["--update-baseline"]) == 0
+        assert len(load_baseline(path)) == 3
+        assert main(args + ["--tolerance", "100"]) == 0
@@ -4,6 +4,9 @@ Tests for Context Ingestion Adapters.
 
 Tests weather, injury, and trade adapters, plus the apply_context_signals mapper.
 """
+import random
+from unittest.mock import patch
+
 import pytest
 from uuid import uuid4
 
@@ -13,8 +16,11 @@ from core.context_adapters import (
     TradeAdapter,
     apply_context_signals,
     adapt_and_apply_signals,
+    _SignalIndex,
     _compute_role_delta,
     _is_weather_affected_block,
+    _signal_matches_block,
+    _signal_matches_block_by_id,
     WIND_THRESHOLD_MPH,
     WIND_FRAGILITY_DELTA,
     PRECIP_FRAGILITY_DELTA,
@@ -975,3 +981,132 @@ class TestEdgeCases:
         result = apply_context_signals([player_prop_block], [weather_signal])
 
         assert result[0].block_id == original_id
+
+
+# =============================================================================
+# Signal Index Tests
+# =============================================================================
+
+
+def _random_block(rng: random.Random, default_modifiers) -> BetBlock:
+    bet_type = rng.choice(list(BetType))
+    return BetBlock(
+        block_id=uuid4(),
+        sport="NFL",
+        game_id=f"game-{rng.randrange(3)}",
+        bet_type=bet_type,
+        selection=rng.choice(["Over 250.5 passing yards", "Team A -3.5", "Over 1.5 TDs"]),
+        base_fragility=10.0,
+        context_modifiers=default_modifiers,
+        correlation_tags=tuple(rng.sample(["passing", "kicking", "rushing"], rng.randint(0, 2))),
+        effective_fragility=10.0,
+        player_id=rng.choice([None, "player-1", "player-2"]),
+        team_id=rng.choice([None, "team-1", "team-2"]),
+    )
+
+
+def _random_signal(rng: random.Random, i: int) -> tuple[ContextSignal, dict | None]:
+    signal_type = rng.choice(list(ContextSignalType))
+    signal = ContextSignal(
+        context_id=uuid4(),
+        type=signal_type,
+        target=rng.choice(list(ContextTarget)),
+        status=rng.choice(["OUT", "DOUBTFUL", "QUESTIONABLE", "adverse"]),
+        confidence=0.9,
+        impact=ContextImpact(fragility_delta=rng.uniform(0.0, 8.0), confidence_delta=0.0),
+        explanation=f"signal {i}",
+    )
+    metadata = rng.choice([
+        None,
+        {},
+        {"game_id": f"game-{rng.randrange(3)}"},
+        {"player_id": f"player-{rng.randrange(1, 3)}"},
+        {"from_team_id": f"team-{rng.randrange(1, 3)}"},
+        {"player_id": "player-1", "to_team_id": f"team-{rng.randrange(1, 3)}"},
+    ])
+    return signal, metadata
+
+
+class TestSignalIndex:
+    """Indexed matching equals checking every signal against every block."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_pairwise_check(self, seed, default_modifiers):
+        rng = random.Random(seed)
+        blocks = [_random_block(rng, default_modifiers) for _ in range(15)]
+        signals, metadata = zip(*(_random_signal(rng, i) for i in range(40)), strict=True)
+        index = _SignalIndex(signals, metadata)
+
+        for block in blocks:
+            expected = [
+                signal for signal, meta in zip(signals, metadata, strict=True)
+                if _signal_matches_block_by_id(signal, block, meta)
+            ]
+            assert index.matching(block) == expected
+
+    def test_without_metadata_matches_by_type(self, player_prop_block, spread_block):
+        injury_signal = ContextSignal(
+            context_id=uuid4(),
+            type=ContextSignalType.INJURY,
+            target=ContextTarget.PLAYER,
+            status="OUT",
+            confidence=0.95,
+            impact=ContextImpact(fragility_delta=10.0, confidence_delta=-0.1),
+            explanation="Player X is OUT",
+        )
+        index = _SignalIndex([injury_signal], None)
+
+        assert index.matching(player_prop_block) == [injury_signal]
+        assert index.matching(spread_block) == []
+
+    def test_without_metadata_checks_one_signal_per_type_and_target(self, default_modifiers):
+        rng = random.Random(7)
+        blocks = [_random_block(rng, default_modifiers) for _ in range(15)]
+        signals = [_random_signal(rng, i)[0] for i in range(200)]
+        index = _SignalIndex(signals, None)
+        groups = len({(signal.type, signal.target) for signal in signals})
+
+        with patch(
+            "core.context_adapters._signal_matches_block", wraps=_signal_matches_block
+        ) as check:
+            matched = [index.matching(block) for block in blocks]
+
+        assert check.call_count == len(blocks) * groups
+        assert matched == [
+            [signal for signal in signals if _signal_matches_block(signal, block)] for block in blocks
+        ]
+
+    def test_shared_effect_keeps_each_blocks_reason(self, default_modifiers):
+        injured = ContextModifier(applied=True, delta=2.0, reason="Earlier report")
+        blocks = [
+            BetBlock(
+                block_id=uuid4(),
+                sport="NFL",
+                game_id="game-123",
+                bet_type=BetType.PLAYER_PROP,
+                selection="Over 1.5 TDs",
+                base_fragility=10.0,
+                context_modifiers=ContextModifiers(
+                    weather=default_modifiers.weather,
+                    injury=modifier,
+                    trade=default_modifiers.trade,
+                    role=default_modifiers.role,
+                ),
+                correlation_tags=(),
+                effective_fragility=10.0 + modifier.delta,
+                player_id="player-1",
+            )
+            for modifier in (default_modifiers.injury, injured)
+        ]
+        signals = [
+            InjuryAdapter.adapt({"player_id": "player-1", "player_name": "P1", "status": "OUT"}).signals[0],
+            InjuryAdapter.adapt({"player_id": "player-2", "player_name": "P2", "status": "OUT"}).signals[0],
+        ]
+        metadata = [{"player_id": "player-1"}, {"player_id": "player-2"}]
+
+        first, second = apply_context_signals(blocks, signals, metadata)
+
+        assert first.context_modifiers.injury.reason == "P1 is OUT (undisclosed)"
+        assert first.context_modifiers.injury.delta == INJURY_DELTA_OUT
+        assert second.context_modifiers.injury.reason == "Earlier report; P1 is OUT (undisclosed)"
+        assert second.context_modifiers.injury.delta == 2.0 + INJURY_DELTA_OUT
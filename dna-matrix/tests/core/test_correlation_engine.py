@@ -4,6 +4,9 @@ Unit tests for Correlation Engine.
 
 Tests correlation detection, penalty computation, and multiplier thresholds.
 """
+import dataclasses
+import itertools
+
 import pytest
 from uuid import uuid4
 
@@ -27,6 +30,13 @@ from core.correlation_engine import (
     compute_correlation_multiplier,
     compute_correlations,
     CorrelationResult,
+    # Rule table
+    COMPILED_RULES,
+    CORRELATION_RULES,
+    CorrelationRule,
+    LegPattern,
+    compile_rules,
+    highest_pair_correlation,
     # Constants
     PENALTY_SAME_PLAYER_MULTI_PROPS,
     PENALTY_SCRIPT_DEPENDENCY,
@@ -664,3 +674,75 @@ class TestPenaltyValues:
 
     def test_pace_dependency_penalty(self):
         assert PENALTY_PACE_DEPENDENCY == 8
+
+
+# =============================================================================
+# Test Rule Table
+# =============================================================================
+
+
+class TestRuleTable:
+    TAG_CHOICES = [
+        (), ("qb_passing",), ("wr_receiving",), ("td_prop",), ("passing_volume",),
+        ("script_dependency",), ("volume_dependency",), ("pace_dependency",),
+        ("td_dependency",), ("qb_passing", "td_prop"),
+    ]
+
+    def test_compiled_dispatch_matches_detection(self):
+        """highest_pair_correlation == highest of detect_pair_correlations, exhaustively."""
+        legs = [
+            make_block(bet_type, game_id=game_id, player_id=player_id, correlation_tags=list(tags))
+            for bet_type in BetType
+            for tags in self.TAG_CHOICES
+            for game_id in ("game-1", "game-2")
+            for player_id in ("player-1", None)
+        ]
+        for block_a, block_b in itertools.product(legs, repeat=2):
+            expected = get_highest_penalty_correlation(detect_pair_correlations(block_a, block_b))
+            assert highest_pair_correlation(block_a, block_b) == expected
+
+    def test_dispatch_skips_impossible_rules(self):
+        """A spread/spread pair is never tested for same_player_multi_props."""
+        types = {entry.rule.type for entry in COMPILED_RULES.by_bet_types[(BetType.SPREAD, BetType.SPREAD)]}
+        assert TYPE_SAME_PLAYER_MULTI_PROPS not in types
+        assert TYPE_SCRIPT_DEPENDENCY in types  # via its override tag
+
+    def test_dispatch_highest_penalty_first(self):
+        entries = COMPILED_RULES.by_bet_types[(BetType.PLAYER_PROP, BetType.PLAYER_PROP)]
+        penalties = [entry.rule.penalty for entry in entries]
+        assert penalties == sorted(penalties, reverse=True)
+
+    def test_sport_specific_rule(self):
+        """A new rule is a table row; sports limits it to matching legs."""
+        pitcher_rule = CorrelationRule(
+            type="pitcher_strikeout_dependency",
+            penalty=9,
+            side_a=LegPattern(tags=frozenset({"pitcher_strikeouts"})),
+            side_b=LegPattern(bet_types=frozenset({BetType.TOTAL})),
+            sports=frozenset({"MLB"}),
+        )
+        compiled = compile_rules(CORRELATION_RULES + (pitcher_rule,))
+        prop = make_block(BetType.PLAYER_PROP, correlation_tags=["pitcher_strikeouts"])
+        total = make_block(BetType.TOTAL)
+
+        mlb_prop = dataclasses.replace(prop, sport="MLB")
+        mlb_total = dataclasses.replace(total, sport="MLB")
+
+        assert highest_pair_correlation(mlb_prop, mlb_total, compiled) == (
+            "pitcher_strikeout_dependency", 9,
+        )
+        assert highest_pair_correlation(prop, total, compiled) is None
+        assert highest_pair_correlation(mlb_prop, mlb_total) is None  # default table
+
+    def test_too_many_tags(self):
+        rules = [
+            CorrelationRule(
+                type=f"rule_{i}",
+                penalty=1,
+                side_a=LegPattern(tags=frozenset({f"tag_{i}"})),
+                side_b=LegPattern(),
+            )
+            for i in range(63)
+        ]
+        with pytest.raises(ValueError, match="tags"):
+            compile_rules(rules)
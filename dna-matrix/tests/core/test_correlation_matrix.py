@@ -0,0 +1,170 @@
+# tests/core/test_correlation_matrix.py
+"""
+Unit tests for the vectorized Correlation Matrix.
+
+Every result is checked against the per-pair detectors in correlation_engine.
+"""
+import dataclasses
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from core import correlation_matrix
+from core.correlation_engine import (
+    CORRELATION_RULES,
+    CorrelationRule,
+    LegPattern,
+    compile_rules,
+    compute_correlations,
+    detect_pair_correlations,
+    get_highest_penalty_correlation,
+)
+from core.correlation_matrix import (
+    CodeTables,
+    candidate_penalties,
+    compute_correlations_matrix,
+    encode_blocks,
+    pair_type_matrix,
+    pair_types,
+)
+from core.models.leading_light import BetBlock, BetType, ContextModifier, ContextModifiers
+from core.parlay_reducer import build_parlay_state
+from core.suggestion_engine import compute_suggestions
+
+TAGS = [
+    "script_dependency", "volume_dependency", "td_dependency", "pace_dependency",
+    "qb_passing", "wr_receiving", "te_receiving", "td_prop",
+    "passing_volume", "receiving_volume", "unknown_tag",
+]
+
+
+def random_block(rng: random.Random) -> BetBlock:
+    """Random block drawn from a small id space so rules fire often."""
+    return BetBlock.create(
+        sport="NFL",
+        game_id=rng.choice(["game-1", "game-2"]),
+        bet_type=rng.choice(list(BetType)),
+        selection="Test Selection",
+        base_fragility=10.0,
+        context_modifiers=ContextModifiers(
+            weather=ContextModifier(applied=False, delta=0.0),
+            injury=ContextModifier(applied=False, delta=0.0),
+            trade=ContextModifier(applied=False, delta=0.0),
+            role=ContextModifier(applied=False, delta=0.0),
+        ),
+        correlation_tags=rng.sample(TAGS, rng.randint(0, 3)),
+        player_id=rng.choice(["p1", "p2", None]),
+    )
+
+
+def pairwise_penalty(blocks, candidate) -> int:
+    total = 0
+    for block in blocks:
+        highest = get_highest_penalty_correlation(detect_pair_correlations(block, candidate))
+        if highest:
+            total += highest[1]
+    return total
+
+
+@pytest.fixture
+def per_pair_only(monkeypatch):
+    """Force compute_correlations onto the per-pair detectors."""
+    monkeypatch.setattr(correlation_matrix, "NUMPY_AVAILABLE", False)
+
+
+class TestComputeCorrelationsMatrix:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_per_pair(self, seed: int, per_pair_only):
+        rng = random.Random(seed)
+        blocks = [random_block(rng) for _ in range(rng.randint(2, 30))]
+        assert compute_correlations_matrix(blocks) == compute_correlations(blocks)
+
+    def test_dispatch_above_threshold(self, monkeypatch):
+        rng = random.Random(0)
+        blocks = [random_block(rng) for _ in range(correlation_matrix.VECTORIZE_MIN_BLOCKS)]
+        calls = []
+        original = correlation_matrix.compute_correlations_matrix
+
+        def spy(arg):
+            calls.append(len(arg))
+            return original(arg)
+
+        monkeypatch.setattr(correlation_matrix, "compute_correlations_matrix", spy)
+        compute_correlations(blocks)
+        compute_correlations(blocks[:-1])
+
+        assert calls == [len(blocks)]
+
+
+class TestCandidatePenalties:
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_per_pair(self, seed: int):
+        rng = random.Random(seed)
+        blocks = [random_block(rng) for _ in range(rng.randint(1, 10))]
+        candidates = [random_block(rng) for _ in range(50)]
+
+        expected = [pairwise_penalty(blocks, candidate) for candidate in candidates]
+        assert candidate_penalties(blocks, candidates) == expected
+
+    def test_empty_parlay(self):
+        rng = random.Random(0)
+        assert candidate_penalties([], [random_block(rng), random_block(rng)]) == [0, 0]
+
+
+class TestSuggestionSweep:
+    def test_vectorized_sweep_matches_per_pair(self, monkeypatch):
+        rng = random.Random(7)
+        parlay = build_parlay_state([random_block(rng) for _ in range(6)])
+        candidates = [random_block(rng) for _ in range(correlation_matrix.VECTORIZE_MIN_PAIRS)]
+
+        vectorized = compute_suggestions(parlay, candidates, max_suggestions=20)
+        monkeypatch.setattr(correlation_matrix, "NUMPY_AVAILABLE", False)
+        per_pair = compute_suggestions(parlay, candidates, max_suggestions=20)
+
+        assert vectorized == per_pair
+
+
+class TestPairTypes:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_matrix_entries(self, seed: int):
+        rng = random.Random(seed)
+        left = [random_block(rng) for _ in range(15)]
+        right = [random_block(rng) for _ in range(15)]
+        tables = CodeTables()
+        left_codes, right_codes = encode_blocks(left, tables), encode_blocks(right, tables)
+
+        matrix = pair_type_matrix(left_codes, right_codes, tables)
+        assert pair_types(left_codes, right_codes, tables).tolist() == matrix.diagonal().tolist()
+
+
+class TestCustomRuleTable:
+    def test_sport_specific_rule(self):
+        rule = CorrelationRule(
+            type="pitcher_strikeout_dependency",
+            penalty=9,
+            side_a=LegPattern(tags=frozenset({"pitcher_strikeouts"})),
+            side_b=LegPattern(bet_types=frozenset({BetType.TOTAL})),
+            sports=frozenset({"MLB"}),
+        )
+        compiled = compile_rules(CORRELATION_RULES + (rule,))
+        rng = random.Random(0)
+        prop = dataclasses.replace(
+            random_block(rng), bet_type=BetType.PLAYER_PROP, game_id="g",
+            correlation_tags=("pitcher_strikeouts",),
+        )
+        total = dataclasses.replace(random_block(rng), bet_type=BetType.TOTAL, game_id="g")
+        blocks = [
+            dataclasses.replace(prop, sport="MLB"),
+            dataclasses.replace(total, sport="MLB"),
+            prop,
+            total,
+        ]
+
+        tables = CodeTables()
+        encoded = encode_blocks(blocks, tables, compiled)
+        winner = pair_type_matrix(encoded, encoded, tables, compiled)
+
+        assert winner[0, 1] == len(CORRELATION_RULES)
+        assert winner[2, 3] != len(CORRELATION_RULES)
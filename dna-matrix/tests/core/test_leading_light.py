@@ -728,6 +728,40 @@ class TestSuggestedBlock:
         assert restored.label == original.label
 
 
+# =============================================================================
+# Test Trusted Construction
+# =============================================================================
+
+
+class TestTrustedConstruction:
+    def test_equals_validated_construction(self, sample_bet_block: BetBlock):
+        kwargs = {
+            name: getattr(sample_bet_block, name)
+            for name in BetBlock.__dataclass_fields__
+        }
+        assert BetBlock._trusted(**kwargs) == sample_bet_block
+
+    def test_defaults_applied(self):
+        modifier = ContextModifier._trusted(applied=True, delta=2.0)
+        assert modifier == ContextModifier(applied=True, delta=2.0)
+        assert modifier.reason is None
+
+    def test_skips_validation(self):
+        modifier = ContextModifier._trusted(applied=True, delta=-1.0)
+        assert modifier.delta == -1.0
+
+    def test_result_is_frozen(self):
+        modifier = ContextModifier._trusted(applied=False, delta=0.0)
+        with pytest.raises(AttributeError):
+            modifier.delta = 1.0  # type: ignore
+
+    def test_public_constructors_still_validate(self):
+        with pytest.raises(ValueError, match="delta must be >= 0"):
+            ContextModifier(applied=True, delta=-1.0)
+        with pytest.raises(ValueError, match="delta must be >= 0"):
+            ContextModifier.from_dict({"applied": True, "delta": -1.0})
+
+
 # =============================================================================
 # Test Invariant Enforcement
 # =============================================================================
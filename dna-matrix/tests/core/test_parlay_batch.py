@@ -0,0 +1,101 @@
+# tests/core/test_parlay_batch.py
+"""
+Unit tests for the columnar Parlay Batch evaluator.
+
+Every result is checked bit for bit against evaluate_parlay.
+"""
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from core import parlay_batch
+from core.evaluation import evaluate_parlay
+from core.models.leading_light import BetBlock, BetType, ContextModifier, ContextModifiers
+from core.parlay_batch import ParlayBatch, evaluate_batch
+from core.risk_inductor import RiskInductor
+
+TAGS = [
+    "script_dependency", "volume_dependency", "td_dependency", "pace_dependency",
+    "qb_passing", "wr_receiving", "te_receiving", "td_prop",
+    "passing_volume", "receiving_volume", "unknown_tag",
+]
+
+
+def random_block(rng: random.Random) -> BetBlock:
+    """Random block drawn from a small id space so rules fire often."""
+    return BetBlock.create(
+        sport="NFL",
+        game_id=rng.choice(["game-1", "game-2", "game-3"]),
+        bet_type=rng.choice(list(BetType)),
+        selection="Test Selection",
+        base_fragility=rng.uniform(0.0, 20.0),
+        context_modifiers=ContextModifiers(
+            weather=ContextModifier(applied=False, delta=0.0),
+            injury=ContextModifier(applied=rng.random() < 0.3, delta=rng.choice([0.0, 2.5, 7.0])),
+            trade=ContextModifier(applied=False, delta=0.0),
+            role=ContextModifier(applied=False, delta=0.0),
+        ),
+        correlation_tags=rng.sample(TAGS, rng.randint(0, 3)),
+        player_id=rng.choice(["p1", "p2", None]),
+    )
+
+
+def random_parlays(seed: int, count: int = 200) -> list[list[BetBlock]]:
+    rng = random.Random(seed)
+    return [[random_block(rng) for _ in range(rng.randint(0, 12))] for _ in range(count)]
+
+
+def assert_matches(parlays, result):
+    assert len(result) == len(parlays)
+    for i, blocks in enumerate(parlays):
+        expected = evaluate_parlay(blocks, max_suggestions=0)
+        metrics = expected.metrics
+        assert result.leg_count[i] == len(blocks)
+        assert result.leg_penalty[i] == metrics.leg_penalty
+        assert result.correlation_penalty[i] == metrics.correlation_penalty
+        assert result.correlation_multiplier[i] == metrics.correlation_multiplier
+        assert result.raw_fragility[i] == metrics.raw_fragility
+        assert result.final_fragility[i] == metrics.final_fragility
+        assert result.inductor_at(i) == expected.inductor.level
+
+
+class TestEvaluateBatch:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_evaluate_parlay(self, seed: int):
+        parlays = random_parlays(seed)
+        assert_matches(parlays, evaluate_batch(ParlayBatch.from_blocks(parlays)))
+
+    def test_from_dicts_matches_from_blocks(self):
+        parlays = random_parlays(11)
+        from_blocks = evaluate_batch(ParlayBatch.from_blocks(parlays))
+        from_dicts = evaluate_batch(
+            ParlayBatch.from_dicts([[block.to_dict() for block in blocks] for blocks in parlays])
+        )
+        assert from_dicts.final_fragility.tolist() == from_blocks.final_fragility.tolist()
+        assert from_dicts.inductor.tolist() == from_blocks.inductor.tolist()
+
+    def test_pairs_scored_in_chunks(self, monkeypatch):
+        monkeypatch.setattr(parlay_batch, "PAIR_CHUNK", 7)
+        parlays = random_parlays(3, count=40)
+        assert_matches(parlays, evaluate_batch(ParlayBatch.from_blocks(parlays)))
+
+    def test_empty_batch(self):
+        result = evaluate_batch(ParlayBatch.from_blocks([]))
+        assert len(result) == 0
+
+    def test_empty_parlay(self):
+        result = evaluate_batch(ParlayBatch.from_blocks([[]]))
+        assert result.final_fragility[0] == 0.0
+        assert result.inductor_at(0) == RiskInductor.STABLE
+
+    def test_unknown_bet_type_rejected(self):
+        data = dict(random_block(random.Random(0)).to_dict(), betType="parlay")
+        with pytest.raises(ValueError):
+            ParlayBatch.from_dicts([[data]])
+
+    def test_requires_numpy(self, monkeypatch):
+        monkeypatch.setattr(parlay_batch, "NUMPY_AVAILABLE", False)
+        with pytest.raises(RuntimeError):
+            ParlayBatch.from_blocks([])
@@ -4,6 +4,8 @@ Unit tests for Parlay State Reducer.
 
 Tests the "spine" of the Parlay Builder - deterministic ParlayState construction.
 """
+import random
+
 import pytest
 from uuid import uuid4
 
@@ -14,6 +16,7 @@ from core.models.leading_light import (
     ContextModifiers,
     ParlayState,
 )
+import core.parlay_reducer as parlay_reducer
 from core.parlay_reducer import (
     build_parlay_state,
     add_block,
@@ -132,6 +135,12 @@ class TestBuildParlayState:
 
         assert parlay.parlay_id is not None
 
+    def test_parlay_id_must_be_uuid(self, zero_modifiers: ContextModifiers):
+        """A non-UUID parlay ID is rejected."""
+        block = make_block(modifiers=zero_modifiers)
+        with pytest.raises(TypeError, match="parlay_id must be a UUID"):
+            build_parlay_state([block], parlay_id="not-a-uuid")
+
 
 # =============================================================================
 # REQUIRED TEST VECTORS
@@ -500,3 +509,84 @@ class TestOrderOfOperations:
         # rawFragility should include all three
         assert parlay.metrics.correlation_penalty == 12.0
         assert parlay.metrics.raw_fragility > 40.0 + 12.0  # Includes leg penalty too
+
+
+# =============================================================================
+# Test incremental updates
+# =============================================================================
+
+
+def _random_block(rng: random.Random) -> BetBlock:
+    bet_type = rng.choice(list(BetType))
+    return make_block(
+        bet_type=bet_type,
+        game_id=rng.choice(["game-1", "game-2", "game-3"]),
+        player_id=rng.choice(["p1", "p2", None]) if bet_type == BetType.PLAYER_PROP else None,
+        base_fragility=rng.uniform(0.0, 30.0),
+        correlation_tags=rng.sample(
+            ["qb_passing", "wr_receiving", "td_prop", "script_dependency", "pace_dependency"],
+            rng.randint(0, 2),
+        ),
+    )
+
+
+class TestIncrementalUpdates:
+    @pytest.fixture(autouse=True)
+    def verify(self, monkeypatch):
+        monkeypatch.setattr(parlay_reducer, "VERIFY_INCREMENTAL", True)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_add_remove_matches_rebuild(self, seed: int):
+        """Any sequence of adds and removes equals the from-scratch state."""
+        rng = random.Random(seed)
+        parlay = build_parlay_state([])
+        for _ in range(30):
+            if parlay.blocks and rng.random() < 0.35:
+                parlay = remove_block(parlay, rng.choice(parlay.blocks).block_id)
+            else:
+                parlay = add_block(parlay, _random_block(rng))
+
+            expected = build_parlay_state(parlay.blocks, parlay_id=parlay.parlay_id)
+            assert parlay == expected
+
+    def test_add_interleaves_correlation_order(self, zero_modifiers: ContextModifiers):
+        """New pairs keep compute_correlations' (i, j) order."""
+        a = make_block(player_id="p1", modifiers=zero_modifiers)
+        b = make_block(player_id="p1", modifiers=zero_modifiers)
+        c = make_block(player_id="p1", modifiers=zero_modifiers)
+
+        parlay = add_block(build_parlay_state([a, b]), c)
+
+        pairs = [(corr.block_a, corr.block_b) for corr in parlay.correlations]
+        assert pairs == [
+            (a.block_id, b.block_id),
+            (a.block_id, c.block_id),
+            (b.block_id, c.block_id),
+        ]
+
+    def test_remove_subtracts_penalty(self, zero_modifiers: ContextModifiers):
+        a = make_block(player_id="p1", modifiers=zero_modifiers)
+        b = make_block(player_id="p1", modifiers=zero_modifiers)
+        c = make_block(player_id="p1", modifiers=zero_modifiers)
+        parlay = build_parlay_state([a, b, c])
+        assert parlay.metrics.correlation_penalty == 36.0
+
+        parlay = remove_block(parlay, b.block_id)
+
+        assert parlay.metrics.correlation_penalty == 12.0
+        assert len(parlay.correlations) == 1
+
+    def test_verify_detects_divergence(self, zero_modifiers: ContextModifiers):
+        a = make_block(player_id="p1", modifiers=zero_modifiers)
+        b = make_block(player_id="p1", modifiers=zero_modifiers)
+        parlay = build_parlay_state([a, b])
+        tampered = ParlayState(
+            parlay_id=parlay.parlay_id,
+            blocks=parlay.blocks,
+            metrics=parlay.metrics,
+            correlations=(),
+            dna_enforcement=parlay.dna_enforcement,
+        )
+
+        with pytest.raises(AssertionError, match="diverged"):
+            add_block(tampered, make_block(player_id="p2", modifiers=zero_modifiers))
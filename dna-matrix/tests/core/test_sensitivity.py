@@ -0,0 +1,130 @@
+# tests/core/test_sensitivity.py
+"""
+Unit tests for Sensitivity Engine.
+
+Tests that the leave-one-out profile equals a full evaluation of every
+remaining parlay.
+"""
+import random
+
+import pytest
+
+from core.evaluation import evaluate_parlay
+from core.models.leading_light import (
+    BetBlock,
+    BetType,
+    ContextModifier,
+    ContextModifiers,
+)
+from core.parlay_reducer import build_parlay_state
+from core.risk_inductor import RiskInductor
+from core.sensitivity import compute_leave_one_out
+
+
+def make_block(
+    bet_type: BetType = BetType.SPREAD,
+    game_id: str = "game-1",
+    player_id: str | None = None,
+    base_fragility: float = 10.0,
+    correlation_tags: list[str] | None = None,
+) -> BetBlock:
+    """Helper to create a BetBlock for testing."""
+    return BetBlock.create(
+        sport="NFL",
+        game_id=game_id,
+        bet_type=bet_type,
+        selection="Test Selection",
+        base_fragility=base_fragility,
+        context_modifiers=ContextModifiers(
+            weather=ContextModifier(applied=False, delta=0.0),
+            injury=ContextModifier(applied=False, delta=0.0),
+            trade=ContextModifier(applied=False, delta=0.0),
+            role=ContextModifier(applied=False, delta=0.0),
+        ),
+        correlation_tags=correlation_tags or [],
+        player_id=player_id,
+    )
+
+
+def random_blocks(rng: random.Random, size: int) -> list[BetBlock]:
+    tag_choices = [[], ["passing"], ["receiving"], ["rushing"], ["receiving", "volume"]]
+    blocks = []
+    for _ in range(size):
+        bet_type = rng.choice(list(BetType))
+        is_prop = bet_type == BetType.PLAYER_PROP
+        blocks.append(make_block(
+            bet_type=bet_type,
+            game_id=f"game-{rng.randrange(3)}",
+            player_id=f"player-{rng.randrange(3)}" if is_prop else None,
+            base_fragility=rng.uniform(0.0, 15.0),
+            correlation_tags=rng.choice(tag_choices) if is_prop else [],
+        ))
+    return blocks
+
+
+class TestComputeLeaveOneOut:
+    """Tests for compute_leave_one_out."""
+
+    def test_empty_parlay(self):
+        assert compute_leave_one_out(build_parlay_state([])) == ()
+
+    def test_single_leg(self):
+        block = make_block()
+        profile = compute_leave_one_out(build_parlay_state([block]))
+
+        assert len(profile) == 1
+        assert profile[0].block_id == block.block_id
+        assert profile[0].final_fragility == 0.0
+        assert profile[0].inductor == RiskInductor.STABLE
+
+    def test_correlated_leg_carries_penalty(self):
+        blocks = [
+            make_block(bet_type=BetType.SPREAD),
+            make_block(bet_type=BetType.TOTAL),
+            make_block(game_id="game-2"),
+        ]
+        state = build_parlay_state(blocks)
+        profile = compute_leave_one_out(state)
+
+        assert state.metrics.correlation_penalty > 0
+        assert profile[0].correlation_penalty == 0
+        assert profile[1].correlation_penalty == 0
+        assert profile[2].correlation_penalty == state.metrics.correlation_penalty
+
+    def test_delta_is_relative_to_full_parlay(self):
+        blocks = [make_block(game_id=f"g{i}") for i in range(3)]
+        state = build_parlay_state(blocks)
+        for entry in compute_leave_one_out(state):
+            assert entry.delta_fragility == entry.final_fragility - state.metrics.final_fragility
+            assert entry.delta_fragility < 0
+
+    def test_violations_escalate_inductor(self):
+        blocks = [make_block(game_id=f"g{i}", base_fragility=25.0) for i in range(4)]
+        state = build_parlay_state(blocks)
+
+        plain = compute_leave_one_out(state)
+        escalated = compute_leave_one_out(state, dna_violations=("max_legs_exceeded",))
+        assert plain[0].inductor == RiskInductor.TENSE
+        assert escalated[0].inductor == RiskInductor.CRITICAL
+
+    def test_duplicate_block_ids(self):
+        block = make_block()
+        state = build_parlay_state([block, block, make_block(bet_type=BetType.TOTAL)])
+        profile = compute_leave_one_out(state)
+
+        expected = build_parlay_state([block, state.blocks[2]]).metrics
+        assert profile[0].final_fragility == expected.final_fragility
+        assert profile[0].correlation_penalty == expected.correlation_penalty
+
+    @pytest.mark.parametrize("seed", range(30))
+    def test_matches_full_evaluation(self, seed):
+        rng = random.Random(seed)
+        blocks = random_blocks(rng, rng.randrange(2, 12))
+        profile = compute_leave_one_out(build_parlay_state(blocks))
+
+        for i, entry in enumerate(profile):
+            expected = evaluate_parlay(blocks[:i] + blocks[i + 1:], max_suggestions=0)
+            assert entry.block_id == blocks[i].block_id
+            assert entry.final_fragility == expected.metrics.final_fragility
+            assert entry.correlation_penalty == expected.metrics.correlation_penalty
+            assert entry.inductor == expected.inductor.level
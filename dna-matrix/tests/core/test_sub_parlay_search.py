@@ -0,0 +1,241 @@
+# tests/core/test_sub_parlay_search.py
+"""
+Unit tests for Sub-Parlay Search.
+
+Tests budget resolution, DNA limits, ranking, and agreement with a
+brute-force search over every subset.
+"""
+import random
+from itertools import combinations
+
+import pytest
+
+from core.dna_enforcement import BehaviorProfile, DNAProfile, RiskProfile
+from core.models.leading_light import (
+    BetBlock,
+    BetType,
+    ContextModifier,
+    ContextModifiers,
+)
+from core.parlay_reducer import build_parlay_state
+from core.sub_parlay_search import resolve_target, search_sub_parlays
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def make_block(
+    bet_type: BetType = BetType.SPREAD,
+    game_id: str = "game-1",
+    player_id: str | None = None,
+    base_fragility: float = 10.0,
+    correlation_tags: list[str] | None = None,
+) -> BetBlock:
+    """Helper to create a BetBlock for testing."""
+    return BetBlock.create(
+        sport="NFL",
+        game_id=game_id,
+        bet_type=bet_type,
+        selection="Test Selection",
+        base_fragility=base_fragility,
+        context_modifiers=ContextModifiers(
+            weather=ContextModifier(applied=False, delta=0.0),
+            injury=ContextModifier(applied=False, delta=0.0),
+            trade=ContextModifier(applied=False, delta=0.0),
+            role=ContextModifier(applied=False, delta=0.0),
+        ),
+        correlation_tags=correlation_tags or [],
+        player_id=player_id,
+    )
+
+
+def make_dna(tolerance: float = 50, max_legs: int = 10, avoid_props: bool = False) -> DNAProfile:
+    return DNAProfile(
+        risk=RiskProfile(
+            tolerance=tolerance,
+            max_parlay_legs=max_legs,
+            max_stake_pct=0.10,
+            avoid_live_bets=False,
+            avoid_props=avoid_props,
+        ),
+        behavior=BehaviorProfile(discipline=0.5),
+    )
+
+
+def random_pool(rng: random.Random, size: int) -> list[BetBlock]:
+    """Legs spread over a few games so many pairs correlate."""
+    tag_choices = [[], ["passing"], ["receiving"], ["rushing"], ["receiving", "volume"]]
+    blocks = []
+    for _ in range(size):
+        bet_type = rng.choice(list(BetType))
+        is_prop = bet_type == BetType.PLAYER_PROP
+        blocks.append(make_block(
+            bet_type=bet_type,
+            game_id=f"game-{rng.randrange(3)}",
+            player_id=f"player-{rng.randrange(3)}" if is_prop else None,
+            base_fragility=rng.choice([0.0, 2.5, 4.0, 7.5, 12.0]),
+            correlation_tags=rng.choice(tag_choices) if is_prop else [],
+        ))
+    return blocks
+
+
+def brute_force(pool, original_count, target, max_legs, top_k):
+    """Rank every subset the slow way."""
+    ranked = []
+    for legs in range(1, min(len(pool), max_legs) + 1):
+        for positions in combinations(range(len(pool)), legs):
+            final = build_parlay_state([pool[p] for p in positions]).metrics.final_fragility
+            if final <= target:
+                ranked.append((-legs, final, positions))
+    ranked.sort()
+    return [(-neg_legs, positions) for neg_legs, _, positions in ranked[:top_k]]
+
+
+# =============================================================================
+# Test resolve_target
+# =============================================================================
+
+
+class TestResolveTarget:
+    """Tests for fragility budget resolution."""
+
+    def test_requires_a_budget(self):
+        with pytest.raises(ValueError):
+            resolve_target(None, None)
+
+    def test_tighter_of_max_and_tolerance(self):
+        assert resolve_target(40.0, make_dna(tolerance=55)) == 40.0
+        assert resolve_target(70.0, make_dna(tolerance=55)) == 55.0
+        assert resolve_target(None, make_dna(tolerance=55)) == 55.0
+
+
+# =============================================================================
+# Test search_sub_parlays
+# =============================================================================
+
+
+class TestSearchSubParlays:
+    """Tests for the branch-and-bound search."""
+
+    def test_whole_parlay_when_under_budget(self):
+        blocks = [make_block(game_id=f"g{i}", base_fragility=5.0) for i in range(3)]
+        result = search_sub_parlays(blocks, max_fragility=100)
+
+        best = result.subsets[0]
+        assert result.complete
+        assert best.legs == 3
+        assert best.removed_block_ids == ()
+        assert best.final_fragility == build_parlay_state(blocks).metrics.final_fragility
+
+    def test_drops_most_fragile_leg(self):
+        blocks = [
+            make_block(game_id="g1", base_fragility=5.0),
+            make_block(game_id="g2", base_fragility=40.0),
+            make_block(game_id="g3", base_fragility=5.0),
+        ]
+        result = search_sub_parlays(blocks, max_fragility=40, top_k=1)
+
+        best = result.subsets[0]
+        assert best.legs == 2
+        assert best.removed_block_ids == (blocks[1].block_id,)
+        assert best.final_fragility <= 40
+
+    def test_candidates_can_be_added(self):
+        blocks = [make_block(game_id="g1", base_fragility=5.0)]
+        candidate = make_block(game_id="g2", base_fragility=5.0)
+        result = search_sub_parlays(blocks, candidates=[candidate], max_fragility=60, top_k=1)
+
+        assert result.subsets[0].added_block_ids == (candidate.block_id,)
+
+    def test_nothing_fits(self):
+        blocks = [make_block(base_fragility=90.0)]
+        result = search_sub_parlays(blocks, max_fragility=10)
+
+        assert result.subsets == ()
+        assert result.complete
+
+    def test_dna_max_legs(self):
+        blocks = [make_block(game_id=f"g{i}", base_fragility=1.0) for i in range(6)]
+        result = search_sub_parlays(blocks, dna_profile=make_dna(tolerance=100, max_legs=3))
+
+        assert all(subset.legs <= 3 for subset in result.subsets)
+        assert result.subsets[0].legs == 3
+
+    def test_dna_avoid_props(self):
+        blocks = [
+            make_block(game_id="g1", base_fragility=1.0),
+            make_block(bet_type=BetType.PLAYER_PROP, game_id="g2", player_id="p1", base_fragility=1.0),
+        ]
+        result = search_sub_parlays(blocks, dna_profile=make_dna(tolerance=100, avoid_props=True))
+
+        assert result.subsets[0].block_ids == (blocks[0].block_id,)
+
+    def test_avoid_props_keeps_candidate_labels(self):
+        """Filtering a prop out of blocks does not shift which legs are candidates."""
+        blocks = [
+            make_block(bet_type=BetType.PLAYER_PROP, game_id="g1", player_id="p1", base_fragility=1.0),
+            make_block(game_id="g2", base_fragility=1.0),
+        ]
+        candidate = make_block(bet_type=BetType.ML, game_id="g3", base_fragility=1.0)
+        result = search_sub_parlays(
+            blocks, candidates=[candidate], dna_profile=make_dna(tolerance=100, avoid_props=True), top_k=1
+        )
+
+        best = result.subsets[0]
+        assert set(best.block_ids) == {blocks[1].block_id, candidate.block_id}
+        assert best.added_block_ids == (candidate.block_id,)
+        assert best.removed_block_ids == (blocks[0].block_id,)
+
+    def test_pair_table_counts_against_time_budget(self):
+        blocks = [make_block(game_id=f"g{i}", base_fragility=0.0) for i in range(22)]
+        result = search_sub_parlays(blocks, max_fragility=100, time_budget_ms=-1)
+
+        assert not result.complete
+        assert result.subsets == ()
+        assert result.nodes_explored == 0
+
+    def test_invalid_top_k(self):
+        with pytest.raises(ValueError):
+            search_sub_parlays([make_block()], max_fragility=50, top_k=0)
+
+    def test_time_budget_marks_incomplete(self):
+        blocks = [make_block(game_id=f"g{i}", base_fragility=0.0) for i in range(22)]
+        result = search_sub_parlays(blocks, max_fragility=100, top_k=20, time_budget_ms=0)
+
+        assert not result.complete
+        for subset in result.subsets:
+            assert subset.final_fragility <= 100
+
+    def test_deterministic(self):
+        rng = random.Random(7)
+        pool = random_pool(rng, 9)
+        first = search_sub_parlays(pool[:6], candidates=pool[6:], max_fragility=60)
+        second = search_sub_parlays(pool[:6], candidates=pool[6:], max_fragility=60)
+
+        assert first.subsets == second.subsets
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_brute_force(self, seed):
+        rng = random.Random(seed)
+        pool = random_pool(rng, rng.randrange(4, 10))
+        split = rng.randrange(1, len(pool) + 1)
+        target = rng.choice([35.0, 50.0, 65.0, 80.0])
+        max_legs = rng.choice([3, 5, 10])
+        top_k = rng.choice([1, 3, 8])
+
+        result = search_sub_parlays(
+            pool[:split],
+            candidates=pool[split:],
+            dna_profile=make_dna(tolerance=target, max_legs=max_legs),
+            top_k=top_k,
+        )
+        expected = brute_force(pool, split, target, max_legs, top_k)
+
+        position = {block.block_id: i for i, block in enumerate(pool)}
+        found = [
+            (subset.legs, tuple(position[bid] for bid in subset.block_ids))
+            for subset in result.subsets
+        ]
+        assert result.complete
+        assert found == expected
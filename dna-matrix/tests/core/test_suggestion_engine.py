@@ -4,6 +4,8 @@ Unit tests for Suggestion Engine.
 
 Tests ranking, labels, DNA compatibility, and determinism.
 """
+import random
+
 import pytest
 from uuid import uuid4
 
@@ -19,6 +21,8 @@ from core.suggestion_engine import (
     assign_label,
     compute_suggestions,
     evaluate_candidate,
+    simulate_add,
+    ParlayBase,
     rank_candidates,
     CandidateEvaluation,
     THRESHOLD_LOWEST_RISK,
@@ -347,6 +351,57 @@ class TestComputeSuggestions:
         assert suggestions[0].added_correlation > 0  # Correlation detected
 
 
+# =============================================================================
+# Test candidate-only simulation
+# =============================================================================
+
+
+def _random_block(rng: random.Random) -> BetBlock:
+    bet_type = rng.choice(list(BetType))
+    return make_block(
+        bet_type=bet_type,
+        game_id=rng.choice(["game-1", "game-2"]),
+        player_id=rng.choice(["p1", "p2", None]) if bet_type == BetType.PLAYER_PROP else None,
+        base_fragility=rng.uniform(0.0, 15.0),
+        correlation_tags=rng.sample(
+            ["qb_passing", "wr_receiving", "td_prop", "script_dependency"], rng.randint(0, 2)
+        ),
+    )
+
+
+class TestSimulateAdd:
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_rebuild(self, seed: int):
+        """Candidate-only scoring equals rebuilding the parlay with the candidate."""
+        rng = random.Random(seed)
+        parlay = build_parlay_state([_random_block(rng) for _ in range(rng.randint(0, 8))])
+        base = ParlayBase.from_parlay(parlay)
+
+        for _ in range(20):
+            candidate = _random_block(rng)
+            rebuilt = build_parlay_state(list(parlay.blocks) + [candidate])
+            assert simulate_add(base, candidate) == (
+                rebuilt.metrics.final_fragility,
+                rebuilt.metrics.correlation_penalty,
+            )
+
+    @pytest.mark.parametrize("max_suggestions", [0, 1, 3, 50])
+    def test_top_k_matches_full_sort(self, max_suggestions: int):
+        """Bounded selection returns exactly the head of the full ranking."""
+        rng = random.Random(max_suggestions)
+        parlay = build_parlay_state([_random_block(rng) for _ in range(4)])
+        candidates = [_random_block(rng) for _ in range(40)]
+        # Duplicate scores exercise tie order
+        candidates += [make_block(game_id="game-9") for _ in range(5)]
+
+        evaluations = [evaluate_candidate(parlay, c) for c in candidates]
+        ranked = rank_candidates([e for e in evaluations if e is not None])
+        expected = [e.block.block_id for e in ranked[:max_suggestions]]
+
+        suggestions = compute_suggestions(parlay, candidates, max_suggestions=max_suggestions)
+        assert [s.candidate_block_id for s in suggestions] == expected
+
+
 # =============================================================================
 # Test evaluate_candidate
 # =============================================================================